@@ -1,5 +1,5 @@
 """Labby Package."""
-import pkg_resources
+from importlib.metadata import version
 
 
-__version__ = pkg_resources.get_distribution("labby").version
+__version__ = version("labby")
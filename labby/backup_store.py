@@ -0,0 +1,177 @@
+"""Config backup store module.
+
+Keeps the node configurations collected by `labby run project backup` as content-addressed blobs. Each configuration
+is stored once, gzip compressed and named by the SHA-256 of its content, so a configuration that did not change
+since a previous backup takes no space. Each backup run writes a manifest with the blob of each node:
+
+- `objects/<digest[:2]>/<digest[2:]>.gz`: configurations, shared by all the projects and environments.
+- `manifests/<environment>/<provider>/<project>/<run>.json`: backup runs of a project, named by their creation time.
+"""
+# pylint: disable=no-name-in-module
+import gzip
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from pydantic import BaseModel
+
+from labby import config
+
+
+class BackupManifest(BaseModel):
+    # pylint: disable=too-few-public-methods
+    """Backup run of a project.
+
+    Attributes:
+        project (str): Project name
+        created (datetime): Time the backup was taken, in UTC
+        nodes (Dict[str, str]): Configuration blob digest by node name
+        failed (List[str]): Nodes whose configuration could not be collected
+    """
+
+    project: str
+    created: datetime
+    nodes: Dict[str, str] = {}
+    failed: List[str] = []
+
+    @property
+    def run_id(self) -> str:
+        """Backup run ID, its creation time. i.e. `20240131-120000-000000`."""
+        return f"{self.created:%Y%m%d-%H%M%S-%f}"
+
+
+def get_store_dir() -> Path:
+    """Get the backup store directory from SETTINGS.
+
+    Raises:
+        ValueError: Configuration not set
+
+    Returns:
+        Path: Backup store Path object
+    """
+    if config.SETTINGS is None:
+        raise ValueError("Configuration is not set")
+    return config.SETTINGS.backup_dir
+
+
+def get_blob_path(store: Path, digest: str) -> Path:
+    """Get the file path of a configuration blob.
+
+    Args:
+        store (Path): Backup store directory
+        digest (str): SHA-256 hex digest of the configuration
+
+    Returns:
+        Path: Blob Path object
+    """
+    return store / "objects" / digest[:2] / f"{digest[2:]}.gz"
+
+
+def write_blob(store: Path, content: str) -> str:
+    """Write a configuration blob, unless the store already has it.
+
+    Args:
+        store (Path): Backup store directory
+        content (str): Configuration
+
+    Returns:
+        str: SHA-256 hex digest of the configuration
+    """
+    data = content.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    blob_path = get_blob_path(store, digest)
+    if blob_path.exists():
+        return digest
+
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so an interrupted backup never leaves a partial blob
+    tmp_path = blob_path.with_suffix(".tmp")
+    tmp_path.write_bytes(gzip.compress(data, mtime=0))
+    tmp_path.replace(blob_path)
+    return digest
+
+
+def read_blob(store: Path, digest: str) -> str:
+    """Read a configuration blob.
+
+    Args:
+        store (Path): Backup store directory
+        digest (str): SHA-256 hex digest of the configuration
+
+    Raises:
+        FileNotFoundError: If the store does not have the blob
+
+    Returns:
+        str: Configuration
+    """
+    return gzip.decompress(get_blob_path(store, digest).read_bytes()).decode()
+
+
+def get_manifests_dir(store: Path, project_name: str) -> Path:
+    """Get the manifests directory of a project in the current environment and provider.
+
+    Args:
+        store (Path): Backup store directory
+        project_name (str): Project name
+
+    Returns:
+        Path: Manifests directory Path object
+    """
+    env = config.get_environment()
+    return store / "manifests" / env.name / env.provider.name / quote(project_name, safe="")
+
+
+def write_manifest(store: Path, manifest: BackupManifest) -> Path:
+    """Write the manifest of a backup run.
+
+    Args:
+        store (Path): Backup store directory
+        manifest (BackupManifest): Backup run
+
+    Returns:
+        Path: Manifest Path object
+    """
+    manifest_path = get_manifests_dir(store, manifest.project) / f"{manifest.run_id}.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(manifest.json(indent=4))
+    tmp_path.replace(manifest_path)
+    return manifest_path
+
+
+def list_manifests(store: Path, project_name: str) -> List[BackupManifest]:
+    """List the backup runs of a project, oldest first.
+
+    Args:
+        store (Path): Backup store directory
+        project_name (str): Project name
+
+    Returns:
+        List[BackupManifest]: Backup runs
+    """
+    manifests_dir = get_manifests_dir(store, project_name)
+    return [BackupManifest.parse_file(x) for x in sorted(manifests_dir.glob("*.json"))]
+
+
+def get_manifest(store: Path, project_name: str, run_id: Optional[str] = None) -> Optional[BackupManifest]:
+    """Get a backup run of a project.
+
+    Args:
+        store (Path): Backup store directory
+        project_name (str): Project name
+        run_id (Optional[str], optional): Backup run ID. Defaults to the latest backup run.
+
+    Returns:
+        Optional[BackupManifest]: Backup run, None if not found
+    """
+    manifests_dir = get_manifests_dir(store, project_name)
+    if run_id is not None:
+        manifest_path = manifests_dir / f"{run_id}.json"
+        return BackupManifest.parse_file(manifest_path) if manifest_path.exists() else None
+
+    # Run IDs sort by time, so only the latest manifest is read
+    manifest_paths = sorted(manifests_dir.glob("*.json"))
+    return BackupManifest.parse_file(manifest_paths[-1]) if manifest_paths else None
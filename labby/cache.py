@@ -0,0 +1,154 @@
+"""Local read cache module.
+
+Keeps on disk the provider listings (projects, templates and project snapshots) used by the `labby get` commands, so
+they can be served without reaching the provider while they are fresh. Entries are scoped by environment and provider.
+
+Also keeps the parsed content of the project files, reused while the file content and the labby version are the same.
+"""
+import hashlib
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+from labby import __version__, config
+from labby.utils import console, write_text_atomic
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory of the current environment and provider.
+
+    Raises:
+        ValueError: Configuration not set
+
+    Returns:
+        Path: Cache directory Path object
+    """
+    if config.SETTINGS is None:
+        raise ValueError("Configuration is not set")
+    env = config.get_environment()
+    return config.SETTINGS.cache_dir / env.name / env.provider.name
+
+
+def get_entry_path(key: str) -> Path:
+    """Get the file path of a cache entry.
+
+    Args:
+        key (str): Cache entry key. i.e. `projects` or `project-lab01`
+
+    Returns:
+        Path: Cache entry Path object
+    """
+    return get_cache_dir() / f"{quote(key, safe='')}.json"
+
+
+def read(key: str, max_age: Optional[int] = None) -> Optional[Any]:
+    """Read a cache entry, if it is present and fresh.
+
+    Args:
+        key (str): Cache entry key
+        max_age (Optional[int], optional): Maximum age in seconds of the entry. Defaults to the `cache_max_age` setting.
+
+    Returns:
+        Optional[Any]: Cached data, None if not present or stale
+    """
+    entry_path = get_entry_path(key)
+    if not entry_path.exists():
+        return None
+
+    try:
+        entry = json.loads(entry_path.read_text())
+    except ValueError:
+        return None
+
+    age = time.time() - entry["timestamp"]
+    if max_age is None:
+        max_age = config.SETTINGS.cache_max_age  # type: ignore
+    if age > max_age:
+        if config.DEBUG:
+            console.log(f"Cache entry [cyan i]{key}[/] is stale ({age:.0f}s old)", style="warning")
+        return None
+
+    if config.DEBUG:
+        console.log(f"Using cache entry [cyan i]{key}[/] ({age:.0f}s old)")
+    return entry["data"]
+
+
+def write(key: str, data: Any) -> None:
+    """Write a cache entry.
+
+    Args:
+        key (str): Cache entry key
+        data (Any): JSON serializable data
+    """
+    entry_path = get_entry_path(key)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+    write_text_atomic(entry_path, json.dumps({"timestamp": time.time(), "data": data}))
+
+
+def invalidate() -> None:
+    """Remove all the cache entries of the current environment and provider."""
+    if config.SETTINGS is None:
+        return
+    cache_dir = get_cache_dir()
+    if cache_dir.exists():
+        if config.DEBUG:
+            console.log(f"Invalidating cache at [cyan i]{cache_dir}[/]")
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def get_file_entry_path(path: Path) -> Path:
+    """Get the cache entry file path of the parsed content of a file. Shared by all environments.
+
+    Args:
+        path (Path): File path
+
+    Returns:
+        Path: Cache entry Path object
+    """
+    path_digest = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+    return config.SETTINGS.cache_dir / "files" / f"{path_digest}.json"  # type: ignore
+
+
+def load_file(path: Path, parser: Callable[[str], Any]) -> Any:
+    """Load the parsed content of a file, parsing it only when its content or the labby version changed.
+
+    Only the content that is the same after a JSON round trip is cached, i.e. not YAML dates or integer keys.
+
+    Args:
+        path (Path): File path
+        parser (Callable[[str], Any]): Parser of the file content. i.e. `utils.load_yaml`
+
+    Returns:
+        Any: Parsed content
+    """
+    content = path.read_text(encoding="utf-8")
+    if config.SETTINGS is None:
+        return parser(content)
+
+    digest = hashlib.sha256(f"{__version__}\n{content}".encode()).hexdigest()
+    entry_path = get_file_entry_path(path)
+    if entry_path.exists():
+        try:
+            entry = json.loads(entry_path.read_text())
+        except ValueError:
+            entry = {}
+        if entry.get("digest") == digest:
+            if config.DEBUG:
+                console.log(f"Using parsed file cache of [cyan i]{path}[/]")
+            return entry["data"]
+
+    data = parser(content)
+    try:
+        serialized = json.dumps({"digest": digest, "data": data})
+    except (TypeError, ValueError):
+        return data
+    if json.loads(serialized)["data"] != data:
+        return data
+
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(entry_path, serialized)
+    return data
@@ -0,0 +1,156 @@
+"""Labby CLI entrypoint.
+
+Runs the labby commands through the labby daemon when it is running, which answers them from its already loaded
+configuration, provider connections and projects. Otherwise, or for the commands that need the terminal, the command
+runs in this process, and the daemon is told to drop its loaded projects when the command changed the lab.
+
+Only the standard library is imported until the command is known to run locally, so going through the daemon does not
+pay the import of the labby CLI.
+"""
+import json
+import os
+import shutil
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Commands that prompt or take over the terminal, always run locally
+LOCAL_COMMANDS = ["init", "config", "connect", "build", "daemon"]
+
+# Main options taking a value
+MAIN_OPTIONS_WITH_VALUE = ["--config-file", "-c", "--environment", "-e", "--provider"]
+
+# Seconds to wait for the daemon to accept a command
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_path() -> Path:
+    """Returns the unix socket of the labby daemon, next to the global labby configuration.
+
+    Returns:
+        Path: Socket Path object
+    """
+    if os.getenv("LABBY_DAEMON_SOCKET"):
+        return Path(os.environ["LABBY_DAEMON_SOCKET"])
+    return Path.home() / ".config" / "labby" / "labbyd.sock"
+
+
+def get_command_name(args: List[str]) -> Optional[str]:
+    """Returns the command of the labby arguments, skipping the main options.
+
+    Args:
+        args (List[str]): Labby arguments
+
+    Returns:
+        Optional[str]: Command name. None if there is no command
+    """
+    args_iter = iter(args)
+    for arg in args_iter:
+        if arg in MAIN_OPTIONS_WITH_VALUE:
+            next(args_iter, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def can_use_daemon(args: List[str]) -> bool:
+    """Checks if the labby arguments can run through the daemon.
+
+    Args:
+        args (List[str]): Labby arguments
+
+    Returns:
+        bool: True if the command can run through the daemon
+    """
+    # The shell completion is answered locally, from the name index
+    if os.getenv("LABBY_NO_DAEMON") or os.getenv("_LABBY_COMPLETE"):
+        return False
+
+    # The output is rendered by the daemon for a terminal, without reading its keys
+    if not sys.stdout.isatty() or "--pager" in args:
+        return False
+
+    command_name = get_command_name(args)
+    return command_name is not None and command_name not in LOCAL_COMMANDS and get_socket_path().exists()
+
+
+def run_remote(args: List[str]) -> Optional[int]:
+    """Runs the labby arguments through the daemon, writing its output as it comes.
+
+    Args:
+        args (List[str]): Labby arguments
+
+    Returns:
+        Optional[int]: Exit code of the command. None if the daemon could not be reached
+    """
+    request: Dict[str, Any] = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "run",
+        "params": {
+            "args": args,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "columns": shutil.get_terminal_size().columns,
+        },
+    }
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(get_socket_path()))
+        sock.settimeout(None)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+    except OSError:
+        # Stale socket of a daemon no longer running
+        sock.close()
+        return None
+
+    with sock, sock.makefile("r", encoding="utf-8") as stream:
+        for line in stream:
+            message = json.loads(line)
+            if message.get("method") == "output":
+                sys.stdout.write(message["params"]["data"])
+                sys.stdout.flush()
+            elif "error" in message:
+                sys.stderr.write(f"labby daemon error: {message['error']['message']}\n")
+                return 1
+            elif "result" in message:
+                return message["result"]["exit_code"]
+
+    sys.stderr.write("labby daemon closed the connection\n")
+    return 1
+
+
+def reset_remote() -> None:
+    """Tells the daemon to drop its loaded projects, if it is running."""
+    request = {"jsonrpc": "2.0", "id": 1, "method": "reset"}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(get_socket_path()))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            sock.recv(4096)
+    except OSError:
+        # Daemon not running
+        pass
+
+
+def main() -> None:
+    """Runs labby, through the daemon if it is running."""
+    args = sys.argv[1:]
+    exit_code = run_remote(args) if can_use_daemon(args) else None
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    # pylint: disable=import-outside-toplevel
+    from labby.main import MUTATING_COMMANDS, app
+
+    try:
+        app(prog_name="labby")
+    finally:
+        # The projects loaded by the daemon no longer match the lab changed by this command. i.e. a build
+        if get_command_name(args) in MUTATING_COMMANDS and get_socket_path().exists():
+            reset_remote()
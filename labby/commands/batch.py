@@ -0,0 +1,351 @@
+"""Labby batch command.
+
+Runs the operations of an operations file in one process. The configuration is loaded and the provider registered
+once, and the projects loaded by an operation are kept for the next ones. Operations reading with `--cached` reuse
+them as they are, together with their nodes, links and Nornir inventory, the rest retrieve them again.
+
+Each operation is a labby command line. Operations run in the order of the file, unless they set `after`: then they
+run once the operations listed are done, concurrently with the rest of operations ready to run.
+
+Example of an operations file:
+
+```yaml
+operations:
+  - name: r1
+    command: create node r1 --project lab --template "Arista EOS vEOS 4.25.0FX"
+  - name: r2
+    command: create node r2 --project lab --template "Arista EOS vEOS 4.25.0FX"
+    after: []
+  - command: create link --project lab -na r1 -pa Ethernet1 -nb r2 -pb Ethernet1
+    after: [r1, r2]
+  - start project lab
+```
+
+Example:
+> labby batch --ops-file "ops.yml"
+"""
+# pylint: disable=no-name-in-module
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+import typer
+from pydantic import BaseModel
+from rich.table import Table
+
+from labby import cache, output, scheduler, utils
+from labby.commands import common
+
+
+# Commands that can not run as an operation: nested batches and interactive commands
+UNSUPPORTED_COMMANDS = ["batch", "init", "config", "connect"]
+
+# Commands that do not modify the lab, so the read cache is kept after them
+READ_ONLY_COMMANDS = ["get"]
+
+
+class BatchOperation(BaseModel):
+    # pylint: disable=too-few-public-methods
+    """Labby batch operation.
+
+    Attributes:
+        name (str): Operation name
+        args (List[str]): Labby command line arguments
+        after (Optional[List[str]]): Operations to run before this one. If not set, the previous operation
+        status (str): Operation status. One of `pending`, `done`, `failed` or `skipped`
+        error (Optional[str]): Error of a failed or skipped operation
+        duration (Optional[float]): Seconds the operation took
+    """
+
+    name: str
+    args: List[str]
+    after: Optional[List[str]] = None
+    status: str = "pending"
+    error: Optional[str] = None
+    duration: Optional[float] = None
+
+    @property
+    def command(self) -> str:
+        """Labby command line of the operation."""
+        return " ".join(shlex.quote(x) for x in self.args)
+
+
+def load_operations(ops_file: Path) -> List[BatchOperation]:
+    """Loads the operations of an operations file.
+
+    Args:
+        ops_file (Path): Operations file
+
+    Raises:
+        ValueError: If the operations file is not valid
+
+    Returns:
+        List[BatchOperation]: Operations in the order of the file
+    """
+    if not ops_file.is_file():
+        raise ValueError(f"Operations file not found: {ops_file}")
+
+    ops_data = utils.load_yaml_file(str(ops_file)) or {}
+    if not isinstance(ops_data, dict) or not isinstance(ops_data.get("operations"), list):
+        raise ValueError("Operations file must have a list of `operations`")
+
+    operations: List[BatchOperation] = []
+    for index, op_data in enumerate(ops_data["operations"], start=1):
+        if isinstance(op_data, str):
+            op_data = {"command": op_data}
+        if not isinstance(op_data, dict) or not op_data.get("command"):
+            raise ValueError(f"Operation {index} must have a `command`")
+
+        command = op_data["command"]
+        args = shlex.split(command) if isinstance(command, str) else [str(x) for x in command]
+        if args[0] in UNSUPPORTED_COMMANDS:
+            raise ValueError(f"Operation {index}: command not supported in a batch: {args[0]}")
+
+        operations.append(BatchOperation(name=str(op_data.get("name", index)), args=args, after=op_data.get("after")))
+
+    names = [x.name for x in operations]
+    for operation in operations:
+        if names.count(operation.name) > 1:
+            raise ValueError(f"Duplicated operation name: {operation.name}")
+        for ref in operation.after or []:
+            if ref not in names:
+                raise ValueError(f"Operation {operation.name} runs after an unknown operation: {ref}")
+
+    return operations
+
+
+def get_dependencies(operations: List[BatchOperation]) -> Dict[str, List[str]]:
+    """Returns the operations each operation runs after.
+
+    Args:
+        operations (List[BatchOperation]): Operations in the order of the file
+
+    Returns:
+        Dict[str, List[str]]: Operation names by operation name
+    """
+    depends_on: Dict[str, List[str]] = {}
+    for index, operation in enumerate(operations):
+        if operation.after is not None:
+            depends_on[operation.name] = operation.after
+        else:
+            depends_on[operation.name] = [operations[index - 1].name] if index else []
+    return depends_on
+
+
+def plan_operations(operations: List[BatchOperation]) -> List[List[BatchOperation]]:
+    """Groups the operations in waves, each one holding the operations that can run concurrently.
+
+    Args:
+        operations (List[BatchOperation]): Operations in the order of the file
+
+    Raises:
+        ValueError: If the operations dependencies are cyclic
+
+    Returns:
+        List[List[BatchOperation]]: Operations of each wave, in run order
+    """
+    by_name = {x.name: x for x in operations}
+    try:
+        waves = scheduler.plan_start_waves({x.name: [] for x in operations}, start_after=get_dependencies(operations))
+    except ValueError as err:
+        raise ValueError(f"Cyclic dependencies between operations: {err}") from err
+    return [[by_name[x] for x in wave] for wave in waves]
+
+
+def get_operation_params(ctx: click.Context, operation: BatchOperation) -> Dict[str, Any]:
+    """Parses the parameters of an operation, without running it.
+
+    Args:
+        ctx (click.Context): Labby main context
+        operation (BatchOperation): Operation to parse
+
+    Returns:
+        Dict[str, Any]: Parameters of the operation command, empty if they could not be parsed
+    """
+    command: Optional[click.Command] = ctx.command
+    cmd_ctx, args = ctx, operation.args
+    try:
+        while isinstance(command, click.MultiCommand) and args:
+            cmd_name, command, args = command.resolve_command(cmd_ctx, args)
+            if command is None or cmd_name is None:
+                return {}
+            cmd_ctx = command.make_context(cmd_name, list(args), parent=cmd_ctx, resilient_parsing=True)
+            args = cmd_ctx.protected_args + cmd_ctx.args
+    except click.ClickException:
+        return {}
+    return cmd_ctx.params if cmd_ctx is not ctx else {}
+
+
+def get_operation_project(params: Dict[str, Any]) -> Optional[str]:
+    """Returns the project an operation works on.
+
+    Args:
+        params (Dict[str, Any]): Parameters of the operation command. See `get_operation_params`
+
+    Returns:
+        Optional[str]: Project name, or project file. None if the operation does not work on a project
+    """
+    if params.get("project_name"):
+        return str(params["project_name"])
+    if params.get("project_file"):
+        return f"file:{params['project_file']}"
+    return None
+
+
+def run_operation(ctx: click.Context, operation: BatchOperation) -> None:
+    """Runs an operation as a labby command, within the labby main context.
+
+    Args:
+        ctx (click.Context): Labby main context, with the configuration already loaded
+        operation (BatchOperation): Operation to run
+    """
+    utils.console.log(f"[b](batch)({operation.name})[/] Running: [i dark_orange3]labby {operation.command}")
+    started = time.monotonic()
+    try:
+        command = ctx.command.get_command(ctx, operation.args[0])  # type: ignore
+        if command is None:
+            raise click.UsageError(f"No such command: {operation.args[0]}")
+        with command.make_context(operation.args[0], operation.args[1:], parent=ctx) as sub_ctx:
+            command.invoke(sub_ctx)
+    except click.exceptions.Exit as err:
+        if err.exit_code:
+            operation.error = f"Exit code {err.exit_code}"
+    except click.ClickException as err:
+        operation.error = err.format_message()
+    except click.exceptions.Abort:
+        operation.error = "Aborted"
+    except Exception as err:  # pylint: disable=broad-except
+        operation.error = str(err) or err.__class__.__name__
+    operation.duration = time.monotonic() - started
+    operation.status = "failed" if operation.error else "done"
+
+    if operation.args[0] not in READ_ONLY_COMMANDS:
+        cache.invalidate()
+
+    if operation.error:
+        utils.console.log(f"[b](batch)({operation.name})[/] Operation failed: {operation.error}", style="error")
+    else:
+        utils.console.log(f"[b](batch)({operation.name})[/] Operation done in {operation.duration:.1f}s", style="good")
+
+
+def run_operations_serially(ctx: click.Context, operations: List[BatchOperation]) -> None:
+    """Runs operations one after the other.
+
+    Args:
+        ctx (click.Context): Labby main context, with the configuration already loaded
+        operations (List[BatchOperation]): Operations to run, in order
+    """
+    for operation in operations:
+        run_operation(ctx, operation)
+
+
+def run_operations(
+    ctx: click.Context, operations: List[BatchOperation], workers: int = 4, keep_going: bool = False
+) -> None:
+    """Runs the operations wave by wave, the operations of a wave concurrently.
+
+    The operations of a wave on the same project share its loaded project, so they run one after the other in the
+    order of the file. Only the operations on different projects run concurrently.
+
+    Args:
+        ctx (click.Context): Labby main context, with the configuration already loaded
+        operations (List[BatchOperation]): Operations in the order of the file
+        workers (int, optional): Maximum operations running at the same time
+        keep_going (bool, optional): Keep running the operations that do not depend on a failed one
+    """
+    waves = plan_operations(operations)
+    depends_on = get_dependencies(operations)
+    by_name = {x.name: x for x in operations}
+
+    params = {x.name: get_operation_params(ctx, x) for x in operations}
+
+    # The operations share the console, so its messages go to stderr for the whole batch when any operation writes
+    # machine-readable output
+    utils.console.stderr = any(x.get("output") not in (None, "table") for x in params.values())
+    output.KEEP_CONSOLE_STREAM = True
+    # Projects loaded are shared by the operations, or with the daemon commands when run by the daemon
+    own_session = common.SESSION_PROJECTS is None
+    if own_session:
+        common.SESSION_PROJECTS = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for wave in waves:
+                groups: Dict[Any, List[BatchOperation]] = {}
+                for operation in wave:
+                    failed = [x for x in depends_on[operation.name] if by_name[x].status in ("failed", "skipped")]
+                    if failed:
+                        operation.status = "skipped"
+                        operation.error = f"Runs after failed operations: {failed}"
+                    elif not keep_going and any(x.status == "failed" for x in operations):
+                        operation.status = "skipped"
+                        operation.error = "Batch stopped on a failed operation"
+                    else:
+                        project = get_operation_project(params[operation.name])
+                        groups.setdefault(project or id(operation), []).append(operation)
+                list(executor.map(run_operations_serially, repeat(ctx), groups.values()))
+    finally:
+        if own_session:
+            common.SESSION_PROJECTS = None
+        output.KEEP_CONSOLE_STREAM = False
+        utils.console.stderr = False
+
+
+def render_operations(operations: List[BatchOperation]) -> Table:
+    """Renders the result of the operations.
+
+    Args:
+        operations (List[BatchOperation]): Operations of the batch
+
+    Returns:
+        Table: Operations table
+    """
+    table = Table(title="Batch Operations", highlight=True)
+    table.add_column("Name")
+    table.add_column("Command")
+    table.add_column("Status")
+    table.add_column("Duration")
+    table.add_column("Error")
+    status_style = {"done": "green", "failed": "red", "skipped": "yellow", "pending": "white"}
+    for operation in operations:
+        table.add_row(
+            operation.name,
+            f"labby {operation.command}",
+            f"[{status_style[operation.status]}]{operation.status}[/]",
+            f"{operation.duration:.1f}s" if operation.duration is not None else "",
+            operation.error or "",
+        )
+    return table
+
+
+def run_batch(ctx: click.Context, ops_file: Path, workers: int = 4, keep_going: bool = False) -> None:
+    """Runs the operations of an operations file and renders their result.
+
+    Args:
+        ctx (click.Context): Labby main context, with the configuration already loaded
+        ops_file (Path): Operations file
+        workers (int, optional): Maximum operations running at the same time
+        keep_going (bool, optional): Keep running the operations that do not depend on a failed one
+
+    Raises:
+        typer.Exit: If the operations file is not valid or an operation did not succeed
+    """
+    try:
+        operations = load_operations(ops_file)
+        for operation in operations:
+            if ctx.command.get_command(ctx, operation.args[0]) is None:  # type: ignore
+                raise ValueError(f"Operation {operation.name}: no such command: {operation.args[0]}")
+        plan_operations(operations)
+    except ValueError as err:
+        utils.console.log(f"[b](batch)[/] {err}", style="error")
+        raise typer.Exit(1) from err
+
+    utils.console.log(f"[b](batch)[/] Running {len(operations)} operations from [cyan i]{ops_file}[/]")
+    run_operations(ctx, operations, workers=workers, keep_going=keep_going)
+    utils.console.log(render_operations(operations))
+
+    if any(x.status != "done" for x in operations):
+        raise typer.Exit(1)
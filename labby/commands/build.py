@@ -5,18 +5,28 @@ Handles the complete build of a Labby Project.
 Example:
 > labby build project --project-file "myproject.yaml"
 """
+# pylint: disable=no-name-in-module
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import click
 import typer
 from netaddr import IPNetwork
 from nornir.core.helpers.jinja_helper import render_from_file
 from nornir_utils.plugins.functions import print_result
+from pydantic import BaseModel
 from rich.prompt import Prompt
+from rich.table import Table
 
-from labby import utils
+from labby import config, state_file, utils
+from labby.commands.common import filter_project_nornir
+from labby.journal import BuildJournal, BuildStep, get_config_hash
 from labby.models import LabbyProject
-from labby.project_data import ProjectData, get_project_from_file
+from labby.preflight import check_project_data, render_preflight_issues
+from labby.project_data import ProjectData, get_project_from_data, get_project_from_file
 from labby.nornir_tasks import config_task
 
 
@@ -25,6 +35,33 @@ app = typer.Typer(
 )
 
 
+class Placement(str, Enum):
+    """Node Placement Strategy Enum."""
+
+    # pylint: disable=invalid-name
+    binpack = "binpack"
+    spread = "spread"
+
+
+class ProjectBuild(BaseModel):
+    # pylint: disable=too-few-public-methods
+    """Build of a project of a parallel build.
+
+    Attributes:
+        project_file (Path): Project file
+        name (str): Project name
+        status (str): Build status. One of `pending`, `done` or `failed`
+        error (Optional[str]): Error of a failed build
+        duration (Optional[float]): Seconds the build took
+    """
+
+    project_file: Path
+    name: str
+    status: str = "pending"
+    error: Optional[str] = None
+    duration: Optional[float] = None
+
+
 def bootstrap_nodes(
     project: LabbyProject,
     project_data: ProjectData,
@@ -33,6 +70,7 @@ def bootstrap_nodes(
     boot_delay: int = 5,
     delay_multiplier: int = 1,
     render_only: bool = False,
+    journal: Optional[BuildJournal] = None,
 ):
     # pylint: disable=too-many-branches
     """Runs the bootstrap tasks for all devices in the project.
@@ -45,6 +83,8 @@ def bootstrap_nodes(
         boot_delay (int, optional): The boot delay to use for the devices. Defaults to 5.
         delay_multiplier (int, optional): The delay multiplier to use for the devices. Defaults to 1.
         render_only (bool): Flag to render the configuration only. Defaults to False.
+        journal (Optional[BuildJournal], optional): Build journal. Nodes it records as bootstrapped with the same
+            configuration are skipped, and the nodes bootstrapped are recorded.
     """
     for node_spec in project_data.nodes_spec:
         # Skip devices that are not going to be configured
@@ -127,6 +167,10 @@ def bootstrap_nodes(
                     ),
                 )
             utils.console.log(f"[b]({project.name})({device.name})[/] Bootstrap config rendered", style="good")
+            config_hash = get_config_hash(cfg_data)
+            if not render_only and journal and journal.is_done(BuildStep.bootstrapped, node_name, config_hash):
+                utils.console.log(f"[b]({project.name})[/] Node already bootstrapped: [i dark_orange3]{node_name}")
+                continue
 
             # Run node bootstrap config process
             if render_only:
@@ -134,7 +178,11 @@ def bootstrap_nodes(
                 utils.console.print(cfg_data, highlight=True)
                 utils.console.rule(title=f"End of bootstrap config: [b cyan]{device.name}")
             else:
-                device.bootstrap(config=cfg_data, boot_delay=boot_delay, delay_multiplier=delay_multiplier)
+                bootstrapped = device.bootstrap(
+                    config=cfg_data, boot_delay=boot_delay, delay_multiplier=delay_multiplier
+                )
+                if bootstrapped and journal:
+                    journal.record(BuildStep.bootstrapped, node_name, config_hash=config_hash)
 
 
 def config_nodes(
@@ -143,7 +191,9 @@ def config_nodes(
     model: Optional[str] = None,
     net_os: Optional[str] = None,
     name: Optional[str] = None,
+    labels: Optional[List[str]] = None,
     silent: bool = False,
+    journal: Optional[BuildJournal] = None,
 ):
     """Runs configuration tasks for all devices in the project.
 
@@ -153,22 +203,18 @@ def config_nodes(
         model (str): The model to filter the devices from.
         net_os (str): The net_os to filter the devices from.
         name (str): The name blob to filter the devices from.
+        labels (Optional[List[str]], optional): Label expressions to select the devices with.
         silent (bool, optional): If true, will not print the result. Defaults to False.
+        journal (Optional[BuildJournal], optional): Build journal. Devices it records with the same configuration
+            applied are skipped, and the devices configured are recorded.
     """
     # Apply filters
-    if model:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: model == n.data["labby_obj"].model)  # type: ignore
-    elif net_os:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: net_os == n.data["labby_obj"].net_os)  # type: ignore
-    elif name:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: name in n.data["labby_obj"].name)  # type: ignore
-    else:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: n.data["labby_obj"].config_managed)  # type: ignore
+    nr_filtered = filter_project_nornir(project, model=model, net_os=net_os, name=name, labels=labels)
 
     utils.console.log(
         f"[b]({project.name})[/] Devices to configure: [i dark_orange3]{list(nr_filtered.inventory.hosts.keys())}[/]"
     )
-    result = nr_filtered.run(task=config_task, project_data=project_data, project=project)
+    result = nr_filtered.run(task=config_task, project_data=project_data, project=project, journal=journal)
     if not silent:
         utils.console.rule(title="Start section")
         print_result(result)  # type: ignore
@@ -178,26 +224,53 @@ def config_nodes(
     )
 
 
-def build_topology(project: LabbyProject, project_data: ProjectData):
+def get_link_spec_name(link_spec: Dict[str, Any]) -> str:
+    """Returns the name of a link to create, as shown and recorded in the build journal.
+
+    Args:
+        link_spec (Dict[str, Any]): Link spec, holding the arguments of `create_link`
+
+    Returns:
+        str: Link name
+    """
+    return f"{link_spec['node_a']}: {link_spec['port_a']} <==> {link_spec['port_b']}: {link_spec['node_b']}"
+
+
+def build_topology(
+    project: LabbyProject,
+    project_data: ProjectData,
+    placement: Optional[str] = None,
+    journal: Optional[BuildJournal] = None,
+):
     # pylint: disable=too-many-locals
     """Builds a project topology.
 
     Args:
         project (LabbyProject): The project to build.
         project_data (ProjectData): The project data processed from project file.
+        placement (Optional[str], optional): Node placement strategy. Defaults to the `placement` of the project file.
+        journal (Optional[BuildJournal], optional): Build journal. Links it records as created are skipped, unless one
+            of their nodes is created again, and the nodes and links created are recorded. Nodes are skipped when the
+            project already has them.
     """
     # Determine mgmt network
     mgmt_ips = project_data.mgmt_ips
     prefixlen = IPNetwork(project_data.mgmt_network["network"]).prefixlen
 
+    # Refresh the project nodes once, instead of searching each node
+    project.get(nodes_refresh=True)
+
     # Create nodes
     index = 0
+    nodes_spec = []
+    start_after = {}
     for node_spec in project_data.nodes_spec:
         for node_name in node_spec.get("nodes", []):
-            device = project.search_node(name=node_name)
+            if node_spec.get("start_after"):
+                start_after[node_name] = node_spec["start_after"]
 
             # Validate devices exists in the project
-            if device:
+            if node_name in project.nodes:
                 utils.console.log(f"[b]({project.name})[/] Node already created: [i dark_orange3]{node_name}")
                 continue
 
@@ -222,28 +295,52 @@ def build_topology(project: LabbyProject, project_data: ProjectData):
             index += 1
 
             utils.console.log(f"[b]({project.name})[/] Creating node: [i dark_orange3]{node_name}")
-            _ = project.create_node(
-                name=node_name,
-                template=node_spec["template"],
-                labels=labels,
-                mgmt_port=mgmt_port,
-                mgmt_addr=mgmt_addr,
-                **extra_params,
+            nodes_spec.append(
+                {
+                    "name": node_name,
+                    "template": node_spec["template"],
+                    "labels": labels,
+                    "mgmt_port": mgmt_port,
+                    "mgmt_addr": mgmt_addr,
+                    **extra_params,
+                }
             )
 
+    # Assign where each node runs
+    placement = placement or project_data.placement
+    if placement and nodes_spec:
+        nodes_spec = project.place_nodes(nodes_spec, strategy=placement)
+    project.create_nodes(
+        nodes_spec, on_created=lambda x: journal.record(BuildStep.node_created, x["name"]) if journal else None
+    )
+    if start_after:
+        state_file.apply_start_after_data(start_after, project)
+
     # Create links
+    created_nodes = {x["name"] for x in nodes_spec}
+    links_spec = []
     for link_spec in project_data.links_spec:
         for link_info in link_spec.get("links", []):
-            link_name = f"{link_spec['node']}: {link_info['port']} <==> {link_info['port_b']}: {link_info['node_b']}"
+            link = {
+                "node_a": link_spec["node"],
+                "port_a": link_info["port"],
+                "port_b": link_info["port_b"],
+                "node_b": link_info["node_b"],
+                "filters": link_info.get("filters"),
+                "labels": link_info.get("labels", []),
+            }
+            link_name = get_link_spec_name(link)
+            # The links of the nodes created again went away with their nodes
+            nodes_created = {link["node_a"], link["node_b"]} & created_nodes
+            if journal and not nodes_created and journal.is_done(BuildStep.link_created, link_name):
+                utils.console.log(f"[b]({project.name})[/] Link already created: [i dark_orange3]{link_name}")
+                continue
             utils.console.log(f"[b]({project.name})[/] Creating link: [i dark_orange3]{link_name}")
-            _ = project.create_link(
-                node_a=link_spec["node"],
-                port_a=link_info["port"],
-                port_b=link_info["port_b"],
-                node_b=link_info["node_b"],
-                filters=link_info.get("filters"),
-                labels=link_info.get("labels", []),
-            )
+            links_spec.append(link)
+    project.create_links(
+        links_spec,
+        on_created=lambda x: journal.record(BuildStep.link_created, get_link_spec_name(x)) if journal else None,
+    )
 
     # Show the details of the project
     project.get(nodes_refresh=True, links_refresh=True)
@@ -254,10 +351,193 @@ def build_topology(project: LabbyProject, project_data: ProjectData):
     utils.console.log(project.render_links_summary())
 
 
+def run_preflight(project_data: ProjectData) -> bool:
+    """Validates a project file against the template catalog of the provider, before any change is made.
+
+    Args:
+        project_data (ProjectData): The project data processed from project file.
+
+    Returns:
+        bool: True if no issues were found.
+    """
+    utils.console.log(f"[b]({project_data.name})[/] Running pre-flight checks")
+    issues = check_project_data(project_data, config.get_provider().get_templates_ports(cached=True))
+    if issues:
+        utils.console.log(render_preflight_issues(issues, title=f"Pre-flight Issues: {project_data.name}"))
+        utils.console.log(f"[b]({project_data.name})[/] Pre-flight checks found {len(issues)} issues", style="error")
+        return False
+    utils.console.log(f"[b]({project_data.name})[/] Pre-flight checks passed", style="good")
+    return True
+
+
+def open_build_journal(project_name: str, resume: bool = False) -> BuildJournal:
+    """Opens the journal of a project build, started over unless the build is resumed.
+
+    Args:
+        project_name (str): Project name
+        resume (bool, optional): Resume the previous build of the project. Defaults to False.
+
+    Returns:
+        BuildJournal: Build journal
+    """
+    journal = BuildJournal(project_name, resume=resume)
+    if resume:
+        utils.console.log(f"[b]({project_name})[/] Resuming build, {journal.completed_steps} steps already completed")
+    return journal
+
+
+def build_project(
+    project: LabbyProject,
+    project_data: ProjectData,
+    bootstrap: bool,
+    configure: bool,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    boot_delay: int = 5,
+    delay_multiplier: int = 1,
+    placement: Optional[str] = None,
+    resume: bool = False,
+) -> None:
+    # pylint: disable=redefined-outer-name
+    """Builds the topology of a project, and optionally bootstraps and configures its nodes.
+
+    Args:
+        project (LabbyProject): The project to build.
+        project_data (ProjectData): The project data processed from project file.
+        bootstrap (bool): Flag to run the bootstrap of the nodes.
+        configure (bool): Flag to run the configuration of the nodes.
+        user (Optional[str], optional): Initial user of the nodes. Defaults to the project file management user.
+        password (Optional[str], optional): Initial password of the nodes. Defaults to the project file management
+            password.
+        boot_delay (int, optional): The boot delay to use for the devices. Defaults to 5.
+        delay_multiplier (int, optional): The delay multiplier to use for the devices. Defaults to 1.
+        placement (Optional[str], optional): Node placement strategy. Defaults to the `placement` of the project file.
+        resume (bool, optional): Resume the previous build of the project from its journal. Defaults to False.
+    """
+    journal = open_build_journal(project.name, resume=resume)
+    build_topology(project=project, project_data=project_data, placement=placement, journal=journal)
+
+    if bootstrap:
+        bootstrap_nodes(
+            project=project,
+            project_data=project_data,
+            user=user if user else project_data.mgmt_creds.user,
+            password=password if password else project_data.mgmt_creds.password,
+            boot_delay=boot_delay,
+            delay_multiplier=delay_multiplier,
+            render_only=False,
+            journal=journal,
+        )
+
+    if configure:
+        config_nodes(project=project, project_data=project_data, journal=journal)
+
+
+def run_project_build(build: ProjectBuild, project_data: ProjectData, **build_args) -> None:
+    """Runs the build of a project of a parallel build, recording its result instead of raising it.
+
+    Args:
+        build (ProjectBuild): Project build
+        project_data (ProjectData): The project data processed from project file.
+        build_args: Arguments of `build_project`
+    """
+    utils.console.log(f"[b](build)({build.name})[/] Building project from [cyan i]{build.project_file}[/]")
+    started = time.monotonic()
+    try:
+        build_project(project=get_project_from_data(project_data), project_data=project_data, **build_args)
+    except click.exceptions.Exit as err:
+        if err.exit_code:
+            build.error = f"Exit code {err.exit_code}"
+    except Exception as err:  # pylint: disable=broad-except
+        build.error = str(err) or err.__class__.__name__
+    build.duration = time.monotonic() - started
+    build.status = "failed" if build.error else "done"
+
+    if build.error:
+        utils.console.log(f"[b](build)({build.name})[/] Build failed: {build.error}", style="error")
+    else:
+        utils.console.log(f"[b](build)({build.name})[/] Project built in {build.duration:.1f}s", style="good")
+
+
+def render_project_builds(builds: List[ProjectBuild]) -> Table:
+    """Renders the result of the project builds.
+
+    Args:
+        builds (List[ProjectBuild]): Project builds
+
+    Returns:
+        Table: Project builds table
+    """
+    table = Table(title="Project Builds", highlight=True)
+    table.add_column("Project")
+    table.add_column("Project File")
+    table.add_column("Status")
+    table.add_column("Duration")
+    table.add_column("Error")
+    status_style = {"done": "green", "failed": "red", "pending": "white"}
+    for build in builds:
+        table.add_row(
+            build.name,
+            str(build.project_file),
+            f"[{status_style[build.status]}]{build.status}[/]",
+            f"{build.duration:.1f}s" if build.duration is not None else "",
+            build.error or "",
+        )
+    return table
+
+
+def build_projects(project_files: List[Path], max_parallel: int = 4, preflight: bool = True, **build_args) -> None:
+    """Builds several projects concurrently, sharing the provider and its connection.
+
+    Args:
+        project_files (List[Path]): Project files
+        max_parallel (int, optional): Maximum projects built at the same time
+        preflight (bool, optional): Validate all the project files before building any of them
+        build_args: Arguments of `build_project`
+
+    Raises:
+        typer.Exit: If a project file is not valid or a build did not succeed
+    """
+    projects_data = []
+    for project_file in project_files:
+        try:
+            projects_data.append(ProjectData(project_file))
+        except (ValueError, FileNotFoundError) as err:
+            utils.console.log(f"[b](build)[/] {project_file}: {err}", style="error")
+            raise typer.Exit(1) from err
+    names = [x.name for x in projects_data]
+    for name in names:
+        if names.count(name) > 1:
+            utils.console.log(f"[b](build)[/] Project defined in several project files: {name}", style="error")
+            raise typer.Exit(1)
+
+    # Built before the builds start, so they all share the same provider
+    config.get_provider()
+
+    if preflight:
+        # All the project files are checked, to report all their issues at once
+        passed = [run_preflight(x) for x in projects_data]
+        if not all(passed):
+            raise typer.Exit(1)
+
+    builds = [ProjectBuild(project_file=x.project_file, name=x.name) for x in projects_data]
+    utils.console.log(f"[b](build)[/] Building {len(builds)} projects, up to {max_parallel} at the same time")
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        list(executor.map(lambda x: run_project_build(*x, **build_args), zip(builds, projects_data)))
+    utils.console.log(render_project_builds(builds))
+
+    if any(x.status != "done" for x in builds):
+        raise typer.Exit(1)
+
+
 @app.command(short_help="Builds a Project in a declarative way.", name="project")
 def labby_project(
-    project_file: Path = typer.Option(
-        Path("labby_project.yml"), "--project-file", "-f", help="Project file", envvar="LABBY_PROJECT_FILE"
+    project_files: List[Path] = typer.Option(
+        [Path("labby_project.yml")],
+        "--project-file",
+        "-f",
+        help="Project file. Repeat it to build several projects at the same time",
+        envvar="LABBY_PROJECT_FILE",
     ),
     user: Optional[str] = typer.Option(
         None, "--user", "-u", help="Initial user to configure on the system.", envvar="LABBY_NODE_USER"
@@ -270,48 +550,64 @@ def labby_project(
         1, help="Delay multiplier to apply to boot/config delay before timeouts. Applicable over console connection."
     ),
     force: bool = typer.Option(False, help="Flag to pass yes between all phases."),
+    placement: Optional[Placement] = typer.Option(
+        None, help="Strategy to place the nodes on the provider computes. Overrides the project file `placement`"
+    ),
+    max_parallel: int = typer.Option(4, min=1, help="Maximum projects built at the same time"),
+    preflight: bool = typer.Option(True, help="Validate the project file against the provider before building it"),
+    resume: bool = typer.Option(False, help="Resume the previous build, skipping the steps it completed"),
 ):
     """
     Build a Project in a declarative way.
 
     The project is built based on the contents of the project file.
 
+    The project file is validated against the provider template catalog first, see `labby build validate`.
+
+    Several projects are built concurrently when more project files are given, sharing the provider connection.
+    The bootstrap and configuration questions are asked before the build starts, once for all of them.
+
+    Each completed step is recorded in the build journal of the project. An interrupted build can be resumed with
+    `--resume`, skipping the nodes the project already has, the links created, and the nodes bootstrapped and
+    configured with the same configuration.
+
     Example:
 
     > labby build project --project-file "myproject.yaml"
-    """
-    prj, project_data = get_project_from_file(project_file)
 
-    # Build project
-    build_topology(project=prj, project_data=project_data)
+    > labby build project --project-file "myproject.yaml" --resume
 
-    # Bootstrap nodes
+    > labby build project -f lab01.yml -f lab02.yml -f lab03.yml --max-parallel 2 --force
+    """
+    # Asked before the build starts, once for all the projects
     if not force:
         is_bootstrap_required = Prompt.ask(
             "Do you want to bootstrap the nodes?", console=utils.console, choices=["yes", "no"], default="yes"
         )
-    else:
-        is_bootstrap_required = "yes"
-    if is_bootstrap_required == "yes":
-        bootstrap_nodes(
-            project=prj,
-            project_data=project_data,
-            user=user if user else project_data.mgmt_creds.user,
-            password=password if password else project_data.mgmt_creds.password,
-            boot_delay=boot_delay,
-            delay_multiplier=delay_multiplier,
-            render_only=False,
-        )
-
-    # Configure nodes
-    if not force:
         is_config_required = Prompt.ask(
             "Do you want to configure the nodes?", console=utils.console, choices=["yes", "no"], default="yes"
         )
     else:
-        is_config_required = "yes"
-    if is_config_required == "yes":
-        config_nodes(project=prj, project_data=project_data)
+        is_bootstrap_required = is_config_required = "yes"
+    build_args = {
+        "bootstrap": is_bootstrap_required == "yes",
+        "configure": is_config_required == "yes",
+        "user": user,
+        "password": password,
+        "boot_delay": boot_delay,
+        "delay_multiplier": delay_multiplier,
+        "placement": placement,
+        "resume": resume,
+    }
+
+    if len(project_files) > 1:
+        build_projects(project_files, max_parallel=max_parallel, preflight=preflight, **build_args)
+        return
+
+    project_data = ProjectData(project_files[0])
+    if preflight and not run_preflight(project_data):
+        raise typer.Exit(1)
+    build_project(project=get_project_from_data(project_data), project_data=project_data, **build_args)
 
 
 @app.command(short_help="Builds a Project Topology.")
@@ -319,6 +615,10 @@ def topology(
     project_file: Path = typer.Option(
         Path("labby_project.yml"), "--project-file", "-f", help="Project file", envvar="LABBY_PROJECT_FILE"
     ),
+    placement: Optional[Placement] = typer.Option(
+        None, help="Strategy to place the nodes on the provider computes. Overrides the project file `placement`"
+    ),
+    preflight: bool = typer.Option(True, help="Validate the project file against the provider before building it"),
 ):
     """
     Builds a topology from a given project file.
@@ -326,10 +626,39 @@ def topology(
     Example:
 
     > labby build topology --project-file "myproject.yml"
+
+    Spreading the nodes between the provider computes
+
+    > labby build topology --project-file "myproject.yml" --placement spread
     """
-    prj, project_data = get_project_from_file(project_file)
+    project_data = ProjectData(project_file)
+    if preflight and not run_preflight(project_data):
+        raise typer.Exit(1)
+    prj = get_project_from_data(project_data)
+
+    build_topology(project=prj, project_data=project_data, placement=placement)
+
+
+@app.command(short_help="Validates a project file before building it.")
+def validate(
+    project_files: List[Path] = typer.Option(
+        [Path("labby_project.yml")], "--project-file", "-f", help="Project file", envvar="LABBY_PROJECT_FILE"
+    ),
+):
+    """
+    Validates project files against the provider template catalog, without making any change.
 
-    build_topology(project=prj, project_data=project_data)
+    Checks the node templates, the management and link ports of the nodes, the link ends, the management IP range
+    capacity and the management credentials, reporting all the issues found.
+
+    Example:
+
+    > labby build validate --project-file "myproject.yml"
+    """
+    # All the project files are checked, to report all their issues at once
+    passed = [run_preflight(ProjectData(x)) for x in project_files]
+    if not all(passed):
+        raise typer.Exit(1)
 
 
 @app.command(short_help="Runs the bootstrap config process on the devices of a Project.")
@@ -377,6 +706,9 @@ def configs(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Filter devices based on the model provided"),
     net_os: Optional[str] = typer.Option(None, "--net-os", "-n", help="Filter devices based on the net_os provided"),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter devices based on the name"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression to select the devices with. i.e. `edge & !lab`"
+    ),
     silent: bool = typer.Option(False, "--silent", "-s", help="Silent mode", envvar="LABBY_SILENT"),
 ):
     """
@@ -385,8 +717,14 @@ def configs(
     Example:
 
     > labby build configs --project-file "myproject.yml"
+
+    Or on the devices selected by their labels
+
+    > labby build configs --project-file "myproject.yml" --label "edge & !lab"
     """
     prj, project_data = get_project_from_file(project_file)
 
     # Config Nodes
-    config_nodes(project=prj, project_data=project_data, model=model, net_os=net_os, name=name, silent=silent)
+    config_nodes(
+        project=prj, project_data=project_data, model=model, net_os=net_os, name=name, labels=labels, silent=silent
+    )
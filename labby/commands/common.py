@@ -1,22 +1,48 @@
 """Common functionalities between commands."""
 from __future__ import annotations
-from typing import Tuple, TYPE_CHECKING
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 import typer
+from rich.table import Table
 
 from labby import utils, config
-from labby.models import LabbyNodeTemplate
+from labby.labels import parse_label_expression
+from labby.models import LabbyNodeTemplate, LabbyProjectSummary
+from labby.providers import get_service_id, register_service, services
 
 if TYPE_CHECKING:
     # pylint: disable=all
+    from nornir.core import Nornir
     from labby.models import LabbyProvider, LabbyProject, LabbyNode, LabbyLink
 
 
-def get_labby_objs_from_project(project_name: str) -> Tuple[LabbyProvider, LabbyProject]:
+# Projects loaded during a batch or by the daemon, reused by the next commands. None otherwise
+SESSION_PROJECTS: Optional[Dict[str, LabbyProject]] = None
+_session_lock = threading.Lock()
+
+
+def get_session_key(project_name: str) -> str:
+    """Returns the key of a project in the loaded projects, unique between environments and providers.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        str: Project key.
+    """
+    env = config.get_environment()
+    return f"{env.name}/{env.provider.name}/{project_name}"
+
+
+def get_labby_objs_from_project(project_name: str, cached: Optional[bool] = None) -> Tuple[LabbyProvider, LabbyProject]:
     """Gets a Provider and Project from a project's name.
 
     Args:
         project_name (str): Project name.
+        cached (Optional[bool], optional): Use of the read cache. True serves it while fresh, False refreshes it.
 
     Raises:
         typer.Exit: If project not found
@@ -28,7 +54,16 @@ def get_labby_objs_from_project(project_name: str) -> Tuple[LabbyProvider, Labby
     provider = config.get_provider()
 
     # Get project
-    prj = provider.search_project(project_name=project_name)
+    if SESSION_PROJECTS is None:
+        prj = provider.search_project(project_name=project_name, cached=cached)
+    else:
+        with _session_lock:
+            # The loaded project is only reused when asked for cached data, otherwise it is retrieved again
+            prj = SESSION_PROJECTS.get(get_session_key(project_name)) if cached is True else None
+            if prj is None:
+                prj = provider.search_project(project_name=project_name, cached=cached)
+                if prj:
+                    SESSION_PROJECTS[get_session_key(project_name)] = prj
     if not prj:
         utils.console.log(f"Project [cyan i]{project_name}[/] not found. Nothing to do...", style="error")
         raise typer.Exit(1)
@@ -36,6 +71,123 @@ def get_labby_objs_from_project(project_name: str) -> Tuple[LabbyProvider, Labby
     return provider, prj
 
 
+def get_labby_project_view(project_name: str, cached: Optional[bool] = None) -> LabbyProjectSummary:
+    """Gets a read only view of a project, to list its nodes and links.
+
+    A project already loaded by the session is used as it is when asked for cached data.
+
+    Args:
+        project_name (str): Project name.
+        cached (Optional[bool], optional): Use of the read cache. True serves it while fresh, False refreshes it.
+
+    Raises:
+        typer.Exit: If project not found
+
+    Returns:
+        LabbyProjectSummary: Project view, or the loaded project.
+    """
+    if SESSION_PROJECTS is not None and cached is True:
+        with _session_lock:
+            prj = SESSION_PROJECTS.get(get_session_key(project_name))
+        if prj is not None:
+            return prj
+
+    prj_view = config.get_provider().search_project_view(project_name=project_name, cached=cached)
+    if not prj_view:
+        utils.console.log(f"Project [cyan i]{project_name}[/] not found. Nothing to do...", style="error")
+        raise typer.Exit(1)
+
+    return prj_view
+
+
+def forget_project(project_name: str) -> None:
+    """Drops a project from the loaded projects. i.e. once it is deleted.
+
+    Args:
+        project_name (str): Project name.
+    """
+    if SESSION_PROJECTS is not None:
+        with _session_lock:
+            SESSION_PROJECTS.pop(get_session_key(project_name), None)
+
+
+def check_label_expressions(labels: Optional[List[str]]) -> None:
+    """Validates the label expressions of a command. See `labby.labels`.
+
+    Args:
+        labels (Optional[List[str]]): Label expressions given
+
+    Raises:
+        typer.Exit: If a label expression is not valid
+    """
+    for expression in labels or []:
+        try:
+            parse_label_expression(expression)
+        except ValueError as err:
+            utils.console.log(str(err), style="error")
+            raise typer.Exit(1) from err
+
+
+def select_project_nodes(project: LabbyProject, labels: Optional[List[str]]) -> Optional[List[str]]:
+    """Selects the project nodes matching the label expressions of a command.
+
+    Args:
+        project (LabbyProject): Labby project
+        labels (Optional[List[str]]): Label expressions given
+
+    Raises:
+        typer.Exit: If a label expression is not valid
+
+    Returns:
+        Optional[List[str]]: Names of the nodes selected. None when no labels are given
+    """
+    if not labels:
+        return None
+    check_label_expressions(labels)
+    return project.select_nodes(labels)
+
+
+def filter_project_nornir(
+    project: LabbyProject,
+    model: Optional[str] = None,
+    net_os: Optional[str] = None,
+    name: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+) -> Nornir:
+    """Filters the Nornir hosts of a project to run a task on.
+
+    One of the model, net_os or name filters is applied, or the nodes managed by labby are taken when none is given.
+    The label expressions narrow the selection down.
+
+    Args:
+        project (LabbyProject): Labby project
+        model (Optional[str], optional): The model to filter the devices from
+        net_os (Optional[str], optional): The net_os to filter the devices from
+        name (Optional[str], optional): The name blob to filter the devices from
+        labels (Optional[List[str]], optional): Label expressions to select the devices with
+
+    Raises:
+        typer.Exit: If a label expression is not valid
+
+    Returns:
+        Nornir: Nornir object with the hosts selected
+    """
+    if model:
+        nr_filtered = project.nornir.filter(filter_func=lambda n: model == n.data["labby_obj"].model)  # type: ignore
+    elif net_os:
+        nr_filtered = project.nornir.filter(filter_func=lambda n: net_os == n.data["labby_obj"].net_os)  # type: ignore
+    elif name:
+        nr_filtered = project.nornir.filter(filter_func=lambda n: name in n.data["labby_obj"].name)  # type: ignore
+    else:
+        nr_filtered = project.nornir.filter(filter_func=lambda n: n.data["labby_obj"].config_managed)  # type: ignore
+
+    selected = select_project_nodes(project, labels)
+    if selected is not None:
+        names = set(selected)
+        nr_filtered = nr_filtered.filter(filter_func=lambda n: n.name in names)
+    return nr_filtered
+
+
 def get_labby_objs_from_node_template(template_name: str) -> Tuple[LabbyProvider, LabbyNodeTemplate]:
     """Gets a Provider and Project from a node template's name.
 
@@ -119,3 +271,175 @@ def get_labby_objs_from_link(
         raise typer.Exit(1)
 
     return provider, prj, enlace
+
+
+def get_labby_providers(config_file: Path, all_environments: bool = False) -> List[Tuple[str, LabbyProvider]]:
+    """Gets all the Providers of the current environment, or of all the environments.
+
+    Providers that can not be instantiated are skipped with a warning.
+
+    Args:
+        config_file (Path): Labby configuration file.
+        all_environments (bool, optional): Get the providers of all the environments.
+
+    Returns:
+        List[Tuple[str, LabbyProvider]]: Environment name and provider.
+    """
+    config_data = config.load_toml(config_file)
+    if all_environments:
+        environment_names = list(config_data.get("environment", {}))
+    else:
+        environment_names = [config.get_environment().name]
+
+    labby_providers = []
+    for environment_name in environment_names:
+        for provider_settings in config.get_environment_providers_settings(environment_name, config_data):
+            try:
+                register_service(provider_settings.name, provider_settings.kind, environment_name)
+                provider = services.get(
+                    get_service_id(environment_name, provider_settings.name), settings=provider_settings
+                )
+            except NotImplementedError:
+                utils.console.log(
+                    f"Provider [cyan i]{environment_name}/{provider_settings.name}[/] skipped: "
+                    f"kind {provider_settings.kind} not supported",
+                    style="warning",
+                )
+                continue
+            except ValueError as err:
+                utils.console.log(
+                    f"Provider [cyan i]{environment_name}/{provider_settings.name}[/] skipped: {err}", style="warning"
+                )
+                continue
+            labby_providers.append((environment_name, provider))
+
+    return labby_providers
+
+
+def query_providers(
+    providers: List[Tuple[str, LabbyProvider]], query: Callable[[LabbyProvider], Any], timeout: int = 10
+) -> List[Tuple[str, LabbyProvider, Any, Optional[str]]]:
+    """Runs a query concurrently against multiple Providers.
+
+    Each query runs in a daemon thread, so a provider that does not answer within the timeout is reported as an
+    error without holding the command.
+
+    Args:
+        providers (List[Tuple[str, LabbyProvider]]): Environment name and provider.
+        query (Callable[[LabbyProvider], Any]): Query to run against each provider.
+        timeout (int, optional): Seconds to wait for each provider.
+
+    Returns:
+        List[Tuple[str, LabbyProvider, Any, Optional[str]]]: Environment name, provider, query result and error.
+    """
+    results: Dict[int, Any] = {}
+    errors: Dict[int, str] = {}
+
+    def _run(index: int, provider: LabbyProvider) -> None:
+        try:
+            results[index] = query(provider)
+        except Exception as err:  # pylint: disable=broad-except
+            errors[index] = str(err) or err.__class__.__name__
+
+    threads = []
+    for index, (_, provider) in enumerate(providers):
+        thread = threading.Thread(target=_run, args=(index, provider), daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    # All the queries start at the same time, so they share the deadline
+    deadline = time.monotonic() + timeout
+    query_results = []
+    for index, ((environment_name, provider), thread) in enumerate(zip(providers, threads)):
+        thread.join(timeout=max(deadline - time.monotonic(), 0))
+        if thread.is_alive():
+            errors[index] = f"No response after {timeout}s"
+        query_results.append((environment_name, provider, results.get(index), errors.get(index)))
+
+    return query_results
+
+
+def iter_providers_project_list(
+    providers: List[Tuple[str, LabbyProvider]],
+    field: Optional[str] = None,
+    value: Optional[str] = None,
+    timeout: int = 10,
+) -> Iterator[Dict[str, Any]]:
+    """Iterates over the projects of multiple Providers.
+
+    Args:
+        providers (List[Tuple[str, LabbyProvider]]): Environment name and provider.
+        field (Optional[str], optional): Field to filter on
+        value (Optional[str], optional): Value to filter on
+        timeout (int, optional): Seconds to wait for each provider.
+
+    Yields:
+        Iterator[Dict[str, Any]]: Project attributes. Unreachable providers have the `error` set and no project
+    """
+    for environment_name, provider, projects, error in query_providers(
+        providers, lambda p: p.get_projects_data(), timeout=timeout
+    ):
+        if error is not None:
+            yield {
+                "environment": environment_name,
+                "provider": provider.name,
+                "name": None,
+                "status": "unreachable",
+                "auto_start": None,
+                "auto_close": None,
+                "auto_open": None,
+                "id": None,
+                "error": str(error),
+            }
+            continue
+        for prj in projects:
+            if field and prj.get(field) != value:
+                continue
+            yield {
+                "environment": environment_name,
+                "provider": provider.name,
+                "name": prj["name"],
+                "status": prj.get("status"),
+                "auto_start": prj.get("auto_start"),
+                "auto_close": prj.get("auto_close"),
+                "auto_open": prj.get("auto_open"),
+                "id": prj.get("project_id"),
+                "error": None,
+            }
+
+
+def render_providers_project_list(
+    providers: List[Tuple[str, LabbyProvider]],
+    field: Optional[str] = None,
+    value: Optional[str] = None,
+    timeout: int = 10,
+) -> Table:
+    """Render the projects of multiple Providers in one table.
+
+    Args:
+        providers (List[Tuple[str, LabbyProvider]]): Environment name and provider.
+        field (Optional[str], optional): Field to filter on
+        value (Optional[str], optional): Value to filter on
+        timeout (int, optional): Seconds to wait for each provider.
+
+    Returns:
+        Table: Projects table
+    """
+    table = Table(title="Projects", highlight=True)
+    table.add_column("Environment")
+    table.add_column("Provider")
+    table.add_column("Project Name")
+    table.add_column("Status")
+    table.add_column("Auto Start")
+    table.add_column("Auto Close")
+    table.add_column("Auto Open")
+    providers_by_key = {(environment_name, provider.name): provider for environment_name, provider in providers}
+    for prj in iter_providers_project_list(providers, field=field, value=value, timeout=timeout):
+        if prj["error"] is not None:
+            table.add_row(
+                prj["environment"], prj["provider"], f"[i]{prj['error']}[/]", "[red]unreachable[/]", "", "", ""
+            )
+            continue
+        provider = providers_by_key[(prj["environment"], prj["provider"])]
+        table.add_row(prj["environment"], prj["provider"], prj["name"], *provider.render_project_row(prj))
+    return table
@@ -0,0 +1,160 @@
+"""Shell completion of the labby resource names.
+
+The names are read from the local name index, kept up to date by the listings, and from the state file. The provider
+is never reached, so the completion answers right away.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional, Set, Tuple
+
+import typer
+
+from labby import config, name_index, state_file
+
+
+def load_settings(ctx: typer.Context) -> bool:
+    """Loads the labby configuration from the main options parsed so far. The main callback does not run on completion.
+
+    Args:
+        ctx (typer.Context): Completion context
+
+    Returns:
+        bool: True if the configuration is loaded
+    """
+    if config.SETTINGS is not None:
+        return True
+
+    params = ctx.find_root().params
+    try:
+        config.load_config(
+            # Values are not converted to their types while completing
+            config_file=Path(params["config_file"]) if params.get("config_file") else config.get_config_path(),
+            environment_name=params.get("environment"),
+            provider_name=params.get("provider"),
+        )
+    except Exception:  # pylint: disable=broad-except
+        # A broken configuration must not break the shell
+        return False
+    return config.SETTINGS is not None
+
+
+def get_names(kind: str, project_name: Optional[str] = None) -> List[str]:
+    """Returns the names of a kind of resource, from the name index and the state file.
+
+    Args:
+        kind (str): Kind of resource. One of `projects`, `templates`, `nodes` or `links`
+        project_name (Optional[str], optional): Project of the nodes and links
+
+    Returns:
+        List[str]: Resource names
+    """
+    index = name_index.read_index()
+    names: Set[str] = set(index.get(kind, []) if project_name is None else index.get(kind, {}).get(project_name, []))
+
+    state_file_data = state_file.read_data(state_file.get_state_file()) or {}
+    env = config.get_environment()
+    projects_data = state_file_data.get(env.name, {}).get(env.provider.name, {}).get("projects", {})
+    if kind == "projects":
+        names.update(projects_data)
+    elif kind == "templates":
+        for project_data in projects_data.values():
+            names.update(x["template"] for x in project_data.get("nodes", {}).values() if x.get("template"))
+    elif project_name is not None:
+        names.update(projects_data.get(project_name, {}).get(kind, {}))
+
+    return sorted(names)
+
+
+def get_link_endpoints(project_name: str) -> List[Tuple[str, str, str, str]]:
+    """Returns the endpoints of the links of a project, from both sides.
+
+    Args:
+        project_name (str): Project name
+
+    Returns:
+        List[Tuple[str, str, str, str]]: Node A, port A, node B and port B of each link
+    """
+    endpoints = []
+    for link_name in get_names("links", project_name):
+        try:
+            side_a, side_b = link_name.split(" == ")
+            node_a, port_a = side_a.split(": ", 1)
+            node_b, port_b = side_b.split(": ", 1)
+        except ValueError:
+            continue
+        endpoints.extend([(node_a, port_a, node_b, port_b), (node_b, port_b, node_a, port_a)])
+    return endpoints
+
+
+def complete_project(ctx: typer.Context, incomplete: str) -> List[str]:
+    """Completes a project name."""
+    if not load_settings(ctx):
+        return []
+    return [x for x in get_names("projects") if x.startswith(incomplete)]
+
+
+def complete_template(ctx: typer.Context, incomplete: str) -> List[str]:
+    """Completes a node template name."""
+    if not load_settings(ctx):
+        return []
+    return [x for x in get_names("templates") if x.startswith(incomplete)]
+
+
+def complete_node(ctx: typer.Context, incomplete: str) -> List[str]:
+    """Completes a node name of the `--project` given."""
+    if not load_settings(ctx) or not ctx.params.get("project_name"):
+        return []
+    return [x for x in get_names("nodes", ctx.params["project_name"]) if x.startswith(incomplete)]
+
+
+def complete_link(ctx: typer.Context, incomplete: str) -> List[str]:
+    """Completes a link name of the project given."""
+    if not load_settings(ctx) or not ctx.params.get("project_name"):
+        return []
+    return [x for x in get_names("links", ctx.params["project_name"]) if x.startswith(incomplete)]
+
+
+def complete_port(node_param: str) -> Callable[[typer.Context, str], List[str]]:
+    """Builds the completion of a port name of a node.
+
+    Args:
+        node_param (str): Parameter holding the node name. i.e. `node_a`
+
+    Returns:
+        Callable[[typer.Context, str], List[str]]: Completion callback
+    """
+
+    def _complete(ctx: typer.Context, incomplete: str) -> List[str]:
+        project_name = ctx.params.get("project_name")
+        node_name = ctx.params.get(node_param)
+        if not load_settings(ctx) or not project_name or not node_name:
+            return []
+        ports = name_index.read_index().get("ports", {}).get(project_name, {}).get(node_name, [])
+        return [x for x in ports if x.startswith(incomplete)]
+
+    return _complete
+
+
+def complete_link_endpoint(field: str) -> Callable[[typer.Context, str], List[str]]:
+    """Builds the completion of an endpoint of an existing link, narrowed by the endpoints already given.
+
+    Args:
+        field (str): Endpoint to complete. One of `node_a`, `port_a`, `node_b` or `port_b`
+
+    Returns:
+        Callable[[typer.Context, str], List[str]]: Completion callback
+    """
+    fields = ["node_a", "port_a", "node_b", "port_b"]
+
+    def _complete(ctx: typer.Context, incomplete: str) -> List[str]:
+        project_name = ctx.params.get("project_name")
+        if not load_settings(ctx) or not project_name:
+            return []
+        given = {i: ctx.params[x] for i, x in enumerate(fields) if x != field and ctx.params.get(x)}
+        values = {
+            endpoint[fields.index(field)]
+            for endpoint in get_link_endpoints(project_name)
+            if all(endpoint[i] == value for i, value in given.items())
+        }
+        return sorted(x for x in values if x.startswith(incomplete))
+
+    return _complete
@@ -12,6 +12,7 @@ from netaddr.ip import IPNetwork
 
 from labby.commands.common import get_labby_objs_from_node
 from labby import utils
+from labby.commands.completion import complete_node, complete_project
 
 
 app = typer.Typer(help="[b orange1]Connects[/b orange1] to a Network Resource")
@@ -19,8 +20,10 @@ app = typer.Typer(help="[b orange1]Connects[/b orange1] to a Network Resource")
 
 @app.command(short_help="Connects to a node via [cyan]ssh[/cyan] or [cyan]telnet[/cyan].")
 def node(
-    node_name: str = typer.Argument(..., help="Node name."),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name.", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     user: str = typer.Option(None, "--user", "-u", help="Node user", envvar="LABBY_NODE_USER"),
     console: bool = typer.Option(False, "--console", "-c", help="Apply configuration over console"),
 ):
@@ -12,6 +12,7 @@ import typer
 
 from labby.commands.common import get_labby_objs_from_project
 from labby import utils, config
+from labby.commands.completion import complete_node, complete_port, complete_project, complete_template
 
 
 app = typer.Typer(
@@ -33,7 +34,9 @@ class LinkFilter(str, Enum):
 
 @app.command(short_help="Creates a [b i]project[/b i] on a network provider lab")
 def project(
-    project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     label: Optional[List[str]] = typer.Option(None, help="Add labels to created project"),
 ):
     """
@@ -57,9 +60,11 @@ def project(
 
 @app.command(short_help="Creates a [b i]node[/b i] on a network provider lab")
 def node(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
-    template_name: str = typer.Option(..., "--template", "-t", help="Node template"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    template_name: str = typer.Option(..., "--template", "-t", help="Node template", autocompletion=complete_template),
     mgmt_port: Optional[str] = typer.Option(None, help="Management Interface used on the device"),
     mgmt_addr: Optional[str] = typer.Option(
         None, help="IP Prefix to configure on mgmt_port. i.e. [cyan]192.168.77.77/24[/cyan]"
@@ -106,11 +111,17 @@ def node(
 
 @app.command(short_help="Creates a [b i]link[/b i] on a network provider lab")
 def link(
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
-    node_a: str = typer.Option(..., "--node-a", "-na", help="Node name from ENDPOINT A"),
-    port_a: str = typer.Option(..., "--port-a", "-pa", help="Port name from node on ENDPOINT A"),
-    node_b: str = typer.Option(..., "--node-b", "-nb", help="Node name from ENDPOINT B"),
-    port_b: str = typer.Option(..., "--port-b", "-pb", help="Port name from node on ENDPOINT B"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    node_a: str = typer.Option(..., "--node-a", "-na", help="Node name from ENDPOINT A", autocompletion=complete_node),
+    port_a: str = typer.Option(
+        ..., "--port-a", "-pa", help="Port name from node on ENDPOINT A", autocompletion=complete_port("node_a")
+    ),
+    node_b: str = typer.Option(..., "--node-b", "-nb", help="Node name from ENDPOINT B", autocompletion=complete_node),
+    port_b: str = typer.Option(
+        ..., "--port-b", "-pb", help="Port name from node on ENDPOINT B", autocompletion=complete_port("node_b")
+    ),
     filter_type: Optional[LinkFilter] = typer.Option(None, help="Filter to apply to the link"),
     filter_value: Optional[str] = typer.Option(None, help="Value of Link Filter to apply to the link"),
     label: Optional[List[str]] = typer.Option(None, help="Add labels to created link"),
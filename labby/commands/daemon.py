@@ -0,0 +1,144 @@
+"""Labby daemon command.
+
+Handles the labby daemon, which keeps the configuration, provider connections and projects loaded between commands.
+While it runs, the `labby` commands run through it.
+
+Example:
+> labby daemon start
+"""
+import os
+import subprocess  # nosec
+import sys
+import time
+from typing import Any, Dict, List
+
+import typer
+from rich.table import Table
+
+from labby import utils
+from labby.client import get_socket_path
+from labby.daemon import LabbyDaemon, call
+
+
+app = typer.Typer(help="Handles the labby daemon, keeping the Network Provider Lab resources loaded between commands")
+
+
+def get_main_options(ctx: typer.Context) -> Dict[str, Any]:
+    """Returns the main options the command was run with, to load the same configuration in the daemon.
+
+    Args:
+        ctx (typer.Context): Command context
+
+    Returns:
+        Dict[str, Any]: Main options: `config_file`, `environment` and `provider`
+    """
+    params = ctx.find_root().params
+    return {
+        "config_file": ctx.obj["config_file"].resolve(),
+        "environment": params.get("environment"),
+        "provider": params.get("provider"),
+    }
+
+
+@app.command(short_help="Starts the labby daemon")
+def start(
+    ctx: typer.Context,
+    foreground: bool = typer.Option(False, help="Run the daemon in the foreground instead of in the background"),
+    timeout: int = typer.Option(10, help="Seconds to wait for the daemon to start"),
+):
+    """
+    Starts the labby daemon, listening on a unix socket next to the global labby configuration.
+
+    Example:
+
+    > labby daemon start
+    """
+    try:
+        daemon_status = call("ping")
+    except ConnectionError:
+        pass
+    else:
+        utils.console.log(f"Labby daemon already running with PID [cyan i]{daemon_status['pid']}[/]", style="warning")
+        return
+
+    options = get_main_options(ctx)
+    if foreground:
+        utils.console.log(f"Labby daemon listening on [cyan i]{get_socket_path()}[/]", style="good")
+        LabbyDaemon(get_socket_path(), **options).serve_forever()
+        return
+
+    args: List[str] = [sys.executable, "-m", "labby.daemon", "--socket", str(get_socket_path())]
+    for option, value in options.items():
+        if value:
+            args.extend([f"--{option.replace('_', '-')}", str(value)])
+
+    # The output is rendered for the terminals of the clients
+    log_file = get_socket_path().with_suffix(".log")
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "a", encoding="utf-8") as log:
+        process = subprocess.Popen(  # nosec # pylint: disable=consider-using-with
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            env={**os.environ, "FORCE_COLOR": "1"},
+        )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            utils.console.log(f"Labby daemon failed to start. Check [cyan i]{log_file}[/]", style="error")
+            raise typer.Exit(1)
+        try:
+            call("ping")
+        except ConnectionError:
+            time.sleep(0.1)
+            continue
+        utils.console.log(f"Labby daemon started with PID [cyan i]{process.pid}[/]", style="good")
+        return
+
+    utils.console.log(f"Labby daemon did not start after {timeout}s. Check [cyan i]{log_file}[/]", style="error")
+    raise typer.Exit(1)
+
+
+@app.command(short_help="Stops the labby daemon")
+def stop():
+    """
+    Stops the labby daemon.
+
+    Example:
+
+    > labby daemon stop
+    """
+    try:
+        result = call("shutdown")
+    except ConnectionError:
+        utils.console.log("Labby daemon is not running. Nothing to do...", style="warning")
+        return
+    utils.console.log(f"Labby daemon with PID [cyan i]{result['pid']}[/] stopped", style="good")
+
+
+@app.command(short_help="Shows the status of the labby daemon")
+def status():
+    """
+    Shows the status of the labby daemon and the projects it has loaded.
+
+    Example:
+
+    > labby daemon status
+    """
+    try:
+        daemon_status = call("ping")
+    except ConnectionError as err:
+        utils.console.log("Labby daemon is not running", style="warning")
+        raise typer.Exit(1) from err
+
+    table = Table(title="Labby Daemon", highlight=True, show_header=False)
+    table.add_row("PID", str(daemon_status["pid"]))
+    table.add_row("Version", daemon_status["version"])
+    table.add_row("Socket", str(get_socket_path()))
+    table.add_row("Uptime", f"{daemon_status['uptime']:.0f}s")
+    table.add_row("Commands", str(daemon_status["requests"]))
+    table.add_row("Projects", "\n".join(daemon_status["projects"]))
+    utils.console.log(table)
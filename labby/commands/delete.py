@@ -7,8 +7,14 @@ Example:
 """
 import typer
 
-from labby.commands.common import get_labby_objs_from_link, get_labby_objs_from_project, get_labby_objs_from_node
+from labby.commands.common import (
+    forget_project,
+    get_labby_objs_from_link,
+    get_labby_objs_from_project,
+    get_labby_objs_from_node,
+)
 from labby import utils
+from labby.commands.completion import complete_link_endpoint, complete_node, complete_project
 
 
 app = typer.Typer(
@@ -17,7 +23,11 @@ app = typer.Typer(
 
 
 @app.command(short_help="Deletes a [b i]project[/b i] on a network provider lab")
-def project(project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT")):
+def project(
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    )
+):
     """
     Deletes a Project.
 
@@ -31,12 +41,15 @@ def project(project_name: str = typer.Argument(..., help="Project name", envvar=
     # Delete project
     utils.console.log(prj)
     prj.delete()
+    forget_project(project_name)
 
 
 @app.command(short_help="Deletes a [b i]node[/b i] on a network provider lab")
 def node(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
 ):
     """
     Deletes a Node.
@@ -55,11 +68,29 @@ def node(
 
 @app.command(short_help="Deletes a [b i]link[/b i] on a network provider lab")
 def link(
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
-    node_a: str = typer.Option(..., "--node-a", "-na", help="Node name from ENDPOINT A"),
-    port_a: str = typer.Option(..., "--port-a", "-pa", help="Port name from node on ENDPOINT A"),
-    node_b: str = typer.Option(..., "--node-b", "-nb", help="Node name from ENDPOINT B"),
-    port_b: str = typer.Option(..., "--port-b", "-pb", help="Port name from node on ENDPOINT B"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    node_a: str = typer.Option(
+        ..., "--node-a", "-na", help="Node name from ENDPOINT A", autocompletion=complete_link_endpoint("node_a")
+    ),
+    port_a: str = typer.Option(
+        ...,
+        "--port-a",
+        "-pa",
+        help="Port name from node on ENDPOINT A",
+        autocompletion=complete_link_endpoint("port_a"),
+    ),
+    node_b: str = typer.Option(
+        ..., "--node-b", "-nb", help="Node name from ENDPOINT B", autocompletion=complete_link_endpoint("node_b")
+    ),
+    port_b: str = typer.Option(
+        ...,
+        "--port-b",
+        "-pb",
+        help="Port name from node on ENDPOINT B",
+        autocompletion=complete_link_endpoint("port_b"),
+    ),
 ):
     """
     Deletes a Link.
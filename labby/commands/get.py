@@ -5,19 +5,35 @@ Handles all get/retrive information actions of labby resources.
 Example:
 > labby get --help
 """
+import sys
 from pathlib import Path
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import typer
 
 from labby.commands.common import (
+    check_label_expressions,
     get_labby_objs_from_link,
     get_labby_objs_from_node,
     get_labby_objs_from_node_template,
-    get_labby_objs_from_project,
+    get_labby_project_view,
+    get_labby_providers,
+    iter_providers_project_list,
+    render_providers_project_list,
 )
 from labby import utils, config
+from labby.models import LINK_SUMMARY_FIELDS, NODE_SUMMARY_FIELDS
+from labby.output import OutputFormat, page_table, setup_output, write_record, write_rows
+from labby.utils import parse_columns, select_columns
+from labby.commands.completion import (
+    complete_link,
+    complete_link_endpoint,
+    complete_node,
+    complete_project,
+    complete_template,
+)
+from labby.topology import TopologyFormat, render_topology_table
 
 
 app = typer.Typer(
@@ -51,15 +67,52 @@ class NodeFilter(str, Enum):
     status = "status"
 
 
+def get_view_columns(columns: Optional[List[str]], sort: Optional[str], fields: List[str]) -> Optional[List[str]]:
+    """Validates the columns and sort field of a summary listing.
+
+    Args:
+        columns (Optional[List[str]]): Columns given, comma separated or repeated
+        sort (Optional[str]): Field to sort on, prefixed with `-` for descending order
+        fields (List[str]): Summary fields
+
+    Raises:
+        typer.Exit: If a column or the sort field is not a summary field
+
+    Returns:
+        Optional[List[str]]: Columns to show. None for the default columns
+    """
+    try:
+        if sort and sort.lstrip("-") not in fields:
+            raise ValueError(f"Unknown sort field: {sort.lstrip('-')}. Available: {', '.join(fields)}")
+        return parse_columns(columns, fields)
+    except ValueError as err:
+        utils.console.log(str(err), style="error")
+        raise typer.Exit(1) from err
+
+
 @project_app.command(name="list", short_help="Retrieves summary list of projects")
 def project_list(
+    ctx: typer.Context,
     pfilter: Optional[ProjectFilter] = typer.Option(
         None, "--filter", "-f", help="Attribute name to filter on. Works with `--value`"
     ),
     value: Optional[str] = typer.Option(
         None, "--value", "-v", help="Attribute value to filter on. Works with `--filter`"
     ),
-    labels: Optional[List[str]] = typer.Option(None, "--label", "-l", help="Labels to filter on."),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expressions to filter on. i.e. 'edge & !lab'"
+    ),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    all_providers: bool = typer.Option(False, "--all-providers", help="Query all the providers of the environment"),
+    all_environments: bool = typer.Option(
+        False, "--all-environments", help="Query all the providers of all the environments"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
+    timeout: int = typer.Option(10, "--timeout", help="Seconds to wait for each provider when querying several"),
 ):
     """
     Retrieve a summary list of projects configured on server.
@@ -71,14 +124,63 @@ def project_list(
     Or based on labels
 
     > labby get project list --label telemetry --label test
+
+    Or on label expressions, combining labels with `&`, `|` and `!`
+
+    > labby get project list --label 'telemetry & !test'
+
+    Served from the local read cache while it is fresh
+
+    > labby get project list --cached
+
+    Or from all the providers of the environment, or of all the environments. Labels and the read cache are only
+    available for the current provider
+
+    > labby get project list --all-providers
+
+    Or as JSON, one project per line
+
+    > labby get project list --output ndjson
     """
+    setup_output(output)
+    check_label_expressions(labels)
+    if all_providers or all_environments:
+        # The labels and the read cache are kept for the current environment and provider only
+        if labels:
+            raise typer.BadParameter(
+                "Can not be used with --all-providers or --all-environments", param_hint="'--label'"
+            )
+        if cached is not None:
+            raise typer.BadParameter(
+                "Can not be used with --all-providers or --all-environments", param_hint="'--cached' / '--refresh'"
+            )
+        providers = get_labby_providers(ctx.obj["config_file"], all_environments=all_environments)
+        if output != OutputFormat.table:
+            write_rows(iter_providers_project_list(providers, field=pfilter, value=value, timeout=timeout), output)
+            return
+        utils.console.log(render_providers_project_list(providers, field=pfilter, value=value, timeout=timeout))
+        return
+
     provider = config.get_provider()
-    utils.console.log(provider.render_project_list(field=pfilter, value=value, labels=labels))
+    if output != OutputFormat.table:
+        write_rows(provider.iter_project_list(field=pfilter, value=value, labels=labels, cached=cached), output)
+        return
+    utils.console.log(provider.render_project_list(field=pfilter, value=value, labels=labels, cached=cached))
 
 
 @project_app.command(short_help="Retrieves details of a project", name="detail")
 def project_detail(
-    project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=0, help="Maximum number of nodes and links to show"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Nodes and links to skip"),
 ):
     """
     Retrieves Project details.
@@ -86,27 +188,163 @@ def project_detail(
     Example:
 
     > labby get project detail lab01
+
+    Large projects can be shown a window at a time. See `labby get node list` and `labby get link list` to select
+    the columns, sort or page them
+
+    > labby get project detail lab01 --limit 50
     """
-    # Get Labby objects from project definition
-    _, prj = get_labby_objs_from_project(project_name=project_name)
+    # Get a read only view of the project, the listings do not modify it
+    setup_output(output)
+    prj = get_labby_project_view(project_name=project_name, cached=cached)
+
+    if output != OutputFormat.table:
+        project_detail_data = prj.summary()
+        project_detail_data.update(
+            nodes=list(prj.iter_nodes_summary(limit=limit, offset=offset)),
+            links=list(prj.iter_links_summary(limit=limit, offset=offset)),
+        )
+        write_record(project_detail_data, output)
+        prj.to_initial_state()
+        return
 
     utils.console.log()
-    utils.console.log(prj.render_nodes_summary())
+    utils.console.log(prj.render_nodes_summary(limit=limit, offset=offset))
     utils.console.log()
-    utils.console.log(prj.render_links_summary())
+    utils.console.log(prj.render_links_summary(limit=limit, offset=offset))
+    prj.to_initial_state()
+
+
+@project_app.command(short_help="Retrieves the topology of a project", name="topology")
+def project_topology(
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    neighbors: Optional[str] = typer.Option(
+        None, "--neighbors", "-N", help="Node to show the neighbors of", autocompletion=complete_node
+    ),
+    path: Tuple[str, str] = typer.Option((None, None), "--path", help="Source and target nodes of the shortest path"),
+    components: bool = typer.Option(False, "--components", help="Show the groups of nodes connected between them"),
+    link_down: Optional[str] = typer.Option(
+        None, "--link-down", help="Link to show the impact of its failure", autocompletion=complete_link
+    ),
+    export: Optional[TopologyFormat] = typer.Option(None, "--export", help="Write the topology graph to stdout"),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
+):
+    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-locals
+    """
+    Retrieves the topology of a project: the nodes and their neighbors.
+
+    Example:
+
+    > labby get project topology lab01
+
+    Or the neighbors of a node, the shortest path between two nodes, the groups of connected nodes or the impact of a
+    link going down
+
+    > labby get project topology lab01 --path r1 r9
+
+    > labby get project topology lab01 --link-down "r1: Ethernet1 == r2: Ethernet1"
+
+    Or exported as a graph
+
+    > labby get project topology lab01 --export dot | dot -Tsvg > lab01.svg
+    """
+    queries = [x for x in (neighbors, path[0], components, link_down, export) if x]
+    if len(queries) > 1:
+        utils.console.log(
+            "Only one of `--neighbors`, `--path`, `--components`, `--link-down` or `--export` can be used",
+            style="error",
+        )
+        raise typer.Exit(1)
+
+    setup_output(output if export is None else OutputFormat.json)
+    # Get a read only view of the project, the topology does not modify it
+    prj = get_labby_project_view(project_name=project_name, cached=cached)
+    topology = prj.get_topology()
     prj.to_initial_state()
 
+    if export is not None:
+        graph = topology.to_dot(project_name) if export == TopologyFormat.dot else topology.to_graphml(project_name)
+        sys.stdout.write(graph)
+        return
+
+    try:
+        if neighbors:
+            rows = [x._asdict() for x in topology.neighbors(neighbors)]
+            title = f"Neighbors of {neighbors}"
+            caption = f"{len(rows)} links"
+        elif path[0]:
+            hops = topology.shortest_path(*path)
+            if hops is None:
+                utils.console.log(f"No path between [cyan i]{path[0]}[/] and [cyan i]{path[1]}[/]", style="warning")
+                raise typer.Exit(1)
+            rows = [x._asdict() for x in hops]
+            title = f"Shortest path from {path[0]} to {path[1]}"
+            caption = f"{len(rows)} hops"
+        elif components:
+            groups = topology.components()
+            rows = [{"component": i, "size": len(x), "nodes": x} for i, x in enumerate(groups, start=1)]
+            title = "Connected components"
+            caption = f"{len(rows)} components"
+        elif link_down:
+            groups = topology.link_impact(link_down)
+            rows = [{"group": i, "size": len(x), "nodes": x} for i, x in enumerate(groups, start=1)]
+            title = f"Link down: {link_down}"
+            caption = "Nodes split in two groups" if len(groups) > 1 else "Nodes still connected through other links"
+        else:
+            rows = list(topology.iter_nodes_summary())
+            title = f"Topology of {project_name}"
+            caption = f"{len(topology.adjacency)} nodes, {len(topology.links)} links"
+    except ValueError as err:
+        utils.console.log(str(err), style="error")
+        raise typer.Exit(1) from err
+
+    if output != OutputFormat.table:
+        write_rows(rows, output)
+        return
+    if not rows:
+        utils.console.log(f"[b]{title}:[/] {caption}", style="warning")
+        return
+    utils.console.log()
+    utils.console.log(render_topology_table(rows, title=title, caption=caption))
+
 
 @node_app.command(name="list", short_help="Retrieves summary list of nodes in a project")
 def node_list(
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     nfilter: Optional[NodeFilter] = typer.Option(
         None, "--filter", "-f", help="Attribute name to filter on. Works with `--value`"
     ),
     value: Optional[str] = typer.Option(
         None, "--value", "-v", help="Attribute value to filter on. Works with `--filter`"
     ),
-    labels: Optional[List[str]] = typer.Option(None, "--label", "-l", help="Labels to filter on."),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expressions to filter on. i.e. 'edge & !lab'"
+    ),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
+    columns: Optional[List[str]] = typer.Option(
+        None, "--columns", "-C", help="Summary fields to show, comma separated or repeated. i.e. `name,status`"
+    ),
+    sort: Optional[str] = typer.Option(
+        None, "--sort", "-s", help="Summary field to sort on. Prefix it with `-` to sort in descending order"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=0, help="Maximum number of rows to show"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Rows to skip"),
+    pager: bool = typer.Option(False, "--pager", help="Page the table, rendering only the rows displayed"),
 ):
     """
     Retrieve a summary list of nodes configured on a project.
@@ -118,12 +356,38 @@ def node_list(
     Or based on labels
 
     > labby get node list --project lab01 --label edge --label mgmt
+
+    > labby get node list --project lab01 --label '(spine | leaf) & !lab'
+
+    Or a page of the columns needed, for large projects
+
+    > labby get node list --project lab01 --columns name,status,console --sort name --limit 50 --offset 100
     """
-    # Get Labby objects from project definition
-    _, prj = get_labby_objs_from_project(project_name=project_name)
+    setup_output(output)
+    check_label_expressions(labels)
+    columns = get_view_columns(columns, sort, NODE_SUMMARY_FIELDS)
+    # Get a read only view of the project, the listings do not modify it
+    prj = get_labby_project_view(project_name=project_name, cached=cached)
+
+    filters = {"field": nfilter, "value": value, "labels": labels}
+    if output != OutputFormat.table:
+        rows = prj.iter_nodes_summary(**filters, sort=sort, limit=limit, offset=offset)
+        write_rows((select_columns(x, columns) for x in rows), output)
+        prj.to_initial_state()
+        return
+
+    if pager:
+        page_table(
+            lambda page_offset, page_limit: prj.render_nodes_summary(
+                **filters, columns=columns, sort=sort, limit=page_limit, offset=page_offset
+            ),
+            total=sum(1 for _ in prj.filter_nodes(**filters)),
+        )
+        prj.to_initial_state()
+        return
 
     utils.console.log()
-    utils.console.log(prj.render_nodes_summary(field=nfilter, value=value, labels=labels))
+    utils.console.log(prj.render_nodes_summary(**filters, columns=columns, sort=sort, limit=limit, offset=offset))
     prj.to_initial_state()
 
 
@@ -131,6 +395,12 @@ def node_list(
 def node_template_list(
     nfilter: Optional[NodeFilter] = typer.Option(None, help="If used you MUST provide expected `--value`"),
     value: Optional[str] = typer.Option(None, help="Value to be used with `--filter`"),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
 ):
     """
     Retrieve a summary list of node templates configured on a provider.
@@ -139,15 +409,24 @@ def node_template_list(
 
     > labby get node template-list
     """
+    setup_output(output)
     provider = config.get_provider()
-    utils.console.log(provider.render_templates_list(field=nfilter, value=value))
+    if output != OutputFormat.table:
+        write_rows(provider.iter_templates_list(field=nfilter, value=value, cached=cached), output)
+        return
+    utils.console.log(provider.render_templates_list(field=nfilter, value=value, cached=cached))
 
 
 @node_app.command(short_help="Retrieves details of a node", name="detail")
 def node_detail(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     properties: bool = typer.Option(False, "--properties", "-o", help="Show node properties"),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
 ):
     """
     Retrieves Node details.
@@ -157,8 +436,14 @@ def node_detail(
     > labby get node detail --project lab01 --node r1
     """
     # Get Labby objects from project and node definition
+    setup_output(output)
     _, prj, device = get_labby_objs_from_node(project_name=project_name, node_name=node_name)
 
+    if output != OutputFormat.table:
+        write_record(device.detail(properties=properties), output)
+        prj.to_initial_state()
+        return
+
     utils.console.log(device)
     utils.console.log()
     utils.console.log(device.render_ports_detail())
@@ -172,8 +457,10 @@ def node_detail(
 
 @node_app.command(short_help="Retrieves node running configuration", name="config")
 def node_config(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     console: bool = typer.Option(False, "--console", "-c", help="Retrieve configuration over console"),
     user: Optional[str] = typer.Option(
         None, "--user", "-u", help="User to use for the node connection", envvar="LABBY_NODE_USER"
@@ -211,7 +498,12 @@ def node_config(
 
 @node_app.command(short_help="Retrieves details of a node template", name="template-detail")
 def node_template_detail(
-    template_name: str = typer.Option(..., "--template", "-t", help="Node Template name"),
+    template_name: str = typer.Option(
+        ..., "--template", "-t", help="Node Template name", autocompletion=complete_template
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
 ):
     """
     Retrieves Node Template details.
@@ -221,21 +513,44 @@ def node_template_detail(
     > labby get node template-detail --template "Arista EOS vEOS 4.25F"
     """
     # Get Labby objects from node's template
+    setup_output(output)
     _, tplt = get_labby_objs_from_node_template(template_name=template_name)
 
+    if output != OutputFormat.table:
+        write_record(tplt.summary(), output)
+        return
     utils.console.log(tplt)
 
 
 @link_app.command(name="list", short_help="Retrieves summary list of links in a project")
 def link_list(
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     lfilter: Optional[str] = typer.Option(
         None, "--filter", "-f", help="Attribute name to filter on. Works with `--value`"
     ),
     value: Optional[str] = typer.Option(
         None, "--value", "-v", help="Attribute value to filter on. Works with `--filter`"
     ),
-    labels: Optional[List[str]] = typer.Option(None, "--label", "-l", help="Labels to filter on."),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expressions to filter on. i.e. 'edge & !lab'"
+    ),
+    cached: Optional[bool] = typer.Option(
+        None, "--cached/--refresh", help="Serve from the local read cache while fresh, or refresh it"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
+    columns: Optional[List[str]] = typer.Option(
+        None, "--columns", "-C", help="Summary fields to show, comma separated or repeated. i.e. `name,status`"
+    ),
+    sort: Optional[str] = typer.Option(
+        None, "--sort", "-s", help="Summary field to sort on. Prefix it with `-` to sort in descending order"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=0, help="Maximum number of rows to show"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Rows to skip"),
+    pager: bool = typer.Option(False, "--pager", help="Page the table, rendering only the rows displayed"),
 ):
     """
     Retrieve a summary list of links configured on a project.
@@ -247,22 +562,71 @@ def link_list(
     Or based on labels
 
     > labby get link list --project lab01 --label inter-dc
+
+    Or as CSV
+
+    > labby get link list --project lab01 --output csv
+
+    Or page by page
+
+    > labby get link list --project lab01 --pager
     """
-    # Get Labby objects from project definition
-    _, prj = get_labby_objs_from_project(project_name=project_name)
+    setup_output(output)
+    check_label_expressions(labels)
+    columns = get_view_columns(columns, sort, LINK_SUMMARY_FIELDS)
+    # Get a read only view of the project, the listings do not modify it
+    prj = get_labby_project_view(project_name=project_name, cached=cached)
+
+    filters = {"field": lfilter, "value": value, "labels": labels}
+    if output != OutputFormat.table:
+        rows = prj.iter_links_summary(**filters, sort=sort, limit=limit, offset=offset)
+        write_rows((select_columns(x, columns) for x in rows), output)
+        prj.to_initial_state()
+        return
+
+    if pager:
+        page_table(
+            lambda page_offset, page_limit: prj.render_links_summary(
+                **filters, columns=columns, sort=sort, limit=page_limit, offset=page_offset
+            ),
+            total=sum(1 for _ in prj.filter_links(**filters)),
+        )
+        prj.to_initial_state()
+        return
 
     utils.console.log()
-    utils.console.log(prj.render_links_summary(field=lfilter, value=value, labels=labels))
+    utils.console.log(prj.render_links_summary(**filters, columns=columns, sort=sort, limit=limit, offset=offset))
     prj.to_initial_state()
 
 
 @link_app.command(short_help="Retrieves details of a link", name="detail")
 def link_detail(
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
-    node_a: str = typer.Option(..., "--node-a", "-na", help="Node name from ENDPOINT A"),
-    port_a: str = typer.Option(..., "--port-a", "-pa", help="Port name from node on ENDPOINT A"),
-    node_b: str = typer.Option(..., "--node-b", "-nb", help="Node name from ENDPOINT B"),
-    port_b: str = typer.Option(..., "--port-b", "-pb", help="Port name from node on ENDPOINT B"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    node_a: str = typer.Option(
+        ..., "--node-a", "-na", help="Node name from ENDPOINT A", autocompletion=complete_link_endpoint("node_a")
+    ),
+    port_a: str = typer.Option(
+        ...,
+        "--port-a",
+        "-pa",
+        help="Port name from node on ENDPOINT A",
+        autocompletion=complete_link_endpoint("port_a"),
+    ),
+    node_b: str = typer.Option(
+        ..., "--node-b", "-nb", help="Node name from ENDPOINT B", autocompletion=complete_link_endpoint("node_b")
+    ),
+    port_b: str = typer.Option(
+        ...,
+        "--port-b",
+        "-pb",
+        help="Port name from node on ENDPOINT B",
+        autocompletion=complete_link_endpoint("port_b"),
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", help="Output format. Machine-readable formats write the log to stderr"
+    ),
 ):
     """
     Retrieves details of a link.
@@ -271,6 +635,7 @@ def link_detail(
 
     > labby get link detail --project lab01 -na r1 -pa Ethernet1 -nb r2 -pb Ethernet1
     """
+    setup_output(output)
     # Get Labby objects from project and link definition
     _, prj, enlace = get_labby_objs_from_link(
         project_name=project_name,
@@ -280,5 +645,10 @@ def link_detail(
         port_b=port_b,
     )
 
+    if output != OutputFormat.table:
+        write_record(enlace.summary(), output)
+        prj.to_initial_state()
+        return
+
     utils.console.log(enlace)
     prj.to_initial_state()
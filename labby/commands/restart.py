@@ -9,6 +9,7 @@ import typer
 
 from labby.commands.common import get_labby_objs_from_node
 from labby import utils
+from labby.commands.completion import complete_node, complete_project
 
 
 app = typer.Typer(
@@ -18,8 +19,10 @@ app = typer.Typer(
 
 @app.command(short_help="[b i]Restarts[/b i] a node")
 def node(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
 ):
     """
     Restarts a Node.
@@ -5,19 +5,23 @@ Handles all ad-hoc actions for labby resources.
 Example:
 > labby run --help
 """
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 import typer
 from nornir.core.helpers.jinja_helper import render_from_file
 from nornir_utils.plugins.functions import print_result
+from rich.table import Table
 
+from labby import backup_store
 from labby.commands.build import config_task
-from labby.commands.common import get_labby_objs_from_node, get_labby_objs_from_project
-from labby.project_data import sync_project_data
-from labby.nornir_tasks import save_task
+from labby.commands.common import filter_project_nornir, get_labby_objs_from_node, get_labby_objs_from_project
+from labby.project_data import ProjectData, get_project_from_file, sync_project_data
+from labby.nornir_tasks import backup_task, save_task
 from labby import utils
+from labby.commands.completion import complete_node, complete_project
 
 
 app = typer.Typer(
@@ -64,7 +68,11 @@ def file_check(value: Path) -> Path:
 
 
 @project_app.command(short_help="Launches a project on a browser")
-def launch(project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT")):
+def launch(
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    )
+):
     """
     Launches a Project on a browser.
 
@@ -80,8 +88,10 @@ def launch(project_name: str = typer.Argument(..., help="Project name", envvar="
 
 @node_app.command(short_help="Initial bootsrtap config on a Node")
 def bootstrap(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     render: bool = typer.Option(False, "--render", "-r", help="Renders configuration only."),
     render_output: Optional[Path] = typer.Option(
         None, "--render-output", "-ro", help="Specifies file to send rendered output. Works only with --render set."
@@ -180,8 +190,10 @@ def bootstrap(
 
 @node_app.command(name="config", short_help="Configures a Node.")
 def node_config(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     config_template: Path = typer.Option(..., "--template", "-t", help="Config template file"),
     vars_file: Path = typer.Option(..., "--vars", "-v", help="Variables YAML file. For example: vars.yml"),
     render: bool = typer.Option(False, "--render", "-r", help="Renders configuration only."),
@@ -275,6 +287,9 @@ def project_save(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Filter devices based on the model provided"),
     net_os: Optional[str] = typer.Option(None, "--net-os", "-n", help="Filter devices based on the net_os provided"),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter devices based on the name"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression to select the devices with. i.e. `edge & !lab`"
+    ),
     backup: Optional[Path] = typer.Option(None, "--backup", "-b", help="Backup directory location"),
     silent: bool = typer.Option(False, "--silent", "-s", help="Silent mode", envvar="LABBY_SILENT"),
 ):
@@ -293,14 +308,7 @@ def project_save(
             backup.mkdir(parents=True)
 
     # Apply filters
-    if model:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: model == n.data["labby_obj"].model)  # type: ignore
-    elif net_os:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: net_os == n.data["labby_obj"].net_os)  # type: ignore
-    elif name:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: name in n.data["labby_obj"].name)  # type: ignore
-    else:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: n.data["labby_obj"].config_managed)  # type: ignore
+    nr_filtered = filter_project_nornir(project, model=model, net_os=net_os, name=name, labels=labels)
 
     utils.console.log(
         f"[b]({project.name})[/] Devices to configure: [i dark_orange3]{list(nr_filtered.inventory.hosts.keys())}[/]"
@@ -321,6 +329,9 @@ def project_config(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Filter devices based on the model provided"),
     net_os: Optional[str] = typer.Option(None, "--net-os", "-n", help="Filter devices based on the net_os provided"),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter devices based on the name"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression to select the devices with. i.e. `edge & !lab`"
+    ),
 ):
     """
     Builds and applies configuration to the nodes specified on the project file.
@@ -332,14 +343,7 @@ def project_config(
     project, project_data = sync_project_data(project_file)
 
     # Apply filters
-    if model:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: model == n.data["labby_obj"].model)  # type: ignore
-    elif net_os:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: net_os == n.data["labby_obj"].net_os)  # type: ignore
-    elif name:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: name in n.data["labby_obj"].name)  # type: ignore
-    else:
-        nr_filtered = project.nornir.filter(filter_func=lambda n: n.data["labby_obj"].config_managed)  # type: ignore
+    nr_filtered = filter_project_nornir(project, model=model, net_os=net_os, name=name, labels=labels)
 
     utils.console.log(
         f"[b]({project.name})[/] Devices to configure: [i dark_orange3]{list(nr_filtered.inventory.hosts.keys())}[/]"
@@ -348,3 +352,102 @@ def project_config(
     utils.console.rule(title="Start section")
     print_result(result)  # type: ignore
     utils.console.rule(title="End section")
+
+
+@project_app.command(name="backup", short_help="Backs up the nodes configuration of a project to the backup store.")
+def project_backup(
+    project_file: Path = typer.Option(..., "--project-file", "-f", help="Project file", envvar="LABBY_PROJECT_FILE"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Filter devices based on the model provided"),
+    net_os: Optional[str] = typer.Option(None, "--net-os", "-n", help="Filter devices based on the net_os provided"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter devices based on the name"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression to select the devices with. i.e. `edge & !lab`"
+    ),
+    store: Optional[Path] = typer.Option(None, "--store", help="Backup store directory. Defaults to `backup_dir`"),
+):
+    # pylint: disable=too-many-locals
+    """
+    Backs up the running configuration of the nodes of a project to the backup store.
+
+    The configurations are collected in parallel with the Nornir runner of the environment. Each one is stored once,
+    compressed and named by its content hash, so configurations that did not change take no space. Each backup run
+    writes a manifest with the configuration of each node. See `labby run project backup-export`.
+
+    Example:
+
+    > labby run project backup --project-file "myproject.yml"
+    """
+    project, _ = get_project_from_file(project_file)
+    store = store or backup_store.get_store_dir()
+    previous = backup_store.get_manifest(store, project.name)
+
+    # Apply filters
+    nr_filtered = filter_project_nornir(project, model=model, net_os=net_os, name=name, labels=labels)
+
+    utils.console.log(
+        f"[b]({project.name})[/] Devices to back up: [i dark_orange3]{list(nr_filtered.inventory.hosts.keys())}[/]"
+    )
+    result = nr_filtered.run(task=backup_task)
+
+    manifest = backup_store.BackupManifest(project=project.name, created=datetime.utcnow())
+    table = Table(title=f"Config Backup: {project.name}", highlight=True)
+    table.add_column("Node")
+    table.add_column("Status")
+    table.add_column("Digest")
+    table.add_column("Size")
+    for host_name, host_result in sorted(result.items()):
+        if host_result.failed:
+            manifest.failed.append(host_name)
+            table.add_row(host_name, "[red]failed[/]", "", "")
+            continue
+        config_text = str(host_result[-1].result)
+        digest = manifest.nodes[host_name] = backup_store.write_blob(store, config_text)
+        if previous is None or host_name not in previous.nodes:
+            status = "[green]new[/]"
+        elif previous.nodes[host_name] != digest:
+            status = "[yellow]changed[/]"
+        else:
+            status = "unchanged"
+        table.add_row(host_name, status, digest[:12], f"{len(config_text)}")
+
+    backup_store.write_manifest(store, manifest)
+    utils.console.log(table)
+    utils.console.log(
+        f"[b]({project.name})[/] Backup {manifest.run_id} stored: {len(manifest.nodes)} nodes backed up, "
+        f"{len(manifest.failed)} failed",
+        style="error" if manifest.failed else "good",
+    )
+    if manifest.failed:
+        raise typer.Exit(1)
+
+
+@project_app.command(name="backup-export", short_help="Exports the nodes configuration of a project backup.")
+def project_backup_export(
+    project_file: Path = typer.Option(..., "--project-file", "-f", help="Project file", envvar="LABBY_PROJECT_FILE"),
+    output: Path = typer.Option(..., "--output", "-o", help="Directory to write the `<node>.cfg` files to"),
+    run_id: Optional[str] = typer.Option(None, "--run", "-r", help="Backup run ID. Defaults to the latest backup"),
+    store: Optional[Path] = typer.Option(None, "--store", help="Backup store directory. Defaults to `backup_dir`"),
+):
+    """
+    Exports the nodes configuration of a project backup run, one `<node>.cfg` file per node.
+
+    Example:
+
+    > labby run project backup-export --project-file "myproject.yml" --output /path/to/backup/folder
+    """
+    project_name = ProjectData(project_file).name
+    store = store or backup_store.get_store_dir()
+    manifest = backup_store.get_manifest(store, project_name, run_id=run_id)
+    if manifest is None:
+        run_ids = [x.run_id for x in backup_store.list_manifests(store, project_name)]
+        utils.console.log(f"[b]({project_name})[/] Backup run not found. Backup runs: {run_ids}", style="error")
+        raise typer.Exit(1)
+
+    output.mkdir(parents=True, exist_ok=True)
+    for node_name, digest in manifest.nodes.items():
+        (output / f"{node_name}.cfg").write_text(backup_store.read_blob(store, digest))
+    utils.console.log(
+        f"[b]({project_name})[/] Backup {manifest.run_id} exported to {output.absolute()}: "
+        f"{len(manifest.nodes)} nodes",
+        style="good",
+    )
@@ -6,12 +6,13 @@ Example:
 > labby start --help
 """
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
-from labby.commands.common import get_labby_objs_from_node, get_labby_objs_from_project
+from labby.commands.common import get_labby_objs_from_node, get_labby_objs_from_project, select_project_nodes
 from labby import utils
+from labby.commands.completion import complete_node, complete_project
 
 
 app = typer.Typer(
@@ -25,31 +26,63 @@ class StartNodes(str, Enum):
     # pylint: disable=invalid-name
     one_by_one = "one_by_one"
     all = "all"
+    waves = "waves"
 
 
 @app.command(short_help="Starts a project")
 def project(
-    project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     start_nodes: Optional[StartNodes] = typer.Option(None, help="Strategy to use to start nodes in project"),
     delay: int = typer.Option(10, help="Time to wait starting nodes"),
+    wave_label: List[str] = typer.Option(
+        [], help="Label to start its nodes in a wave, in the given order. Used with --start-nodes waves"
+    ),
+    max_booting: Optional[int] = typer.Option(
+        None, min=1, help="Maximum nodes booting at the same time. Used with --start-nodes waves"
+    ),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression of the nodes to start. i.e. 'edge & !lab'"
+    ),
 ):
     """
     Starts a Project and optionally you can start the nodes.
 
+    With the `waves` strategy the nodes are started concurrently in waves, admitting the next wave once the previous
+    one is started. Waves follow the `--wave-label` order and the `start_after` of the nodes in the project file.
+
+    With `--label` only the nodes matching any of the label expressions are started, used with `--start-nodes`.
+
     Example:
     > labby start project lab01 --start-nodes one_by_one --delay 20
+
+    > labby start project lab01 --start-nodes waves --wave-label spine --wave-label leaf --max-booting 4
+
+    > labby start project lab01 --start-nodes all --label 'edge & !lab'
     """
+    if start_nodes != StartNodes.waves:
+        if wave_label:
+            raise typer.BadParameter("Only used with --start-nodes waves", param_hint="'--wave-label'")
+        if max_booting is not None:
+            raise typer.BadParameter("Only used with --start-nodes waves", param_hint="'--max-booting'")
+    if labels and start_nodes is None:
+        raise typer.BadParameter("Only used with --start-nodes", param_hint="'--label'")
+
     # Get Labby objects from project definition
     _, prj = get_labby_objs_from_project(project_name=project_name)
+    names = select_project_nodes(prj, labels)
 
     # Start project
-    prj.start(start_nodes=start_nodes, nodes_delay=delay)
+    prj.start(start_nodes=start_nodes, nodes_delay=delay, labels_order=wave_label, max_booting=max_booting, names=names)
 
 
 @app.command(short_help="Starts a node")
 def node(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
 ):
     """
     Starts a Node.
@@ -5,10 +5,13 @@ Handles all stop related actions for labby resources.
 Example:
 > labby stop --help
 """
+from typing import List, Optional
+
 import typer
 
-from labby.commands.common import get_labby_objs_from_node, get_labby_objs_from_project
+from labby.commands.common import get_labby_objs_from_node, get_labby_objs_from_project, select_project_nodes
 from labby import utils
+from labby.commands.completion import complete_node, complete_project
 
 
 app = typer.Typer(
@@ -18,27 +21,44 @@ app = typer.Typer(
 
 @app.command(short_help="Stops a project")
 def project(
-    project_name: str = typer.Argument(..., help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Argument(
+        ..., help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     stop_nodes: bool = typer.Option(True, help="Strategy to use to start nodes in project"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-l", help="Label expression of the nodes to stop, keeping the project open. i.e. 'edge'"
+    ),
 ):
     """
     Stops a Project and optionally stops the nodes preemptively.
 
+    With `--label` only the nodes matching any of the label expressions are stopped, and the project is kept open.
+
     Example:
 
     > labby stop project lab01
+
+    > labby stop project lab01 --label 'edge & !lab'
     """
     # Get Labby objects from project definition
     _, prj = get_labby_objs_from_project(project_name=project_name)
 
+    # Stop the selected nodes only
+    names = select_project_nodes(prj, labels)
+    if names is not None:
+        prj.stop_nodes(names=names)
+        return
+
     # Stop project
     prj.stop(stop_nodes=stop_nodes)
 
 
 @app.command(short_help="Stops a node")
 def node(
-    node_name: str = typer.Argument(..., help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Argument(..., help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
 ):
     """
     Stops a Node.
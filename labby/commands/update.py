@@ -17,6 +17,7 @@ from labby.commands.common import (
     get_labby_objs_from_project,
 )
 from labby import utils
+from labby.commands.completion import complete_link_endpoint, complete_node, complete_project, complete_template
 
 app = typer.Typer(
     help="[b orange1]Updates[/b orange1] a [link=https://github.com/davidban77/labby/blob/develop/README.md#42-environments-and-providers]Network Provider Lab[/link] resource"
@@ -91,7 +92,9 @@ def parse_value(value: str, bool_flag: bool, int_flag: bool, float_flag: bool) -
 def project_attr(
     attr: str = typer.Argument(..., help="Attribute to set"),
     value: str = typer.Argument(..., help="Value to set"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     bool_flag: bool = typer.Option(False, "--bool", "-b", help="Value to be parsed as a boolean"),
     int_flag: bool = typer.Option(False, "--int", "-i", help="Value to be parsed as an integer"),
     float_flag: bool = typer.Option(False, "--float", "-f", help="Value to be parsed as a float"),
@@ -115,7 +118,9 @@ def project_attr(
 @project_app.command(name="labels", short_help="Updates the labels of a project")
 def project_labels(
     labels: str = typer.Argument(..., help="Labels to set"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
 ):
     """Update the labels of a Project.
 
@@ -137,8 +142,10 @@ def project_labels(
 def node_attr(
     attr: str = typer.Argument(..., help="Attribute to set"),
     value: str = typer.Argument(..., help="Value to set"),
-    node_name: str = typer.Option(..., "--node", "-n", help="Node name"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Projectname", envvar="LABBY_PROJECT"),
+    node_name: str = typer.Option(..., "--node", "-n", help="Node name", autocompletion=complete_node),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Projectname", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
     bool_flag: bool = typer.Option(False, "--bool", "-b", help="Value to be parsed as a boolean"),
     int_flag: bool = typer.Option(False, "--int", "-i", help="Value to be parsed as an integer"),
     float_flag: bool = typer.Option(False, "--float", "-f", help="Value to be parsed as a float"),
@@ -163,7 +170,9 @@ def node_attr(
 def node_template(
     attr: str = typer.Argument(..., help="Attribute to set"),
     value: str = typer.Argument(..., help="Value to set"),
-    template_name: str = typer.Option(..., "--template", "-t", help="Node Template name"),
+    template_name: str = typer.Option(
+        ..., "--template", "-t", help="Node Template name", autocompletion=complete_template
+    ),
     bool_flag: bool = typer.Option(False, "--bool", "-b", help="Value to be parsed as a boolean"),
     int_flag: bool = typer.Option(False, "--int", "-i", help="Value to be parsed as an integer"),
     float_flag: bool = typer.Option(False, "--float", "-f", help="Value to be parsed as a float"),
@@ -188,11 +197,29 @@ def node_template(
 def link_filter(
     attr: LinkFilter = typer.Argument(..., help="Filter to apply to the link"),
     value: str = typer.Argument(..., help="Value of Link Filter to apply to the link"),
-    project_name: str = typer.Option(..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT"),
-    node_a: str = typer.Option(..., "--node-a", "-na", help="Node name from ENDPOINT A"),
-    port_a: str = typer.Option(..., "--port-a", "-pa", help="Port name from node on ENDPOINT A"),
-    node_b: str = typer.Option(..., "--node-b", "-nb", help="Node name from ENDPOINT B"),
-    port_b: str = typer.Option(..., "--por-b", "-pb", help="Port name from node on ENDPOINT B"),
+    project_name: str = typer.Option(
+        ..., "--project", "-p", help="Project name", envvar="LABBY_PROJECT", autocompletion=complete_project
+    ),
+    node_a: str = typer.Option(
+        ..., "--node-a", "-na", help="Node name from ENDPOINT A", autocompletion=complete_link_endpoint("node_a")
+    ),
+    port_a: str = typer.Option(
+        ...,
+        "--port-a",
+        "-pa",
+        help="Port name from node on ENDPOINT A",
+        autocompletion=complete_link_endpoint("port_a"),
+    ),
+    node_b: str = typer.Option(
+        ..., "--node-b", "-nb", help="Node name from ENDPOINT B", autocompletion=complete_link_endpoint("node_b")
+    ),
+    port_b: str = typer.Option(
+        ...,
+        "--por-b",
+        "-pb",
+        help="Port name from node on ENDPOINT B",
+        autocompletion=complete_link_endpoint("port_b"),
+    ),
     bool_flag: bool = typer.Option(False, "--bool", "-b", help="Value to be parsed as a boolean"),
     int_flag: bool = typer.Option(False, "--int", "-i", help="Value to be parsed as an integer"),
     float_flag: bool = typer.Option(False, "--float", "-f", help="Value to be parsed as a float"),
@@ -4,8 +4,9 @@ import os
 import re
 import typer
 import toml
-from labby.providers import services
+from labby.providers import get_service_id, services
 from labby import utils
+from labby.project_spec import iter_links_spec, iter_nodes_spec
 
 from pathlib import Path
 from typing import MutableMapping, Optional, Dict, List, Any, Literal
@@ -61,7 +62,7 @@ class ProviderSettings(BaseSettings):
 
     Attributes:
         name (str): The name of the provider.
-        kind (Literal["gns3", "eve_ng", "vrnetlab"]): The kind of provider {you} are working with.
+        kind (Literal["gns3", "gns3-async", "eve_ng", "vrnetlab"]): The kind of provider {you} are working with.
         server_url (Optional[AnyUrl]): The URL for the server.
         user (Optional[str]): The name for the user.
         password (Optional[SecretStr]): The password for the provider settings.
@@ -69,7 +70,7 @@ class ProviderSettings(BaseSettings):
     """
 
     name: str
-    kind: Literal["gns3", "eve_ng", "vrnetlab"]
+    kind: Literal["gns3", "gns3-async", "eve_ng", "vrnetlab"]
     server_url: Optional[AnyUrl]
     user: Optional[str] = None
     password: Optional[SecretStr] = None
@@ -239,11 +240,19 @@ class LabbySettings(BaseSettings):
     Attributes:
         environment (EnviromentSettings): The settings for the environment.
         state_file (Path): The path of the lock file.
+        cache_dir (Path): The directory of the local read cache.
+        journal_dir (Path): The directory of the project build journals.
+        backup_dir (Path): The directory of the config backup store.
+        cache_max_age (int): Seconds a read cache entry is considered fresh (default=60).
         debug (bool): The debug state (default=False).
     """
 
     environment: EnvironmentSettings
     state_file: Path
+    cache_dir: Path
+    journal_dir: Path
+    backup_dir: Path
+    cache_max_age: int = 60
     debug: bool = False
 
     class Config(LabbyBaseConfig):
@@ -315,7 +324,7 @@ def get_provider() -> LabbyProvider:
     # # Importing at command runtime - not import load time
     # from labby.config import SETTINGS
     env = get_environment()
-    return services.get(env.provider.name, settings=env.provider)
+    return services.get(get_service_id(env.name, env.provider.name), settings=env.provider)
 
 
 def load_toml(config_file: Path) -> MutableMapping:
@@ -391,6 +400,27 @@ def get_provider_settings(provider_name: str, providers_data: Dict[str, Any]) ->
     return ProviderSettings(**provider_args)  # type: ignore
 
 
+def get_environment_providers_settings(
+    environment_name: str, config_data: MutableMapping[str, Any]
+) -> List[ProviderSettings]:
+    """Returns the settings of all the providers of an environment.
+
+    Args:
+        environment_name (str): The name of the environment.
+        config_data (MutableMapping[str, Any]): Configuration data.
+
+    Raises:
+        ValueError: If the environment is not found.
+    """
+    try:
+        env_settings = config_data.get("environment", {})[environment_name]
+    except KeyError:
+        raise ValueError(f"Environment '{environment_name}' not found")
+
+    providers = env_settings.get("providers", {})
+    return [get_provider_settings(provider_name, providers) for provider_name in providers]
+
+
 def get_nornir_runner_settings(nornir_data: Dict[str, Any]) -> NornirRunner:
     """Returns the Norning Runnner settings."""
     nornir_args: Dict[str, Any] = {}
@@ -478,6 +508,24 @@ def load_config(
     else:
         options: Dict[str, Any] = {"state_file": config_file.parent / ".labby_state.json"}
 
+    if config_data["main"].get("cache_dir"):
+        options.update(cache_dir=get_value(config_data["main"]["cache_dir"]))
+    else:
+        options.update(cache_dir=config_file.parent / ".labby_cache")
+
+    if config_data["main"].get("journal_dir"):
+        options.update(journal_dir=get_value(config_data["main"]["journal_dir"]))
+    else:
+        options.update(journal_dir=config_file.parent / ".labby_journal")
+
+    if config_data["main"].get("backup_dir"):
+        options.update(backup_dir=get_value(config_data["main"]["backup_dir"]))
+    else:
+        options.update(backup_dir=config_file.parent / ".labby_backups")
+
+    if "cache_max_age" in config_data["main"]:
+        options.update(cache_max_age=config_data["main"]["cache_max_age"])
+
     if debug is not None:
         options.update(debug=debug)
 
@@ -543,11 +591,11 @@ def load_project(project_file: Optional[Path]):
     project_data = load_toml(project_file)
 
     nodes_spec = []
-    for node_spec in project_data["nodes_spec"]:
+    for node_spec in iter_nodes_spec(project_data["nodes_spec"]):
         nodes_spec.append(get_project_node_spec(node_spec))
 
     links_spec = []
-    for link_spec in project_data["links_spec"]:
+    for link_spec in iter_links_spec(project_data["links_spec"]):
         links_spec.extend(get_project_link_spec(link_spec))
 
     options = {}
@@ -0,0 +1,331 @@
+"""Labby daemon module.
+
+Long running labby process serving a JSON-RPC 2.0 API over a unix socket, one JSON message per line. It keeps warm
+what each labby command would load again: the provider instances with their HTTP sessions, the projects with their
+nodes, links and Nornir inventory, and the imported command modules.
+
+Methods:
+- `ping`: Daemon process ID, version, uptime and commands served.
+- `run`: Runs a labby command line, sending its output as `output` notifications. Returns its `exit_code`.
+- `reset`: Drops the loaded projects. The client calls it once a command run locally changed the lab.
+- `shutdown`: Stops the daemon.
+
+The loaded projects are only reused by the commands reading with `--cached`, and they are dropped once older than the
+`cache_max_age` setting, so changes made out of labby are seen.
+"""
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import click
+import typer
+
+from labby import __version__, config, utils
+from labby.client import get_socket_path
+from labby.commands import common
+from labby.main import app
+from labby.providers import register_service
+
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+class DaemonOutput(io.TextIOBase):
+    """Text stream sending what is written to it as JSON-RPC `output` notifications."""
+
+    def __init__(self, send: Callable[[Dict[str, Any]], None]) -> None:
+        """Initialize a daemon output stream.
+
+        Args:
+            send (Callable[[Dict[str, Any]], None]): Sends a JSON-RPC message to the client
+        """
+        super().__init__()
+        self._send = send
+
+    def write(self, data: str) -> int:  # type: ignore
+        """Sends the data written to the client."""
+        if not isinstance(data, str):
+            # Tells click this is not a binary stream
+            raise TypeError(f"write() argument must be str, not {data.__class__.__name__}")
+        if data:
+            self._send({"jsonrpc": "2.0", "method": "output", "params": {"data": data}})
+        return len(data)
+
+    def isatty(self) -> bool:
+        """The client only goes through the daemon from a terminal."""
+        return True
+
+
+class LabbyDaemon:
+    # pylint: disable=too-many-instance-attributes
+    """Labby daemon, serving the JSON-RPC API on a unix socket.
+
+    Attributes:
+        socket_path (Path): Unix socket the daemon listens on
+        options (Dict[str, Any]): Main options of the daemon configuration: `config_file`, `environment` and
+            `provider`
+        requests (int): Commands run by the daemon
+    """
+
+    def __init__(self, socket_path: Path, **options: Any) -> None:
+        """Initialize a labby daemon.
+
+        Args:
+            socket_path (Path): Unix socket to listen on
+            options (Any): Main options of the daemon configuration: `config_file`, `environment` and `provider`
+        """
+        self.socket_path = socket_path
+        self.options = options
+        self.requests = 0
+        self._started = time.monotonic()
+        self._projects_loaded = time.monotonic()
+        self._run_lock = threading.Lock()
+        self._command = typer.main.get_command(app)
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def load_config(self) -> None:
+        """Loads the configuration of the daemon and registers its provider."""
+        config_file = self.options.get("config_file") or config.get_config_path()
+        config.load_config(
+            config_file=Path(config_file),
+            environment_name=self.options.get("environment"),
+            provider_name=self.options.get("provider"),
+        )
+        env = config.get_environment()
+        register_service(env.provider.name, env.provider.kind, env.name)
+
+    def ping(self) -> Dict[str, Any]:
+        """Returns the state of the daemon."""
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "uptime": time.monotonic() - self._started,
+            "requests": self.requests,
+            "projects": sorted(common.SESSION_PROJECTS or {}),
+        }
+
+    def reset(self) -> Dict[str, Any]:
+        """Drops the loaded projects, so the next commands retrieve them again."""
+        # Not waiting for the command running, which keeps the projects it already got
+        common.SESSION_PROJECTS = {}
+        self._projects_loaded = time.monotonic()
+        return {"pid": os.getpid()}
+
+    def run(
+        self, send: Callable[[Dict[str, Any]], None], args: List[str], cwd: str, env: Dict[str, str], columns: int = 80
+    ) -> Dict[str, Any]:
+        # pylint: disable=too-many-arguments
+        """Runs a labby command line as if it was run by the client.
+
+        Commands run one at a time, as they share the process working directory, environment and console.
+
+        Args:
+            send (Callable[[Dict[str, Any]], None]): Sends a JSON-RPC message to the client
+            args (List[str]): Labby arguments
+            cwd (str): Working directory of the client
+            env (Dict[str, str]): Environment variables of the client
+            columns (int, optional): Terminal width of the client
+
+        Returns:
+            Dict[str, Any]: Command `exit_code`
+        """
+        with self._run_lock:
+            self.requests += 1
+            if config.SETTINGS is not None and time.monotonic() - self._projects_loaded > config.SETTINGS.cache_max_age:
+                common.SESSION_PROJECTS = {}
+                self._projects_loaded = time.monotonic()
+
+            daemon_cwd = os.getcwd()
+            daemon_env = os.environ.copy()
+            output = DaemonOutput(send)
+            try:
+                os.chdir(cwd)
+                os.environ.clear()
+                os.environ.update(env)
+                utils.console.width = columns
+                utils.console.stderr = False
+                with redirect_stdout(output), redirect_stderr(output):  # type: ignore
+                    exit_code = self.invoke(args)
+            finally:
+                # Commands can change the environment too. i.e. with the variables of a .env file
+                os.chdir(daemon_cwd)
+                os.environ.clear()
+                os.environ.update(daemon_env)
+                # The console records its output, which is not used by the daemon
+                utils.console.export_text(clear=True)
+
+        return {"exit_code": exit_code}
+
+    def invoke(self, args: List[str]) -> int:
+        """Invokes the labby CLI with the arguments given.
+
+        Args:
+            args (List[str]): Labby arguments
+
+        Returns:
+            int: Exit code
+        """
+        try:
+            # The exit code of the commands exiting is returned when not standalone
+            result = self._command.main(args=args, prog_name="labby", standalone_mode=False)
+        except click.exceptions.Exit as err:
+            return err.exit_code
+        except click.ClickException as err:
+            err.show()
+            return err.exit_code
+        except click.exceptions.Abort:
+            sys.stderr.write("Aborted!\n")
+            return 1
+        except Exception:  # pylint: disable=broad-except
+            # A failed command must not stop the daemon
+            traceback.print_exc()
+            return 1
+        return result if isinstance(result, int) else 0
+
+    def handle(self, message: Dict[str, Any], send: Callable[[Dict[str, Any]], None]) -> Any:
+        """Runs the method of a JSON-RPC request.
+
+        Args:
+            message (Dict[str, Any]): JSON-RPC request
+            send (Callable[[Dict[str, Any]], None]): Sends a JSON-RPC message to the client
+
+        Raises:
+            LookupError: If the method is not found
+
+        Returns:
+            Any: Method result
+        """
+        method = message.get("method")
+        params = message.get("params") or {}
+        if method == "ping":
+            return self.ping()
+        if method == "run":
+            return self.run(send, **params)
+        if method == "reset":
+            return self.reset()
+        if method == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"pid": os.getpid()}
+        raise LookupError(f"Method not found: {method}")
+
+    def serve_forever(self) -> None:
+        """Listens on the daemon socket and serves the requests until the daemon is shut down."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        common.SESSION_PROJECTS = {}
+        self.load_config()
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            """Labby daemon client connection, one JSON-RPC request per line."""
+
+            def handle(self) -> None:
+                """Answers the requests of the client."""
+                write_lock = threading.Lock()
+
+                def send(message: Dict[str, Any]) -> None:
+                    with write_lock:
+                        self.wfile.write(json.dumps(message).encode() + b"\n")
+                        self.wfile.flush()
+
+                for line in self.rfile:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        send({"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "Parse error"}})
+                        continue
+                    if not isinstance(message, dict) or "method" not in message:
+                        error = {"code": INVALID_REQUEST, "message": "Invalid request"}
+                        send({"jsonrpc": "2.0", "id": None, "error": error})
+                        continue
+                    try:
+                        result = daemon.handle(message, send)
+                    except LookupError as err:
+                        error = {"code": METHOD_NOT_FOUND, "message": str(err)}
+                        send({"jsonrpc": "2.0", "id": message.get("id"), "error": error})
+                    except Exception as err:  # pylint: disable=broad-except
+                        error = {"code": INTERNAL_ERROR, "message": str(err) or err.__class__.__name__}
+                        send({"jsonrpc": "2.0", "id": message.get("id"), "error": error})
+                    else:
+                        send({"jsonrpc": "2.0", "id": message.get("id"), "result": result})
+
+        self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        self._server.daemon_threads = True
+        # Only the user can talk to the daemon, which runs commands as the user
+        self.socket_path.chmod(0o600)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stops serving the requests."""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def call(method: str, params: Optional[Dict[str, Any]] = None, timeout: float = 5.0) -> Any:
+    """Calls a method of the labby daemon.
+
+    Args:
+        method (str): Method name
+        params (Optional[Dict[str, Any]], optional): Method parameters
+        timeout (float, optional): Seconds to wait for the daemon
+
+    Raises:
+        ConnectionError: If the daemon is not running
+        RuntimeError: If the daemon answered with an error
+
+    Returns:
+        Any: Method result
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(get_socket_path()))
+        except OSError as err:
+            raise ConnectionError("Labby daemon is not running") from err
+        sock.sendall(json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}).encode() + b"\n")
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                message = json.loads(line)
+                if "error" in message:
+                    raise RuntimeError(message["error"]["message"])
+                if "result" in message:
+                    return message["result"]
+    raise ConnectionError("Labby daemon closed the connection")
+
+
+def main() -> None:
+    """Runs the labby daemon in the foreground, taking the main options of labby."""
+    parser = argparse.ArgumentParser(prog="labbyd", description="Labby daemon")
+    parser.add_argument("--socket", type=Path, default=get_socket_path(), help="Unix socket to listen on")
+    parser.add_argument("--config-file", "-c", type=Path, help="Path to find labby.toml file")
+    parser.add_argument("--environment", "-e", help="Environment of network lab provider")
+    parser.add_argument("--provider", help="Network Lab provider to use")
+    options = parser.parse_args()
+
+    LabbyDaemon(
+        options.socket, config_file=options.config_file, environment=options.environment, provider=options.provider
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
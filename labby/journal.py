@@ -0,0 +1,150 @@
+"""Build journal module.
+
+Records each step a project build completes in an append-only file, one JSON entry per line, so an interrupted build
+can be resumed from the first step not completed instead of being walked again from the start:
+
+- `node_created` and `link_created` for the nodes and links created. Nodes are looked up in the project instead, so
+  the ones removed since are created again, along with their links.
+- `bootstrapped` and `configured` for the nodes bootstrapped and configured, with the hash of the configuration applied,
+  so the nodes are bootstrapped or configured again when their configuration changes.
+
+Journals are scoped by environment and provider, one per project.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from labby import config
+
+
+class BuildStep(str, Enum):
+    """Build step Enum."""
+
+    # pylint: disable=invalid-name
+    node_created = "node_created"
+    link_created = "link_created"
+    bootstrapped = "bootstrapped"
+    configured = "configured"
+
+
+def get_journal_path(project_name: str) -> Path:
+    """Get the journal file path of a project in the current environment and provider.
+
+    Args:
+        project_name (str): Project name
+
+    Raises:
+        ValueError: Configuration not set
+
+    Returns:
+        Path: Journal Path object
+    """
+    if config.SETTINGS is None:
+        raise ValueError("Configuration is not set")
+    env = config.get_environment()
+    return config.SETTINGS.journal_dir / env.name / env.provider.name / f"{quote(project_name, safe='')}.jsonl"
+
+
+def get_config_hash(config_data: str) -> str:
+    """Get the hash of a node configuration, as recorded in the journal.
+
+    Args:
+        config_data (str): Node configuration
+
+    Returns:
+        str: SHA-256 hex digest of the configuration
+    """
+    return hashlib.sha256(config_data.encode()).hexdigest()
+
+
+class BuildJournal:
+    """Journal of the steps completed by the build of a project.
+
+    Entries are appended and flushed to disk as each step completes, and the journal is safe to use from several
+    threads, i.e. the Nornir runner threads.
+
+    Attributes:
+        project_name (str): Project name
+        path (Path): Journal file path
+    """
+
+    def __init__(self, project_name: str, resume: bool = False, path: Optional[Path] = None) -> None:
+        """Initializes the journal of a project build.
+
+        Args:
+            project_name (str): Project name
+            resume (bool, optional): Keep the steps of the previous build, to resume it. Otherwise the journal is
+                started over. Defaults to False.
+            path (Optional[Path], optional): Journal file path. Defaults to the project journal of the current
+                environment and provider.
+        """
+        self.project_name = project_name
+        self.path = path or get_journal_path(project_name)
+        self._lock = threading.Lock()
+        self._steps: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+        else:
+            self.path.write_text("")
+
+    def _load(self) -> None:
+        content = self.path.read_text()
+        # Entry partially written when the build was interrupted, removed so the next entries start on their own line
+        end = content.rfind("\n") + 1
+        if end < len(content):
+            content = content[:end]
+            self.path.write_text(content)
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._steps[(entry["step"], entry["name"])] = entry
+
+    @property
+    def completed_steps(self) -> int:
+        """Number of build steps completed."""
+        return len(self._steps)
+
+    def is_done(self, step: BuildStep, name: str, config_hash: Optional[str] = None) -> bool:
+        """Checks if a build step was completed.
+
+        Args:
+            step (BuildStep): Build step
+            name (str): Node or link name
+            config_hash (Optional[str], optional): Hash of the configuration to apply. The step is only completed if
+                it applied the same configuration.
+
+        Returns:
+            bool: True if the step was completed
+        """
+        entry = self._steps.get((step.value, name))
+        if entry is None:
+            return False
+        return config_hash is None or entry.get("config_hash") == config_hash
+
+    def record(self, step: BuildStep, name: str, config_hash: Optional[str] = None) -> None:
+        """Records a completed build step.
+
+        Args:
+            step (BuildStep): Build step
+            name (str): Node or link name
+            config_hash (Optional[str], optional): Hash of the configuration applied
+        """
+        entry: Dict[str, Any] = {"timestamp": time.time(), "step": step.value, "name": name}
+        if config_hash is not None:
+            entry["config_hash"] = config_hash
+        with self._lock:
+            with self.path.open("a") as fil:
+                fil.write(json.dumps(entry) + "\n")
+                fil.flush()
+                os.fsync(fil.fileno())
+            self._steps[(step.value, name)] = entry
@@ -0,0 +1,187 @@
+"""Labby labels module.
+
+Selects the nodes and links of a project by label expressions, answered from an inverted index of the labels kept in
+the state file instead of checking the labels of each node.
+
+Expressions combine labels with `&` (and), `|` (or), `!` (not) and parentheses. i.e. `edge & !lab`. Several
+expressions given together, as the repeated `--label` options, match if any of them does. A plain label keeps
+matching the nodes having it.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+TOKEN_PATTERN = re.compile(r"\s*(?:([&|!()])|([^\s&|!()]+))")
+
+# Parsed expression: a label name, or a tuple of the operator and its operands
+LabelExpression = Union[str, Tuple[Any, ...]]
+
+
+def tokenize(expression: str) -> List[str]:
+    """Splits a label expression in its operators and labels.
+
+    Args:
+        expression (str): Label expression
+
+    Raises:
+        ValueError: If the expression has characters not allowed
+
+    Returns:
+        List[str]: Tokens
+    """
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            raise ValueError(f"Label expression not valid: {expression}")
+        tokens.append(match.group(1) or match.group(2))
+        position = match.end()
+    return tokens
+
+
+def parse_label_expression(expression: str) -> LabelExpression:
+    """Parses a label expression. `!` binds tighter than `&`, which binds tighter than `|`.
+
+    Args:
+        expression (str): Label expression. i.e. `(spine | leaf) & !lab`
+
+    Raises:
+        ValueError: If the expression is not valid
+
+    Returns:
+        LabelExpression: Label name, or `("and"|"or", operand, ...)` or `("not", operand)` tuples
+    """
+    tokens = tokenize(expression)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError(f"Label expression not complete: {expression}")
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or() -> LabelExpression:
+        operands = [parse_and()]
+        while peek() == "|":
+            take()
+            operands.append(parse_and())
+        return operands[0] if len(operands) == 1 else ("or", *operands)
+
+    def parse_and() -> LabelExpression:
+        operands = [parse_not()]
+        while peek() == "&":
+            take()
+            operands.append(parse_not())
+        return operands[0] if len(operands) == 1 else ("and", *operands)
+
+    def parse_not() -> LabelExpression:
+        token = take()
+        if token == "!":
+            return ("not", parse_not())
+        if token == "(":
+            operand = parse_or()
+            if take() != ")":
+                raise ValueError(f"Label expression is missing a `)`: {expression}")
+            return operand
+        if token in ("&", "|", ")"):
+            raise ValueError(f"Label expression not valid, unexpected `{token}`: {expression}")
+        return token
+
+    parsed = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Label expression not valid, unexpected `{peek()}`: {expression}")
+    return parsed
+
+
+class LabelIndex:
+    """Inverted index of labels to the names of the resources having them.
+
+    Attributes:
+        names (Dict[str, None]): Names of all the indexed resources, in order
+        labels (Dict[str, Set[str]]): Names of the resources by label
+    """
+
+    __slots__ = ("names", "labels")
+
+    def __init__(self, resources: Dict[str, Iterable[str]]) -> None:
+        """Initialize a label index.
+
+        Args:
+            resources (Dict[str, Iterable[str]]): Labels by resource name
+        """
+        self.names: Dict[str, None] = dict.fromkeys(resources)
+        self.labels: Dict[str, Set[str]] = {}
+        for name, labels in resources.items():
+            for label in labels:
+                self.labels.setdefault(label, set()).add(name)
+
+    @classmethod
+    def from_state_data(cls, names: Iterable[str], resources_state: Dict[str, Any]) -> "LabelIndex":
+        """Builds the index of the labels kept in the state file.
+
+        Args:
+            names (Iterable[str]): Names of the resources. The ones not in the state file have no labels
+            resources_state (Dict[str, Any]): Nodes or links data of a project in the state file, by name
+
+        Returns:
+            LabelIndex: Label index of the resources
+        """
+        return cls({x: (resources_state.get(x) or {}).get("labels") or [] for x in names})
+
+    def evaluate(self, expression: LabelExpression) -> Set[str]:
+        """Returns the names of the resources matching a parsed label expression.
+
+        Args:
+            expression (LabelExpression): Parsed label expression
+
+        Returns:
+            Set[str]: Resource names
+        """
+        if isinstance(expression, str):
+            return self.labels.get(expression, set())
+        operator, *operands = expression
+        if operator == "not":
+            return set(self.names).difference(self.evaluate(operands[0]))
+        matches = [self.evaluate(x) for x in operands]
+        if operator == "and":
+            return set.intersection(*matches)
+        return set.union(*matches)
+
+    def select(self, expressions: Iterable[str]) -> List[str]:
+        """Returns the names of the resources matching any of the label expressions.
+
+        Args:
+            expressions (Iterable[str]): Label expressions
+
+        Raises:
+            ValueError: If an expression is not valid
+
+        Returns:
+            List[str]: Resource names, in the order of the index
+        """
+        matches: Set[str] = set()
+        for expression in expressions:
+            matches.update(self.evaluate(parse_label_expression(expression)))
+        return [x for x in self.names if x in matches]
+
+
+def match_labels(expressions: Iterable[str], labels: Iterable[str]) -> bool:
+    """Returns whether the labels of a single resource match any of the label expressions.
+
+    Args:
+        expressions (Iterable[str]): Label expressions
+        labels (Iterable[str]): Labels of the resource
+
+    Raises:
+        ValueError: If an expression is not valid
+
+    Returns:
+        bool: True if any of the expressions matches
+    """
+    return bool(LabelIndex({"": labels}).select(expressions))
@@ -1,56 +1,173 @@
-"""The main module for labby. All of the labby commands are loaded in this module."""
-from typing import Any, Dict, Optional
+"""The main module for labby.
+
+The command groups are loaded from their modules when they are run, so `labby --help` and the shell completion do not
+import the heavy dependencies (nornir, scrapli, gns3fy, ...) of every command.
+"""
+import importlib
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+import click
 import typer
 import toml
 from dotenv import load_dotenv
+from typer.core import TyperGroup
 
 # from rich.traceback import install as traceback_install
 from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-from nornir.core.plugins.inventory import InventoryPluginRegister
-
-import labby.commands.build
-import labby.commands.configuration
-import labby.commands.run
-import labby.commands.get
-import labby.commands.start
-import labby.commands.restart
-import labby.commands.stop
-import labby.commands.create
-import labby.commands.delete
-import labby.commands.update
-import labby.commands.connect
+
+from labby import cache
 from labby import config
 from labby import utils
 from labby.providers import register_service
-from labby.nornir.plugins.inventory.labby import LabbyNornirInventory
 from labby import __version__
 
 # traceback_install(show_locals=True)
 
 
-InventoryPluginRegister.register("LabbyNornirInventory", LabbyNornirInventory)
+# Command groups by name, with their module, help panel and help
+LAZY_COMMANDS: Dict[str, Dict[str, str]] = {
+    "config": {
+        "import_path": "labby.commands.configuration",
+        "rich_help_panel": "Labby Setup",
+        "help": "Configuration for Labby",
+    },
+    "get": {
+        "import_path": "labby.commands.get",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "[b orange1]Retrieves[/b orange1] information on a [i]resource[/i] from a Network Provider Lab",
+    },
+    "start": {
+        "import_path": "labby.commands.start",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "Runs [b orange1]Start/Boot[/b orange1] actions on Network Provider Lab resources",
+    },
+    "restart": {
+        "import_path": "labby.commands.restart",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "[b orange1]Run restart[/b orange1] actions on a [i]resource[/i] from a Network Provider Lab",
+    },
+    "stop": {
+        "import_path": "labby.commands.stop",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "Runs [b orange1]Stop/Halt[/b orange1] actions on Network Provider Lab resources",
+    },
+    "create": {
+        "import_path": "labby.commands.create",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "[b orange1]Creates[/b orange1] a [i]resource[/i] on a Network Provider Lab",
+    },
+    "delete": {
+        "import_path": "labby.commands.delete",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "[b orange1]Deletes[/b orange1] a [i]resource[/i] on a Network Provider Lab",
+    },
+    "update": {
+        "import_path": "labby.commands.update",
+        "rich_help_panel": "Labby Provider Actions",
+        "help": "[b orange1]Updates[/b orange1] a Network Provider Lab resource",
+    },
+    "build": {
+        "import_path": "labby.commands.build",
+        "rich_help_panel": "Labby Orchestration",
+        "help": "[b orange1]Builds[/b orange1] a complete Network Provider Lab in a declarative way.",
+    },
+    "run": {
+        "import_path": "labby.commands.run",
+        "rich_help_panel": "Labby Ops",
+        "help": "[b orange1]Runs actions[/b orange1] on Network Provider Lab resources",
+    },
+    "connect": {
+        "import_path": "labby.commands.connect",
+        "rich_help_panel": "Labby Ops",
+        "help": "[b orange1]Connects[/b orange1] to a Network Resource",
+    },
+    "daemon": {
+        "import_path": "labby.commands.daemon",
+        "rich_help_panel": "Labby Setup",
+        "help": "Handles the labby daemon, keeping the Network Provider Lab resources loaded between commands",
+    },
+}
+
+RICH_MARKUP_MODE = "rich"
+
+
+class LazyTyperGroup(TyperGroup):
+    """Command group whose module is imported when the group is run or completed.
+
+    Listing it only needs its name and help, the loaded group is used for everything else.
+    """
+
+    def __init__(self, *, name: str, import_path: str, **attrs: Any) -> None:
+        """Initialize a lazy command group.
+
+        Args:
+            name (str): Name of the command group
+            import_path (str): Module of the command group, holding its typer `app`
+            attrs (Any): Arguments of the typer group. i.e. `help` and `rich_help_panel`
+        """
+        super().__init__(name=name, rich_markup_mode=RICH_MARKUP_MODE, **attrs)
+        self.import_path = import_path
+        self._group: Optional[click.Command] = None
+
+    def load(self) -> click.Command:
+        """Imports the module of the command group and builds it.
+
+        Returns:
+            click.Command: Command group
+        """
+        if self._group is None:
+            module = importlib.import_module(self.import_path)
+            wrapper = typer.Typer(rich_markup_mode=RICH_MARKUP_MODE)
+            wrapper.add_typer(module.app, name=self.name, rich_help_panel=self.rich_help_panel)
+            self._group = typer.main.get_group(wrapper).commands[self.name]  # type: ignore
+        return self._group
+
+    def make_context(
+        self, info_name: Optional[str], args: List[str], parent: Optional[click.Context] = None, **extra: Any
+    ) -> click.Context:
+        """Creates the context of the loaded command group, which then runs or completes it."""
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Lists the commands of the loaded command group."""
+        return self.load().list_commands(ctx)  # type: ignore
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Returns a command of the loaded command group."""
+        return self.load().get_command(ctx, cmd_name)  # type: ignore
+
+
+class LabbyGroup(TyperGroup):
+    """Labby main command group, holding the command groups loaded on demand."""
+
+    def __init__(self, **attrs: Any) -> None:
+        """Initialize the Labby main command group."""
+        super().__init__(**attrs)
+        for name, command in LAZY_COMMANDS.items():
+            self.add_command(LazyTyperGroup(name=name, **command))
 
 
 app = typer.Typer(
-    help=f"{utils.banner()} Awesome Network Lab Management Tool!", add_completion=False, rich_markup_mode="rich"
+    cls=LabbyGroup,
+    help=f"{utils.banner()} Awesome Network Lab Management Tool!",
+    add_completion=False,
+    rich_markup_mode=RICH_MARKUP_MODE,
 )
 state = {"verbose": False}
 
-# app.add_typer(labby.commands.projects.app, name="project")
-app.add_typer(labby.commands.configuration.app, name="config", rich_help_panel="Labby Setup")
-app.add_typer(labby.commands.get.app, name="get", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.start.app, name="start", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.restart.app, name="restart", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.stop.app, name="stop", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.create.app, name="create", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.delete.app, name="delete", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.update.app, name="update", rich_help_panel="Labby Provider Actions")
-app.add_typer(labby.commands.build.app, name="build", rich_help_panel="Labby Orchestration")
-app.add_typer(labby.commands.run.app, name="run", rich_help_panel="Labby Ops")
-app.add_typer(labby.commands.connect.app, name="connect", rich_help_panel="Labby Ops")
+# Commands that modify the provider resources and leave the local read cache outdated
+MUTATING_COMMANDS = ["start", "restart", "stop", "create", "delete", "update", "build", "run", "batch"]
+
+
+def report_requests_stats():
+    """Prints the counters of the requests sent to the provider during the command."""
+    try:
+        stats = config.get_provider().render_requests_stats()
+    except (ValueError, typer.Exit):
+        return
+    if stats is not None:
+        utils.console.log(stats)
 
 
 def version_callback(value: bool):
@@ -109,13 +226,45 @@ def main(
 
     # Register each provider environment
     try:
-        register_service(config.SETTINGS.environment.provider.name, config.SETTINGS.environment.provider.kind)
+        env = config.SETTINGS.environment
+        register_service(env.provider.name, env.provider.kind, env.name)
     except AttributeError as err:
         utils.console.print(
             "An attribute was not found in configuration. Most likely is a configuration file issue", style="error"
         )
         raise typer.Exit(1) from err
 
+    if ctx.invoked_subcommand in MUTATING_COMMANDS:
+        ctx.call_on_close(cache.invalidate)
+    if verbose:
+        ctx.call_on_close(report_requests_stats)
+
+
+@app.command(short_help="Runs a batch of operations from a file.", rich_help_panel="Labby Orchestration")
+def batch(
+    ctx: typer.Context,
+    ops_file: Path = typer.Option(
+        Path("labby_ops.yml"), "--ops-file", "-f", help="Operations file", envvar="LABBY_OPS_FILE"
+    ),
+    workers: int = typer.Option(4, min=1, help="Maximum operations running at the same time"),
+    keep_going: bool = typer.Option(
+        False, help="Keep running the operations that do not depend on a failed one, instead of stopping the batch"
+    ),
+):
+    """
+    Runs the labby operations of a file in one process, reusing the provider connection and the loaded projects.
+
+    Operations run in order, or concurrently when they set the operations they run `after`.
+
+    Example:
+
+    > labby batch --ops-file "ops.yml"
+    """
+    # Loaded with the command, like the command groups
+    from labby.commands.batch import run_batch  # pylint: disable=import-outside-toplevel
+
+    run_batch(ctx.find_root(), ops_file=ops_file, workers=workers, keep_going=keep_going)
+
 
 @app.command(short_help="Initialises Labby Configuration file.", rich_help_panel="Labby Setup")
 def init(
@@ -154,7 +303,7 @@ def init(
 
     provider_type = Prompt.ask(
         "[cyan]Network Lab Provider Type",
-        choices=["gns3", "vrnetlab", "eve_ng"],
+        choices=["gns3", "gns3-async", "vrnetlab", "eve_ng"],
         default="gns3",
     )
 
@@ -172,6 +321,9 @@ def init(
     }
 
     rendered_data = toml.dumps(config_data)
+    # Syntax highlighting loads pygments, only needed here
+    from rich.syntax import Syntax  # pylint: disable=import-outside-toplevel
+
     utils.console.print(
         Syntax(
             rendered_data,
@@ -4,13 +4,52 @@
 # pylint: disable=too-few-public-methods
 # pylint: disable=no-name-in-module
 import abc
-from typing import Dict, Optional, List, Any
+from typing import Callable, Dict, Iterator, Optional, List, Any
 
 from nornir.core import Nornir
 from pydantic import BaseModel
 from pydantic.fields import Field
 from rich.console import ConsoleRenderable
 
+from labby import state_file
+from labby.labels import LabelIndex
+from labby.topology import Topology
+from labby.utils import console, select_rows
+
+
+# Fields of the nodes and links summary. Stable between releases, as they are the machine-readable output fields
+NODE_SUMMARY_FIELDS = [
+    "name",
+    "status",
+    "kind",
+    "category",
+    "net_os",
+    "model",
+    "version",
+    "builtin",
+    "template",
+    "console",
+    "labels",
+    "mgmt_port",
+    "mgmt_addr",
+    "config_managed",
+    "ports",
+    "id",
+]
+LINK_SUMMARY_FIELDS = [
+    "name",
+    "node_a",
+    "port_a",
+    "node_b",
+    "port_b",
+    "status",
+    "capturing",
+    "filters",
+    "labels",
+    "kind",
+    "id",
+]
+
 
 class LabbyNodeTemplate(BaseModel):
     """
@@ -51,6 +90,10 @@ class LabbyNodeTemplate(BaseModel):
     def delete(self) -> bool:
         """Abstract method for LabbyNodeTemplate."""
 
+    @abc.abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """Abstract method for LabbyNodeTemplate."""
+
 
 class LabbyProjectInfo(BaseModel):
     """Project information class, has a name and id attribute."""
@@ -181,6 +224,14 @@ class LabbyNode(BaseModel, abc.ABC):
     def get_config_over_console(self, user: Optional[str] = None, password: Optional[str] = None) -> Optional[str]:
         """Abstract method for LabbyNode."""
 
+    @abc.abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """Abstract method for LabbyNode."""
+
+    @abc.abstractmethod
+    def detail(self, properties: bool = False) -> Dict[str, Any]:
+        """Abstract method for LabbyNode."""
+
 
 class LabbyLinkEndpoint(BaseModel):
     """
@@ -244,8 +295,138 @@ class LabbyLink(BaseModel, abc.ABC):
     def apply_filters(self, **kwargs) -> bool:
         """Abstract method for LabbyLink."""
 
+    @abc.abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """Abstract method for LabbyLink."""
 
-class LabbyProject(BaseModel, abc.ABC):
+
+class LabbyProjectSummary:
+    """
+    Read only listing of the nodes and links of a project, shared by the projects and their compact views.
+
+    The classes using it have the `nodes` and `links` mappings, whose values implement `summary()`.
+    """
+
+    __slots__ = ()
+
+    def get_label_index(self, kind: str) -> LabelIndex:
+        """Builds the inverted index of the node or link labels of the project, from the state file.
+
+        Args:
+            kind (str): Resources to index. One of `nodes` or `links`.
+
+        Returns:
+            LabelIndex: Label index of the resources.
+        """
+        project_state_data = state_file.get_project_data(self.name) or {}  # type: ignore # pylint: disable=no-member
+        resources = getattr(self, kind)
+        return LabelIndex.from_state_data(resources, project_state_data.get(kind, {}))
+
+    def select_nodes(self, labels: List[str]) -> List[str]:
+        """Returns the names of the nodes matching any of the label expressions. See `labby.labels`.
+
+        Args:
+            labels (List[str]): Label expressions. i.e. `edge & !lab`
+
+        Raises:
+            ValueError: If a label expression is not valid
+
+        Returns:
+            List[str]: Node names, in the project order.
+        """
+        return self.get_label_index("nodes").select(labels)
+
+    def select_links(self, labels: List[str]) -> List[str]:
+        """Returns the names of the links matching any of the label expressions. See `labby.labels`.
+
+        Args:
+            labels (List[str]): Label expressions. i.e. `core | !lab`
+
+        Raises:
+            ValueError: If a label expression is not valid
+
+        Returns:
+            List[str]: Link names, in the project order.
+        """
+        return self.get_label_index("links").select(labels)
+
+    def filter_nodes(
+        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+    ) -> Iterator[LabbyNode]:
+        """Iterates over the nodes matching an attribute value and any of the label expressions given.
+
+        Args:
+            field (Optional[str], optional): Field to filter on.
+            value (Optional[str], optional): Value to filter on.
+            labels (Optional[List[str]], optional): Label expressions to filter on. See `select_nodes`.
+
+        Yields:
+            Iterator[LabbyNode]: Nodes matching the filters.
+        """
+        nodes = self.nodes  # type: ignore # pylint: disable=no-member
+        for name in self.select_nodes(labels) if labels else nodes:
+            node = nodes[name]
+            if field and getattr(node, field) != value:
+                continue
+            yield node
+
+    def filter_links(
+        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+    ) -> Iterator[LabbyLink]:
+        """Iterates over the links matching an attribute value and any of the label expressions given.
+
+        Args:
+            field (Optional[str], optional): Field to filter on.
+            value (Optional[str], optional): Value to filter on.
+            labels (Optional[List[str]], optional): Label expressions to filter on. See `select_links`.
+
+        Yields:
+            Iterator[LabbyLink]: Links matching the filters.
+        """
+        links = self.links  # type: ignore # pylint: disable=no-member
+        for name in self.select_links(labels) if labels else links:
+            link = links[name]
+            if field and getattr(link, field) != value:
+                continue
+            yield link
+
+    def iter_nodes_summary(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over the summary of the nodes matching the filters. See `filter_nodes` and `utils.select_rows`."""
+        nodes_summary = (node.summary() for node in self.filter_nodes(field=field, value=value, labels=labels))
+        return select_rows(nodes_summary, sort=sort, limit=limit, offset=offset)
+
+    def iter_links_summary(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over the summary of the links matching the filters. See `filter_links` and `utils.select_rows`."""
+        links_summary = (link.summary() for link in self.filter_links(field=field, value=value, labels=labels))
+        return select_rows(links_summary, sort=sort, limit=limit, offset=offset)
+
+    def get_topology(self) -> Topology:
+        """Builds the topology graph of the project nodes and links. See `labby.topology.Topology`.
+
+        Returns:
+            Topology: Topology of the project.
+        """
+        links_summary = (link.summary() for link in self.links.values())  # type: ignore # pylint: disable=no-member
+        return Topology.from_links_summary(self.nodes, links_summary)  # type: ignore # pylint: disable=no-member
+
+
+class LabbyProject(BaseModel, LabbyProjectSummary, abc.ABC):
     """
     A Labby Project class.
 
@@ -283,7 +464,14 @@ class LabbyProject(BaseModel, abc.ABC):
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
-    def start(self, start_nodes: Optional[str], nodes_delay: int = 5) -> bool:
+    def start(
+        self,
+        start_nodes: Optional[str],
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> bool:
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
@@ -299,11 +487,18 @@ class LabbyProject(BaseModel, abc.ABC):
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
-    def start_nodes(self, start_nodes: str, nodes_delay: int = 5) -> None:
+    def start_nodes(
+        self,
+        start_nodes: str,
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> None:
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
-    def stop_nodes(self) -> None:
+    def stop_nodes(self, names: Optional[List[str]] = None) -> None:
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
@@ -314,6 +509,34 @@ class LabbyProject(BaseModel, abc.ABC):
     def create_node(self, name: str, template: str, labels: List[str] = [], **kwargs) -> LabbyNode:
         """Abstract method for LabbyProject."""
 
+    def place_nodes(self, nodes_spec: List[Dict[str, Any]], strategy: str) -> List[Dict[str, Any]]:
+        """Assign where to run the nodes to create, based on their specs and a placement strategy.
+
+        Providers with a single host to run the nodes return the specs as they are.
+        """
+        console.log(
+            f"[b]({self.name})[/] Placement strategy [cyan i]{strategy}[/] not supported by the provider, "
+            "the nodes run on its single host",
+            style="warning",
+        )
+        return nodes_spec
+
+    def create_nodes(
+        self, nodes_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[LabbyNode]:
+        """Create multiple nodes from their specs, each one holding the arguments of `create_node`.
+
+        `on_created` is called with the spec of each node as soon as it is created, i.e. to record the build progress.
+
+        Providers able to create them concurrently override this method.
+        """
+        nodes = []
+        for node_spec in nodes_spec:
+            nodes.append(self.create_node(**node_spec))
+            if on_created:
+                on_created(node_spec)
+        return nodes
+
     # @abc.abstractmethod
     # def delete_node(self) -> None:
 
@@ -334,18 +557,52 @@ class LabbyProject(BaseModel, abc.ABC):
     ) -> LabbyLink:
         """Abstract method for LabbyProject."""
 
+    def create_links(
+        self, links_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[LabbyLink]:
+        """Create multiple links from their specs, each one holding the arguments of `create_link`.
+
+        `on_created` is called with the spec of each link as soon as it is created, i.e. to record the build progress.
+
+        Providers able to create them concurrently override this method.
+        """
+        links = []
+        for link_spec in links_spec:
+            links.append(self.create_link(**link_spec))
+            if on_created:
+                on_created(link_spec)
+        return links
+
     # @abc.abstractmethod
     # def delete_link(self, node_a: str, port_a: str, node_b: str, port_b: str) -> None:
 
+    @abc.abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """Abstract method for LabbyProject."""
+
     @abc.abstractmethod
     def render_nodes_summary(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        columns: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> ConsoleRenderable:
         """Abstract method for LabbyProject."""
 
     @abc.abstractmethod
     def render_links_summary(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        columns: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> ConsoleRenderable:
         """Abstract method for LabbyProject."""
 
@@ -380,7 +637,19 @@ class LabbyProvider(BaseModel, abc.ABC):
     # def get_projects(self) -> List[LabbyProject]:
 
     @abc.abstractmethod
-    def search_project(self, project_name: str) -> Optional[LabbyProject]:
+    def get_projects_data(self, cached: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def get_templates_ports(self, cached: Optional[bool] = None) -> Dict[str, Optional[List[str]]]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def search_project(self, project_name: str, cached: Optional[bool] = None) -> Optional[LabbyProject]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def search_project_view(self, project_name: str, cached: Optional[bool] = None) -> Optional[LabbyProjectSummary]:
         """Abstract method for LabbyProvider."""
 
     @abc.abstractmethod
@@ -405,11 +674,41 @@ class LabbyProvider(BaseModel, abc.ABC):
     # def stop_project(self, project: str) -> LabbyProject:
 
     @abc.abstractmethod
-    def render_templates_list(self, field: Optional[str] = None, value: Optional[str] = None) -> ConsoleRenderable:
+    def iter_templates_list(
+        self, field: Optional[str] = None, value: Optional[str] = None, cached: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def iter_project_list(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        cached: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def render_project_row(self, project_data: Dict[str, Any]) -> List[str]:
+        """Abstract method for LabbyProvider."""
+
+    @abc.abstractmethod
+    def render_templates_list(
+        self, field: Optional[str] = None, value: Optional[str] = None, cached: Optional[bool] = None
+    ) -> ConsoleRenderable:
         """Abstract method for LabbyProvider."""
 
     @abc.abstractmethod
     def render_project_list(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        cached: Optional[bool] = None,
     ) -> ConsoleRenderable:
         """Abstract method for LabbyProvider."""
+
+    def render_requests_stats(self) -> Optional[ConsoleRenderable]:
+        """Render the counters of the requests sent to the provider. None if the provider does not keep them."""
+        return None
@@ -0,0 +1,165 @@
+"""Local name index module.
+
+Keeps on disk the names of the projects, templates, nodes, ports and links of the current environment and provider,
+as seen by the last successful listings. It is used by the shell completion, which answers without reaching the
+provider. Unlike the read cache entries it has no expiration, and it is not invalidated by the commands that modify
+the lab: those update the state file, which the completion reads as well.
+"""
+import functools
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from labby import config, utils
+
+# Serializes the read-modify-write of the index, i.e. between the projects of a parallel build
+_index_lock = threading.RLock()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def locked(func: F) -> F:
+    """Decorator running a function holding the name index lock."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _index_lock:
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def get_index_path() -> Path:
+    """Get the name index file of the current environment and provider.
+
+    Raises:
+        ValueError: Configuration not set
+
+    Returns:
+        Path: Name index Path object
+    """
+    if config.SETTINGS is None:
+        raise ValueError("Configuration is not set")
+    env = config.get_environment()
+    return config.SETTINGS.cache_dir / env.name / f"{env.provider.name}.names.json"
+
+
+def read_index() -> Dict[str, Any]:
+    """Read the name index.
+
+    Returns:
+        Dict[str, Any]: Names of the `projects` and `templates`, and by project name of its `nodes`, `ports` (by node
+            name) and `links`
+    """
+    index_path = get_index_path()
+    if not index_path.exists():
+        return {}
+
+    try:
+        return json.loads(index_path.read_text())
+    except ValueError:
+        return {}
+
+
+def save_index(index: Dict[str, Any]) -> None:
+    """Save the name index.
+
+    Args:
+        index (Dict[str, Any]): Name index data
+    """
+    index_path = get_index_path()
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so the completion never reads a partial index
+    utils.write_text_atomic(index_path, json.dumps(index))
+
+
+@locked
+def index_projects(names: List[str]) -> None:
+    """Replace the project names of the index.
+
+    Args:
+        names (List[str]): Project names
+    """
+    index = read_index()
+    index["projects"] = sorted(names)
+    for project_name in list(index.get("nodes", {})):
+        if project_name not in names:
+            remove_project(project_name, index=index)
+    save_index(index)
+
+
+@locked
+def index_templates(names: List[str]) -> None:
+    """Replace the template names of the index.
+
+    Args:
+        names (List[str]): Template names
+    """
+    index = read_index()
+    if index.get("templates") == sorted(names):
+        return
+    index["templates"] = sorted(names)
+    save_index(index)
+
+
+@locked
+def index_project(project_name: str, ports: Dict[str, List[str]], links: List[str]) -> None:
+    """Replace the node, port and link names of a project in the index.
+
+    Args:
+        project_name (str): Project name
+        ports (Dict[str, List[str]]): Port names by node name
+        links (List[str]): Link names
+    """
+    index = read_index()
+    names = {"nodes": sorted(ports), "ports": ports, "links": sorted(links)}
+    # Projects are indexed on each refresh, the index is only written when their names change
+    if project_name in index.get("projects", []) and all(
+        index.get(kind, {}).get(project_name) == value for kind, value in names.items()
+    ):
+        return
+    if project_name not in index.setdefault("projects", []):
+        index["projects"] = sorted(index["projects"] + [project_name])
+    for kind, value in names.items():
+        index.setdefault(kind, {})[project_name] = value
+    save_index(index)
+
+
+@locked
+def remove_project(project_name: str, index: Optional[Dict[str, Any]] = None) -> None:
+    """Remove a project and its nodes, ports and links from the index.
+
+    Args:
+        project_name (str): Project name
+        index (Optional[Dict[str, Any]], optional): Index data to update. If not set, the index is read and saved.
+    """
+    _index = read_index() if index is None else index
+    if project_name in _index.get("projects", []):
+        _index["projects"].remove(project_name)
+    for kind in ("nodes", "ports", "links"):
+        _index.get(kind, {}).pop(project_name, None)
+    if index is None:
+        save_index(_index)
+
+
+@locked
+def remove_names(project_name: str, nodes: List[str] = [], links: List[str] = []) -> None:
+    # pylint: disable=dangerous-default-value
+    """Remove nodes and links of a project from the index.
+
+    Args:
+        project_name (str): Project name
+        nodes (List[str], optional): Node names
+        links (List[str], optional): Link names
+    """
+    index = read_index()
+    for node_name in nodes:
+        if node_name in index.get("nodes", {}).get(project_name, []):
+            index["nodes"][project_name].remove(node_name)
+        index.get("ports", {}).get(project_name, {}).pop(node_name, None)
+    for link_name in links:
+        if link_name in index.get("links", {}).get(project_name, []):
+            index["links"][project_name].remove(link_name)
+    save_index(index)
@@ -1,57 +1,112 @@
-"""Labby Nornir Inventory Plugin."""
-from typing import Any, Dict
+"""Labby Nornir Inventory Plugin.
+
+The hosts data is read from the live node objects of the project, and the connection options shared by all the
+hosts are set once in the inventory defaults.
+"""
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator
 
 from ipaddress import IPv4Interface
 from nornir.core.inventory import Inventory, Hosts, Host, Groups, ConnectionOptions, Defaults
 from nornir.core.plugins.inventory import InventoryPlugin
 
-from labby.models import LabbyProject
-
+from labby.models import LabbyNode, LabbyProject
 
-def _set_host(data: Dict[str, Any], name: str, groups, host, host_platform) -> Host:
-    """Creates Nornir Hosts object from data passed.
 
-    Args:
-        data (Dict[str, Any]): Host data returned to Nornir
-        name (str): Host name
-        groups (_type_): Groups for hosts
-        host (_type_): Host object
-        host_platform (_type_): Host platform
+def get_default_connection_options() -> Dict[str, ConnectionOptions]:
+    """Returns the connection options shared by the hosts. Their platform is taken from each host.
 
     Returns:
-        Host: Nornir Host
+        Dict[str, ConnectionOptions]: Connection options by connection plugin
     """
-    connection_option = {
+    return {
         "scrapli": ConnectionOptions(
-            port=host.get("port", 22),
-            username=host.get("username", "netops"),
-            password=host.get("password", "netops123"),
-            platform=host_platform,
-            extras=host.get(
-                "extras",
-                {
-                    "auth_strict_key": False,
-                    "transport_options": {
-                        "open_cmd": [
-                            "-o",
-                            "KexAlgorithms=+diffie-hellman-group1-sha1,diffie-hellman-group14-sha1,"
-                            "diffie-hellman-group-exchange-sha1",
-                        ]
-                    },
+            port=22,
+            username="netops",
+            password="netops123",
+            extras={
+                "auth_strict_key": False,
+                "transport_options": {
+                    "open_cmd": [
+                        "-o",
+                        "KexAlgorithms=+diffie-hellman-group1-sha1,diffie-hellman-group14-sha1,"
+                        "diffie-hellman-group-exchange-sha1",
+                    ]
                 },
-            ),
+            },
         )
     }
 
+
+class LabbyHostData(MutableMapping):
+    """Data of a Nornir host, read from its Labby node when accessed.
+
+    Keys:
+    - `labby_obj`: The Labby node.
+    - `labby_dict`: The node attributes as a dictionary, serialized from the node on each access so it is up to date.
+
+    Other keys can be set on it, as on the data of any Nornir host.
+    """
+
+    lazy_keys: Dict[str, Callable[[LabbyNode], Any]] = {"labby_dict": lambda node: node.dict()}
+
+    def __init__(self, node: LabbyNode) -> None:
+        """Initialize the data of a host.
+
+        Args:
+            node (LabbyNode): Labby node of the host
+        """
+        self._data: Dict[str, Any] = {"labby_obj": node}
+
+    def __getitem__(self, key: str) -> Any:
+        """Returns the value of a key, reading the lazy keys from the node."""
+        if key in self._data:
+            return self._data[key]
+        if key in self.lazy_keys:
+            return self.lazy_keys[key](self._data["labby_obj"])
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Sets the value of a key."""
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Removes a key set on the host data."""
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the keys set and the lazy keys."""
+        yield from self._data
+        yield from (x for x in self.lazy_keys if x not in self._data)
+
+    def __len__(self) -> int:
+        """Number of keys set and lazy keys."""
+        return len(self._data) + len([x for x in self.lazy_keys if x not in self._data])
+
+    def __repr__(self) -> str:
+        """Representation with the node name and the keys."""
+        return f"{self.__class__.__name__}(node={self._data['labby_obj'].name!r}, keys={list(self)!r})"
+
+
+def _set_host(node: LabbyNode, groups, host_platform, defaults: Defaults) -> Host:
+    """Creates Nornir Hosts object from a Labby node.
+
+    Args:
+        node (LabbyNode): Labby node
+        groups (_type_): Groups for hosts
+        host_platform (_type_): Host platform
+        defaults (Defaults): Inventory defaults, with the connection options shared by the hosts
+
+    Returns:
+        Host: Nornir Host
+    """
     return Host(
-        name=name,
-        hostname=host["hostname"],
-        username=host.get("username"),
-        password=host.get("password"),
+        name=node.name,
+        hostname=str(IPv4Interface(node.mgmt_addr).ip) if node.mgmt_addr else node.name,
         platform=host_platform,
-        data=data,
+        data=LabbyHostData(node),  # type: ignore
         groups=groups,
-        connection_options=connection_option,
+        defaults=defaults,
     )
 
 
@@ -75,25 +130,10 @@ class LabbyNornirInventory(InventoryPlugin):
         """
         hosts = Hosts()
         groups = Groups()
-        defaults = Defaults()
+        defaults = Defaults(connection_options=get_default_connection_options())
 
         for _, node in self.project.nodes.items():
-            host: Dict[Any, Any] = {"data": {}}
-
-            host["data"]["labby_obj"] = node
-
-            host["data"]["labby_dict"] = node.dict()
-
-            host["hostname"] = str(IPv4Interface(node.mgmt_addr).ip) if node.mgmt_addr else node.name
-
-            host["name"] = node.name
-
-            host["groups"] = []
-
             host_platform = node.net_os if node.net_os != "cisco_ios" else "cisco_iosxe"
-
-            hosts[node.name] = _set_host(
-                data=host["data"], name=host["name"], groups=host["groups"], host=host, host_platform=host_platform
-            )
+            hosts[node.name] = _set_host(node=node, groups=[], host_platform=host_platform, defaults=defaults)
 
         return Inventory(hosts=hosts, groups=groups, defaults=defaults)
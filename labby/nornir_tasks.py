@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 
-from nornir.core.task import Task
+from nornir.core.task import Result, Task
 from nornir_scrapli.tasks import send_config, send_command
 from nornir.core.helpers.jinja_helper import render_from_file
 
+from labby.journal import BuildJournal, BuildStep, get_config_hash
 from labby.models import LabbyProject
 from labby import utils
 
@@ -60,13 +61,20 @@ def save_task(task: Task, backup: Optional[Path]):
             fil.write(response.result)
 
 
-def config_task(task: Task, project_data: ProjectData, project: LabbyProject):
+def config_task(
+    task: Task, project_data: ProjectData, project: LabbyProject, journal: Optional[BuildJournal] = None
+) -> Optional[Result]:
     """Task to render and apply configuration to devices.
 
     Args:
         task (Task): Nornir task object
         project_data (ProjectData): Labby ProjectData object
         project (LabbyProject): Labby Project object
+        journal (Optional[BuildJournal], optional): Build journal. The configuration is not applied again if the
+            journal records it was already applied, and it is recorded once applied.
+
+    Returns:
+        Optional[Result]: Result of the devices skipped because their configuration was already applied
     """
     cfg_data = render_from_file(
         path=str(Path(project_data.template).parent),
@@ -74,4 +82,11 @@ def config_task(task: Task, project_data: ProjectData, project: LabbyProject):
         jinja_filters={"ipaddr": utils.ipaddr_renderer},
         **dict(project=project, node=task.host.data["labby_obj"], **project_data.vars),
     )
+    config_hash = get_config_hash(cfg_data)
+    if journal and journal.is_done(BuildStep.configured, task.host.name, config_hash=config_hash):
+        return Result(host=task.host, result="Configuration already applied")
+
     task.run(task=send_config, config=cfg_data)
+    if journal:
+        journal.record(BuildStep.configured, task.host.name, config_hash=config_hash)
+    return None
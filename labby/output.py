@@ -0,0 +1,154 @@
+"""Output of the labby get commands.
+
+Machine-readable output: the rows are written to stdout as they are produced, so a listing can be piped to another
+tool before it is complete. The log messages go to stderr meanwhile, leaving stdout with the data only.
+
+Formats:
+- `table`: Rich tables, the default.
+- `json`: A JSON array of rows, or a JSON object for a detail.
+- `ndjson`: One JSON object per line.
+- `csv`: A header with the fields of the first row, then one line per row. Lists and mappings are JSON encoded.
+
+Tables of many rows can be paged instead, rendering only the rows of the page displayed.
+"""
+import csv
+import json
+import os
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import typer
+from rich.console import ConsoleRenderable
+
+from labby import utils
+
+
+# Set while the console is shared by several commands, i.e. the operations of a batch, which keep it where it is
+KEEP_CONSOLE_STREAM = False
+
+
+class OutputFormat(str, Enum):
+    """Output Format enum."""
+
+    # pylint: disable=invalid-name
+    table = "table"
+    json = "json"
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def setup_output(output: OutputFormat) -> None:
+    """Sends the console messages to stderr when the output is machine-readable.
+
+    Args:
+        output (OutputFormat): Output format of the command
+    """
+    if KEEP_CONSOLE_STREAM:
+        return
+    utils.console.stderr = output != OutputFormat.table
+
+
+def csv_value(value: Any) -> Optional[str]:
+    """Converts a value to a CSV cell.
+
+    Args:
+        value (Any): Field value
+
+    Returns:
+        Optional[str]: Cell value. Lists, mappings and booleans are JSON encoded
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], output: OutputFormat) -> int:
+    """Writes the rows to stdout in the output format given, flushing each one as it is produced.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Rows to write, all with the same fields
+        output (OutputFormat): Output format. One of `json`, `ndjson` or `csv`
+
+    Returns:
+        int: Number of rows written
+    """
+    stream = sys.stdout
+    count = 0
+    writer: Optional[csv.DictWriter] = None
+    try:
+        if output == OutputFormat.json:
+            stream.write("[")
+        for row in rows:
+            if output == OutputFormat.csv:
+                if writer is None:
+                    writer = csv.DictWriter(stream, fieldnames=list(row), extrasaction="ignore", lineterminator="\n")
+                    writer.writeheader()
+                writer.writerow({k: csv_value(v) for k, v in row.items()})
+            elif output == OutputFormat.json:
+                stream.write(("," if count else "") + "\n  " + json.dumps(row, default=str))
+            else:
+                stream.write(json.dumps(row, default=str) + "\n")
+            stream.flush()
+            count += 1
+        if output == OutputFormat.json:
+            stream.write("\n]\n" if count else "]\n")
+        stream.flush()
+    except BrokenPipeError:
+        # The reader stopped reading. i.e. `head`. Python would complain again when flushing stdout at exit
+        try:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), stream.fileno())
+        except (OSError, ValueError):
+            pass
+    return count
+
+
+def write_record(record: Dict[str, Any], output: OutputFormat) -> None:
+    """Writes a record to stdout in the output format given.
+
+    Args:
+        record (Dict[str, Any]): Record to write, i.e. the detail of a resource
+        output (OutputFormat): Output format. One of `json`, `ndjson` or `csv`
+    """
+    if output == OutputFormat.json:
+        sys.stdout.write(json.dumps(record, indent=2, default=str) + "\n")
+        sys.stdout.flush()
+        return
+    write_rows([record], output)
+
+
+def page_table(
+    render_page: Callable[[int, int], ConsoleRenderable], total: int, page_size: Optional[int] = None
+) -> None:
+    """Displays a table page by page, rendering only the rows of the page displayed.
+
+    Keys: `n` or space for the next page, `p` for the previous one and `q` to quit.
+
+    Args:
+        render_page (Callable[[int, int], ConsoleRenderable]): Renders the table of the rows at an offset and limit
+        total (int): Number of rows of the table
+        page_size (Optional[int], optional): Rows per page. By default the rows fitting the terminal, each one taking
+            two lines with the table separators
+    """
+    console = utils.console
+    size = page_size or max((console.height - 10) // 2, 1)
+    if total <= size or not sys.stdin.isatty():
+        # Nothing to page, or nobody to press the keys
+        console.print(render_page(0, total))
+        return
+
+    offset = 0
+    while True:
+        console.clear()
+        console.print(render_page(offset, size))
+        console.print(
+            f"[dim]Rows {offset + 1}-{min(offset + size, total)} of {total}. "
+            "[b]n[/b]ext page, [b]p[/b]revious page, [b]q[/b]uit[/]"
+        )
+        key = typer.getchar()
+        if key in ("n", " ", "j") and offset + size < total:
+            offset += size
+        elif key in ("p", "b", "k") and offset:
+            offset = max(offset - size, 0)
+        elif key in ("q", "\x1b", "\x03"):
+            return
@@ -0,0 +1,166 @@
+"""Labby port index module.
+
+Maps the ports of the project nodes to the links using them, so the port occupancy, free ports and link lookups do
+not scan the links of the project. Built from the project data when it is retrieved, and kept up to date as links
+and nodes are created and deleted.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+Endpoint = Tuple[str, str]
+
+
+class PortIndex:
+    """Index of the links by node and port name.
+
+    Attributes:
+        ports (Dict[str, Dict[str, Optional[str]]]): Ports of each node, in the node order, with the name of the link
+            using them or None if free
+        links (Dict[str, List[Endpoint]]): Endpoints (node name, port name) of each link
+    """
+
+    __slots__ = ("ports", "links")
+
+    def __init__(
+        self,
+        ports: Optional[Dict[str, Iterable[str]]] = None,
+        links: Optional[Dict[str, Iterable[Endpoint]]] = None,
+    ) -> None:
+        """Initialize a port index.
+
+        Args:
+            ports (Optional[Dict[str, Iterable[str]]], optional): Port names by node name
+            links (Optional[Dict[str, Iterable[Endpoint]]], optional): Endpoints by link name
+        """
+        self.ports: Dict[str, Dict[str, Optional[str]]] = {}
+        self.links: Dict[str, List[Endpoint]] = {}
+        self.rebuild(ports or {}, links or {})
+
+    def rebuild(self, ports: Dict[str, Iterable[str]], links: Dict[str, Iterable[Endpoint]]) -> None:
+        """Replaces the content of the index, keeping the same instance for the objects holding it.
+
+        Args:
+            ports (Dict[str, Iterable[str]]): Port names by node name
+            links (Dict[str, Iterable[Endpoint]]): Endpoints by link name
+        """
+        self.ports = {}
+        self.links = {}
+        for node_name, port_names in ports.items():
+            self.add_node(node_name, port_names)
+        for link_name, endpoints in links.items():
+            self.add_link(link_name, endpoints)
+
+    def add_node(self, node_name: str, port_names: Iterable[str]) -> None:
+        """Adds a node with its ports, all free.
+
+        Args:
+            node_name (str): Node name
+            port_names (Iterable[str]): Port names of the node
+        """
+        self.ports[node_name] = {x: None for x in port_names}
+
+    def remove_node(self, node_name: str) -> None:
+        """Removes a node together with its links, as the server deletes them with the node.
+
+        Args:
+            node_name (str): Node name
+        """
+        for link_name in self.get_node_links(node_name):
+            self.remove_link(link_name)
+        self.ports.pop(node_name, None)
+
+    def add_link(self, link_name: str, endpoints: Iterable[Endpoint]) -> None:
+        """Adds a link, marking its ports as used.
+
+        Args:
+            link_name (str): Link name
+            endpoints (Iterable[Endpoint]): Node and port names of the link ends
+        """
+        self.links[link_name] = list(endpoints)
+        for node_name, port_name in self.links[link_name]:
+            self.ports.setdefault(node_name, {})[port_name] = link_name
+
+    def remove_link(self, link_name: str) -> None:
+        """Removes a link, freeing its ports.
+
+        Args:
+            link_name (str): Link name
+        """
+        for node_name, port_name in self.links.pop(link_name, []):
+            node_ports = self.ports.get(node_name, {})
+            if node_ports.get(port_name) == link_name:
+                node_ports[port_name] = None
+
+    def has_port(self, node_name: str, port_name: str) -> bool:
+        """Returns whether the node has the port.
+
+        Args:
+            node_name (str): Node name
+            port_name (str): Port name
+
+        Returns:
+            bool: True if the port is indexed for the node
+        """
+        return port_name in self.ports.get(node_name, {})
+
+    def get_link(self, node_name: str, port_name: str) -> Optional[str]:
+        """Returns the link using a port.
+
+        Args:
+            node_name (str): Node name
+            port_name (str): Port name
+
+        Returns:
+            Optional[str]: Link name, or None if the port is free or not found
+        """
+        return self.ports.get(node_name, {}).get(port_name)
+
+    def find_link(self, node_a: str, port_a: str, node_b: str, port_b: str) -> Optional[str]:
+        """Returns the link between two ports, in any direction.
+
+        Args:
+            node_a (str): Side A node name
+            port_a (str): Side A port name
+            node_b (str): Side B node name
+            port_b (str): Side B port name
+
+        Returns:
+            Optional[str]: Link name, or None if the ports are not linked together
+        """
+        link_name = self.get_link(node_a, port_a)
+        if link_name is not None and (node_b, port_b) in self.links[link_name]:
+            return link_name
+        return None
+
+    def get_used_ports(self, node_name: str) -> List[str]:
+        """Returns the ports of a node with a link.
+
+        Args:
+            node_name (str): Node name
+
+        Returns:
+            List[str]: Port names
+        """
+        return [port for port, link in self.ports.get(node_name, {}).items() if link is not None]
+
+    def get_free_ports(self, node_name: str) -> List[str]:
+        """Returns the ports of a node without a link.
+
+        Args:
+            node_name (str): Node name
+
+        Returns:
+            List[str]: Port names
+        """
+        return [port for port, link in self.ports.get(node_name, {}).items() if link is None]
+
+    def get_node_links(self, node_name: str) -> List[str]:
+        """Returns the links of a node, in the order of its ports.
+
+        Args:
+            node_name (str): Node name
+
+        Returns:
+            List[str]: Link names
+        """
+        return list(dict.fromkeys(link for link in self.ports.get(node_name, {}).values() if link is not None))
@@ -0,0 +1,205 @@
+"""Labby pre-flight module.
+
+Validates a project file against the template catalog of the provider in one pass, before the project is built, so
+mistakes are reported together instead of stopping the build halfway:
+
+- The node names are unique and their templates exist.
+- The `mgmt_port` of the nodes and the ports of the links are ports of the node templates, and no port is used by
+  more than one link. The ports of the templates whose ports depend on the node are not checked.
+- The link ends are nodes of the project file.
+- The management IP range has an address for each node.
+- The management credentials are set.
+"""
+# pylint: disable=no-name-in-module
+from difflib import get_close_matches
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from netaddr import IPNetwork
+from pydantic import BaseModel
+from rich.table import Table
+
+from labby.project_data import ProjectData
+
+
+class PreflightIssue(BaseModel):
+    # pylint: disable=too-few-public-methods
+    """Issue found validating a project file.
+
+    Attributes:
+        resource (str): Resource with the issue. i.e. `node r1` or `link r1: Ethernet1 == r2: Ethernet1`
+        message (str): Description of the issue
+    """
+
+    resource: str
+    message: str
+
+
+def _not_found(kind: str, name: str, choices: Iterable[str]) -> str:
+    message = f"{kind} not found: {name}"
+    matches = get_close_matches(name, list(choices), n=1)
+    return f"{message}. Did you mean {matches[0]}?" if matches else message
+
+
+def check_credentials(project_data: ProjectData) -> List[PreflightIssue]:
+    """Checks the management credentials of a project file are set.
+
+    Args:
+        project_data (ProjectData): Project data of the project file
+
+    Returns:
+        List[PreflightIssue]: Issues found
+    """
+    issues = []
+    raw_creds = project_data.project_data["main"].get("mgmt_creds", {})
+    for field in ["user", "password"]:
+        if getattr(project_data.mgmt_creds, field):
+            continue
+        raw_value = str(raw_creds.get(field) or "")
+        message = f"Management {field} is empty"
+        if raw_value.startswith("${"):
+            message = f"{message}, environment variable not set: {raw_value}"
+        issues.append(PreflightIssue(resource="mgmt_creds", message=message))
+    return issues
+
+
+def check_mgmt_capacity(project_data: ProjectData, nodes_count: int) -> List[PreflightIssue]:
+    """Checks the management IP range has an address for each node.
+
+    Args:
+        project_data (ProjectData): Project data of the project file
+        nodes_count (int): Number of nodes of the project file
+
+    Returns:
+        List[PreflightIssue]: Issues found
+    """
+    available = len(project_data.mgmt_ips)
+    if project_data.mgmt_network.get("gateway"):
+        # The gateway address is skipped when assigning the addresses
+        if IPNetwork(project_data.mgmt_network["gateway"]).ip in project_data.mgmt_ips:
+            available -= 1
+    if nodes_count <= available:
+        return []
+    return [
+        PreflightIssue(
+            resource="mgmt_network",
+            message=f"Management IP range has {available} addresses for {nodes_count} nodes",
+        )
+    ]
+
+
+def check_nodes(
+    nodes_spec: List[Dict[str, Any]], templates_ports: Dict[str, Optional[List[str]]]
+) -> Tuple[List[PreflightIssue], Dict[str, Optional[List[str]]]]:
+    """Checks the node names are unique, their templates exist and their `mgmt_port` is a port of the template.
+
+    Args:
+        nodes_spec (List[Dict[str, Any]]): Nodes specification of the project file
+        templates_ports (Dict[str, Optional[List[str]]]): Port names by template name. None if they depend on the node
+
+    Returns:
+        Tuple[List[PreflightIssue], Dict[str, Optional[List[str]]]]: Issues found, and port names by node name. None
+            if they are not known
+    """
+    issues = []
+    nodes_ports: Dict[str, Optional[List[str]]] = {}
+    for node_spec in nodes_spec:
+        template = node_spec.get("template")
+        if template not in templates_ports:
+            issues.append(
+                PreflightIssue(
+                    resource=f"nodes {node_spec.get('nodes', [])}",
+                    message=_not_found("Template", str(template), templates_ports),
+                )
+            )
+        for node_name in node_spec.get("nodes", []):
+            if node_name in nodes_ports:
+                issues.append(PreflightIssue(resource=f"node {node_name}", message="Node defined more than once"))
+            ports = nodes_ports[node_name] = templates_ports.get(template)
+            mgmt_port = node_spec.get("mgmt_port")
+            if mgmt_port and ports is not None and mgmt_port not in ports:
+                issues.append(
+                    PreflightIssue(resource=f"node {node_name}", message=_not_found("mgmt_port", mgmt_port, ports))
+                )
+    return issues, nodes_ports
+
+
+def check_links(links_spec: List[Dict[str, Any]], nodes_ports: Dict[str, Optional[List[str]]]) -> List[PreflightIssue]:
+    """Checks the link ends are nodes and ports of the project file, and no port is used by more than one link.
+
+    Args:
+        links_spec (List[Dict[str, Any]]): Links specification of the project file
+        nodes_ports (Dict[str, Optional[List[str]]]): Port names by node name. None if they are not known
+
+    Returns:
+        List[PreflightIssue]: Issues found
+    """
+    issues = []
+    used_ports: Dict[Tuple[str, str], str] = {}
+    for link_spec in links_spec:
+        for link_info in link_spec.get("links", []):
+            endpoints = [(link_spec["node"], link_info["port"]), (link_info["node_b"], link_info["port_b"])]
+            link_name = f"{endpoints[0][0]}: {endpoints[0][1]} == {endpoints[1][0]}: {endpoints[1][1]}"
+            for node_name, port_name in endpoints:
+                if node_name not in nodes_ports:
+                    message = _not_found("Node", node_name, nodes_ports)
+                elif nodes_ports[node_name] is not None and port_name not in nodes_ports[node_name]:  # type: ignore
+                    message = _not_found(f"{node_name} port", port_name, nodes_ports[node_name] or [])
+                elif (node_name, port_name) in used_ports:
+                    message = f"Port {node_name}: {port_name} already used by {used_ports[(node_name, port_name)]}"
+                else:
+                    used_ports[(node_name, port_name)] = link_name
+                    continue
+                issues.append(PreflightIssue(resource=f"link {link_name}", message=message))
+    return issues
+
+
+def check_project_data(
+    project_data: ProjectData, templates_ports: Dict[str, Optional[List[str]]]
+) -> List[PreflightIssue]:
+    """Validates a project file against the template catalog of the provider.
+
+    Args:
+        project_data (ProjectData): Project data of the project file
+        templates_ports (Dict[str, Optional[List[str]]]): Port names by template name. None if they depend on the node
+
+    Returns:
+        List[PreflightIssue]: Issues found, empty if the project file is valid
+    """
+    issues = check_credentials(project_data)
+
+    try:
+        nodes_spec = project_data.nodes_spec
+    except ValueError as err:
+        issues.append(PreflightIssue(resource="nodes_spec", message=str(err)))
+        return issues
+    nodes_issues, nodes_ports = check_nodes(nodes_spec, templates_ports)
+    issues.extend(nodes_issues)
+
+    issues.extend(check_mgmt_capacity(project_data, len(nodes_ports)))
+
+    try:
+        links_spec = project_data.links_spec
+    except ValueError as err:
+        issues.append(PreflightIssue(resource="links_spec", message=str(err)))
+        return issues
+    issues.extend(check_links(links_spec, nodes_ports))
+
+    return issues
+
+
+def render_preflight_issues(issues: List[PreflightIssue], title: str) -> Table:
+    """Renders the issues found validating a project file.
+
+    Args:
+        issues (List[PreflightIssue]): Issues found
+        title (str): Table title
+
+    Returns:
+        Table: Issues table
+    """
+    table = Table(title=title, highlight=True)
+    table.add_column("Resource")
+    table.add_column("Issue", style="red")
+    for issue in issues:
+        table.add_row(issue.resource, issue.message)
+    return table
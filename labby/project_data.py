@@ -1,6 +1,7 @@
 """Project Data module."""
 from __future__ import annotations
-from typing import Tuple, TYPE_CHECKING
+from functools import cached_property
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 import typer
@@ -8,7 +9,8 @@ from pydantic import BaseModel
 from netaddr.ip import IPRange
 from netaddr import IPNetwork
 
-from labby import config, utils
+from labby import cache, config, utils
+from labby.project_spec import iter_links_spec, iter_nodes_spec
 
 if TYPE_CHECKING:
     # pylint: disable=all
@@ -49,6 +51,7 @@ class ProjectData:
             self.contributors = self.project_data["main"].get("contributors", [])
             self.template = self.project_data["main"].get("template", "")
             self.labels = self.project_data["main"].get("labels", [])
+            self.placement = self.project_data["main"].get("placement")
 
             # Chek Management IP Addresses
             self.check_mgmt_ips()
@@ -57,9 +60,9 @@ class ProjectData:
             self.mgmt_creds.user = config.get_value(self.mgmt_creds.user)
             self.mgmt_creds.password = config.get_value(self.mgmt_creds.password)
 
-            # Project nodes and links
-            self.nodes_spec = self.project_data.get("nodes_spec", [])
-            self.links_spec = self.project_data.get("links_spec", [])
+            # Project nodes and links, expanded from their compact syntax when first used
+            self.nodes_spec_data = self.project_data.get("nodes_spec", [])
+            self.links_spec_data = self.project_data.get("links_spec", [])
 
             # Vars
             self.vars = self.project_data.get("vars", {})
@@ -70,9 +73,27 @@ class ProjectData:
         else:
             raise FileNotFoundError(f"Project file not found: {project_file}")
 
+    @cached_property
+    def nodes_spec(self) -> List[Dict[str, Any]]:
+        """Node specs of the project file, with their ranges expanded. See `labby.project_spec`.
+
+        Raises:
+            ValueError: If a range is not valid.
+        """
+        return list(iter_nodes_spec(self.nodes_spec_data))
+
+    @cached_property
+    def links_spec(self) -> List[Dict[str, Any]]:
+        """Link specs of the project file, with their ranges and macros expanded. See `labby.project_spec`.
+
+        Raises:
+            ValueError: If a range or a macro is not valid.
+        """
+        return list(iter_links_spec(self.links_spec_data))
+
     def get_project_data(self) -> dict:
-        """Get the project data from the project file."""
-        return utils.load_yaml_file(str(self.project_file))
+        """Get the project data from the project file, reusing the parsed data while the file does not change."""
+        return cache.load_file(self.project_file, utils.load_yaml)
 
     def check_mgmt_ips(self) -> None:
         """Check if the management IP addresses are valid."""
@@ -99,6 +120,18 @@ def get_project_from_file(project_file: Path) -> Tuple[LabbyProject, ProjectData
         Tuple[LabbyProject, ProjectData]: A tuple with the project and the project data.
     """
     project_data = ProjectData(project_file)
+    return get_project_from_data(project_data), project_data
+
+
+def get_project_from_data(project_data: ProjectData) -> LabbyProject:
+    """Get the project of the project data, creating it if it does not exist.
+
+    Args:
+        project_data (ProjectData): The project data processed from project file.
+
+    Returns:
+        LabbyProject: The project.
+    """
     utils.console.log(f"[b]({project_data.name})[/] Retrieving project specification")
     provider = config.get_provider()
     project = provider.search_project(project_name=project_data.name)
@@ -108,7 +141,7 @@ def get_project_from_file(project_file: Path) -> Tuple[LabbyProject, ProjectData
         project_args = dict(project_name=project_data.name, labels=project_data.labels, **project_data.extra_properties)
         project = provider.create_project(**project_args)
         utils.console.log(f"[b]({project.name})[/] Project created")
-    return project, project_data
+    return project
 
 
 def sync_project_data(project_file: Path) -> Tuple[LabbyProject, ProjectData]:
@@ -0,0 +1,214 @@
+"""Labby project spec module.
+
+Expands the compact syntax of the `nodes_spec` and `links_spec` of a project file into the explicit entries, one
+node name per node and one link per link, so large topologies stay small on disk.
+
+- Ranges: `leaf[1-4]` is `leaf1` to `leaf4`, `leaf[01-16]` keeps the zero padding and `r[1-2,5]` is `r1`, `r2`
+  and `r5`. Several ranges in a name expand to all their combinations. Names without ranges are kept as they are.
+- Node names, link nodes and ports take ranges. The `node` of a link spec and the `port`, `node_b` and `port_b` of
+  each of its links expand together, one link per value, while a single value is repeated for all of them. i.e.
+  `leaf[1-4]` `Ethernet1` to `spine1` `Ethernet[1-4]` links each leaf to a port of `spine1`.
+- Macros generate the links of a topology, taking the ports of each node in order:
+    - `full_mesh`: links every pair of `nodes`, from their `ports`.
+    - `leaf_spine`: links every node of `leaves` to every node of `spines`. The leaf uses its `leaf_ports` port of
+      the spine position and the spine its `spine_ports` port of the leaf position.
+
+Entries are expanded as they are iterated, and the expanded entries have the same fields as the explicit ones.
+"""
+import re
+from itertools import combinations, groupby, product
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+RANGE_PATTERN = re.compile(r"\[(\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*)\]")
+
+LINK_PATTERN_FIELDS = ["port", "node_b", "port_b"]
+
+
+def _iter_range(spec: str) -> Iterator[str]:
+    """Iterates over the values of a range. i.e. `1-3,7`.
+
+    Args:
+        spec (str): Range, without the brackets
+
+    Raises:
+        ValueError: If a range goes backwards
+
+    Yields:
+        Iterator[str]: Values, zero padded as the start of each range
+    """
+    for part in spec.split(","):
+        start, _, end = part.partition("-")
+        end = end or start
+        if int(end) < int(start):
+            raise ValueError(f"Range not valid, it goes backwards: [{spec}]")
+        width = len(start) if start.startswith("0") else 0
+        for value in range(int(start), int(end) + 1):
+            yield str(value).zfill(width)
+
+
+def iter_pattern(pattern: str) -> Iterator[str]:
+    """Iterates over the names of a pattern with ranges. i.e. `leaf[1-256]`.
+
+    Args:
+        pattern (str): Name pattern
+
+    Raises:
+        ValueError: If a range is not valid
+
+    Yields:
+        Iterator[str]: Names
+    """
+    parts = RANGE_PATTERN.split(pattern)
+    if len(parts) == 1:
+        yield pattern
+        return
+
+    # Literal text at the even positions and ranges at the odd ones
+    for values in product(*(list(_iter_range(x)) for x in parts[1::2])):
+        yield "".join(x for pair in zip(parts[::2], values + ("",)) for x in pair)
+
+
+def expand_pattern(pattern: str) -> List[str]:
+    """Returns the names of a pattern with ranges. See `iter_pattern`.
+
+    Args:
+        pattern (str): Name pattern
+
+    Raises:
+        ValueError: If a range is not valid
+
+    Returns:
+        List[str]: Names
+    """
+    return list(iter_pattern(pattern))
+
+
+def expand_patterns(patterns: Iterable[str]) -> List[str]:
+    """Returns the names of several patterns, in order.
+
+    Args:
+        patterns (Iterable[str]): Name patterns
+
+    Raises:
+        ValueError: If a range is not valid
+
+    Returns:
+        List[str]: Names
+    """
+    return [name for pattern in patterns for name in iter_pattern(pattern)]
+
+
+def iter_nodes_spec(nodes_spec: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Iterates over the node specs with their node names and `start_after` references expanded.
+
+    Args:
+        nodes_spec (Iterable[Dict[str, Any]]): Node specs of the project file
+
+    Raises:
+        ValueError: If a range is not valid
+
+    Yields:
+        Iterator[Dict[str, Any]]: Node specs
+    """
+    for node_spec in nodes_spec:
+        expanded = dict(node_spec, nodes=expand_patterns(node_spec.get("nodes", [])))
+        if node_spec.get("start_after"):
+            expanded["start_after"] = expand_patterns(node_spec["start_after"])
+        yield expanded
+
+
+def _zip_patterns(values: Dict[str, str]) -> Iterator[Dict[str, str]]:
+    """Expands patterns together, repeating the single values.
+
+    Args:
+        values (Dict[str, str]): Patterns by field
+
+    Raises:
+        ValueError: If the patterns expand to a different number of values
+
+    Yields:
+        Iterator[Dict[str, str]]: Values by field
+    """
+    expanded = {field: expand_pattern(value) for field, value in values.items()}
+    sizes = {len(x) for x in expanded.values() if len(x) != 1}
+    if len(sizes) > 1:
+        raise ValueError(f"Link patterns expand to a different number of values: {values}")
+    for index in range(sizes.pop() if sizes else 1):
+        yield {field: names[index if len(names) > 1 else 0] for field, names in expanded.items()}
+
+
+def _take_port(ports: Dict[str, Iterator[str]], node: str) -> str:
+    port = next(ports[node], None)
+    if port is None:
+        raise ValueError(f"Not enough ports in the macro for node: {node}")
+    return port
+
+
+def _iter_macro_links(macro_spec: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterates over the links generated by a topology macro.
+
+    Args:
+        macro_spec (Dict[str, Any]): Macro entry of the links specs
+
+    Raises:
+        ValueError: If the macro is not known, or a node does not have enough ports
+
+    Yields:
+        Iterator[Dict[str, Any]]: Links, with `node` and the `port`, `node_b` and `port_b` fields
+    """
+    if macro_spec["macro"] == "full_mesh":
+        nodes = expand_pattern(macro_spec["nodes"])
+        ports = {x: iter_pattern(macro_spec["ports"]) for x in nodes}
+        for node_a, node_b in combinations(nodes, 2):
+            yield {
+                "node": node_a,
+                "port": _take_port(ports, node_a),
+                "node_b": node_b,
+                "port_b": _take_port(ports, node_b),
+            }
+    elif macro_spec["macro"] == "leaf_spine":
+        leaves = expand_pattern(macro_spec["leaves"])
+        spines = expand_pattern(macro_spec["spines"])
+        leaf_ports = {x: iter_pattern(macro_spec["leaf_ports"]) for x in leaves}
+        spine_ports = {x: iter_pattern(macro_spec["spine_ports"]) for x in spines}
+        for leaf in leaves:
+            for spine in spines:
+                yield {
+                    "node": leaf,
+                    "port": _take_port(leaf_ports, leaf),
+                    "node_b": spine,
+                    "port_b": _take_port(spine_ports, spine),
+                }
+    else:
+        raise ValueError(f"Links macro not known: {macro_spec['macro']}")
+
+
+def iter_links_spec(links_spec: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Iterates over the link specs with their patterns and macros expanded.
+
+    Args:
+        links_spec (Iterable[Dict[str, Any]]): Link specs of the project file
+
+    Raises:
+        ValueError: If a pattern or a macro is not valid
+
+    Yields:
+        Iterator[Dict[str, Any]]: Link specs, each with a `node` and its `links`
+    """
+    for link_spec in links_spec:
+        if "macro" in link_spec:
+            extra = {x: link_spec[x] for x in ["filters", "labels"] if x in link_spec}
+            links: Iterable[Dict[str, Any]] = (dict(x, **extra) for x in _iter_macro_links(link_spec))
+        else:
+            links = (
+                dict(link_info, **values)
+                for link_info in link_spec.get("links", [])
+                for values in _zip_patterns(
+                    {"node": link_spec["node"], **{x: link_info[x] for x in LINK_PATTERN_FIELDS if x in link_info}}
+                )
+            )
+
+        # Consecutive links of the same node are kept in the same entry
+        for node, node_links in groupby(links, key=lambda x: x.pop("node")):
+            yield {"node": node, "links": list(node_links)}
@@ -1,5 +1,9 @@
-"""Labby Providers setup."""
-from .gns3 import GNS3ProviderBuilder
+"""Labby Providers setup.
+
+The provider modules are imported when their service is registered, so they are only loaded by the commands that use
+them.
+"""
+# pylint: disable=import-outside-toplevel
 
 
 class ObjectFactory:
@@ -31,6 +35,11 @@ class ObjectFactory:
 class NetworkLabProvider(ObjectFactory):
     """Network Lab Provider Object Factory."""
 
+    def __init__(self):
+        """Network Lab Provider Object Factory initialization."""
+        super().__init__()
+        self.kinds = {}
+
     def get(self, service_id: str, **kwargs):
         """Creates a record of a service for network lab providers.
 
@@ -43,17 +52,46 @@ class NetworkLabProvider(ObjectFactory):
 services = NetworkLabProvider()
 
 
-def register_service(provider_name: str, provider_type: str):
+def get_service_id(environment_name: str, provider_name: str) -> str:
+    """Returns the service ID of a provider, unique between environments.
+
+    Args:
+        environment_name (str): Environment Name
+        provider_name (str): Provider Name
+
+    Returns:
+        str: Service ID key
+    """
+    return f"{environment_name}/{provider_name}"
+
+
+def register_service(provider_name: str, provider_type: str, environment_name: str):
     """Registers an specific service based on provider name and type.
 
+    Providers of different environments can share a name, so the services are registered by environment.
+
     Args:
         provider_name (str): Provider Name
         provider_type (str): Provider Type
+        environment_name (str): Environment Name
 
     Raises:
         NotImplementedError: raised when provider is not implemented
     """
+    service_id = get_service_id(environment_name, provider_name)
+    # Keep the builder, and the providers it built, when the provider is registered again. i.e. by the daemon
+    if services.kinds.get(service_id) == provider_type:
+        return
+
     if provider_type == "gns3":
-        services.register_builder(f"{provider_name}", GNS3ProviderBuilder())
+        from .gns3 import GNS3ProviderBuilder
+
+        services.register_builder(service_id, GNS3ProviderBuilder())
+    elif provider_type == "gns3-async":
+        from .gns3 import GNS3ProviderBuilder
+        from .gns3.aio import GNS3AsyncProvider
+
+        services.register_builder(service_id, GNS3ProviderBuilder(GNS3AsyncProvider))
     else:
         raise NotImplementedError(provider_type)
+    services.kinds[service_id] = provider_type
@@ -1,20 +1,25 @@
 """Labby GNS3 Provider Setup."""
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from .provider import GNS3Provider
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
 if TYPE_CHECKING:
     from labby.config import ProviderSettings
+    from .provider import GNS3Provider
 
 
 class GNS3ProviderBuilder:
     # pylint: disable=too-few-public-methods
     """Builder of GNS3 Providers."""
 
-    def __init__(self):
-        """GNS3 Provider Builder instantiation."""
-        self._instance = None
+    def __init__(self, provider_class: Optional[Type[GNS3Provider]] = None):
+        """GNS3 Provider Builder instantiation.
+
+        Args:
+            provider_class (Optional[Type[GNS3Provider]], optional): GNS3 provider class to build. Defaults to
+                GNS3Provider, imported when the provider is built.
+        """
+        self._instances: Dict[Tuple[Any, ...], GNS3Provider] = {}
+        self._provider_class = provider_class
 
     def __call__(
         self,
@@ -34,8 +39,22 @@ class GNS3ProviderBuilder:
         """
         if not settings.server_url:
             raise ValueError(f"Server URL for provider {settings.name} has not been set")
-        if not self._instance:
-            self._instance = GNS3Provider(
+        # Providers of different environments can share a name, so they are built once per settings
+        key = (
+            settings.kind,
+            settings.server_url,
+            settings.user,
+            settings.password,
+            settings.verify_cert,
+            settings.timeout,
+            settings.retries,
+        )
+        if key not in self._instances:
+            if self._provider_class is None:
+                from .provider import GNS3Provider  # pylint: disable=import-outside-toplevel
+
+                self._provider_class = GNS3Provider
+            self._instances[key] = self._provider_class(
                 name=settings.name,
                 kind=settings.kind,
                 server_url=settings.server_url,
@@ -45,4 +64,4 @@ class GNS3ProviderBuilder:
                 timeout=settings.timeout,
                 retries=settings.retries,
             )
-        return self._instance
+        return self._instances[key]
@@ -0,0 +1,504 @@
+"""GNS3 asyncio provider module.
+
+Exposes the same Labby objects as the GNS3 provider, but the operations over many resources (create, start, stop
+and get) are driven from a single event loop so their network waits overlap. Registered as `kind = "gns3-async"`.
+"""
+# pylint: disable=protected-access
+# pylint: disable=dangerous-default-value
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar
+
+from gns3fy.connector import Connector
+from gns3fy.projects import Project
+from gns3fy.templates import Template
+from requests.adapters import HTTPAdapter
+
+from labby import state_file
+from labby.providers.gns3.link import GNS3Link
+from labby.providers.gns3.node import GNS3Node
+from labby.providers.gns3.project import GNS3Project, get_link_name
+from labby.providers.gns3.provider import GNS3Provider
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot, get_snapshot_urls
+from labby.utils import console
+
+
+T = TypeVar("T")
+
+# Node arguments handled by Labby, the rest are passed as GNS3 node attributes
+LABBY_NODE_ARGS = ["labels", "mgmt_addr", "mgmt_port", "config_managed", "net_os", "model", "version"]
+
+
+class AsyncGNS3Client:
+    """Awaitable interface over the GNS3 connector.
+
+    The gns3fy connector (and its `requests` session) is blocking, so each call is run on a bounded thread pool while
+    the event loop awaits it. This keeps the connector retries and authentication settings untouched.
+    """
+
+    def __init__(self, connector: Connector, max_concurrency: int = 20) -> None:
+        """Initialize the client.
+
+        Args:
+            connector (Connector): GNS3 connector object
+            max_concurrency (int, optional): Maximum number of in flight requests. Defaults to 20.
+        """
+        self.connector = connector
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="labby-gns3")
+
+        # Allow as many pooled connections as concurrent requests, keeping the connector retry settings
+        retries = connector.session.get_adapter(connector.base_url).max_retries
+        adapter = HTTPAdapter(max_retries=retries, pool_connections=1, pool_maxsize=max_concurrency)
+        connector.session.mount("https://", adapter)
+        connector.session.mount("http://", adapter)
+
+    async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking callable without blocking the event loop.
+
+        Args:
+            func (Callable[..., T]): Blocking callable
+
+        Returns:
+            T: Result of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def request(self, method: str, url: str, json_data: Optional[Dict[str, Any]] = None) -> Any:
+        """Performs an HTTP request against the GNS3 server.
+
+        Args:
+            method (str): HTTP method
+            url (str): Target URL
+            json_data (Optional[Dict[str, Any]], optional): JSON body. Defaults to None.
+
+        Returns:
+            Any: JSON response data, None if the response has no content
+        """
+        response = await self.call(self.connector.http_call, method, url, json_data=json_data)
+        return response.json() if response.content else None
+
+
+class EventLoopThread:
+    """Event loop running on a dedicated thread.
+
+    Coroutines are submitted from any thread and the caller blocks until they complete, so several threads (i.e. the
+    workers of `labby build project --workers` or `labby batch --workers`) can share the loop of a provider.
+    """
+
+    def __init__(self) -> None:
+        """Starts the event loop thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="labby-gns3-loop", daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion on the event loop thread.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): Coroutine to run
+
+        Raises:
+            RuntimeError: If called from the event loop thread itself, where it would block the loop forever.
+
+        Returns:
+            T: Result of the coroutine
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("Cannot wait on a coroutine from the event loop thread")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self) -> None:
+        """Stops the event loop thread and closes the loop."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class GNS3AsyncProject(GNS3Project):
+    """GNS3 Project class whose operations over many nodes and links are run concurrently."""
+
+    _client: AsyncGNS3Client
+    _loop: EventLoopThread
+
+    def __init__(
+        self,
+        name: str,
+        project: Project,
+        client: AsyncGNS3Client,
+        loop: EventLoopThread,
+        labels: List[str] = [],
+        **data,
+    ) -> None:
+        """Initialize a GNS3 async Project instance.
+
+        Args:
+            name (str): Project name.
+            project (Project): GNS3 Project instance.
+            client (AsyncGNS3Client): Async client shared with the provider.
+            loop (EventLoopThread): Event loop thread of the provider.
+            labels (List[str], optional): List of labels.
+            data (Dict[str, Any]): Project data.
+        """
+        super().__init__(name, project, labels=labels, _client=client, _loop=loop, **data)
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion on the provider event loop.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): Coroutine to run
+
+        Returns:
+            T: Result of the coroutine
+        """
+        return self._loop.run(coroutine)
+
+    @property
+    def _url(self) -> str:
+        return f"{self._base._connector.base_url}/projects/{self._base.project_id}"
+
+    async def fetch_snapshot(self) -> GNS3ProjectSnapshot:
+        """Retrieves the project, nodes, links and templates data concurrently.
+
+        Returns:
+            GNS3ProjectSnapshot: Snapshot of the project data
+        """
+        urls = get_snapshot_urls(self._base._connector, self._base.project_id)
+        payloads = await asyncio.gather(*(self._client.request("get", url) for url in urls.values()))
+        return GNS3ProjectSnapshot(**dict(zip(urls, payloads)))
+
+    async def get_async(self, nodes_refresh: bool = False, links_refresh: bool = False) -> None:
+        """Get project attributes.
+
+        Args:
+            nodes_refresh (bool, optional): Refresh nodes attributes.
+            links_refresh (bool, optional): Refresh links attributes.
+        """
+        console.log(f"[b]({self.name})[/] Collecting project data")
+        snapshot = await self.fetch_snapshot()
+        self._apply_snapshot(snapshot, nodes_refresh, links_refresh)
+        self.init_nornir()
+
+    def get(self, nodes_refresh: bool = False, links_refresh: bool = False) -> None:
+        """Get project attributes.
+
+        Args:
+            nodes_refresh (bool, optional): Refresh nodes attributes.
+            links_refresh (bool, optional): Refresh links attributes.
+        """
+        self.run(self.get_async(nodes_refresh, links_refresh))
+
+    async def open_async(self) -> None:
+        """Opens the project if it is closed, and collects its data."""
+        if self.status != "closed":
+            return
+        console.log(f"[b]({self.name})[/] Starting project")
+        await self._client.request("post", f"{self._url}/open")
+        await self.get_async(nodes_refresh=True, links_refresh=True)
+
+    async def _node_action(self, node: GNS3Node, action: str) -> None:
+        console.log(f"[b]({self.name})({node.name})[/] Running node action: [cyan i]{action}[/]")
+        await self._client.request("post", f"{self._url}/nodes/{node.id}/{action}")
+
+    async def start_nodes_async(self, names: Optional[List[str]] = None, nodes_delay: int = 0) -> None:
+        """Start nodes concurrently.
+
+        Args:
+            names (Optional[List[str]], optional): Names of the nodes to start. Defaults to all nodes.
+            nodes_delay (int, optional): Delay after the nodes are started, to give some time for device bootup.
+        """
+        await self.open_async()
+        nodes = [n for n in self.nodes.values() if (names is None or n.name in names) and n.status != "started"]
+        await asyncio.gather(*(self._node_action(node, "start") for node in nodes))
+        if nodes_delay:
+            await asyncio.sleep(nodes_delay)
+        await self.get_async(nodes_refresh=True, links_refresh=True)
+
+    async def stop_nodes_async(self, names: Optional[List[str]] = None) -> None:
+        """Stop nodes concurrently.
+
+        Args:
+            names (Optional[List[str]], optional): Names of the nodes to stop. Defaults to all nodes.
+        """
+        nodes = [n for n in self.nodes.values() if (names is None or n.name in names) and n.status != "stopped"]
+        await asyncio.gather(*(self._node_action(node, "stop") for node in nodes))
+        await self.get_async(nodes_refresh=True, links_refresh=True)
+
+    def start_nodes(
+        self,
+        start_nodes: str,
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> None:
+        """Start nodes.
+
+        Args:
+            start_nodes (str): Start nodes method. Options are: "all", "one_by_one", "waves".
+            nodes_delay (int, optional): Nodes delay between starts.
+            labels_order (List[str], optional): Labels in the order their nodes are started. Used by "waves".
+            max_booting (Optional[int], optional): Maximum nodes booting at the same time. Used by "waves".
+            names (Optional[List[str]], optional): Names of the nodes to start. Defaults to all nodes.
+        """
+        if start_nodes != "all" or (names is not None and not names):
+            super().start_nodes(
+                start_nodes=start_nodes,
+                nodes_delay=nodes_delay,
+                labels_order=labels_order,
+                max_booting=max_booting,
+                names=names,
+            )
+            return
+
+        if names is None:
+            console.log(f"[b]({self.name})[/] Starting all nodes in project {self.name}...")
+        else:
+            console.log(f"[b]({self.name})[/] Starting nodes: [cyan i]{names}[/]")
+        self.run(self.start_nodes_async(names=names, nodes_delay=nodes_delay))
+        console.log(f"[b]({self.name})[/] Project nodes have been started", style="good")
+
+    def start_wave(self, names: List[str]) -> bool:
+        """Start a group of nodes concurrently.
+
+        Args:
+            names (List[str]): Names of the nodes to start.
+
+        Returns:
+            bool: True if all the nodes reported as started.
+        """
+        self.run(self.start_nodes_async(names=names))
+        return all(self.nodes[x].status == "started" for x in names)
+
+    def stop_nodes(self, names: Optional[List[str]] = None) -> None:
+        """Stop nodes.
+
+        Args:
+            names (Optional[List[str]], optional): Names of the nodes to stop. Defaults to all nodes.
+        """
+        if names is not None and not names:
+            console.log(f"[b]({self.name})[/] No nodes selected to stop", style="warning")
+            return
+
+        console.log(f"[b]({self.name})[/] Stopping nodes")
+        self.run(self.stop_nodes_async(names=names))
+        console.log(f"[b]({self.name})[/] Project nodes have been stopped", style="good")
+
+    async def _create_gns3_node(self, template: Template, name: str, **kwargs) -> None:
+        console.log(f"[b]({self.name})({name})[/] Creating node with template [cyan i]{template.name}[/]")
+        node_data = await self._client.request(
+            "post",
+            f"{self._url}/templates/{template.template_id}",
+            json_data={"x": 0, "y": 0, "compute_id": kwargs.get("compute_id", "local")},
+        )
+        gns3_attrs = {k: v for k, v in kwargs.items() if k != "compute_id"}
+        await self._client.request(
+            "put", f"{self._url}/nodes/{node_data['node_id']}", json_data={"name": name, **gns3_attrs}
+        )
+
+    async def create_nodes_async(
+        self, nodes_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[GNS3Node]:
+        """Create nodes concurrently.
+
+        Args:
+            nodes_spec (List[Dict[str, Any]]): Nodes specs, each one holding the arguments of `create_node`.
+            on_created (Optional[Callable[[Dict[str, Any]], None]], optional): Called with the spec of each node
+                created, once its data is in the state file.
+
+        Raises:
+            ValueError: If a node template is not found.
+
+        Returns:
+            List[GNS3Node]: Nodes created.
+        """
+        await self.open_async()
+        await self.get_async(nodes_refresh=True)
+
+        pending = []
+        for node_spec in nodes_spec:
+            if node_spec["name"] in self.nodes:
+                console.log(f"Node [cyan i]{node_spec['name']}[/] already created. Nothing to do...", style="warning")
+                continue
+            if node_spec["template"] not in self._templates:
+                raise ValueError(f"Template not found: {node_spec['template']}")
+            pending.append(node_spec)
+
+        await asyncio.gather(
+            *(
+                self._create_gns3_node(
+                    self._templates[spec["template"]],
+                    spec["name"],
+                    **{k: v for k, v in spec.items() if k not in LABBY_NODE_ARGS + ["name", "template"]},
+                )
+                for spec in pending
+            )
+        )
+        await self.get_async(nodes_refresh=True)
+
+        nodes = []
+        for spec in pending:
+            node = GNS3Node(
+                project_name=self.name,
+                node=self._base.nodes[spec["name"]],
+                gns3_template=self._templates[spec["template"]],
+                port_index=self._port_index,
+                **spec,
+            )
+            self.nodes[node.name] = node
+            nodes.append(node)
+            console.log(f"[b]({self.name})({node.name})[/] Node created", style="good")
+
+        # Apply nodes to lock file
+        state_file.apply_nodes_data(nodes, self)
+        if on_created:
+            for spec in pending:
+                on_created(spec)
+
+        # Refresh Nornir object
+        self.init_nornir()
+        return nodes
+
+    def create_nodes(  # type: ignore
+        self, nodes_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[GNS3Node]:
+        """Create nodes concurrently.
+
+        Args:
+            nodes_spec (List[Dict[str, Any]]): Nodes specs, each one holding the arguments of `create_node`.
+            on_created (Optional[Callable[[Dict[str, Any]], None]], optional): Called with the spec of each node
+                created.
+
+        Returns:
+            List[GNS3Node]: Nodes created.
+        """
+        return self.run(self.create_nodes_async(nodes_spec, on_created=on_created))
+
+    async def _create_gns3_link(self, node_a: str, port_a: str, node_b: str, port_b: str, **kwargs) -> None:
+        console.log(f"[b]({self.name})[/] Creating link on: [cyan i]{node_a}: {port_a} <==> {port_b}: {node_b}[/]")
+        endpoints = []
+        for node_name, port_name in ((node_a, port_a), (node_b, port_b)):
+            gns3_node = self._base.nodes.get(node_name)
+            if gns3_node is None:
+                raise ValueError(f"Node not found: {node_name}")
+            try:
+                port = next(p for p in gns3_node.ports if p.name == port_name)
+            except StopIteration as err:
+                raise ValueError(f"Port not found on {node_name}: {port_name}") from err
+            endpoints.append(
+                {
+                    "adapter_number": port.adapter_number,
+                    "port_number": port.port_number,
+                    "node_id": gns3_node.node_id,
+                    "label": {"text": port_name},
+                }
+            )
+        await self._client.request("post", f"{self._url}/links", json_data={"nodes": endpoints, **kwargs})
+
+    async def create_links_async(
+        self, links_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[GNS3Link]:
+        """Create links concurrently.
+
+        Args:
+            links_spec (List[Dict[str, Any]]): Links specs, each one holding the arguments of `create_link`.
+            on_created (Optional[Callable[[Dict[str, Any]], None]], optional): Called with the spec of each link
+                created, once its filters are applied and its data is in the state file.
+
+        Returns:
+            List[GNS3Link]: Links created.
+        """
+        await self.open_async()
+        await self.get_async(nodes_refresh=True, links_refresh=True)
+
+        pending = []
+        for link_spec in links_spec:
+            endpoints = (link_spec["node_a"], link_spec["port_a"], link_spec["node_b"], link_spec["port_b"])
+            link_name = get_link_name(*endpoints)
+            if self._port_index.find_link(*endpoints) is not None:
+                console.log(f"Link [cyan i]{link_name}[/] already created. Nothing to do...", style="warning")
+                continue
+            pending.append((link_name, link_spec))
+
+        await asyncio.gather(
+            *(
+                self._create_gns3_link(**{k: v for k, v in spec.items() if k not in ("filters", "labels")})
+                for _, spec in pending
+            )
+        )
+        await self.get_async(links_refresh=True)
+
+        filtered = [(self._base.links[name], spec["filters"]) for name, spec in pending if spec.get("filters")]
+        if filtered:
+            await asyncio.gather(*(self._client.call(link.apply_filters, **filters) for link, filters in filtered))
+            await self.get_async(links_refresh=True)
+
+        links = []
+        for link_name, spec in pending:
+            link = self.links[link_name]
+            link.labels = spec.get("labels", [])
+            links.append(link)
+            console.log(f"[b]({self.name})({link.name})[/] Link created", style="good")
+
+        # Apply links to lock file
+        state_file.apply_links_data(links, self)
+        if on_created:
+            for _, spec in pending:
+                on_created(spec)
+        return links
+
+    def create_links(  # type: ignore
+        self, links_spec: List[Dict[str, Any]], on_created: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[GNS3Link]:
+        """Create links concurrently.
+
+        Args:
+            links_spec (List[Dict[str, Any]]): Links specs, each one holding the arguments of `create_link`.
+            on_created (Optional[Callable[[Dict[str, Any]], None]], optional): Called with the spec of each link
+                created.
+
+        Returns:
+            List[GNS3Link]: Links created.
+        """
+        return self.run(self.create_links_async(links_spec, on_created=on_created))
+
+
+class GNS3AsyncProvider(GNS3Provider):
+    """GNS3 provider class driven by an asyncio event loop."""
+
+    def __init__(self, name: str, server_url: str, kind: str = "gns3-async", max_concurrency: int = 20, **kwargs):
+        """GNS3 async provider class.
+
+        Args:
+            name (str): Name of the GNS3 provider
+            server_url (str): GNS3 server URL
+            kind (str, optional): Type of GNS3 server (default: gns3-async)
+            max_concurrency (int, optional): Maximum number of in flight requests (default: 20)
+            kwargs: Arguments of the GNS3 provider
+        """
+        super().__init__(name=name, server_url=server_url, kind=kind, **kwargs)
+        self._loop = EventLoopThread()
+        self._client = AsyncGNS3Client(self._base.connector, max_concurrency=max_concurrency)
+
+    def _init_project(self, project_name: str, project: Project, labels: List[str] = [], **kwargs) -> GNS3Project:
+        return GNS3AsyncProject(project_name, project, client=self._client, loop=self._loop, labels=labels, **kwargs)
+
+    async def get_projects_async(self) -> List[Dict[str, Any]]:
+        """Retrieves the projects data of the server.
+
+        Returns:
+            List[Dict[str, Any]]: Projects data
+        """
+        return await self._client.request("get", f"{self._base.connector.base_url}/projects")
+
+    async def get_templates_async(self) -> List[Dict[str, Any]]:
+        """Retrieves the templates data of the server.
+
+        Returns:
+            List[Dict[str, Any]]: Templates data
+        """
+        return await self._client.request("get", f"{self._base.connector.base_url}/templates")
@@ -0,0 +1,279 @@
+"""GNS3 Connector module.
+
+Connector to the GNS3 server API with client side rate limiting. Each class of endpoint (reads, creations, node and
+project actions and other writes) has its own token bucket, whose rate is adapted with AIMD (additive increase,
+multiplicative decrease): it grows while the server answers within its usual latency, and it is halved when the
+server is overloaded (errors, timeouts or latency spikes). This finds the highest rate a server can take without
+any tuning, and slows down the bursts of parallel operations before the server fails them.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+import requests
+from gns3fy.connector import Connector, ConnectorError
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry  # type: ignore # pylint: disable=import-error
+
+
+# Endpoint classes, each one rate limited on its own
+ENDPOINT_CLASSES = ["read", "create", "action", "write"]
+
+# Initial and maximum rates (requests per second) of each endpoint class
+ENDPOINT_RATES = {
+    "read": (50.0, 200.0),
+    "create": (5.0, 50.0),
+    "action": (5.0, 50.0),
+    "write": (10.0, 100.0),
+}
+
+ACTIONS = ["start", "stop", "reload", "suspend", "open", "close", "isolate", "unisolate", "duplicate"]
+
+# Responses of an overloaded server. The server did not process the request, so they are retried for any method
+OVERLOAD_STATUS = [429, 503]
+
+# Server errors retried for the methods that can be repeated safely
+RETRY_STATUS = [500, 502, 504]
+
+IDEMPOTENT_METHODS = ["get", "head", "put", "delete", "options"]
+
+
+def get_endpoint_class(method: str, url: str) -> str:
+    """Classifies a request of the GNS3 API.
+
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+
+    Returns:
+        str: Endpoint class. One of `read`, `create`, `action` or `write`
+    """
+    method = method.lower()
+    if method in ("get", "head", "options"):
+        return "read"
+
+    if method == "post":
+        if urlparse(url).path.rstrip("/").rsplit("/", 1)[-1] in ACTIONS:
+            return "action"
+        return "create"
+
+    return "write"
+
+
+class AIMDRateLimiter:
+    # pylint: disable=too-many-instance-attributes
+    """Token bucket rate limiter whose rate is adapted with AIMD.
+
+    Attributes:
+        name (str): Name of the limiter
+        rate (float): Current rate, in requests per second
+        latency (Optional[float]): Moving average of the latency of the requests, in seconds
+        counters (Dict[str, Union[int, float]]): Requests, errors, retries, throttled requests and seconds waited
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+    ) -> None:
+        """Initialize an AIMD rate limiter.
+
+        Args:
+            name (str): Name of the limiter
+            rate (float, optional): Initial rate, in requests per second
+            min_rate (float, optional): Minimum rate
+            max_rate (float, optional): Maximum rate
+            increase (float, optional): Rate increase over the requests of one second at the current rate, each
+                request served while the server keeps up adds `increase / rate`
+            decrease (float, optional): Factor applied to the rate when the server is overloaded
+            latency_factor (float, optional): Times over the usual latency considered a latency spike
+        """
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.latency: Optional[float] = None
+        self.counters: Dict[str, Union[int, float]] = {
+            "requests": 0,
+            "errors": 0,
+            "retries": 0,
+            "throttled": 0,
+            "waited": 0.0,
+        }
+        self._baseline: Optional[float] = None
+        self._tokens = max(rate, 1.0)
+        self._refilled = time.monotonic()
+        self._decreased = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._tokens + (now - self._refilled) * self.rate, max(self.rate, 1.0))
+        self._refilled = now
+
+    def acquire(self) -> float:
+        """Waits for a token to send a request.
+
+        Returns:
+            float: Seconds waited
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.counters["requests"] += 1
+                    if waited:
+                        self.counters["throttled"] += 1
+                        self.counters["waited"] += waited
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self, latency: float) -> None:
+        """Accounts a request answered by the server.
+
+        The rate is increased while the latency is close to the usual one, and decreased on latency spikes.
+
+        Args:
+            latency (float): Seconds the request took
+        """
+        with self._lock:
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            if self._baseline is None or self.latency < self._baseline:
+                self._baseline = self.latency
+            else:
+                # Follow a server that is slower for good, instead of taking it as overloaded forever
+                self._baseline += (self.latency - self._baseline) * 0.01
+
+            if self.latency > self.latency_factor * self._baseline:
+                self._decrease()
+            else:
+                self.rate = min(self.rate + self.increase / self.rate, self.max_rate)
+
+    def on_failure(self, retried: bool = False) -> None:
+        """Accounts a request failed by an overloaded server and decreases the rate.
+
+        Args:
+            retried (bool, optional): Whether the request is retried
+        """
+        with self._lock:
+            self.counters["errors"] += 1
+            if retried:
+                self.counters["retries"] += 1
+            self._decrease()
+
+    def _decrease(self) -> None:
+        # Decrease once per round trip, the requests already in flight were sent at the previous rate
+        now = time.monotonic()
+        if now - self._decreased < (self.latency or 0):
+            return
+        self._decreased = now
+        self._refill(now)
+        self.rate = max(self.rate * self.decrease, self.min_rate)
+        self._tokens = min(self._tokens, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the counters and current state of the limiter.
+
+        Returns:
+            Dict[str, Any]: Limiter name, rate, latency and counters
+        """
+        with self._lock:
+            return {"name": self.name, "rate": self.rate, "latency": self.latency, **self.counters}
+
+
+class GNS3Connector(Connector):
+    """GNS3 connector with adaptive rate limiting per endpoint class.
+
+    Server overload responses (429 and 503), and server errors and read timeouts of the idempotent requests, are
+    retried at the rate of their limiter instead of the fixed backoff of the gns3fy connector.
+    """
+
+    def __init__(self, url: str, **kwargs) -> None:
+        """Initialize a GNS3 connector.
+
+        Args:
+            url (str): GNS3 server URL
+            kwargs: Arguments of the gns3fy connector
+        """
+        super().__init__(url, **kwargs)
+        self.limiters = {
+            name: AIMDRateLimiter(name, rate=rate, max_rate=max_rate)
+            for name, (rate, max_rate) in ENDPOINT_RATES.items()
+        }
+
+    def _create_session(self) -> None:
+        super()._create_session()
+        # Only connection errors are retried by the session, safe for any method. The rest through the limiters
+        adapter = HTTPAdapter(max_retries=Retry(total=self.retries, read=0, status=0, backoff_factor=1))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def http_call(self, method: str, url: str, *args, **kwargs) -> requests.Response:  # type: ignore
+        """Performs the HTTP request once its endpoint limiter admits it, retrying it if the server is overloaded.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            args: Arguments of the gns3fy connector `http_call`
+            kwargs: Arguments of the gns3fy connector `http_call`
+
+        Raises:
+            ConnectorError: If the server answers with an error
+            requests.RequestException: If the server could not be reached
+
+        Returns:
+            requests.Response: Server response
+        """
+        limiter = self.limiters[get_endpoint_class(method, url)]
+        idempotent = method.lower() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = super().http_call(method, url, *args, **kwargs)
+            except ConnectorError as err:
+                status_code = getattr(getattr(err.__cause__, "response", None), "status_code", None)
+                overloaded = status_code in OVERLOAD_STATUS or (idempotent and status_code in RETRY_STATUS)
+                if not overloaded:
+                    # The server is healthy, the request is not valid
+                    limiter.on_success(time.monotonic() - started)
+                    raise
+                retry = attempt < self.retries
+                limiter.on_failure(retried=retry)
+                if not retry:
+                    raise
+            except requests.ReadTimeout:
+                retry = idempotent and attempt < self.retries
+                limiter.on_failure(retried=retry)
+                if not retry:
+                    raise
+            except requests.ConnectionError:
+                # Already retried by the session
+                limiter.on_failure()
+                raise
+            else:
+                limiter.on_success(time.monotonic() - started)
+                return response
+            attempt += 1
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Returns the counters of the endpoint limiters.
+
+        Returns:
+            List[Dict[str, Any]]: Counters of each endpoint class
+        """
+        return [limiter.stats() for limiter in self.limiters.values()]
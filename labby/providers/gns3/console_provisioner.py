@@ -242,7 +242,7 @@ def run_bootstrap(
         bool: True if executed succesfully, else False
     """
     # Boot process per device type
-    with utils.console.status(
+    with utils.status(
         f"[b]({node.project.name})({node.name})[/] Running initial boot sequence", spinner="aesthetic"
     ) as status:
         if node.net_os == "arista_eos":
@@ -393,7 +393,7 @@ def run_action(
         node_console_settings["auth_bypass"] = False
 
     # Connection to device
-    with utils.console.status(
+    with utils.status(
         f"[b]({node.project.name})({node.name})[/] Sending command over console", spinner="aesthetic"
     ) as status:
         if node.net_os == "arista_eos":
@@ -2,7 +2,7 @@
 # pylint: disable=protected-access
 # pylint: disable=dangerous-default-value
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from rich import box
 from rich.table import Table
@@ -12,6 +12,7 @@ from gns3fy.links import Link
 from labby.providers.gns3.utils import bool_status, link_status
 from labby import state_file
 from labby.models import LabbyLink, LabbyLinkEndpoint, LabbyProjectInfo
+from labby.port_index import PortIndex
 from labby.utils import console
 
 
@@ -30,8 +31,17 @@ class GNS3Link(LabbyLink):
 
     endpoint: Optional[GNS3LinkEndpoint]
     _base: Link
-
-    def __init__(self, name: str, project_name: str, link: Link, labels: List[str] = [], **data) -> None:
+    _port_index: Optional[PortIndex]
+
+    def __init__(
+        self,
+        name: str,
+        project_name: str,
+        link: Link,
+        labels: List[str] = [],
+        port_index: Optional[PortIndex] = None,
+        **data,
+    ) -> None:
         """
         Initiliazes GNS3Link.
 
@@ -40,10 +50,12 @@ class GNS3Link(LabbyLink):
             project_name (str): Name of project the link belongs to.
             link: A GNS3 link.
             labels (List[str]): Labels for the link.
+            port_index (Optional[PortIndex]): Port index of the project, updated when the link is deleted.
             data: Data for the link.
         """
         _project = LabbyProjectInfo(name=project_name, id=link.project_id)
         super().__init__(name=name, labels=labels, project=_project, _base=link, **data)  # type: ignore
+        self._port_index = port_index
         self._update_labby_link_attrs()
 
     def _update_labby_link_attrs(self):
@@ -105,11 +117,38 @@ class GNS3Link(LabbyLink):
             self.status = "deleted"  # pylint: disable=attribute-defined-outside-init
             console.log(f"[b]({self.project.name})({self.name})[/] Link deleted", style="good")
             state_file.delete_link_data(self.name, self.project.name)
+            if self._port_index is not None:
+                self._port_index.remove_link(self.name)
             return True
 
         console.log(f"[b]({self.project.name})({self.name})[/] Link could not be deleted", style="warning")
         return False
 
+    def summary(self) -> Dict[str, Any]:
+        """Returns the link attributes summary, as plain values.
+
+        Raises:
+            ValueError: If the link does not have an endpoint defined.
+
+        Returns:
+            Dict[str, Any]: Link attributes.
+        """
+        if self.endpoint is None:
+            raise ValueError(f"Link {self} does not have endpoint defined")
+        return {
+            "name": self.name,
+            "node_a": self.endpoint.node_a,
+            "port_a": self.endpoint.port_a,
+            "node_b": self.endpoint.node_b,
+            "port_b": self.endpoint.port_b,
+            "status": self.status,
+            "capturing": self._base.capturing,
+            "filters": self.filters,
+            "labels": self.labels,
+            "kind": self.kind,
+            "id": self.id,
+        }
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         # pylint: disable=unused-argument
         # pylint: disable=redefined-outer-name
@@ -4,7 +4,7 @@
 import time
 import re
 from ipaddress import IPv4Interface
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 from rich.console import Console, ConsoleOptions, ConsoleRenderable, RenderResult, Group
@@ -19,11 +19,13 @@ from gns3fy.nodes import Node
 from gns3fy.ports import Port
 
 import labby.providers.gns3.console_provisioner as node_console
-from labby import config, state_file
+from labby import config, state_file, utils
+from labby.providers.gns3.notifications import GNS3NotificationListener, poll_until
 from labby.providers.gns3.utils import node_net_os, node_status
 from labby.utils import console, dissect_url
 from labby.nornir_tasks import backup_task, SHOW_RUN_COMMANDS
 from labby.models import LabbyNode, LabbyProjectInfo, LabbyPort
+from labby.port_index import PortIndex
 
 
 def config_task(task: Task, config: str):
@@ -83,6 +85,8 @@ class GNS3Node(LabbyNode):
     builtin: bool = False
     _base: Node
     _template: Optional[Template]
+    _listener: Optional[GNS3NotificationListener]
+    _port_index: Optional[PortIndex]
 
     def __init__(
         self,
@@ -97,8 +101,12 @@ class GNS3Node(LabbyNode):
         net_os: Optional[str] = None,
         model: Optional[str] = None,
         version: Optional[str] = None,
+        gns3_template: Optional[Template] = None,
+        listener: Optional[GNS3NotificationListener] = None,
+        port_index: Optional[PortIndex] = None,
         **data,
     ) -> None:
+        # pylint: disable=too-many-locals
         """GNS3 Labby node object.
 
         Args:
@@ -113,6 +121,12 @@ class GNS3Node(LabbyNode):
             net_os (str, optional): Network Operating System. Defaults to None.
             model (str, optional): Model of the node. Defaults to None.
             version (str, optional): Version of the Network Operating System. Defaults to None.
+            gns3_template (Optional[Template], optional): GNS3 template object already retrieved. If not passed it
+                is retrieved from the server. Defaults to None.
+            listener (Optional[GNS3NotificationListener], optional): Notification listener of the project, used to
+                wait for the node status changes. If not passed the node is polled. Defaults to None.
+            port_index (Optional[PortIndex], optional): Port index of the project, used to look up the node ports
+                and links. If not passed the links of the node are scanned. Defaults to None.
         """
         _project = LabbyProjectInfo(name=project_name, id=node.project_id)
         super().__init__(
@@ -129,7 +143,9 @@ class GNS3Node(LabbyNode):
             version=version,
             **data,
         )
-        self._template = self._get_gns3_template()
+        self._template = gns3_template if gns3_template is not None else self._get_gns3_template()
+        self._listener = listener
+        self._port_index = port_index
         self._update_labby_node_attrs()
 
     def _update_labby_node_attrs(self):
@@ -209,6 +225,32 @@ class GNS3Node(LabbyNode):
         self._base.get()
         self._update_labby_node_attrs()
 
+    def wait_status(self, status: str, timeout: int = 60) -> bool:
+        """Waits for the node to reach a status.
+
+        Resolved from the project notifications when they are being listened, polling the node otherwise.
+
+        Args:
+            status (str): Expected status. i.e. `started`
+            timeout (int, optional): Seconds to wait. Defaults to 60.
+
+        Returns:
+            bool: True if the node reached the status, False otherwise.
+        """
+
+        def _poll() -> bool:
+            self._base.get()
+            return self._base.status == status
+
+        if self._base.status != status:
+            if self._listener is None:
+                poll_until(_poll, timeout=timeout)
+            elif self._listener.wait_node_status(self._base.node_id, status, timeout=timeout, poll=_poll):
+                self._base.status = status
+
+        self._update_labby_node_attrs()
+        return self.status == status
+
     def start(self) -> bool:
         """Starts the node.
 
@@ -217,11 +259,8 @@ class GNS3Node(LabbyNode):
         """
         console.log(f"[b]({self.project.name})({self.name})[/] Starting node")
         self._base.start()
-        time.sleep(2)
-
-        self.get()
 
-        if self.status != "started":
+        if not self.wait_status("started"):
             console.log(f"[b]({self.project.name})({self.name})[/] Node could not be started", style="warning")
             return False
 
@@ -236,11 +275,8 @@ class GNS3Node(LabbyNode):
         """
         console.log(f"[b]({self.project.name})({self.name})[/] Stopping node")
         self._base.stop()
-        time.sleep(2)
 
-        self.get()
-
-        if self.status != "stopped":
+        if not self.wait_status("stopped"):
             console.log(f"[b]({self.project.name})({self.name})[/] Node could not be stopped", style="warning")
             return False
 
@@ -255,11 +291,8 @@ class GNS3Node(LabbyNode):
         """
         console.log(f"[b]({self.project.name})({self.name})[/] Retarting node")
         self._base.reload()
-        time.sleep(2)
 
-        self.get()
-
-        if self.status != "started":
+        if not self.wait_status("started"):
             console.log(f"[b]({self.project.name})({self.name})[/] Node could not be restarted", style="warning")
             return False
 
@@ -342,6 +375,8 @@ class GNS3Node(LabbyNode):
             self.status = "deleted"
             console.log(f"[b]({self.project.name})({self.name})[/] Node deleted", style="good")
             state_file.delete_node_data(self.name, self.project.name)
+            if self._port_index is not None:
+                self._port_index.remove_node(self.name)
             return True
 
         console.log(f"[b]({self.project.name})({self.name})[/] Node could not be deleted", style="warning")
@@ -362,9 +397,7 @@ class GNS3Node(LabbyNode):
         Returns:
             bool: True if the node is bootstrapped, False otherwise.
         """
-        with console.status(
-            f"[b]({self.project.name})({self.name})[/] Bootstraping node", spinner="aesthetic"
-        ) as status:
+        with utils.status(f"[b]({self.project.name})({self.name})[/] Bootstraping node", spinner="aesthetic") as status:
             console.log(f"[b]({self.project.name})({self.name})[/] Bootstraping node")
             console.log(self)
             if self.status != "started":
@@ -559,6 +592,84 @@ class GNS3Node(LabbyNode):
         console.log(f"[b]({self.project.name})({self.name})[/] Could not retrieve node's configuration", style="error")
         return None
 
+    def summary(self) -> Dict[str, Any]:
+        """Returns the node attributes summary, as plain values.
+
+        Returns:
+            Dict[str, Any]: Node attributes.
+        """
+        return {
+            "name": self.name,
+            "status": self.status,
+            "kind": self.kind,
+            "category": self.category if self.template else None,
+            "net_os": self.net_os,
+            "model": self.model,
+            "version": self.version,
+            "builtin": self.builtin,
+            "template": self.template,
+            "console": self.console,
+            "labels": self.labels,
+            "mgmt_port": self.mgmt_port,
+            "mgmt_addr": self.mgmt_addr,
+            "config_managed": self.config_managed,
+            "ports": None if self.interfaces is None else len(self.interfaces),
+            "id": self.id,
+        }
+
+    def get_used_ports(self) -> List[str]:
+        """Returns the names of the node ports with a link.
+
+        Returns:
+            List[str]: Port names.
+        """
+        if self._port_index is not None:
+            return self._port_index.get_used_ports(self.name)
+        return [
+            port.name
+            for link in self._base.links.values()
+            for port in link.nodes
+            if port.node_name == self.name  # type: ignore
+        ]
+
+    def get_free_ports(self) -> List[str]:
+        """Returns the names of the node ports without a link.
+
+        Returns:
+            List[str]: Port names.
+        """
+        used_ports = set(self.get_used_ports())
+        return [x.name for x in self._base.ports if x.name not in used_ports]
+
+    def get_links(self) -> List[str]:
+        """Returns the names of the node links.
+
+        Returns:
+            List[str]: Link names.
+        """
+        if self._port_index is not None:
+            return self._port_index.get_node_links(self.name)
+        return list(self._base.links)
+
+    def detail(self, properties: bool = False) -> Dict[str, Any]:
+        """Returns the node attributes summary together with its ports and links, as plain values.
+
+        Args:
+            properties (bool, optional): Include the node properties.
+
+        Returns:
+            Dict[str, Any]: Node attributes.
+        """
+        used_ports = set(self.get_used_ports())
+        node_detail = self.summary()
+        node_detail.update(
+            ports=[{"name": x.name, "linked": x.name in used_ports} for x in self._base.ports],
+            links=self.get_links(),
+        )
+        if properties:
+            node_detail.update(properties=self.properties or {})
+        return node_detail
+
     def render_ports_detail(self) -> ConsoleRenderable:
         """Renders the ports detail.
 
@@ -566,20 +677,8 @@ class GNS3Node(LabbyNode):
             ConsoleRenderable: The rendered ports detail.
         """
         # The following helps highlight used ports
-        list_ports = []
-        flag = False
-        for port in self._base.ports:
-            for _, link in self._base.links.items():
-                for gns3_port in link.nodes:
-                    if gns3_port.name == port.name and gns3_port.node_name == self.name:
-                        flag = True
-            if flag:
-                flag = False
-                list_ports.append(f"[yellow i]{port.name}[/]")
-            else:
-                flag = False
-                list_ports.append(port.name)
-        ports = ", ".join(list_ports)
+        used_ports = set(self.get_used_ports())
+        ports = ", ".join(f"[yellow i]{x.name}[/]" if x.name in used_ports else x.name for x in self._base.ports)
         return Panel(ports, expand=False, title="[b]Ports[/]", box=box.HEAVY_EDGE)
 
     def render_links_detail(self) -> ConsoleRenderable:
@@ -589,10 +688,10 @@ class GNS3Node(LabbyNode):
             ConsoleRenderable: The rendered links detail.
         """
         paneles = []
-        for index, link in enumerate(self._base.links.values()):
+        for index, link_name in enumerate(self.get_links()):
             paneles.append(
                 Panel(
-                    f"[yellow bold]{link.name}",
+                    f"[yellow bold]{link_name}",
                     title=f"Link: {index}",
                 )
             )
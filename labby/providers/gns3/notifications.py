@@ -0,0 +1,255 @@
+"""GNS3 Project notifications module.
+
+Listens to the notification stream of an opened GNS3 project and keeps the live status of its nodes and links, so
+the waits on them (node started, link created, ...) are resolved from the server events. When the stream is not
+available the waits fall back to polling.
+"""
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from gns3fy.connector import Connector
+
+from labby import config
+from labby.utils import console
+
+
+def poll_until(check: Callable[[], bool], timeout: float = 60, interval: float = 2) -> bool:
+    """Calls a check until it succeeds or the timeout expires.
+
+    Args:
+        check (Callable[[], bool]): Check to call
+        timeout (float, optional): Seconds to wait for the check to succeed
+        interval (float, optional): Seconds between checks
+
+    Returns:
+        bool: True if the check succeeded
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+
+
+class GNS3NotificationListener:
+    # pylint: disable=too-many-instance-attributes
+    """Listener of the notification stream of a GNS3 project.
+
+    Attributes:
+        nodes (Dict[str, Dict[str, Any]]): Live data of the project nodes by node ID
+        links (Dict[str, Dict[str, Any]]): Live data of the project links by link ID
+        project (Dict[str, Any]): Live data of the project
+    """
+
+    def __init__(self, connector: Connector, project_id: str) -> None:
+        """Initialize a GNS3 project notification listener.
+
+        Args:
+            connector (Connector): GNS3 connector object
+            project_id (str): GNS3 project ID
+        """
+        self.connector = connector
+        self.project_id = project_id
+        self.url = f"{connector.base_url}/projects/{project_id}/notifications"
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.links: Dict[str, Dict[str, Any]] = {}
+        self.project: Dict[str, Any] = {}
+        self._condition = threading.Condition()
+        self._connected = threading.Event()
+        self._ready = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the notification stream is connected and events are being received."""
+        return self._connected.is_set() and not self._closed.is_set()
+
+    def start(self) -> bool:
+        """Starts listening the notification stream in a background thread.
+
+        Returns:
+            bool: True if the notification stream is connected
+        """
+        if self._thread is not None:
+            return self.active
+
+        self._thread = threading.Thread(target=self._listen, name=f"gns3-notifications-{self.project_id}", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=self.connector.timeout)
+        if not self.active and config.DEBUG:
+            console.log("Project notifications not available, falling back to polling", style="warning")
+        return self.active
+
+    def stop(self) -> None:
+        """Stops listening the notification stream.
+
+        The listener thread leaves the stream on its next notification (the server sends periodic pings), closing the
+        response from here would block while the thread is reading it.
+        """
+        self._closed.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _listen(self) -> None:
+        """Reads the notification stream until it is closed."""
+        session = requests.Session()
+        session.auth = self.connector.session.auth
+        session.proxies.update(self.connector.session.proxies)
+        try:
+            response = session.get(
+                self.url, stream=True, verify=self.connector.verify, timeout=(self.connector.timeout, None)
+            )
+            response.raise_for_status()
+            self._connected.set()
+            self._ready.set()
+            # The stream is sent with chunked encoding, each notification is yielded as soon as it is received
+            for line in response.iter_lines(chunk_size=None):
+                if self._closed.is_set():
+                    break
+                if not line:
+                    continue
+                try:
+                    notification = json.loads(line)
+                except ValueError:
+                    continue
+                self.handle_notification(notification)
+        except requests.RequestException as err:
+            if config.DEBUG and not self._closed.is_set():
+                console.log(f"Project notifications stream ended: {err}", style="warning")
+        finally:
+            session.close()
+            self._closed.set()
+            self._ready.set()
+            with self._condition:
+                self._condition.notify_all()
+
+    def seed(self, nodes: List[Dict[str, Any]], links: List[Dict[str, Any]]) -> None:
+        """Seeds the live data with the project data retrieved from the server.
+
+        Data already received from the notification stream is kept, as it is more recent.
+
+        Args:
+            nodes (List[Dict[str, Any]]): Nodes data
+            links (List[Dict[str, Any]]): Links data
+        """
+        with self._condition:
+            for node in nodes:
+                self.nodes.setdefault(node["node_id"], node)
+            for link in links:
+                self.links.setdefault(link["link_id"], link)
+            self._condition.notify_all()
+
+    def handle_notification(self, notification: Dict[str, Any]) -> None:
+        """Updates the live data from a project notification.
+
+        Args:
+            notification (Dict[str, Any]): Notification with its `action` and `event` data
+        """
+        action = notification.get("action", "")
+        event = notification.get("event") or {}
+        resource, _, operation = action.partition(".")
+        with self._condition:
+            if resource == "node" and "node_id" in event:
+                if operation == "deleted":
+                    self.nodes.pop(event["node_id"], None)
+                else:
+                    self.nodes[event["node_id"]] = {**self.nodes.get(event["node_id"], {}), **event}
+            elif resource == "link" and "link_id" in event:
+                if operation == "deleted":
+                    self.links.pop(event["link_id"], None)
+                else:
+                    self.links[event["link_id"]] = {**self.links.get(event["link_id"], {}), **event}
+            elif resource == "project":
+                self.project.update(event)
+                if operation in ("closed", "deleted"):
+                    self._closed.set()
+            else:
+                return
+            self._condition.notify_all()
+
+    def node_status(self, node_id: str) -> Optional[str]:
+        """Live status of a node.
+
+        Args:
+            node_id (str): GNS3 node ID
+
+        Returns:
+            Optional[str]: Node status, None if unknown
+        """
+        return self.nodes.get(node_id, {}).get("status")
+
+    def wait_for(
+        self,
+        predicate: Callable[[], bool],
+        timeout: float = 60,
+        poll: Optional[Callable[[], bool]] = None,
+        poll_interval: float = 2,
+    ) -> bool:
+        """Waits for a condition on the live data.
+
+        It is resolved from the notifications while the stream is active. Otherwise, or if the stream is lost while
+        waiting, the `poll` check is used instead.
+
+        Args:
+            predicate (Callable[[], bool]): Condition on the live data
+            timeout (float, optional): Seconds to wait
+            poll (Optional[Callable[[], bool]], optional): Check against the server, used when the stream is not active
+            poll_interval (float, optional): Seconds between polls
+
+        Returns:
+            bool: True if the condition was met
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self.active:
+                if predicate():
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+
+            if predicate():
+                return True
+
+        if poll is None:
+            return False
+        return poll_until(poll, timeout=max(deadline - time.monotonic(), 0), interval=poll_interval)
+
+    def wait_node_status(
+        self, node_id: str, status: str, timeout: float = 60, poll: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """Waits for a node to reach a status.
+
+        Args:
+            node_id (str): GNS3 node ID
+            status (str): Expected status. i.e. `started`
+            timeout (float, optional): Seconds to wait
+            poll (Optional[Callable[[], bool]], optional): Check against the server, used when the stream is not active
+
+        Returns:
+            bool: True if the node reached the status
+        """
+        return self.wait_for(lambda: self.node_status(node_id) == status, timeout=timeout, poll=poll)
+
+    def wait_link_created(self, link_id: str, timeout: float = 60, poll: Optional[Callable[[], bool]] = None) -> bool:
+        """Waits for a link to be created with both of its endpoints.
+
+        Args:
+            link_id (str): GNS3 link ID
+            timeout (float, optional): Seconds to wait
+            poll (Optional[Callable[[], bool]], optional): Check against the server, used when the stream is not active
+
+        Returns:
+            bool: True if the link was created
+        """
+        return self.wait_for(
+            lambda: len(self.links.get(link_id, {}).get("nodes") or []) == 2, timeout=timeout, poll=poll
+        )
@@ -0,0 +1,191 @@
+"""GNS3 Node placement module.
+
+Assigns the GNS3 compute of each node to create, based on the capacity and usage of the computes and the footprint
+(RAM and vCPUs) of the node templates.
+
+Strategies:
+- `binpack`: fills the most used computes first, leaving the others free for bigger nodes.
+- `spread`: places each node on the least used compute, balancing the load between them.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from gns3fy.connector import Connector
+from gns3fy.templates import Template
+
+
+PLACEMENT_STRATEGIES = ["binpack", "spread"]
+
+# Footprint of nodes whose template does not specify it. i.e. docker or builtin nodes
+DEFAULT_NODE_RAM = 256
+DEFAULT_NODE_CPUS = 1
+
+
+class NodeFootprint(NamedTuple):
+    """Resources used by a node. RAM in MB."""
+
+    ram: int
+    cpus: int
+
+
+class ComputeLoad:
+    """Capacity and usage of a GNS3 compute. RAM in MB."""
+
+    def __init__(
+        self, compute_id: str, name: str, ram_total: int, cpus_total: int, ram_used: int = 0, cpus_used: float = 0
+    ):
+        """Initialize a GNS3 compute load.
+
+        Args:
+            compute_id (str): GNS3 compute ID
+            name (str): GNS3 compute name
+            ram_total (int): RAM of the compute
+            cpus_total (int): CPUs of the compute
+            ram_used (int, optional): RAM in use
+            cpus_used (float, optional): CPUs in use
+        """
+        self.compute_id = compute_id
+        self.name = name
+        self.ram_total = ram_total
+        self.cpus_total = cpus_total
+        self.ram_used = ram_used
+        self.cpus_used = cpus_used
+
+    @classmethod
+    def from_compute_data(cls, compute_data: Dict[str, Any]) -> "ComputeLoad":
+        """Creates the compute load from the GNS3 compute data.
+
+        Args:
+            compute_data (Dict[str, Any]): Compute data as returned by the GNS3 server
+
+        Returns:
+            ComputeLoad: Compute load
+        """
+        capabilities = compute_data.get("capabilities") or {}
+        ram_total = int((capabilities.get("memory") or 0) / 1024**2)
+        cpus_total = capabilities.get("cpus") or 0
+        return cls(
+            compute_id=compute_data["compute_id"],
+            name=compute_data.get("name") or compute_data["compute_id"],
+            ram_total=ram_total,
+            cpus_total=cpus_total,
+            ram_used=int(ram_total * (compute_data.get("memory_usage_percent") or 0) / 100),
+            cpus_used=cpus_total * (compute_data.get("cpu_usage_percent") or 0) / 100,
+        )
+
+    @property
+    def ram_free(self) -> int:
+        """RAM not in use."""
+        return self.ram_total - self.ram_used
+
+    def fits(self, footprint: NodeFootprint) -> bool:
+        """Whether the RAM of the node fits in the compute. vCPUs are not a limit, as they are usually overcommitted.
+
+        Args:
+            footprint (NodeFootprint): Node footprint
+
+        Returns:
+            bool: True if it fits
+        """
+        return footprint.ram <= self.ram_free
+
+    def load_with(self, footprint: NodeFootprint) -> float:
+        """Highest of the RAM and CPU usage ratios of the compute, if the node is placed on it.
+
+        Args:
+            footprint (NodeFootprint): Node footprint
+
+        Returns:
+            float: Usage ratio
+        """
+        ram_ratio = (self.ram_used + footprint.ram) / self.ram_total if self.ram_total else float("inf")
+        cpus_ratio = (self.cpus_used + footprint.cpus) / self.cpus_total if self.cpus_total else float("inf")
+        return max(ram_ratio, cpus_ratio)
+
+    def reserve(self, footprint: NodeFootprint) -> None:
+        """Accounts the resources of a node placed on the compute.
+
+        Args:
+            footprint (NodeFootprint): Node footprint
+        """
+        self.ram_used += footprint.ram
+        self.cpus_used += footprint.cpus
+
+
+def get_computes_load(connector: Connector) -> List[ComputeLoad]:
+    """Retrieves the load of the connected computes of the GNS3 server.
+
+    Args:
+        connector (Connector): GNS3 connector object
+
+    Returns:
+        List[ComputeLoad]: Computes load
+    """
+    computes_data = connector.http_call("get", f"{connector.base_url}/computes").json()
+    return [ComputeLoad.from_compute_data(x) for x in computes_data if x.get("connected", True)]
+
+
+def get_template_footprint(template: Optional[Template]) -> NodeFootprint:
+    """Estimates the footprint of a node from its template.
+
+    Args:
+        template (Optional[Template]): GNS3 template of the node
+
+    Returns:
+        NodeFootprint: Node footprint
+    """
+    ram = getattr(template, "ram", None) or DEFAULT_NODE_RAM
+    cpus = getattr(template, "cpus", None) or DEFAULT_NODE_CPUS
+    return NodeFootprint(ram=int(ram), cpus=int(cpus))
+
+
+def plan_placement(
+    nodes: Dict[str, NodeFootprint],
+    computes: List[ComputeLoad],
+    strategy: str = "binpack",
+    pinned: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Assigns a compute to each node.
+
+    Nodes are placed from the biggest to the smallest. If a node does not fit in any compute it is placed on the one
+    with more free RAM.
+
+    Args:
+        nodes (Dict[str, NodeFootprint]): Footprint of the nodes to place, by node name
+        computes (List[ComputeLoad]): Computes load. Updated with the resources of the placed nodes
+        strategy (str, optional): Placement strategy. `binpack` or `spread`
+        pinned (Optional[Dict[str, str]], optional): Compute ID of the nodes already decided. i.e. from a previous
+            placement. Kept if the compute is available
+
+    Raises:
+        ValueError: If the strategy is not supported or there are no computes
+
+    Returns:
+        Dict[str, str]: Compute ID by node name, in the same order as the nodes
+    """
+    if strategy not in PLACEMENT_STRATEGIES:
+        raise ValueError(f"Placement strategy not supported: {strategy}. Options are: {PLACEMENT_STRATEGIES}")
+    if not computes:
+        raise ValueError("No computes available for placement")
+
+    computes_by_id = {x.compute_id: x for x in computes}
+    placement: Dict[str, str] = {}
+
+    for node_name, compute_id in (pinned or {}).items():
+        if node_name in nodes and compute_id in computes_by_id:
+            computes_by_id[compute_id].reserve(nodes[node_name])
+            placement[node_name] = compute_id
+
+    pending = sorted((x for x in nodes if x not in placement), key=lambda x: nodes[x], reverse=True)
+    for node_name in pending:
+        footprint = nodes[node_name]
+        candidates = [x for x in computes if x.fits(footprint)]
+        if not candidates:
+            compute = max(computes, key=lambda x: x.ram_free)
+        elif strategy == "binpack":
+            compute = min(candidates, key=lambda x: x.ram_free)
+        else:
+            compute = min(candidates, key=lambda x, footprint=footprint: x.load_with(footprint))
+        compute.reserve(footprint)
+        placement[node_name] = compute.compute_id
+
+    return {x: placement[x] for x in nodes}
@@ -3,21 +3,28 @@
 # pylint: disable=dangerous-default-value
 import re
 import time
-from typing import Any, List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
-from rich import box
-from rich.console import Console, ConsoleOptions, ConsoleRenderable, RenderResult
-from rich.table import Table
+import typer
 from pydantic import Field
 from nornir import InitNornir
+from nornir.core.plugins.inventory import InventoryPluginRegister
 from gns3fy.projects import Project
+from gns3fy.templates import Template
 
 from labby.models import LabbyProject
+from labby.nornir.plugins.inventory.labby import LabbyNornirInventory
+from labby.port_index import PortIndex
 from labby.providers.gns3.node import GNS3Node
 from labby.providers.gns3.link import GNS3Link
-from labby.providers.gns3.utils import bool_status, link_status, node_status, node_net_os, template_type, project_status
+from labby.providers.gns3.notifications import GNS3NotificationListener, poll_until
+from labby.providers.gns3.placement import get_computes_load, get_template_footprint, plan_placement
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot, fetch_project_snapshot
+from labby.providers.gns3.views import GNS3ProjectSummary
+from labby.scheduler import plan_start_waves
 from labby.utils import console
-from labby import state_file
+from labby import name_index, state_file, utils
 
 
 def get_link_name(node_a: str, port_a: str, node_b: str, port_b: str) -> str:
@@ -35,26 +42,61 @@ def get_link_name(node_a: str, port_a: str, node_b: str, port_b: str) -> str:
     return f"{node_a}: {port_a} == {node_b}: {port_b}"
 
 
-class GNS3Project(LabbyProject):
+# Maximum node start or stop requests sent to the GNS3 server at the same time
+MAX_NODE_ACTIONS = 20
+
+
+class GNS3Project(GNS3ProjectSummary, LabbyProject):
+    # pylint: disable=too-many-instance-attributes
     """GNS3 Project class."""
 
     nodes: Dict[str, GNS3Node] = Field(default_factory=dict)  # type: ignore
     links: Dict[str, GNS3Link] = Field(default_factory=dict)  # type: ignore
     _base: Project
     _initial_state: Optional[str]
+    _templates: Dict[str, Template]
+    _snapshot: Optional[GNS3ProjectSnapshot]
+    _listener: Optional[GNS3NotificationListener]
+    _port_index: PortIndex
 
-    def __init__(self, name: str, project: Project, labels: List[str] = [], **data) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: Project,
+        labels: List[str] = [],
+        snapshot: Optional[GNS3ProjectSnapshot] = None,
+        **data,
+    ) -> None:
         """Initialize a GNS3 Project instance.
 
         Args:
             name (str): Project name.
             project (Project): GNS3 Project instance.
             labels (List[str], optional): List of labels.
+            snapshot (Optional[GNS3ProjectSnapshot], optional): Snapshot to build the project from, without reaching
+                the server nor initializing Nornir. Used for read only views.
             data (Dict[str, Any]): Project data.
         """
-        project.get()
-        initial_state = project.status
-        super().__init__(name=name, labels=labels, _base=project, _initial_state=initial_state, **data)  # type: ignore
+        # Projects retrieved from the server listing already carry their status
+        if project.status is None and snapshot is None:
+            project.get()
+        # A project built from a snapshot is not opened, so there is no state to return to
+        initial_state = project.status if snapshot is None else None
+        super().__init__(
+            name=name,
+            labels=labels,
+            _base=project,
+            _initial_state=initial_state,
+            _templates={},
+            _snapshot=snapshot,
+            _listener=None,
+            _port_index=PortIndex(),
+            **data,  # type: ignore
+        )
+        if snapshot is not None:
+            self._apply_snapshot(snapshot, nodes_refresh=True, links_refresh=True)
+            return
+
         if self._initial_state == "closed":
             self.start()
         else:
@@ -64,6 +106,7 @@ class GNS3Project(LabbyProject):
 
     def init_nornir(self) -> None:
         """Initialize Norir instance."""
+        InventoryPluginRegister.register("LabbyNornirInventory", LabbyNornirInventory)
         self.nornir = InitNornir(
             runner={
                 "plugin": "threaded",
@@ -87,15 +130,18 @@ class GNS3Project(LabbyProject):
         """
         self.status = self._base.status
         self.id = self._base.project_id  # pylint: disable=invalid-name
+        # Read the state file once for all the nodes and links of the project
+        project_state_data = state_file.get_project_data(self.name) or {}
         if nodes_refresh:
             self.nodes = {}
+            nodes_state_data = project_state_data.get("nodes", {})
             for _node in self._base.nodes.values():
                 if not _node.template:
                     _node.get()
                     if not _node.template:
                         raise ValueError(f"Node template could not be resolved: {_node}")
                 kwargs: Dict[str, Any] = {}
-                node_state_file_data = state_file.get_node_data(_node.name, self.name)
+                node_state_file_data = nodes_state_data.get(_node.name)
                 if node_state_file_data:
                     kwargs.update(**node_state_file_data)
                     # To avoid duplicate template keys from state file
@@ -105,22 +151,36 @@ class GNS3Project(LabbyProject):
                 self.nodes.update(
                     {
                         _node.name: GNS3Node(
-                            name=_node.name, template=_node.template, project_name=self.name, node=_node, **kwargs
+                            name=_node.name,
+                            template=_node.template,
+                            project_name=self.name,
+                            node=_node,
+                            gns3_template=self._templates.get(_node.template),
+                            listener=self._listener,
+                            port_index=self._port_index,
+                            **kwargs,
                         )
                     }
                 )
         if links_refresh:
             self.links = {}
+            links_state_data = project_state_data.get("links", {})
             for _link in self._base.links.values():
                 if not _link.name:
                     _link.get()
                     if not _link.name:
                         raise ValueError(f"Link name could not be resolved {_link}")
                 kwargs = {}
-                link_state_file_data = state_file.get_link_data(_link.name, self.name)
+                link_state_file_data = links_state_data.get(_link.name)
                 if link_state_file_data:
                     kwargs.update(**link_state_file_data)
-                self.links.update({_link.name: GNS3Link(name=_link.name, project_name=self.name, link=_link, **kwargs)})
+                self.links.update(
+                    {
+                        _link.name: GNS3Link(
+                            name=_link.name, project_name=self.name, link=_link, port_index=self._port_index, **kwargs
+                        )
+                    }
+                )
 
     def to_initial_state(self):
         """Set project status to initial state."""
@@ -146,16 +206,95 @@ class GNS3Project(LabbyProject):
             links_refresh (bool, optional): Refresh links attributes.
         """
         console.log(f"[b]({self.name})[/] Collecting project data")
-        self._base.get()
-        self._update_labby_project_attrs(nodes_refresh, links_refresh)
+        snapshot = fetch_project_snapshot(self._base._connector, self._base.project_id)
+        self._apply_snapshot(snapshot, nodes_refresh, links_refresh)
         self.init_nornir()
 
-    def start(self, start_nodes: Optional[str] = None, nodes_delay: int = 5) -> bool:
+    def _apply_snapshot(
+        self, snapshot: GNS3ProjectSnapshot, nodes_refresh: bool = False, links_refresh: bool = False
+    ) -> None:
+        """Update the project attributes from a snapshot.
+
+        Args:
+            snapshot (GNS3ProjectSnapshot): Project snapshot.
+            nodes_refresh (bool, optional): Refresh nodes attributes.
+            links_refresh (bool, optional): Refresh links attributes.
+        """
+        self._snapshot = snapshot
+        self._templates = snapshot.hydrate(self._base)
+        if self._listener is not None:
+            self._listener.seed(snapshot.nodes, snapshot.links)
+        ports = {node.name: [port.name for port in node.ports or []] for node in self._base.nodes.values()}
+        endpoints = {name: [(x.node_name, x.name) for x in link.nodes or []] for name, link in self._base.links.items()}
+        self._port_index.rebuild(ports, endpoints)
+        self._update_labby_project_attrs(nodes_refresh, links_refresh)
+
+        # Names for the shell completion
+        name_index.index_templates(list(self._templates))
+        name_index.index_project(self.name, ports=ports, links=list(self._base.links))
+
+    def listen(self) -> None:
+        """Starts listening the project notifications, to track the live status of its nodes and links.
+
+        Started by the actions that wait on the nodes or links, once while the project is opened. If the notification
+        stream is not available the waits on the nodes and links fall back to polling.
+        """
+        if self._listener is not None:
+            return
+
+        self._listener = GNS3NotificationListener(self._base._connector, self._base.project_id)
+        self._listener.start()
+        if self._snapshot is not None:
+            self._listener.seed(self._snapshot.nodes, self._snapshot.links)
+        for node in self.nodes.values():
+            node._listener = self._listener
+
+    def wait_nodes_status(self, status: str, timeout: int = 60, names: Optional[List[str]] = None) -> bool:
+        """Waits for the project nodes to reach a status.
+
+        Resolved from the project notifications when they are being listened, polling the nodes otherwise.
+
+        Args:
+            status (str): Expected status. i.e. `started`
+            timeout (int, optional): Seconds to wait.
+            names (Optional[List[str]], optional): Names of the nodes to wait for. Defaults to all nodes.
+
+        Returns:
+            bool: True if all the nodes reached the status.
+        """
+        node_ids = [node.node_id for node in self._base.nodes.values() if names is None or node.name in names]
+
+        def _poll() -> bool:
+            nodes_data = self._base._connector.http_call(
+                "get", f"{self._base._connector.base_url}/projects/{self._base.project_id}/nodes"
+            ).json()
+            return all(node_data["status"] == status for node_data in nodes_data if node_data["node_id"] in node_ids)
+
+        if self._listener is None:
+            return poll_until(_poll, timeout=timeout)
+
+        return self._listener.wait_for(
+            lambda: all(self._listener.node_status(node_id) == status for node_id in node_ids),  # type: ignore
+            timeout=timeout,
+            poll=_poll,
+        )
+
+    def start(
+        self,
+        start_nodes: Optional[str] = None,
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> bool:
         """Start project.
 
         Args:
             start_nodes (Optional[str], optional): Start nodes.
             nodes_delay (int, optional): Nodes delay between starts.
+            labels_order (List[str], optional): Labels in the order their nodes are started. Used by "waves".
+            max_booting (Optional[int], optional): Maximum nodes booting at the same time. Used by "waves".
+            names (Optional[List[str]], optional): Names of the nodes to start. Defaults to all nodes.
 
         Returns:
             bool: True if project started.
@@ -164,10 +303,17 @@ class GNS3Project(LabbyProject):
         self._base.open()
         # Delay to give project to finish initilization
         time.sleep(2)
+        self.listen()
 
         # Start nodes
         if start_nodes is not None:
-            self.start_nodes(start_nodes=start_nodes, nodes_delay=nodes_delay)
+            self.start_nodes(
+                start_nodes=start_nodes,
+                nodes_delay=nodes_delay,
+                labels_order=labels_order,
+                max_booting=max_booting,
+                names=names,
+            )
 
         # Refresh and validate
         self.get(nodes_refresh=True, links_refresh=True)
@@ -194,6 +340,9 @@ class GNS3Project(LabbyProject):
         # Stop nodes
         if stop_nodes:
             self.stop_nodes()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
         self._base.close()
         time.sleep(2)
 
@@ -250,21 +399,52 @@ class GNS3Project(LabbyProject):
         console.log(f"[b]({self.name})[/] Project could not be deleted", style="warning")
         return False
 
-    def start_nodes(self, start_nodes: str, nodes_delay: int = 5) -> None:
+    def start_nodes(
+        self,
+        start_nodes: str,
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> None:
         """Start nodes.
 
         Args:
-            start_nodes (str): Start nodes method. Options are: "all", "one_by_one".
+            start_nodes (str): Start nodes method. Options are: "all", "one_by_one", "waves".
             nodes_delay (int, optional): Nodes delay between starts.
+            labels_order (List[str], optional): Labels in the order their nodes are started. Used by "waves".
+            max_booting (Optional[int], optional): Maximum nodes booting at the same time. Used by "waves".
+            names (Optional[List[str]], optional): Names of the nodes to start. Defaults to all nodes.
         """
-        if start_nodes == "all":
+        if names is not None and not names:
+            console.log(f"[b]({self.name})[/] No nodes selected to start", style="warning")
+            return
+        self.listen()
+
+        if start_nodes == "waves":
+            self.start_nodes_waves(
+                nodes_delay=nodes_delay, labels_order=labels_order, max_booting=max_booting, names=names
+            )
+            return
+
+        if start_nodes == "all" and names is not None:
+            console.log(f"[b]({self.name})[/] Starting nodes: [cyan i]{names}[/]")
+            if not self.start_wave(names):
+                console.log(f"[b]({self.name})[/] Not all the nodes reported as started", style="warning")
+            # Delay to give some time for device bootup
+            time.sleep(nodes_delay)
+        elif start_nodes == "all":
             console.log(f"[b]({self.name})[/] Starting all nodes in project {self.name}...")
-            self._base.nodes_action(action="start", poll_wait_time=nodes_delay)
+            self._base.nodes_action(action="start", poll_wait_time=0)
+            if not self.wait_nodes_status("started"):
+                console.log(f"[b]({self.name})[/] Not all the nodes reported as started", style="warning")
             # Delay to give some time for device bootup
-            time.sleep(5)
+            time.sleep(nodes_delay)
         elif start_nodes == "one_by_one":
-            with console.status(f"[b]({self.name})[/] Starting nodes...", spinner="aesthetic") as status:
+            with utils.status(f"[b]({self.name})[/] Starting nodes...", spinner="aesthetic") as status:
                 for node in self.nodes.values():
+                    if names is not None and node.name not in names:
+                        continue
                     if node.status == "started":
                         console.log(f"[b]({self.name})({node.name})[/] Node already started...")
                     else:
@@ -277,11 +457,85 @@ class GNS3Project(LabbyProject):
                         time.sleep(nodes_delay)
         console.log(f"[b]({self.name})[/] Project nodes have been started", style="good")
 
-    def stop_nodes(self) -> None:
-        """Stop nodes."""
+    def start_nodes_waves(
+        self,
+        nodes_delay: int = 5,
+        labels_order: List[str] = [],
+        max_booting: Optional[int] = None,
+        names: Optional[List[str]] = None,
+    ) -> None:
+        """Start nodes in waves.
+
+        The nodes of a wave are started concurrently. The next wave is admitted once all the nodes of the previous one
+        report as started and the `nodes_delay` warmup has passed. The `start_after` dependencies of the nodes are
+        taken from the state file.
+
+        Args:
+            nodes_delay (int, optional): Warmup delay between waves.
+            labels_order (List[str], optional): Labels in the order their nodes are started.
+            max_booting (Optional[int], optional): Maximum nodes booting at the same time.
+            names (Optional[List[str]], optional): Names of the nodes to start. Defaults to all nodes.
+        """
+        project_state_data = state_file.get_project_data(self.name) or {}
+        try:
+            waves = plan_start_waves(
+                {node.name: node.labels for node in self.nodes.values() if names is None or node.name in names},
+                labels_order=labels_order,
+                start_after=project_state_data.get("start_after"),
+                max_booting=max_booting,
+            )
+        except ValueError as err:
+            console.log(f"[b]({self.name})[/] Nodes start order not valid: {err}", style="error")
+            raise typer.Exit(1) from err
+
+        for index, wave in enumerate(waves, start=1):
+            wave_names = [x for x in wave if self.nodes[x].status != "started"]
+            if not wave_names:
+                console.log(f"[b]({self.name})[/] Wave {index}/{len(waves)} already started")
+                continue
+
+            console.log(f"[b]({self.name})[/] Starting wave {index}/{len(waves)}: [cyan i]{wave_names}[/]")
+            if not self.start_wave(wave_names):
+                console.log(
+                    f"[b]({self.name})[/] Not all the nodes of wave {index} reported as started", style="warning"
+                )
+            if index < len(waves):
+                # Delay to give some time for device bootup before admitting the next wave
+                time.sleep(nodes_delay)
+        console.log(f"[b]({self.name})[/] Project nodes have been started", style="good")
+
+    def start_wave(self, names: List[str]) -> bool:
+        """Start a group of nodes concurrently and wait for them to be started.
+
+        Args:
+            names (List[str]): Names of the nodes to start.
+
+        Returns:
+            bool: True if all the nodes reported as started.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_NODE_ACTIONS) as executor:
+            list(executor.map(lambda x: self.nodes[x]._base.start(), names))
+        return self.wait_nodes_status("started", names=names)
+
+    def stop_nodes(self, names: Optional[List[str]] = None) -> None:
+        """Stop nodes.
+
+        Args:
+            names (Optional[List[str]], optional): Names of the nodes to stop. Defaults to all nodes.
+        """
+        if names is not None and not names:
+            console.log(f"[b]({self.name})[/] No nodes selected to stop", style="warning")
+            return
+        self.listen()
+
         console.log(f"[b]({self.name})[/] Stopping nodes")
-        self._base.nodes_action(action="stop")
-        time.sleep(2)
+        if names is None:
+            self._base.nodes_action(action="stop", poll_wait_time=0)
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_NODE_ACTIONS) as executor:
+                list(executor.map(lambda x: self.nodes[x]._base.stop(), names))
+        if not self.wait_nodes_status("stopped", names=names):
+            console.log(f"[b]({self.name})[/] Not all the nodes reported as stopped", style="warning")
         console.log(f"[b]({self.name})[/] Project nodes have been stopped", style="good")
 
     def create_node(
@@ -316,6 +570,7 @@ class GNS3Project(LabbyProject):
         if _node:
             console.log(f"Node [cyan i]{name}[/] already created. Nothing to do...", style="warning")
             return _node
+        self.listen()
 
         console.log(f"[b]({self.name})({name})[/] Creating node with template [cyan i]{template}[/]")
         gns3_node = self._base.create_node(name=name, template=template, **kwargs)
@@ -324,6 +579,9 @@ class GNS3Project(LabbyProject):
             template=template,
             project_name=self.name,
             node=gns3_node,
+            gns3_template=self._templates.get(template),
+            listener=self._listener,
+            port_index=self._port_index,
             labels=labels,
             mgmt_addr=mgmt_addr,
             mgmt_port=mgmt_port,
@@ -339,6 +597,7 @@ class GNS3Project(LabbyProject):
 
         # Save node in project
         self.nodes[name] = node
+        self._port_index.add_node(name, [port.name for port in gns3_node.ports or []])
         time.sleep(2)
         console.log(f"[b]({self.name})({node.name})[/] Node created", style="good")
 
@@ -349,6 +608,48 @@ class GNS3Project(LabbyProject):
         self.init_nornir()
         return node
 
+    def place_nodes(self, nodes_spec: List[Dict[str, Any]], strategy: str) -> List[Dict[str, Any]]:
+        """Assign the GNS3 compute of the nodes to create, and keep the placement in the state file.
+
+        Nodes placed on a previous run keep their compute while it is available, and nodes with a `compute_id` in
+        their spec are not placed.
+
+        Args:
+            nodes_spec (List[Dict[str, Any]]): Nodes specs, each one holding the arguments of `create_node`.
+            strategy (str): Placement strategy. Options are: "binpack", "spread".
+
+        Returns:
+            List[Dict[str, Any]]: Nodes specs with their `compute_id`.
+        """
+        computes = get_computes_load(self._base._connector)
+        if len(computes) < 2:
+            console.log(f"[b]({self.name})[/] Single compute available, skipping node placement")
+            return nodes_spec
+
+        # Nodes of the project not started yet will use the resources of their compute once started
+        computes_by_id = {x.compute_id: x for x in computes}
+        for _node in self._base.nodes.values():
+            if _node.status != "started" and _node.compute_id in computes_by_id:
+                computes_by_id[_node.compute_id].reserve(get_template_footprint(self._templates.get(_node.template)))
+
+        footprints = {
+            x["name"]: get_template_footprint(self._templates.get(x["template"]))
+            for x in nodes_spec
+            if "compute_id" not in x
+        }
+        project_state_data = state_file.get_project_data(self.name) or {}
+        placement = plan_placement(footprints, computes, strategy=strategy, pinned=project_state_data.get("placement"))
+        for compute in computes:
+            placed = [name for name, compute_id in placement.items() if compute_id == compute.compute_id]
+            if placed:
+                console.log(
+                    f"[b]({self.name})[/] Placing {len(placed)} nodes on compute [cyan i]{compute.name}[/] "
+                    f"({compute.ram_used}/{compute.ram_total} MB RAM)"
+                )
+        state_file.apply_placement_data(placement, self)
+
+        return [dict(x, compute_id=placement[x["name"]]) if x["name"] in placement else x for x in nodes_spec]
+
     def search_node(self, name: str) -> Optional[GNS3Node]:
         """Search node in project.
 
@@ -411,6 +712,7 @@ class GNS3Project(LabbyProject):
         if _link:
             console.log(f"Link [cyan i]{_link.name}[/] already created. Nothing to do...", style="warning")
             return _link
+        self.listen()
 
         console.log(f"[b]({self.name})[/] Creating link on: [cyan i]{node_a}: {port_a} <==> {port_b}: {node_b}[/]")
         gns3_link = self._base.create_link(node_a, port_a, node_b, port_b, **kwargs)
@@ -419,9 +721,12 @@ class GNS3Project(LabbyProject):
             project_name=self.name,
             link=gns3_link,
             labels=labels,
+            port_index=self._port_index,
             **kwargs,
         )
-        time.sleep(2)
+        self._wait_link_created(_link)
+        self.links[_link.name] = _link
+        self._port_index.add_link(_link.name, [(node_a, port_a), (node_b, port_b)])
         if filters:
             _link.apply_filters(**filters)
 
@@ -429,6 +734,28 @@ class GNS3Project(LabbyProject):
         state_file.apply_link_data(_link, self)
         return _link
 
+    def _wait_link_created(self, link: GNS3Link, timeout: int = 30) -> bool:
+        """Waits for a link to be created on the server.
+
+        Resolved from the project notifications when they are being listened, polling the link otherwise.
+
+        Args:
+            link (GNS3Link): Link instance.
+            timeout (int, optional): Seconds to wait.
+
+        Returns:
+            bool: True if the link was created.
+        """
+
+        def _poll() -> bool:
+            link._base.get()
+            return len(link._base.nodes or []) == 2
+
+        if self._listener is None:
+            return poll_until(_poll, timeout=timeout)
+
+        return self._listener.wait_link_created(link.id, timeout=timeout, poll=_poll)  # type: ignore
+
     def search_link(self, node_a: str, port_a: str, node_b: str, port_b: str) -> Optional[GNS3Link]:
         """Search link in project.
 
@@ -438,18 +765,27 @@ class GNS3Project(LabbyProject):
             node_b (str): Side B Node name.
             port_b (str): Side B Port name.
 
+        Raises:
+            ValueError: If a node or port is not found
+
         Returns:
             Optional[GNS3Link]: Link instance.
         """
         # Refresh attributes
         self.get()
 
-        _gns3_link = self._base.search_link(node_a, port_a, node_b, port_b)
+        for side, node_name, port_name in (("a", node_a, port_a), ("b", node_b, port_b)):
+            if node_name not in self._port_index.ports:
+                raise ValueError(f"node_{side}: {node_name} not found")
+            if not self._port_index.has_port(node_name, port_name):
+                raise ValueError(f"port_{side}: {port_name} not found")
+
+        link_name = self._port_index.find_link(node_a, port_a, node_b, port_b)
 
-        if _gns3_link is None:
+        if link_name is None:
             return None
 
-        link = self.links.get(f"{_gns3_link.name}")
+        link = self.links.get(link_name)
 
         if link is not None:
             link_state_file_data = state_file.get_link_data(link.name, self.name)
@@ -458,161 +794,20 @@ class GNS3Project(LabbyProject):
 
         return link
 
-    def render_nodes_summary(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
-    ) -> ConsoleRenderable:
-        """Render a Project's nodes attributes summary.
-
-        Args:
-            field (Optional[str], optional): Field to filter on.
-            value (Optional[str], optional): Value to filter on.
+    def summary(self) -> Dict[str, Any]:
+        """Returns the project attributes summary, as plain values.
 
         Returns:
-            ConsoleRenderable: Renderable table of the nodes attributes.
+            Dict[str, Any]: Project attributes.
         """
-        table = Table(
-            "Name",
-            "Status",
-            "Kind",
-            "Category",
-            "NET OS",
-            "Model",
-            "Version",
-            "Builtin",
-            # "Template",
-            "Console Port",
-            "Labels",
-            "Mgmt Address",
-            "Config Managed",
-            "# Ports",
-            title="Nodes Information",
-            title_justify="center",
-            show_lines=True,
-            highlight=True,
-        )
-        if field:
-            nodes = [x for x in self.nodes.values() if getattr(x, field) == value]
-        else:
-            nodes = list(self.nodes.values())
-        for node in nodes:
-            node_ports = "None" if node.interfaces is None else str(len(node.interfaces))
-
-            # Skip node if labels are not present
-            if labels:
-                if not any(x in node.labels for x in labels):
-                    continue
-
-            table.add_row(
-                f"[b]{node.name}[/]",
-                node_status(node.status),
-                template_type(node.kind),
-                node.category if node.template else "None",
-                node_net_os(node.net_os),
-                node.model if node.model else "None",
-                node.version if node.version else "None",
-                bool_status(node.builtin),
-                # node.template if node.template else "None",
-                str(node.console),
-                str(node.labels) if node.labels is not None else "None",
-                node.mgmt_addr,
-                bool_status(node.config_managed),
-                node_ports,
-            )
-        return table
-
-    def render_links_summary(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
-    ) -> ConsoleRenderable:
-        """Render a Project's links attributes summary.
-
-        Args:
-            field (Optional[str], optional): Field to filter on.
-            value (Optional[str], optional): Value to filter on.
-
-        Raises:
-            ValueError: If a link does not have an endpoint defined.
-
-        Returns:
-            ConsoleRenderable: Renderable table of the links attributes.
-        """
-        table = Table(
-            "Node A",
-            "Port A",
-            "Node B",
-            "Port B",
-            "Status",
-            "Capturing",
-            "Filters",
-            "Labels",
-            "Kind",
-            title="Links Information",
-            show_lines=True,
-            title_justify="center",
-            highlight=True,
-        )
-        if field:
-            links = [x for x in self.links.values() if getattr(x, field) == value]
-        else:
-            links = list(self.links.values())
-
-        for link in links:
-            if link.endpoint is None:
-                raise ValueError(f"Link {link} does not have endpoint defined")
-
-            # Skip node if labels are not present
-            if labels:
-                if not any(x in link.labels for x in labels):
-                    continue
-
-            table.add_row(
-                f"[b]{link.endpoint.node_a}[/]",
-                f"{link.endpoint.port_a}",
-                f"[b]{link.endpoint.node_b}[/]",
-                f"{link.endpoint.port_b}",
-                link_status(link.status),
-                bool_status(link._base.capturing) if link._base.capturing is not None else "None",
-                str(link.filters) if link.filters is not None else "None",
-                str(link.labels) if link.labels is not None else "None",
-                link.kind,
-            )
-        return table
-
-    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
-        # pylint: disable=unused-argument
-        # pylint: disable=redefined-outer-name
-        """Rich repr for a project.
-
-        Args:
-            console (Console): Console instance.
-            options (ConsoleOptions): Console options.
-
-        Returns:
-            RenderResult: Console render result.
-
-        Yields:
-            Iterator[RenderResult]: Console render result.
-        """
-        yield f"[b]Project:[/b] {self.name}"
-        table = Table(
-            "Status",
-            "#Nodes",
-            "#Links",
-            "Labels",
-            "Auto Start",
-            "Auto Close",
-            "Auto Open",
-            "ID",
-            box=box.HEAVY_EDGE,
-            highlight=True,
-        )
-        table.add_row(
-            project_status(self.status),
-            str(len(self.nodes)),
-            str(len(self.links)),
-            str(self.labels),
-            bool_status(self._base.auto_start),
-            bool_status(self._base.auto_close),
-            bool_status(self._base.auto_open),
-            self.id,
-        )
-        yield table
+        return {
+            "name": self.name,
+            "status": self.status,
+            "nodes": len(self.nodes),
+            "links": len(self.links),
+            "labels": self.labels,
+            "auto_start": self._base.auto_start,
+            "auto_close": self._base.auto_close,
+            "auto_open": self._base.auto_open,
+            "id": self.id,
+        }
@@ -2,18 +2,23 @@
 # pylint: disable=protected-access
 # pylint: disable=dangerous-default-value
 import time
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import typer
 from rich.table import Table
 from rich.console import ConsoleRenderable
+from gns3fy.projects import Project
 from gns3fy.server import Server
 
-from labby.providers.gns3.template import GNS3NodeTemplate
+from labby.providers.gns3.connector import GNS3Connector
+from labby.providers.gns3.template import GNS3NodeTemplate, get_template_ports
 from labby.models import LabbyProvider
 from labby.utils import console
-from labby import state_file
+from labby import cache, name_index, state_file
+from labby.labels import match_labels
 from labby.providers.gns3.project import GNS3Project
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot, fetch_project_snapshot
+from labby.providers.gns3.views import GNS3ProjectView
 from labby.providers.gns3.utils import bool_status, project_status, string_status, template_type
 
 
@@ -45,37 +50,173 @@ class GNS3Provider(LabbyProvider):
         """
         super().__init__(name=name, kind=kind)
         self._base: Server = Server(
-            url=server_url,
-            user=user,
-            cred=password,
-            verify=verify_cert,
-            timeout=timeout,
-            retries=retries,
+            url=GNS3Connector(
+                url=server_url,
+                user=user,
+                cred=password,
+                verify=verify_cert,
+                timeout=timeout,
+                retries=retries,
+            )
         )
 
-    def search_project(self, project_name: str) -> Optional[GNS3Project]:
+    def _init_project(self, project_name: str, project: Project, labels: List[str] = [], **kwargs) -> GNS3Project:
+        return GNS3Project(project_name, project, labels=labels, **kwargs)
+
+    def get_projects_data(self, cached: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Retrieves the projects data of the GNS3 server.
+
+        Args:
+            cached (Optional[bool], optional): If True the data is served from the read cache while fresh. If False it
+                is retrieved from the server and the read cache refreshed. If None the read cache is not used.
+
+        Returns:
+            List[Dict[str, Any]]: Projects data
+        """
+        if cached:
+            projects_data = cache.read("projects")
+            if projects_data is not None:
+                return projects_data
+
+        projects_data = self._base.connector.http_call("get", f"{self._base.connector.base_url}/projects").json()
+        if cached is not None:
+            cache.write("projects", projects_data)
+        return projects_data
+
+    def get_templates_data(self, cached: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Retrieves the templates data of the GNS3 server.
+
+        Args:
+            cached (Optional[bool], optional): If True the data is served from the read cache while fresh. If False it
+                is retrieved from the server and the read cache refreshed. If None the read cache is not used.
+
+        Returns:
+            List[Dict[str, Any]]: Templates data
+        """
+        if cached:
+            templates_data = cache.read("templates")
+            if templates_data is not None:
+                return templates_data
+
+        templates_data = self._base.connector.http_call("get", f"{self._base.connector.base_url}/templates").json()
+        if cached is not None:
+            cache.write("templates", templates_data)
+        return templates_data
+
+    def get_templates_ports(self, cached: Optional[bool] = None) -> Dict[str, Optional[List[str]]]:
+        """Retrieves the port names the nodes of each template have.
+
+        Args:
+            cached (Optional[bool], optional): Use of the read cache. See `get_templates_data`
+
+        Returns:
+            Dict[str, Optional[List[str]]]: Port names by template name. None if they depend on the node
+        """
+        return {x["name"]: get_template_ports(x) for x in self.get_templates_data(cached=cached)}
+
+    def search_project(self, project_name: str, cached: Optional[bool] = None) -> Optional[GNS3Project]:
         """Search a project in the GNS3 server.
 
         Args:
             project_name (str): Name of the project to search
+            cached (Optional[bool], optional): If True the project is built from the read cache while fresh, without
+                reaching the server. If False it is retrieved from the server and the read cache refreshed. If None the
+                read cache is not used.
 
         Returns:
             Optional[GNS3Project]: Project object or None
         """
-        r_gns3_project = self._base.search_project(project_name)
+        # Retrive info from lock file
+        project_state_file_data = state_file.get_project_data(project_name)
+        labels = project_state_file_data["labels"] if project_state_file_data else []
+
+        if cached:
+            snapshot_data = cache.read(f"project-{project_name}")
+            if snapshot_data is not None:
+                snapshot = GNS3ProjectSnapshot(**snapshot_data)
+                _project = self._init_project(
+                    project_name,
+                    Project(connector=self._base.connector, **snapshot.project),
+                    labels=labels,
+                    snapshot=snapshot,
+                )
+                console.log(_project)
+                return _project
+
+        # The project data is collected in bulk by GNS3Project, so the listing is enough to find it
+        self._base.get_projects()
+        r_gns3_project = self._base.projects.get(project_name)
         if not r_gns3_project:
             return None
 
-        # Retrive info from lock file
-        project_state_file_data = state_file.get_project_data(project_name)
         if project_state_file_data is None:
-            _project = GNS3Project(project_name, r_gns3_project)
+            _project = self._init_project(project_name, r_gns3_project)
             state_file.apply_project_data(_project)
         else:
-            labels = project_state_file_data["labels"]
-            _project = GNS3Project(project_name, r_gns3_project, labels=labels)
+            _project = self._init_project(project_name, r_gns3_project, labels=labels)
         console.log(_project)
 
+        if cached is not None and _project._snapshot is not None:
+            # Stored with the status the project is left in, read commands return it to its initial state
+            snapshot_data = _project._snapshot.to_dict()
+            snapshot_data["project"] = dict(snapshot_data["project"], status=_project._initial_state)
+            cache.write(f"project-{project_name}", snapshot_data)
+
+        return _project
+
+    def search_project_view(self, project_name: str, cached: Optional[bool] = None) -> Optional[GNS3ProjectView]:
+        """Search a project in the GNS3 server, returning a read only view of it for the listings.
+
+        The view is built from the bulk project data without the gns3fy objects nor the Nornir inventory. A closed
+        project is opened to collect its data and closed again.
+
+        Args:
+            project_name (str): Name of the project to search
+            cached (Optional[bool], optional): Use of the read cache, shared with `search_project`
+
+        Returns:
+            Optional[GNS3ProjectView]: Project view or None
+        """
+        project_state_file_data = state_file.get_project_data(project_name)
+        labels = project_state_file_data["labels"] if project_state_file_data else []
+
+        snapshot = None
+        if cached:
+            snapshot_data = cache.read(f"project-{project_name}")
+            if snapshot_data is not None:
+                snapshot = GNS3ProjectSnapshot(**snapshot_data)
+
+        if snapshot is None:
+            project_data = next((x for x in self.get_projects_data(cached=cached) if x["name"] == project_name), None)
+            if project_data is None:
+                return None
+
+            connector = self._base.connector
+            project_url = f"{connector.base_url}/projects/{project_data['project_id']}"
+            if project_data.get("status") == "closed":
+                console.log(f"[b]({project_name})[/] Opening project to collect its data")
+                connector.http_call("post", f"{project_url}/open")
+                try:
+                    snapshot = fetch_project_snapshot(connector, project_data["project_id"])
+                finally:
+                    connector.http_call("post", f"{project_url}/close")
+            else:
+                snapshot = fetch_project_snapshot(connector, project_data["project_id"])
+            # With the status the project is left in
+            snapshot.project = dict(snapshot.project, status=project_data.get("status"))
+            if cached is not None:
+                cache.write(f"project-{project_name}", snapshot.to_dict())
+
+        _project = GNS3ProjectView(project_name, snapshot, labels=labels, project_state=project_state_file_data)
+
+        # Names for the shell completion
+        name_index.index_templates([x["name"] for x in snapshot.templates])
+        name_index.index_project(
+            project_name,
+            ports={x["name"]: [y["name"] for y in x.get("ports") or []] for x in snapshot.nodes},
+            links=list(_project.links),
+        )
+        console.log(_project)
         return _project
 
     def create_project(self, project_name: str, labels: List[str] = [], **kwargs) -> GNS3Project:
@@ -96,7 +237,7 @@ class GNS3Provider(LabbyProvider):
 
         console.log(f"[b]({project_name})[/] Creating project")
         gns3_project = self._base.create_project(project_name)
-        project = GNS3Project(project_name, gns3_project, labels, **kwargs)
+        project = self._init_project(project_name, gns3_project, labels, **kwargs)
         time.sleep(2)
         # console.log(project)
         console.log(f"[b]({project_name})[/] Project created", style="good")
@@ -149,16 +290,88 @@ class GNS3Provider(LabbyProvider):
         console.log(f"[b]({template.name})[/] Template created", style="good")
         return template
 
-    def render_templates_list(self, field: Optional[str] = None, value: Optional[str] = None) -> ConsoleRenderable:
+    def iter_templates_list(
+        self, field: Optional[str] = None, value: Optional[str] = None, cached: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over the templates summary.
+
+        Args:
+            field (Optional[str], optional): Field to filter on
+            value (Optional[str], optional): Value to filter on
+            cached (Optional[bool], optional): Use of the read cache. See `get_templates_data`
+
+        Yields:
+            Iterator[Dict[str, Any]]: Template attributes
+        """
+        templates = self.get_templates_data(cached=cached)
+        name_index.index_templates([x["name"] for x in templates])
+        for template in templates:
+            if field and template.get(field) != value:
+                continue
+            yield {
+                "name": template["name"],
+                "category": template.get("category"),
+                "template_type": template.get("template_type"),
+                "builtin": template.get("builtin"),
+                "first_port_name": template.get("first_port_name"),
+                "image": template.get("hda_disk_image"),
+                "id": template.get("template_id"),
+            }
+
+    def iter_project_list(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        cached: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over the projects summary.
+
+        Args:
+            field (Optional[str], optional): Field to filter on
+            value (Optional[str], optional): Value to filter on
+            labels (Optional[List[str]], optional): Label expressions to filter on. See `labby.labels`
+            cached (Optional[bool], optional): Use of the read cache. See `get_projects_data`
+
+        Yields:
+            Iterator[Dict[str, Any]]: Project attributes
+        """
+        projects = self.get_projects_data(cached=cached)
+        name_index.index_projects([x["name"] for x in projects])
+        for prj in projects:
+            if field and prj.get(field) != value:
+                continue
+
+            # Get labels from lock file
+            project_state_file_data = state_file.get_project_data(prj["name"])
+            project_labels = project_state_file_data["labels"] if project_state_file_data else []
+
+            # Skip project if labels are not present
+            if labels and not match_labels(labels, project_labels):
+                continue
+
+            yield {
+                "name": prj["name"],
+                "status": prj.get("status"),
+                "auto_start": prj.get("auto_start"),
+                "auto_close": prj.get("auto_close"),
+                "auto_open": prj.get("auto_open"),
+                "labels": project_labels,
+                "id": prj.get("project_id"),
+            }
+
+    def render_templates_list(
+        self, field: Optional[str] = None, value: Optional[str] = None, cached: Optional[bool] = None
+    ) -> ConsoleRenderable:
         """Render templates list.
 
         Args:
             field (Optional[str], optional): Field to filter on
             value (Optional[str], optional): Value to filter on
+            cached (Optional[bool], optional): Use of the read cache. See `get_templates_data`
 
         Returns:
             ConsoleRenderable: Table
-        """ """
         """
         table = Table(title="GNS3 Templates", highlight=True)
         table.add_column("Device Template")
@@ -167,24 +380,39 @@ class GNS3Provider(LabbyProvider):
         table.add_column("Builtin")
         table.add_column("First/Mgmt Port")
         table.add_column("Image")
-        self._base.get_templates()
-        if field:
-            templates = [x for x in self._base.templates.values() if getattr(x, field) == value]
-        else:
-            templates = self._base.templates.values()
-        for template in templates:
+        for template in self.iter_templates_list(field=field, value=value, cached=cached):
             table.add_row(
-                template.name,
-                template.category,
-                template_type(template.template_type),
-                bool_status(template.builtin),
-                string_status(getattr(template, "first_port_name", "N/A")),
-                string_status(getattr(template, "hda_disk_image", "N/A")),
+                template["name"],
+                template["category"],
+                template_type(template["template_type"]),
+                bool_status(template["builtin"]),
+                string_status(template["first_port_name"] or "N/A"),
+                string_status(template["image"] or "N/A"),
             )
         return table
 
+    def render_project_row(self, project_data: Dict[str, Any]) -> List[str]:
+        """Render the status and settings of a project, as listed by `iter_project_list`.
+
+        Args:
+            project_data (Dict[str, Any]): Project attributes
+
+        Returns:
+            List[str]: Status, Auto Start, Auto Close and Auto Open cells
+        """
+        return [
+            project_status(project_data["status"]),
+            bool_status(project_data["auto_start"]),
+            bool_status(project_data["auto_close"]),
+            bool_status(project_data["auto_open"]),
+        ]
+
     def render_project_list(
-        self, field: Optional[str] = None, value: Optional[str] = None, labels: Optional[List[str]] = []
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        cached: Optional[bool] = None,
     ) -> ConsoleRenderable:
         """Render project list.
 
@@ -192,6 +420,7 @@ class GNS3Provider(LabbyProvider):
             field (Optional[str], optional): Field to filter on
             value (Optional[str], optional): Value to filter on
             labels (Optional[List[str]], optional): List of labels to filter on
+            cached (Optional[bool], optional): Use of the read cache. See `get_projects_data`
 
         Returns:
             ConsoleRenderable: Table
@@ -203,30 +432,36 @@ class GNS3Provider(LabbyProvider):
         table.add_column("Auto Close")
         table.add_column("Auto Open")
         table.add_column("Labels")
-        self._base.get_projects()
-        if field:
-            projects = [x for x in self._base.projects.values() if getattr(x, field) == value]
-        else:
-            projects = list(self._base.projects.values())
-        for prj in projects:
-            if prj is None:
-                continue
-
-            # Get labels from lock file
-            project_state_file_data = state_file.get_project_data(prj.name)  # type: ignore
-            project_labels = project_state_file_data["labels"] if project_state_file_data else []
+        for prj in self.iter_project_list(field=field, value=value, labels=labels, cached=cached):
+            table.add_row(prj["name"], *self.render_project_row(prj), str(prj["labels"]))
+        return table
 
-            # Skip project if labels are not present
-            if labels:
-                if not any(x in project_labels for x in labels):
-                    continue
+    def render_requests_stats(self) -> ConsoleRenderable:
+        """Render the counters of the requests sent to the GNS3 server, by endpoint class.
 
+        Returns:
+            ConsoleRenderable: Table
+        """
+        table = Table(title="GNS3 API Requests", highlight=True)
+        table.add_column("Endpoint")
+        table.add_column("Requests", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("Retries", justify="right")
+        table.add_column("Throttled", justify="right")
+        table.add_column("Waited (s)", justify="right")
+        table.add_column("Rate (req/s)", justify="right")
+        table.add_column("Latency (ms)", justify="right")
+        for stats in self._base.connector.stats():
+            if not stats["requests"]:
+                continue
             table.add_row(
-                prj.name,
-                project_status(prj.status),
-                bool_status(prj.auto_start),
-                bool_status(prj.auto_close),
-                bool_status(prj.auto_open),
-                str(project_labels),
+                stats["name"],
+                str(stats["requests"]),
+                str(stats["errors"]),
+                str(stats["retries"]),
+                str(stats["throttled"]),
+                f"{stats['waited']:.2f}",
+                f"{stats['rate']:.1f}",
+                f"{stats['latency'] * 1000:.0f}" if stats["latency"] is not None else "N/A",
             )
         return table
@@ -0,0 +1,149 @@
+"""GNS3 Project snapshot module.
+
+Retrieves a project, its nodes, links and the server template catalog in a fixed number of requests, and hydrates
+the gns3fy objects from that data without any per-object round trip.
+"""
+# pylint: disable=protected-access
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from gns3fy.connector import Connector
+from gns3fy.links import Link
+from gns3fy.nodes import Node
+from gns3fy.ports import Port
+from gns3fy.projects import Project
+from gns3fy.templates import Template
+
+
+def get_snapshot_urls(connector: Connector, project_id: str) -> Dict[str, str]:
+    """Returns the URLs needed to build a project snapshot.
+
+    Args:
+        connector (Connector): GNS3 connector object
+        project_id (str): GNS3 project ID
+
+    Returns:
+        Dict[str, str]: Resource name and URL
+    """
+    return {
+        "project": f"{connector.base_url}/projects/{project_id}",
+        "nodes": f"{connector.base_url}/projects/{project_id}/nodes",
+        "links": f"{connector.base_url}/projects/{project_id}/links",
+        "templates": f"{connector.base_url}/templates",
+    }
+
+
+def fetch_project_snapshot(connector: Connector, project_id: str) -> "GNS3ProjectSnapshot":
+    """Retrieves the project, nodes, links and templates data concurrently.
+
+    Args:
+        connector (Connector): GNS3 connector object
+        project_id (str): GNS3 project ID
+
+    Returns:
+        GNS3ProjectSnapshot: Snapshot of the project data
+    """
+    urls = get_snapshot_urls(connector, project_id)
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = {resource: executor.submit(connector.http_call, "get", url) for resource, url in urls.items()}
+        data = {resource: future.result().json() for resource, future in futures.items()}
+
+    return GNS3ProjectSnapshot(**data)
+
+
+class GNS3ProjectSnapshot:
+    """Raw data of a GNS3 project retrieved in bulk."""
+
+    def __init__(
+        self,
+        project: Dict[str, Any],
+        nodes: List[Dict[str, Any]],
+        links: List[Dict[str, Any]],
+        templates: List[Dict[str, Any]],
+    ) -> None:
+        """Initialize a GNS3 project snapshot.
+
+        Args:
+            project (Dict[str, Any]): Project data
+            nodes (List[Dict[str, Any]]): Nodes data of the project
+            links (List[Dict[str, Any]]): Links data of the project
+            templates (List[Dict[str, Any]]): Template catalog of the server
+        """
+        self.project = project
+        self.nodes = nodes
+        self.links = links
+        self.templates = templates
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the raw data of the snapshot.
+
+        Returns:
+            Dict[str, Any]: Project, nodes, links and templates data
+        """
+        return {"project": self.project, "nodes": self.nodes, "links": self.links, "templates": self.templates}
+
+    @property
+    def status(self) -> Optional[str]:
+        """Status of the project when the snapshot was taken."""
+        return self.project.get("status")
+
+    def hydrate(self, project: Project) -> Dict[str, Template]:
+        """Updates the gns3fy project, nodes and links objects from the snapshot data.
+
+        Args:
+            project (Project): GNS3 project object to update
+
+        Returns:
+            Dict[str, Template]: Template catalog of the server by template name
+        """
+        templates = {}
+        templates_by_id = {}
+        for template_data in self.templates:
+            template = Template(connector=project._connector, **template_data)
+            templates[template.name] = template
+            templates_by_id[template.template_id] = template
+
+        nodes = self._hydrate_nodes(project, templates_by_id)
+        links = self._hydrate_links(project, nodes)
+
+        project._update({k: v for k, v in self.project.items() if k in Project.__fields__})
+        # Assigned without re-validating (and copying) every node and link already validated above
+        object.__setattr__(project, "nodes", nodes)
+        object.__setattr__(project, "links", links)
+        return templates
+
+    def _hydrate_nodes(self, project: Project, templates_by_id: Dict[str, Template]) -> Dict[str, Node]:
+        nodes: Dict[str, Node] = {}
+        for raw_node in self.nodes:
+            node_data = dict(raw_node)
+            node_data.setdefault("project_id", project.project_id)
+            template = templates_by_id.get(node_data.get("template_id"))
+            if template is not None:
+                node_data["template"] = template.name
+            node_data["ports"] = [
+                Port(node_name=node_data["name"], node_id=node_data["node_id"], **port)
+                for port in node_data.get("ports") or []
+            ]
+            node = Node(connector=project._connector, **node_data)
+            nodes[node.name] = node
+        return nodes
+
+    def _hydrate_links(self, project: Project, nodes: Dict[str, Node]) -> Dict[str, Link]:
+        node_names = {node.node_id: name for name, node in nodes.items()}
+        links: Dict[str, Link] = {}
+        for raw_link in self.links:
+            if not raw_link.get("nodes"):
+                continue
+            link_data = dict(raw_link)
+            link_data.setdefault("project_id", project.project_id)
+            link_data["nodes"] = [
+                Port(name=port["label"].get("text"), node_name=node_names.get(port["node_id"]), **port)
+                for port in link_data["nodes"]
+            ]
+            link = Link(connector=project._connector, **link_data)
+            link.name = link._gen_name()
+            links[link.name] = link
+            for port in link.nodes:
+                if port.node_name in nodes:
+                    nodes[port.node_name].links[link.name] = link
+        return links
@@ -3,7 +3,7 @@
 # pylint: disable=dangerous-default-value
 import time
 import re
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from gns3fy.templates import Template
 from rich.console import Console, ConsoleOptions, RenderResult
@@ -32,6 +32,52 @@ def dissect_gns3_template_name(template_name: str) -> Optional[Dict[str, str]]:
     return node_data
 
 
+def get_template_ports(template_data: Dict[str, Any]) -> Optional[List[str]]:
+    """Returns the port names the nodes of a template have, named as the GNS3 server does.
+
+    Args:
+        template_data (Dict[str, Any]): Template data of the GNS3 server
+
+    Returns:
+        Optional[List[str]]: Port names, or None if they depend on the node or the template type is not supported
+    """
+    if template_data.get("ports_mapping"):
+        return [x["name"] for x in template_data["ports_mapping"]]
+    if template_data.get("template_type") == "vpcs":
+        return ["Ethernet0"]
+    if template_data.get("template_type") == "docker":
+        return [f"eth{x}" for x in range(template_data.get("adapters", 1))]
+    if not template_data.get("port_name_format") or "adapters" not in template_data:
+        return None
+
+    custom_names = {x["adapter_number"]: x.get("port_name") for x in template_data.get("custom_adapters", [])}
+    segment_size = template_data.get("port_segment_size", 0)
+    ports = []
+    interface_number = segment_number = 0
+    for adapter_number in range(template_data["adapters"]):
+        if adapter_number == 0 and template_data.get("first_port_name"):
+            port_name = template_data["first_port_name"]
+        else:
+            try:
+                port_name = template_data["port_name_format"].format(
+                    interface_number,
+                    segment_number,
+                    adapter=adapter_number,
+                    port0=interface_number,
+                    port1=interface_number + 1,
+                    segment0=segment_number,
+                    segment1=segment_number + 1,
+                )
+            except (IndexError, KeyError, ValueError):
+                return None
+            interface_number += 1
+            if segment_size and interface_number % segment_size == 0:
+                segment_number += 1
+                interface_number = 0
+        ports.append(custom_names.get(adapter_number) or port_name)
+    return ports
+
+
 class GNS3NodeTemplate(LabbyNodeTemplate):
     # pylint: disable=too-many-instance-attributes
     """
@@ -105,6 +151,18 @@ class GNS3NodeTemplate(LabbyNodeTemplate):
         console.log(f"[b]({self.name})[/] Template could not be deleted", style="warning")
         return False
 
+    def summary(self) -> Dict[str, Any]:
+        """Returns the template attributes, followed by the rest of the GNS3 template attributes.
+
+        Returns:
+            Dict[str, Any]: Template attributes.
+        """
+        data = {k: v for k, v in self.dict().items() if not k.startswith("_")}
+        for key, value in sorted(self._base.dict().items()):
+            if not key.startswith("_") and key not in data:
+                data[key] = value
+        return data
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         # pylint: disable=unused-argument
         # pylint: disable=redefined-outer-name
@@ -0,0 +1,394 @@
+"""GNS3 compact views module.
+
+Read only views of a project, its nodes and links, built straight from the bulk API payload of a project snapshot.
+They hold the summary fields only, in `__slots__`, without the gns3fy objects, the pydantic validation of the Labby
+models nor the Nornir inventory. Used by the listing commands, which do not modify the lab.
+
+The rendering of the nodes and links listings, `GNS3ProjectSummary`, is shared by the views and `GNS3Project`.
+"""
+# pylint: disable=dangerous-default-value
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from rich import box
+from rich.console import Console, ConsoleOptions, ConsoleRenderable, RenderResult
+from rich.table import Table
+
+from labby.models import LINK_SUMMARY_FIELDS, NODE_SUMMARY_FIELDS, LabbyProjectSummary
+from labby.providers.gns3.node import dissect_gns3_template_name
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot
+from labby.providers.gns3.utils import bool_status, link_status, node_status, node_net_os, template_type, project_status
+
+
+def _or_none(value: Any) -> str:
+    """Renders an empty value as `None`."""
+    return "None" if value is None or value == "" else str(value)
+
+
+# Summary fields rendered as table columns: header and cell renderer
+NODE_COLUMNS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "name": ("Name", lambda x: f"[b]{x}[/]"),
+    "status": ("Status", node_status),
+    "kind": ("Kind", template_type),
+    "category": ("Category", _or_none),
+    "net_os": ("NET OS", node_net_os),
+    "model": ("Model", _or_none),
+    "version": ("Version", _or_none),
+    "builtin": ("Builtin", bool_status),
+    "template": ("Template", _or_none),
+    "console": ("Console Port", str),
+    "labels": ("Labels", _or_none),
+    "mgmt_port": ("Mgmt Port", _or_none),
+    "mgmt_addr": ("Mgmt Address", lambda x: x),
+    "config_managed": ("Config Managed", bool_status),
+    "ports": ("# Ports", _or_none),
+    "id": ("ID", str),
+}
+DEFAULT_NODE_COLUMNS = [
+    "name",
+    "status",
+    "kind",
+    "category",
+    "net_os",
+    "model",
+    "version",
+    "builtin",
+    "console",
+    "labels",
+    "mgmt_addr",
+    "config_managed",
+    "ports",
+]
+
+LINK_COLUMNS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "name": ("Name", str),
+    "node_a": ("Node A", lambda x: f"[b]{x}[/]"),
+    "port_a": ("Port A", str),
+    "node_b": ("Node B", lambda x: f"[b]{x}[/]"),
+    "port_b": ("Port B", str),
+    "status": ("Status", link_status),
+    "capturing": ("Capturing", lambda x: bool_status(x) if x is not None else "None"),
+    "filters": ("Filters", _or_none),
+    "labels": ("Labels", _or_none),
+    "kind": ("Kind", str),
+    "id": ("ID", str),
+}
+DEFAULT_LINK_COLUMNS = ["node_a", "port_a", "node_b", "port_b", "status", "capturing", "filters", "labels", "kind"]
+
+
+def render_summary_table(
+    rows: Iterable[Dict[str, Any]], specs: Dict[str, Tuple[str, Callable[[Any], Any]]], columns: List[str], title: str
+) -> Table:
+    """Renders summary rows as a table.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Summary rows
+        specs (Dict[str, Tuple[str, Callable[[Any], Any]]]): Header and cell renderer of each summary field
+        columns (List[str]): Summary fields to render
+        title (str): Table title
+
+    Returns:
+        Table: Summary table
+    """
+    table = Table(*[specs[x][0] for x in columns], title=title, title_justify="center", show_lines=True, highlight=True)
+    for row in rows:
+        table.add_row(*[specs[x][1](row.get(x)) for x in columns])
+    return table
+
+
+def window_caption(offset: int, count: int, total: int) -> str:
+    """Caption of a table showing a window of the rows.
+
+    Args:
+        offset (int): Rows skipped
+        count (int): Rows shown
+        total (int): Rows matching the filters
+
+    Returns:
+        str: Caption. i.e. `Rows 1-50 of 1200`
+    """
+    if not total:
+        return "No rows"
+    if not count:
+        return f"No rows after {offset} of {total}"
+    return f"Rows {offset + 1}-{offset + count} of {total}"
+
+
+class GNS3ProjectSummary(LabbyProjectSummary):
+    """GNS3 rendering of the project nodes and links listings. See `LabbyProjectSummary`."""
+
+    __slots__ = ()
+
+    def render_nodes_summary(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        columns: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ConsoleRenderable:
+        """Render a Project's nodes attributes summary.
+
+        Only the nodes of the window selected are rendered. See `utils.select_rows`.
+
+        Args:
+            field (Optional[str], optional): Field to filter on.
+            value (Optional[str], optional): Value to filter on.
+            labels (Optional[List[str]], optional): Labels to filter on.
+            columns (Optional[List[str]], optional): Summary fields to render. See `NODE_COLUMNS`.
+            sort (Optional[str], optional): Summary field to sort on. Prefixed with `-` sorts in descending order.
+            limit (Optional[int], optional): Maximum number of nodes to render.
+            offset (int, optional): Nodes to skip.
+
+        Returns:
+            ConsoleRenderable: Renderable table of the nodes attributes.
+        """
+        rows = self.iter_nodes_summary(field=field, value=value, labels=labels, sort=sort, limit=limit, offset=offset)
+        table = render_summary_table(rows, NODE_COLUMNS, columns or DEFAULT_NODE_COLUMNS, title="Nodes Information")
+        if limit is not None or offset:
+            total = sum(1 for _ in self.filter_nodes(field=field, value=value, labels=labels))
+            table.caption = window_caption(offset, table.row_count, total)
+        return table
+
+    def render_links_summary(
+        self,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        labels: Optional[List[str]] = [],
+        columns: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ConsoleRenderable:
+        """Render a Project's links attributes summary.
+
+        Only the links of the window selected are rendered. See `utils.select_rows`.
+
+        Args:
+            field (Optional[str], optional): Field to filter on.
+            value (Optional[str], optional): Value to filter on.
+            labels (Optional[List[str]], optional): Labels to filter on.
+            columns (Optional[List[str]], optional): Summary fields to render. See `LINK_COLUMNS`.
+            sort (Optional[str], optional): Summary field to sort on. Prefixed with `-` sorts in descending order.
+            limit (Optional[int], optional): Maximum number of links to render.
+            offset (int, optional): Links to skip.
+
+        Raises:
+            ValueError: If a link does not have an endpoint defined.
+
+        Returns:
+            ConsoleRenderable: Renderable table of the links attributes.
+        """
+        rows = self.iter_links_summary(field=field, value=value, labels=labels, sort=sort, limit=limit, offset=offset)
+        table = render_summary_table(rows, LINK_COLUMNS, columns or DEFAULT_LINK_COLUMNS, title="Links Information")
+        if limit is not None or offset:
+            total = sum(1 for _ in self.filter_links(field=field, value=value, labels=labels))
+            table.caption = window_caption(offset, table.row_count, total)
+        return table
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        # pylint: disable=unused-argument
+        # pylint: disable=redefined-outer-name
+        """Rich repr for a project.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            RenderResult: Console render result.
+
+        Yields:
+            Iterator[RenderResult]: Console render result.
+        """
+        project_summary = self.summary()  # type: ignore # pylint: disable=no-member
+        yield f"[b]Project:[/b] {project_summary['name']}"
+        table = Table(
+            "Status",
+            "#Nodes",
+            "#Links",
+            "Labels",
+            "Auto Start",
+            "Auto Close",
+            "Auto Open",
+            "ID",
+            box=box.HEAVY_EDGE,
+            highlight=True,
+        )
+        table.add_row(
+            project_status(project_summary["status"]),
+            str(project_summary["nodes"]),
+            str(project_summary["links"]),
+            str(project_summary["labels"]),
+            bool_status(project_summary["auto_start"]),
+            bool_status(project_summary["auto_close"]),
+            bool_status(project_summary["auto_open"]),
+            project_summary["id"],
+        )
+        yield table
+
+
+class GNS3NodeView:
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+    """Read only summary of a GNS3 node. Its attributes are the node summary fields."""
+
+    __slots__ = tuple(NODE_SUMMARY_FIELDS)
+
+    def __init__(
+        self, node_data: Dict[str, Any], template_data: Optional[Dict[str, Any]], node_state: Dict[str, Any]
+    ) -> None:
+        """Initialize a GNS3 node view.
+
+        Args:
+            node_data (Dict[str, Any]): Node data of the GNS3 API
+            template_data (Optional[Dict[str, Any]]): Template data of the node, if found in the catalog
+            node_state (Dict[str, Any]): Node data of the state file
+        """
+        self.name = node_data["name"]
+        self.status = node_data.get("status")
+        self.kind = node_data.get("node_type")
+        self.template = template_data["name"] if template_data else node_state.get("template")
+        self.category = template_data.get("category") if template_data else None
+        self.builtin = template_data.get("builtin", False) if template_data else False
+        self.console = node_data.get("console")
+        self.labels = node_state.get("labels", [])
+        self.mgmt_port = node_state.get("mgmt_port")
+        self.mgmt_addr = node_state.get("mgmt_addr")
+        self.config_managed = node_state.get("config_managed", True)
+        self.ports = len(node_data.get("ports") or [])
+        self.id = node_data.get("node_id")  # pylint: disable=invalid-name
+
+        self.net_os = node_state.get("net_os")
+        self.model = node_state.get("model")
+        self.version = node_state.get("version")
+        template_attrs = dissect_gns3_template_name(self.template) if self.template else None
+        if template_attrs:
+            self.net_os = template_attrs["net_os"]
+            self.model = template_attrs["model"]
+            self.version = template_attrs["version"]
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the node attributes summary, as plain values. See `GNS3Node.summary`.
+
+        Returns:
+            Dict[str, Any]: Node attributes.
+        """
+        return {x: getattr(self, x) for x in self.__slots__}
+
+
+class GNS3LinkView:
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+    """Read only summary of a GNS3 link. Its attributes are the link summary fields."""
+
+    __slots__ = tuple(LINK_SUMMARY_FIELDS)
+
+    def __init__(self, link_data: Dict[str, Any], node_names: Dict[str, str], links_state: Dict[str, Any]) -> None:
+        """Initialize a GNS3 link view.
+
+        Args:
+            link_data (Dict[str, Any]): Link data of the GNS3 API, with its nodes
+            node_names (Dict[str, str]): Node names by node ID
+            links_state (Dict[str, Any]): Links data of the state file by link name
+        """
+        port_a, port_b = link_data["nodes"][0], link_data["nodes"][-1]
+        self.node_a = node_names.get(port_a["node_id"])
+        self.port_a = (port_a.get("label") or {}).get("text")
+        self.node_b = node_names.get(port_b["node_id"])
+        self.port_b = (port_b.get("label") or {}).get("text")
+        # Named as gns3fy names the links
+        self.name = f"{self.node_a}: {self.port_a} == {self.node_b}: {self.port_b}"
+        self.status = "suspended" if link_data.get("suspend") else "present"
+        self.capturing = link_data.get("capturing")
+        self.filters = link_data.get("filters")
+        self.labels = links_state.get(self.name, {}).get("labels", [])
+        self.kind = link_data.get("link_type")
+        self.id = link_data.get("link_id")  # pylint: disable=invalid-name
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the link attributes summary, as plain values. See `GNS3Link.summary`.
+
+        Returns:
+            Dict[str, Any]: Link attributes.
+        """
+        return {x: getattr(self, x) for x in self.__slots__}
+
+
+class GNS3ProjectView(GNS3ProjectSummary):
+    """Read only view of a GNS3 project, listing its nodes and links like `GNS3Project` does.
+
+    Attributes:
+        name (str): Project name
+        id (Optional[str]): Project ID
+        status (Optional[str]): Project status
+        labels (List[str]): Project labels
+        nodes (Dict[str, GNS3NodeView]): Node views by name
+        links (Dict[str, GNS3LinkView]): Link views by name
+    """
+
+    __slots__ = ("name", "id", "status", "labels", "nodes", "links", "_project_data")
+
+    def __init__(
+        self,
+        name: str,
+        snapshot: GNS3ProjectSnapshot,
+        labels: Optional[List[str]] = None,
+        project_state: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize a GNS3 project view from a snapshot.
+
+        Args:
+            name (str): Project name
+            snapshot (GNS3ProjectSnapshot): Snapshot of the project data
+            labels (Optional[List[str]], optional): Project labels
+            project_state (Optional[Dict[str, Any]], optional): Project data of the state file
+        """
+        project_state = project_state or {}
+        nodes_state = project_state.get("nodes", {})
+        links_state = project_state.get("links", {})
+        templates = {x["template_id"]: x for x in snapshot.templates}
+
+        self.name = name
+        self.id = snapshot.project.get("project_id")  # pylint: disable=invalid-name
+        self.status = snapshot.status
+        self.labels = labels or []
+        self._project_data = snapshot.project
+
+        self.nodes: Dict[str, GNS3NodeView] = {}
+        node_names: Dict[str, str] = {}
+        for node_data in snapshot.nodes:
+            node = GNS3NodeView(
+                node_data, templates.get(node_data.get("template_id")), nodes_state.get(node_data["name"], {})
+            )
+            self.nodes[node.name] = node
+            node_names[node_data["node_id"]] = node.name
+
+        self.links: Dict[str, GNS3LinkView] = {}
+        for link_data in snapshot.links:
+            if not link_data.get("nodes"):
+                continue
+            link = GNS3LinkView(link_data, node_names, links_state)
+            self.links[link.name] = link
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the project attributes summary, as plain values. See `GNS3Project.summary`.
+
+        Returns:
+            Dict[str, Any]: Project attributes.
+        """
+        return {
+            "name": self.name,
+            "status": self.status,
+            "nodes": len(self.nodes),
+            "links": len(self.links),
+            "labels": self.labels,
+            "auto_start": self._project_data.get("auto_start"),
+            "auto_close": self._project_data.get("auto_close"),
+            "auto_open": self._project_data.get("auto_open"),
+            "id": self.id,
+        }
+
+    def to_initial_state(self) -> None:
+        """A view does not change the project, so there is no state to return to."""
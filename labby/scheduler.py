@@ -0,0 +1,84 @@
+"""Labby nodes start scheduler module.
+
+Plans the start of the project nodes in waves. The nodes of a wave are started concurrently, and the next wave is
+admitted once the nodes of the previous one are started.
+
+Waves are built from:
+- A labels order: nodes with the first label start first, then the ones with the second label, and so on. Nodes
+  without any of the labels start last.
+- The `start_after` dependencies of the nodes: node names or labels that must be started before the node.
+- A maximum number of nodes booting at the same time, splitting the waves that go over it.
+"""
+from typing import Dict, List, Optional, Set
+
+
+def resolve_nodes(refs: List[str], nodes: Dict[str, List[str]]) -> Set[str]:
+    """Resolves node names or labels to the node names they refer to.
+
+    Args:
+        refs (List[str]): Node names or labels
+        nodes (Dict[str, List[str]]): Labels by node name
+
+    Returns:
+        Set[str]: Node names
+    """
+    return {name for name, labels in nodes.items() if name in refs or any(x in refs for x in labels)}
+
+
+def plan_start_waves(
+    nodes: Dict[str, List[str]],
+    labels_order: Optional[List[str]] = None,
+    start_after: Optional[Dict[str, List[str]]] = None,
+    max_booting: Optional[int] = None,
+) -> List[List[str]]:
+    """Groups the nodes in the waves to start them.
+
+    Args:
+        nodes (Dict[str, List[str]]): Labels by node name, in the order the nodes are started within a wave
+        labels_order (Optional[List[str]], optional): Labels in the order their nodes are started
+        start_after (Optional[Dict[str, List[str]]], optional): Node names or labels to start before each node, by
+            node name. References not matching any node are ignored
+        max_booting (Optional[int], optional): Maximum nodes in a wave
+
+    Raises:
+        ValueError: If the start dependencies are cyclic or max_booting is not positive
+
+    Returns:
+        List[List[str]]: Node names of each wave, in start order
+    """
+    if max_booting is not None and max_booting < 1:
+        raise ValueError(f"Maximum nodes booting must be positive: {max_booting}")
+
+    depends_on: Dict[str, Set[str]] = {name: set() for name in nodes}
+
+    if labels_order:
+        rank = {
+            name: min((labels_order.index(x) for x in labels if x in labels_order), default=len(labels_order))
+            for name, labels in nodes.items()
+        }
+        for name in nodes:
+            depends_on[name].update(x for x in nodes if rank[x] < rank[name])
+
+    for name, refs in (start_after or {}).items():
+        if name in depends_on:
+            depends_on[name].update(resolve_nodes(refs, nodes) - {name})
+
+    levels: List[List[str]] = []
+    started: Set[str] = set()
+    while len(started) < len(nodes):
+        level = [x for x in nodes if x not in started and depends_on[x] <= started]
+        if not level:
+            raise ValueError(f"Cyclic start order between nodes: {sorted(x for x in nodes if x not in started)}")
+        levels.append(level)
+        started.update(level)
+
+    if not max_booting:
+        return levels
+
+    # Levels larger than the maximum nodes booting are split in several waves
+    waves: List[List[str]] = []
+    for level in levels:
+        for start in range(0, len(level), max_booting):
+            stop = start + max_booting
+            waves.append(level[start:stop])
+    return waves
@@ -1,11 +1,13 @@
 """Lock file operations module."""
 from __future__ import annotations
+import functools
 import json
+import threading
 from pathlib import Path
-from typing import Any, Dict, MutableMapping, Optional
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, TypeVar
 
 import typer
-from labby import config, utils
+from labby import config, name_index, utils
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,6 +26,22 @@ NODE_STATE_ATTRS = [
     "version",
 ]
 
+# Serializes the read-modify-write of the state file, i.e. between the projects of a parallel build
+_state_lock = threading.RLock()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def locked(func: F) -> F:
+    """Decorator running a function holding the state file lock."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _state_lock:
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
 
 def get_state_file():
     """Get state_file object from SETTINGS.
@@ -135,9 +153,14 @@ def save_data(state_file_data: MutableMapping[str, Any]):
         state_file_data (MutableMapping[str, Any]): Lock file data
     """
     _state_file = get_state_file()
-    _state_file.write_text(json.dumps(state_file_data, indent=4))
 
+    # Write to a temporary file first, so concurrent readers never see a partial file
+    tmp_path = _state_file.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state_file_data, indent=4))
+    tmp_path.replace(_state_file)
 
+
+@locked
 def apply_node_data(node: LabbyNode, project: Optional[LabbyProject] = None):
     """Apply node lock file data.
 
@@ -170,6 +193,7 @@ def apply_node_data(node: LabbyNode, project: Optional[LabbyProject] = None):
     save_data(state_file_data)
 
 
+@locked
 def apply_link_data(link: LabbyLink, project: Optional[LabbyProject] = None):
     """Apply link lock file data.
 
@@ -202,6 +226,96 @@ def apply_link_data(link: LabbyLink, project: Optional[LabbyProject] = None):
     save_data(state_file_data)
 
 
+@locked
+def apply_nodes_data(nodes: List[LabbyNode], project: LabbyProject):
+    """Apply lock file data of multiple nodes of a project in a single write.
+
+    Args:
+        nodes (List[LabbyNode]): Labby node objects
+        project (LabbyProject): Labby project object.
+    """
+    state_file_data = read_data(get_state_file())
+    if state_file_data is None:
+        state_file_data = gen_state_file_data(project)
+
+    else:
+        env = config.get_environment()
+        projects_state_file_data = state_file_data[env.name][env.provider.name]["projects"]
+        if project.name not in projects_state_file_data:
+            projects_state_file_data.update(gen_project_data(project))
+        for node in nodes:
+            projects_state_file_data[project.name]["nodes"].update(gen_node_data(node))
+
+    save_data(state_file_data)
+
+
+@locked
+def apply_links_data(links: List[LabbyLink], project: LabbyProject):
+    """Apply lock file data of multiple links of a project in a single write.
+
+    Args:
+        links (List[LabbyLink]): Labby link objects
+        project (LabbyProject): Labby project object.
+    """
+    state_file_data = read_data(get_state_file())
+    if state_file_data is None:
+        state_file_data = gen_state_file_data(project)
+
+    else:
+        env = config.get_environment()
+        projects_state_file_data = state_file_data[env.name][env.provider.name]["projects"]
+        if project.name not in projects_state_file_data:
+            projects_state_file_data.update(gen_project_data(project))
+        for link in links:
+            projects_state_file_data[project.name]["links"].update(gen_link_data(link))
+
+    save_data(state_file_data)
+
+
+def _update_project_mapping(key: str, data: Dict[str, Any], project: LabbyProject):
+    """Update a mapping of a project in the lock file, i.e. its `placement`, with the given entries.
+
+    Args:
+        key (str): Key of the mapping in the project data.
+        data (Dict[str, Any]): Entries to update the mapping with.
+        project (LabbyProject): Labby project object.
+    """
+    state_file_data = read_data(get_state_file())
+    if state_file_data is None:
+        state_file_data = gen_state_file_data(project)
+
+    env = config.get_environment()
+    projects_state_file_data = state_file_data[env.name][env.provider.name]["projects"]
+    if project.name not in projects_state_file_data:
+        projects_state_file_data.update(gen_project_data(project))
+    projects_state_file_data[project.name].setdefault(key, {}).update(data)
+
+    save_data(state_file_data)
+
+
+@locked
+def apply_placement_data(placement: Dict[str, str], project: LabbyProject):
+    """Apply the compute placement of nodes of a project in the lock file.
+
+    Args:
+        placement (Dict[str, str]): Compute ID by node name.
+        project (LabbyProject): Labby project object.
+    """
+    _update_project_mapping("placement", placement, project)
+
+
+@locked
+def apply_start_after_data(start_after: Dict[str, List[str]], project: LabbyProject):
+    """Apply the start dependencies of nodes of a project in the lock file.
+
+    Args:
+        start_after (Dict[str, List[str]]): Node names or labels to start before each node, by node name.
+        project (LabbyProject): Labby project object.
+    """
+    _update_project_mapping("start_after", start_after, project)
+
+
+@locked
 def apply_project_data(project: LabbyProject):
     """Apply project lock file data.
 
@@ -224,6 +338,7 @@ def apply_project_data(project: LabbyProject):
     save_data(state_file_data)
 
 
+@locked
 def get_project_data(project_name: str) -> Optional[Dict[str, Any]]:
     """Get project data from lock file.
 
@@ -292,6 +407,7 @@ def get_link_data(link_name: str, project_name: str) -> Optional[Dict[str, Any]]
     return project_state_file_data["links"].get(link_name)
 
 
+@locked
 def delete_project_data(project_name: str) -> Optional[Dict[str, Any]]:
     """Delete project data on lock file.
 
@@ -301,6 +417,7 @@ def delete_project_data(project_name: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Project data if present.
     """
+    name_index.remove_project(project_name)
     state_file_data = read_data(get_state_file())
     if state_file_data is None:
         return None
@@ -311,6 +428,7 @@ def delete_project_data(project_name: str) -> Optional[Dict[str, Any]]:
     return _data
 
 
+@locked
 def delete_node_data(node_name: str, project_name: str) -> Optional[Dict[str, Any]]:
     """Delete node data on lock file.
 
@@ -321,6 +439,7 @@ def delete_node_data(node_name: str, project_name: str) -> Optional[Dict[str, An
     Returns:
         Optional[Dict[str, Any]]: Node data if present.
     """
+    name_index.remove_names(project_name, nodes=[node_name])
     state_file_data = read_data(get_state_file())
     if state_file_data is None:
         return None
@@ -332,10 +451,13 @@ def delete_node_data(node_name: str, project_name: str) -> Optional[Dict[str, An
         return None
 
     _data = project_state_file_data["nodes"].pop(node_name, None)
+    project_state_file_data.get("placement", {}).pop(node_name, None)
+    project_state_file_data.get("start_after", {}).pop(node_name, None)
     save_data(state_file_data)
     return _data
 
 
+@locked
 def delete_link_data(link_name: str, project_name: str) -> Optional[Dict[str, Any]]:
     """Delete link data on lock file.
 
@@ -346,6 +468,7 @@ def delete_link_data(link_name: str, project_name: str) -> Optional[Dict[str, An
     Returns:
         Optional[Dict[str, Any]]: Link data if present.
     """
+    name_index.remove_names(project_name, links=[link_name])
     state_file_data = read_data(get_state_file())
     if state_file_data is None:
         return None
@@ -0,0 +1,242 @@
+"""Labby topology module.
+
+Graph of the nodes of a project connected by its links, indexed by node so the neighbors of a node are found in
+O(degree) without scanning the project links. Answers the neighbors, shortest path, connected components and link
+failure impact queries of `labby get project topology`, and exports the graph as DOT or GraphML.
+"""
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from xml.dom import minidom
+from xml.etree import ElementTree as ET
+
+from rich.table import Table
+
+
+class TopologyFormat(str, Enum):
+    """Topology export format enum."""
+
+    # pylint: disable=invalid-name
+    dot = "dot"
+    graphml = "graphml"
+
+
+class TopologyEdge(NamedTuple):
+    """Link of a node to one of its neighbors, seen from the node."""
+
+    node: str
+    port: str
+    neighbor: str
+    neighbor_port: str
+    link: str
+
+
+class Topology:
+    """Adjacency indexed graph of a project.
+
+    Attributes:
+        adjacency (Dict[str, List[TopologyEdge]]): Edges of each node, in the order of the links
+        links (Dict[str, Tuple[str, str, str, str]]): Node A, port A, node B and port B of each link
+    """
+
+    __slots__ = ("adjacency", "links")
+
+    def __init__(self, nodes: Iterable[str], links: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """Initialize a topology.
+
+        Args:
+            nodes (Iterable[str]): Node names. Nodes without links are part of the topology too
+            links (Iterable[Tuple[str, str, str, str, str]]): Name, node A, port A, node B and port B of each link
+        """
+        self.adjacency: Dict[str, List[TopologyEdge]] = {x: [] for x in nodes}
+        self.links: Dict[str, Tuple[str, str, str, str]] = {}
+        for name, node_a, port_a, node_b, port_b in links:
+            self.links[name] = (node_a, port_a, node_b, port_b)
+            self.adjacency.setdefault(node_a, []).append(TopologyEdge(node_a, port_a, node_b, port_b, name))
+            self.adjacency.setdefault(node_b, []).append(TopologyEdge(node_b, port_b, node_a, port_a, name))
+
+    @classmethod
+    def from_links_summary(cls, nodes: Iterable[str], links_summary: Iterable[Dict[str, Any]]) -> "Topology":
+        """Builds the topology of a project from the summary of its links.
+
+        Args:
+            nodes (Iterable[str]): Node names
+            links_summary (Iterable[Dict[str, Any]]): Links summary, with their name and endpoints
+
+        Returns:
+            Topology: Topology of the project
+        """
+        return cls(nodes, ((x["name"], x["node_a"], x["port_a"], x["node_b"], x["port_b"]) for x in links_summary))
+
+    def _check_node(self, name: str) -> None:
+        if name not in self.adjacency:
+            raise ValueError(f"Node not found in the topology: {name}")
+
+    def neighbors(self, name: str) -> List[TopologyEdge]:
+        """Returns the links of a node to its neighbors.
+
+        Args:
+            name (str): Node name
+
+        Raises:
+            ValueError: If the node is not found
+
+        Returns:
+            List[TopologyEdge]: Edges of the node
+        """
+        self._check_node(name)
+        return list(self.adjacency[name])
+
+    def _reach(self, source: str, exclude_link: Optional[str] = None) -> Dict[str, Optional[TopologyEdge]]:
+        """Breadth first search from a node.
+
+        Args:
+            source (str): Node to start from
+            exclude_link (Optional[str], optional): Link to ignore, as if it was down
+
+        Returns:
+            Dict[str, Optional[TopologyEdge]]: Nodes reached, with the edge they were reached through
+        """
+        reached: Dict[str, Optional[TopologyEdge]] = {source: None}
+        queue: Deque[str] = deque([source])
+        while queue:
+            for edge in self.adjacency[queue.popleft()]:
+                if edge.link != exclude_link and edge.neighbor not in reached:
+                    reached[edge.neighbor] = edge
+                    queue.append(edge.neighbor)
+        return reached
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[TopologyEdge]]:
+        """Returns the path of fewer hops between two nodes.
+
+        Args:
+            source (str): Node to start from
+            target (str): Node to reach
+
+        Raises:
+            ValueError: If a node is not found
+
+        Returns:
+            Optional[List[TopologyEdge]]: Edges of the path in order, or None if the nodes are not connected
+        """
+        self._check_node(source)
+        self._check_node(target)
+        reached = self._reach(source)
+        if target not in reached:
+            return None
+
+        path: List[TopologyEdge] = []
+        edge = reached[target]
+        while edge is not None:
+            path.append(edge)
+            edge = reached[edge.node]
+        return path[::-1]
+
+    def components(self) -> List[List[str]]:
+        """Returns the groups of nodes connected between them.
+
+        Returns:
+            List[List[str]]: Node names of each component, the largest first
+        """
+        seen: Set[str] = set()
+        components = []
+        for name in self.adjacency:
+            if name not in seen:
+                component = list(self._reach(name))
+                seen.update(component)
+                components.append(sorted(component))
+        return sorted(components, key=lambda x: (-len(x), x[0]))
+
+    def link_impact(self, link: str) -> List[List[str]]:
+        """Returns how the nodes of the component of a link are grouped once the link is down.
+
+        Args:
+            link (str): Link name
+
+        Raises:
+            ValueError: If the link is not found
+
+        Returns:
+            List[List[str]]: One group with all the nodes if there is another path between the link ends, or the two
+                groups the link splits them into
+        """
+        if link not in self.links:
+            raise ValueError(f"Link not found in the topology: {link}")
+        node_a, _, node_b, _ = self.links[link]
+        side_a = self._reach(node_a, exclude_link=link)
+        if node_b in side_a:
+            return [sorted(side_a)]
+        return [sorted(side_a), sorted(self._reach(node_b, exclude_link=link))]
+
+    def to_dot(self, name: str = "topology") -> str:
+        """Exports the topology in the Graphviz DOT format.
+
+        Args:
+            name (str, optional): Graph name
+
+        Returns:
+            str: DOT graph
+        """
+
+        def quote(value: str) -> str:
+            return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+        lines = [f"graph {quote(name)} {{"]
+        lines.extend(f"  {quote(x)};" for x in self.adjacency)
+        for link, (node_a, port_a, node_b, port_b) in self.links.items():
+            lines.append(
+                f"  {quote(node_a)} -- {quote(node_b)} "
+                f"[label={quote(link)}, taillabel={quote(port_a)}, headlabel={quote(port_b)}];"
+            )
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def to_graphml(self, name: str = "topology") -> str:
+        """Exports the topology in the GraphML format.
+
+        Args:
+            name (str, optional): Graph name
+
+        Returns:
+            str: GraphML document
+        """
+        root = ET.Element("graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
+        for key in ["name", "port_a", "port_b"]:
+            ET.SubElement(root, "key", {"id": key, "for": "edge", "attr.name": key, "attr.type": "string"})
+        graph = ET.SubElement(root, "graph", id=name, edgedefault="undirected")
+        for node in self.adjacency:
+            ET.SubElement(graph, "node", id=node)
+        for link, (node_a, port_a, node_b, port_b) in self.links.items():
+            edge = ET.SubElement(graph, "edge", source=node_a, target=node_b)
+            for key, value in [("name", link), ("port_a", port_a), ("port_b", port_b)]:
+                ET.SubElement(edge, "data", key=key).text = value
+        return minidom.parseString(ET.tostring(root, encoding="unicode")).toprettyxml(indent="  ")
+
+    def iter_nodes_summary(self) -> Iterable[Dict[str, Any]]:
+        """Iterates over the nodes with their degree and neighbors.
+
+        Yields:
+            Iterable[Dict[str, Any]]: Node name, number of links and neighbor names
+        """
+        for name, edges in self.adjacency.items():
+            yield {"node": name, "degree": len(edges), "neighbors": sorted({x.neighbor for x in edges})}
+
+
+def render_topology_table(rows: Iterable[Dict[str, Any]], title: str, caption: Optional[str] = None) -> Table:
+    """Renders topology rows as a table, one column per field of the first row.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Topology rows, all with the same fields
+        title (str): Table title
+        caption (Optional[str], optional): Table caption
+
+    Returns:
+        Table: Topology table
+    """
+    table = Table(title=title, caption=caption, title_justify="center", show_lines=True, highlight=True)
+    for index, row in enumerate(rows):
+        if not index:
+            for field in row:
+                table.add_column(field.replace("_", " ").title())
+        table.add_row(*[", ".join(x) if isinstance(x, list) else str(x) for x in row.values()])
+    return table
@@ -1,6 +1,14 @@
 """Utility module for Labby."""
+import heapq
+import itertools
+import os
 import re
-from typing import Dict, List, Any, MutableMapping, Tuple, Optional, Literal
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Any, MutableMapping, Tuple, Optional, Literal
 
 import typer
 import yaml
@@ -20,12 +28,67 @@ custom_theme = Theme({"warning": "bold yellow3", "error": "bold red", "good": "b
 
 console = Console(color_system="auto", log_path=False, record=True, theme=custom_theme)
 
+# Held while a status spinner is displayed, the console can only display one at a time
+_status_lock = threading.Lock()
+
+
+class LogStatus:
+    # pylint: disable=too-few-public-methods
+    """Status that logs its messages instead of displaying a spinner."""
+
+    def __init__(self, msg: str) -> None:
+        """Initialize a log status.
+
+        Args:
+            msg (str): Status message
+        """
+        console.log(msg)
+
+    def update(self, msg: Optional[str] = None, **kwargs) -> None:
+        """Logs the new status message.
+
+        Args:
+            msg (Optional[str], optional): Status message. Also taken from the `status` keyword, as the console
+                status `update` names it
+            kwargs: Other arguments of the console status `update`, ignored. i.e. `spinner`
+        """
+        msg = kwargs.get("status", msg)
+        if msg is not None:
+            console.log(msg)
+
+
+@contextmanager
+def status(msg: str, **kwargs) -> Iterator[Any]:
+    """Displays a status spinner, or logs the status messages if another status is already displayed.
+
+    Safe to use from concurrent operations and nested statuses, where the console status would fail.
+
+    Args:
+        msg (str): Status message
+        kwargs: Arguments of the console status. i.e. `spinner`
+
+    Yields:
+        Iterator[Any]: Status object, with its `update` method
+    """
+    if not _status_lock.acquire(blocking=False):
+        yield LogStatus(msg)
+        return
+
+    try:
+        with console.status(msg, **kwargs) as _status:
+            yield _status
+    finally:
+        _status_lock.release()
+
 
 def banner():
     # pylint: disable=anomalous-backslash-in-string
     # pylint: disable=consider-using-f-string
-    """A function to print out the banner for labby to the terminal."""
-    console.print(
+    """A function to print out the banner for labby to the terminal.
+
+    When stdout is not a terminal the banner goes to stderr, so piped output only has the command data.
+    """
+    Console(color_system="auto", stderr=not sys.stdout.isatty()).print(
         r"""
 [green]
   _       _     _
@@ -174,10 +237,40 @@ def dissect_url(target: str) -> Tuple[Optional[str], Optional[str], Optional[str
     )
 
 
+# The libyaml based loader parses large files several times faster, when PyYAML is built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(content: str) -> Any:
+    """Loads YAML content."""
+    return yaml.load(content, Loader=YamlLoader)  # nosec
+
+
 def load_yaml_file(path: str) -> Dict[str, Any]:
     """Loads YAML file."""
     with open(path, "r", encoding="utf-8") as fil:
-        return yaml.safe_load(fil)
+        return yaml.load(fil, Loader=YamlLoader)  # nosec
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Writes a text file through a temporary file in the same directory, so readers never see a partial file.
+
+    The temporary file name is unique, so concurrent writers of the same file do not collide. The last one replacing
+    the file wins.
+
+    Args:
+        path (Path): File path
+        content (str): File content
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False, encoding="utf-8"
+    ) as fil:
+        fil.write(content)
+    try:
+        os.replace(fil.name, path)
+    except OSError:
+        os.unlink(fil.name)
+        raise
 
 
 def ipaddr_renderer(value: str, *, render: IpAddressFilter) -> str:
@@ -200,6 +293,78 @@ def ipaddr_renderer(value: str, *, render: IpAddressFilter) -> str:
     return to_render
 
 
+def select_rows(
+    rows: Iterable[Dict[str, Any]], sort: Optional[str] = None, limit: Optional[int] = None, offset: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Selects a window of rows, optionally sorted by a field, holding at most `offset + limit` rows at a time.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Rows to select from
+        sort (Optional[str], optional): Field to sort on. Prefixed with `-` sorts in descending order. Empty values
+            go last
+        limit (Optional[int], optional): Maximum number of rows. All of them if not set
+        offset (int, optional): Rows to skip
+
+    Returns:
+        Iterator[Dict[str, Any]]: Rows of the window, in order
+    """
+    stop = None if limit is None else offset + limit
+    if not sort:
+        return itertools.islice(rows, offset, stop)
+
+    field = sort.lstrip("-")
+    descending = sort.startswith("-")
+
+    def _key(row: Dict[str, Any]) -> Tuple[bool, Any]:
+        # Empty values go last on both orders
+        return (row.get(field) is not None if descending else row.get(field) is None, row.get(field))
+
+    if stop is None:
+        ordered = sorted(rows, key=_key, reverse=descending)
+    elif descending:
+        ordered = heapq.nlargest(stop, rows, key=_key)
+    else:
+        ordered = heapq.nsmallest(stop, rows, key=_key)
+    return iter(ordered[offset:])
+
+
+def select_columns(row: Dict[str, Any], columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Selects the fields of a row, in the order given.
+
+    Args:
+        row (Dict[str, Any]): Row to select from
+        columns (Optional[List[str]], optional): Fields to keep. All of them if not set
+
+    Returns:
+        Dict[str, Any]: Row with the fields selected
+    """
+    if not columns:
+        return row
+    return {x: row.get(x) for x in columns}
+
+
+def parse_columns(columns: Optional[List[str]], available: Iterable[str]) -> Optional[List[str]]:
+    """Parses the columns given as repeated or comma separated options.
+
+    Args:
+        columns (Optional[List[str]]): Columns given. i.e. `["name,status", "console"]`
+        available (Iterable[str]): Columns that can be selected
+
+    Raises:
+        ValueError: If a column is not available
+
+    Returns:
+        Optional[List[str]]: Column names. None if no columns were given
+    """
+    if not columns:
+        return None
+    parsed = [y.strip() for x in columns for y in x.split(",") if y.strip()]
+    unknown = [x for x in parsed if x not in available]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}. Available: {', '.join(available)}")
+    return parsed
+
+
 # def get_package_version() -> str:
 #     data = settings.load_toml(Path(__file__).parent.parent / "pyproject.toml")
 #     return data["tool"]["poetry"]["version"]
@@ -0,0 +1,97 @@
+"""Shared fixtures for labby tests."""
+import json
+import queue
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+
+
+class GNS3StandInServer(ThreadingHTTPServer):
+    """Local stand-in of a GNS3 server, serving the notification stream and nodes of its projects.
+
+    Attributes:
+        nodes (Dict[str, List[Dict[str, Any]]]): Nodes data by project ID
+        notifications (queue.Queue): Notifications to stream to the listeners
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Initialize the server on a free local port."""
+        super().__init__(("127.0.0.1", 0), GNS3StandInHandler)
+        self.nodes: Dict[str, List[Dict[str, Any]]] = {}
+        self.notifications: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.closing = threading.Event()
+
+    @property
+    def url(self) -> str:
+        """URL of the stand-in server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def notify(self, action: str, event: Dict[str, Any]) -> None:
+        """Sends a notification to the stream.
+
+        Args:
+            action (str): Notification action. i.e. `node.updated`
+            event (Dict[str, Any]): Notification event data
+        """
+        self.notifications.put({"action": action, "event": event})
+
+
+class GNS3StandInHandler(BaseHTTPRequestHandler):
+    """Request handler of the GNS3 stand-in server."""
+
+    server: GNS3StandInServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence the request logs."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serves the notification stream and nodes of a project."""
+        match = re.fullmatch(r"/v2/projects/([^/]+)/(notifications|nodes)", self.path)
+        if not match:
+            self.send_error(404)
+            return
+
+        project_id, resource = match.groups()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if resource == "nodes":
+            body = json.dumps(self.server.nodes.get(project_id, [])).encode()
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        # Streamed with chunked encoding, as the GNS3 server does
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.close_connection = True  # pylint: disable=attribute-defined-outside-init
+        while not self.server.closing.is_set():
+            try:
+                notification = self.server.notifications.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            chunk = f"{json.dumps(notification)}\n".encode()
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+
+
+@pytest.fixture()
+def gns3_server():
+    """Fixture for a local GNS3 stand-in server.
+
+    Yields:
+        GNS3StandInServer: Running stand-in server
+    """
+    server = GNS3StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.closing.set()
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,154 @@
+"""Module for testing the GNS3 asyncio provider operations."""
+# pylint: disable=too-few-public-methods
+import asyncio
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from gns3fy.connector import Connector
+from gns3fy.projects import Project
+
+from labby import config
+from labby.providers.gns3.aio import EventLoopThread, GNS3AsyncProject
+from labby.providers.gns3.project import GNS3Project
+
+PORTS = [
+    {"name": f"Ethernet{x}", "short_name": f"e{x}", "adapter_number": x, "port_number": 0, "link_type": "ethernet"}
+    for x in range(3)
+]
+
+SERVER_DATA = {
+    "project": {"project_id": "p1", "name": "lab01", "status": "opened"},
+    "nodes": [
+        {"node_id": "n1", "name": "r1", "template_id": "t1", "node_type": "qemu", "status": "stopped", "ports": PORTS},
+    ],
+    "links": [],
+    "templates": [
+        {"template_id": "t1", "name": "vEOS", "template_type": "qemu", "category": "router", "builtin": False},
+    ],
+}
+
+
+class FakeAsyncClient:
+    """Async client serving a GNS3 project from memory, recording the requests made."""
+
+    def __init__(self, data):
+        """Initialize a client serving a copy of the data given."""
+        self.data = copy.deepcopy(data)
+        self.calls = []
+
+    async def call(self, func, *args, **kwargs):
+        """Runs the callable."""
+        return func(*args, **kwargs)
+
+    async def request(self, method, url, json_data=None):
+        """Serves the project, nodes, links and templates endpoints."""
+        path = url.split("/v2", 1)[1]
+        self.calls.append((method, path))
+        await asyncio.sleep(0)
+        nodes = {x["node_id"]: x for x in self.data["nodes"]}
+        parts = path.strip("/").split("/")
+        if method == "get":
+            return self.data["project"] if path == "/projects/p1" else self.data[parts[-1]]
+        if parts[-2] == "templates":
+            node_id = f"n{len(nodes) + 1}"
+            self.data["nodes"].append(
+                {"node_id": node_id, "template_id": parts[-1], "node_type": "qemu", "status": "stopped", "ports": PORTS}
+            )
+            return {"node_id": node_id}
+        if method == "put":
+            nodes[parts[-1]].update(json_data)
+            return nodes[parts[-1]]
+        if parts[-1] in ("start", "stop"):
+            nodes[parts[-2]]["status"] = "started" if parts[-1] == "start" else "stopped"
+            return None
+        self.data["links"].append({"link_id": f"l{len(self.data['links']) + 1}", "link_type": "ethernet", **json_data})
+        return None
+
+
+@pytest.fixture(name="project")
+def fixture_project(monkeypatch, tmp_path):
+    """GNS3 async project served by the fake client."""
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    settings = SimpleNamespace(
+        state_file=tmp_path / "state.json", cache_dir=tmp_path / "cache", environment=environment
+    )
+    monkeypatch.setattr(config, "SETTINGS", settings)
+    monkeypatch.setattr(GNS3Project, "listen", lambda self: None)
+    client = FakeAsyncClient(SERVER_DATA)
+    base = Project(project_id="p1", status="opened", connector=Connector(url="http://gns3:3080"))
+    loop_thread = EventLoopThread()
+    yield GNS3AsyncProject("lab01", base, client=client, loop=loop_thread)
+    loop_thread.close()
+
+
+def test_get(project):
+    """The project data is collected from the client."""
+    assert project.status == "opened"
+    assert list(project.nodes) == ["r1"]
+    assert project.nodes["r1"].template == "vEOS"
+
+
+def test_create_nodes_and_links(project):
+    """The nodes and links are created, skipping the ones already created."""
+    created = []
+    nodes = project.create_nodes(
+        [{"name": "r1", "template": "vEOS"}, {"name": "r2", "template": "vEOS"}, {"name": "r3", "template": "vEOS"}],
+        on_created=lambda spec: created.append(spec["name"]),
+    )
+    assert [x.name for x in nodes] == ["r2", "r3"]
+    assert created == ["r2", "r3"]
+    assert sorted(project.nodes) == ["r1", "r2", "r3"]
+
+    links_spec = [
+        {"node_a": "r1", "port_a": "Ethernet1", "node_b": "r2", "port_b": "Ethernet1"},
+        {"node_a": "r1", "port_a": "Ethernet2", "node_b": "r3", "port_b": "Ethernet1"},
+    ]
+    links = project.create_links(links_spec)
+    assert sorted(x.name for x in links) == ["r1: Ethernet1 == r2: Ethernet1", "r1: Ethernet2 == r3: Ethernet1"]
+    assert project.create_links(links_spec) == []
+    assert sorted(project.links) == ["r1: Ethernet1 == r2: Ethernet1", "r1: Ethernet2 == r3: Ethernet1"]
+
+    with pytest.raises(ValueError, match="Template not found"):
+        project.create_nodes([{"name": "r4", "template": "vSRX"}])
+
+
+def test_start_stop_nodes(project):
+    """Only the selected nodes not in the target status are started or stopped."""
+    project.create_nodes([{"name": "r2", "template": "vEOS"}])
+
+    project.start_nodes(start_nodes="all", nodes_delay=0, names=["r2"])
+    assert project.nodes["r1"].status == "stopped"
+    assert project.nodes["r2"].status == "started"
+
+    project.start_nodes(start_nodes="all", nodes_delay=0)
+    assert ("post", "/projects/p1/nodes/n2/start") in project._client.calls  # pylint: disable=protected-access
+    assert all(x.status == "started" for x in project.nodes.values())
+
+    project.stop_nodes(names=["r1"])
+    assert project.nodes["r1"].status == "stopped"
+    assert project.nodes["r2"].status == "started"
+
+
+def test_event_loop_thread_concurrent_callers():
+    """Coroutines submitted from several threads at the same time share the loop."""
+    loop_thread = EventLoopThread()
+
+    async def work(value):
+        await asyncio.sleep(0.01)
+        return threading.current_thread().name, value
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda x: loop_thread.run(work(x)), range(32)))
+
+    assert [x[1] for x in results] == list(range(32))
+    assert {x[0] for x in results} == {"labby-gns3-loop"}
+
+    async def nested():
+        return loop_thread.run(work(0))
+
+    with pytest.raises(RuntimeError, match="event loop thread"):
+        loop_thread.run(nested())
+    loop_thread.close()
@@ -0,0 +1,41 @@
+"""Module for testing the config backup store."""
+from datetime import datetime
+from types import SimpleNamespace
+
+from labby import backup_store, config
+
+
+def test_write_blob(tmp_path):
+    """A configuration is stored once, compressed, and read back as it was."""
+    running_config = "hostname r1\n" + "interface Ethernet1\n   no shutdown\n" * 100
+
+    digest = backup_store.write_blob(tmp_path, running_config)
+    blob_path = backup_store.get_blob_path(tmp_path, digest)
+    mtime = blob_path.stat().st_mtime_ns
+
+    assert backup_store.write_blob(tmp_path, running_config) == digest
+    assert blob_path.stat().st_mtime_ns == mtime
+    assert blob_path.stat().st_size < len(running_config)
+    assert backup_store.read_blob(tmp_path, digest) == running_config
+    assert backup_store.write_blob(tmp_path, "hostname r2\n") != digest
+    assert len(list((tmp_path / "objects").glob("*/*.gz"))) == 2
+
+
+def test_manifests(monkeypatch, tmp_path):
+    """Backup runs are kept per project, and the latest one is returned by default."""
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    monkeypatch.setattr(config, "SETTINGS", SimpleNamespace(environment=environment))
+    assert backup_store.get_manifest(tmp_path, "lab01") is None
+
+    first = backup_store.BackupManifest(project="lab01", created=datetime(2024, 1, 31, 12), nodes={"r1": "aa"})
+    second = backup_store.BackupManifest(
+        project="lab01", created=datetime(2024, 2, 1, 9), nodes={"r1": "bb"}, failed=["r2"]
+    )
+    backup_store.write_manifest(tmp_path, second)
+    backup_store.write_manifest(tmp_path, first)
+
+    assert backup_store.get_manifest(tmp_path, "lab01") == second
+    assert backup_store.get_manifest(tmp_path, "lab01", run_id="20240131-120000-000000") == first
+    assert backup_store.get_manifest(tmp_path, "lab01", run_id="20240131-000000-000000") is None
+    assert [x.run_id for x in backup_store.list_manifests(tmp_path, "lab01")] == [first.run_id, second.run_id]
+    assert backup_store.get_manifest(tmp_path, "lab02") is None
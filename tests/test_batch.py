@@ -0,0 +1,125 @@
+"""Module for testing the batch operations planning."""
+import shlex
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Dict
+
+import click
+import pytest
+
+from labby import config, utils
+from labby.commands import common
+from labby.commands.batch import BatchOperation, load_operations, plan_operations, run_operations
+
+
+def test_plan_operations(tmp_path):
+    """Test operations run in order, unless they set the operations they run after."""
+    ops_file = tmp_path / "ops.yml"
+    ops_file.write_text(
+        """
+operations:
+  - name: r1
+    command: create node r1 --project lab --template "Arista vEOS"
+  - name: r2
+    command: [create, node, r2, --project, lab, --template, Arista vEOS]
+    after: []
+  - command: create link --project lab -na r1 -pa Ethernet1 -nb r2 -pb Ethernet1
+    after: [r1, r2]
+  - start project lab
+"""
+    )
+    operations = load_operations(ops_file)
+    assert operations[0].args == ["create", "node", "r1", "--project", "lab", "--template", "Arista vEOS"]
+    assert operations[1].args == operations[0].args[:2] + ["r2"] + operations[0].args[3:]
+    assert [[x.name for x in wave] for wave in plan_operations(operations)] == [["r1", "r2"], ["3"], ["4"]]
+
+
+@pytest.mark.parametrize(
+    "operations, error",
+    [
+        ("- init", "not supported"),
+        ("- {name: a, command: get project list, after: [b]}", "unknown operation"),
+        ("- {name: a, command: get project list}\n  - {name: a, command: get project list}", "Duplicated"),
+    ],
+)
+def test_load_operations_errors(tmp_path, operations, error):
+    """Test invalid operations files."""
+    ops_file = tmp_path / "ops.yml"
+    ops_file.write_text(f"operations:\n  {operations}\n")
+    with pytest.raises(ValueError, match=error):
+        load_operations(ops_file)
+
+
+def test_plan_operations_cyclic(tmp_path):
+    """Test cyclic operations are rejected."""
+    ops_file = tmp_path / "ops.yml"
+    ops_file.write_text(
+        "operations:\n"
+        "  - {name: a, command: get project list, after: [b]}\n"
+        "  - {name: b, command: get project list, after: [a]}\n"
+    )
+    with pytest.raises(ValueError, match="Cyclic"):
+        plan_operations(load_operations(ops_file))
+
+
+def test_run_operations_by_project(monkeypatch):
+    """Test the operations of a wave on the same project run one after the other, and on different projects not."""
+    running: Dict[str, int] = defaultdict(int)
+    overlaps = []
+    lock = threading.Lock()
+
+    def work(project_name):
+        with lock:
+            running[project_name] += 1
+            overlaps.append((running[project_name], sum(running.values())))
+        time.sleep(0.05)
+        with lock:
+            running[project_name] -= 1
+
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command(name="start")
+    @click.argument("project_name")
+    def start(project_name):
+        work(project_name)
+
+    @cli.command(name="get")
+    @click.option("--project", "-p", "project_name")
+    @click.option("--output", default="table")
+    def get(project_name, output):  # pylint: disable=unused-argument
+        work(project_name)
+
+    operations = [
+        BatchOperation(name=str(index), args=shlex.split(command), after=[])
+        for index, command in enumerate(["start lab1", "get -p lab1", "get --project lab1 --output json", "start lab2"])
+    ]
+    monkeypatch.setattr(utils.console, "stderr", False)
+    run_operations(click.Context(cli), operations, workers=4)
+
+    assert [x.status for x in operations] == ["done"] * 4
+    assert max(x[0] for x in overlaps) == 1
+    assert max(x[1] for x in overlaps) == 2
+    assert not utils.console.stderr
+
+
+def test_session_projects_reused_when_cached(monkeypatch):
+    """Test the projects loaded by the operations are only reused when reading with --cached."""
+    searches = []
+    provider = SimpleNamespace(search_project=lambda project_name, cached: searches.append(cached) or object())
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    monkeypatch.setattr(config, "get_provider", lambda: provider)
+    monkeypatch.setattr(config, "get_environment", lambda: environment)
+    monkeypatch.setattr(common, "SESSION_PROJECTS", {})
+
+    _, loaded = common.get_labby_objs_from_project("lab")
+    assert common.get_labby_objs_from_project("lab", cached=True)[1] is loaded
+    assert common.get_labby_project_view("lab", cached=True) is loaded
+
+    _, refreshed = common.get_labby_objs_from_project("lab")
+    assert refreshed is not loaded
+    assert common.get_labby_objs_from_project("lab", cached=True)[1] is refreshed
+    assert searches == [None, None]
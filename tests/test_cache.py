@@ -0,0 +1,93 @@
+"""Module for testing the local read cache."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from labby import cache, config, main
+
+CONFIG = """
+[main]
+environment = "default"
+
+[environment.default]
+provider = "gns3-lab"
+
+[environment.default.providers.gns3-lab]
+kind = "gns3"
+server_url = "http://gns3-lab:80"
+"""
+
+
+@pytest.fixture(name="settings")
+def fixture_settings(monkeypatch, tmp_path):
+    """Settings with the cache under the temporary path."""
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    settings = SimpleNamespace(cache_dir=tmp_path / "cache", cache_max_age=60, environment=environment)
+    monkeypatch.setattr(config, "SETTINGS", settings)
+    return settings
+
+
+def test_read_fresh_entry(settings):
+    """An entry is served while it is fresh, scoped by environment and provider."""
+    cache.write("projects", [{"name": "lab01"}])
+
+    assert cache.read("projects") == [{"name": "lab01"}]
+    assert cache.get_entry_path("projects") == settings.cache_dir / "default" / "gns3-lab" / "projects.json"
+
+    settings.environment.provider.name = "gns3-other"
+    assert cache.read("projects") is None
+
+
+def test_read_expired_entry(monkeypatch, settings):
+    """An entry older than its maximum age is not served."""
+    cache.write("projects", [{"name": "lab01"}])
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+
+    assert cache.read("projects") is None
+    assert cache.read("projects", max_age=120) == [{"name": "lab01"}]
+
+    settings.cache_max_age = 300
+    assert cache.read("projects") == [{"name": "lab01"}]
+
+
+def test_read_missing_or_corrupt_entry(settings):  # pylint: disable=unused-argument
+    """A missing or partially written entry is not served."""
+    assert cache.read("templates") is None
+
+    cache.get_entry_path("templates").parent.mkdir(parents=True)
+    cache.get_entry_path("templates").write_text('{"timestamp": ')
+    assert cache.read("templates") is None
+
+
+def test_concurrent_writes(settings):
+    """Entries written at the same time, as by a parallel build, do not collide."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda x: cache.write("projects", [{"name": f"lab{x}"}]), range(64)))
+
+    assert cache.read("projects") in [[{"name": f"lab{x}"}] for x in range(64)]
+    assert [x.name for x in (settings.cache_dir / "default" / "gns3-lab").iterdir()] == ["projects.json"]
+
+
+@pytest.mark.parametrize(
+    "command, invalidated",
+    [("start", True), ("build", True), ("batch", True), ("get", False), ("init", False)],
+)
+def test_invalidate_after_mutating_commands(monkeypatch, tmp_path, command, invalidated):
+    """The cache of the current environment and provider is removed after the commands that modify the lab."""
+    monkeypatch.setattr(config, "SETTINGS", None)
+    config_file = tmp_path / "labby.toml"
+    config_file.write_text(CONFIG)
+    entry_path = tmp_path / ".labby_cache" / "default" / "gns3-lab" / "projects.json"
+    entry_path.parent.mkdir(parents=True)
+    entry_path.write_text('{"timestamp": 0, "data": []}')
+    on_close = []
+    ctx = SimpleNamespace(invoked_subcommand=command, obj=None, call_on_close=on_close.append)
+
+    main.main(ctx, verbose=False, version=None, config_file=config_file, environment=None, provider=None)
+    for callback in on_close:
+        callback()
+
+    assert entry_path.exists() is not invalidated
@@ -0,0 +1,50 @@
+"""Module for testing the labby entrypoint."""
+import sys
+
+import pytest
+
+from labby import client, main
+from labby.client import can_use_daemon, get_command_name
+
+
+@pytest.mark.parametrize(
+    "args, command_name",
+    [
+        (["get", "project", "list"], "get"),
+        (["-c", "labby.toml", "--verbose", "start", "project", "lab"], "start"),
+        (["--environment", "lab", "--provider", "gns3", "create", "node", "r1"], "create"),
+        (["--version"], None),
+    ],
+)
+def test_get_command_name(args, command_name):
+    """Test the command is found after the main options."""
+    assert get_command_name(args) == command_name
+
+
+def test_can_use_daemon_local_commands(monkeypatch, tmp_path):
+    """Test the commands needing the terminal run locally."""
+    socket_path = tmp_path / "labbyd.sock"
+    socket_path.touch()
+    monkeypatch.setenv("LABBY_DAEMON_SOCKET", str(socket_path))
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    assert can_use_daemon(["get", "project", "list"])
+    assert not can_use_daemon(["connect", "node", "r1"])
+    monkeypatch.setenv("LABBY_NO_DAEMON", "1")
+    assert not can_use_daemon(["get", "project", "list"])
+
+
+def test_reset_remote_after_local_command(monkeypatch, tmp_path):
+    """Test the daemon drops its loaded projects once a command changing the lab runs locally."""
+    socket_path = tmp_path / "labbyd.sock"
+    socket_path.touch()
+    monkeypatch.setenv("LABBY_DAEMON_SOCKET", str(socket_path))
+    monkeypatch.setattr(client, "can_use_daemon", lambda args: False)
+    monkeypatch.setattr(main, "app", lambda prog_name: None)
+    resets = []
+    monkeypatch.setattr(client, "reset_remote", lambda: resets.append(True))
+
+    for args in (["build", "project", "-f", "lab.yml"], ["get", "project", "list"]):
+        monkeypatch.setattr(sys, "argv", ["labby", *args])
+        client.main()
+
+    assert resets == [True]
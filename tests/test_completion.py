@@ -0,0 +1,88 @@
+"""Module for testing the shell completion of the resource names."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from labby import config, name_index
+from labby.commands import completion
+
+
+def test_get_link_endpoints(monkeypatch):
+    """Test the link endpoints are parsed from both sides of the link names."""
+    monkeypatch.setattr(completion, "get_names", lambda kind, project_name: ["r1: Eth1 == r2: Eth2", "invalid"])
+    assert completion.get_link_endpoints("lab") == [("r1", "Eth1", "r2", "Eth2"), ("r2", "Eth2", "r1", "Eth1")]
+
+
+@pytest.fixture(name="settings")
+def fixture_settings(monkeypatch, tmp_path):
+    """Settings with the name index and the state file under the temporary path."""
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    settings = SimpleNamespace(
+        state_file=tmp_path / "state.json", cache_dir=tmp_path / "cache", environment=environment
+    )
+    monkeypatch.setattr(config, "SETTINGS", settings)
+    return settings
+
+
+def test_complete_from_index(settings):  # pylint: disable=unused-argument
+    """Test the projects, templates, nodes and ports are completed from the name index."""
+    name_index.index_templates(["vEOS", "vSRX", "CSR1000v"])
+    name_index.index_project(
+        "lab01", ports={"r1": ["Ethernet1", "Ethernet2"], "sw1": ["e0"]}, links=["r1: Ethernet1 == sw1: e0"]
+    )
+    ctx = SimpleNamespace(params={"project_name": "lab01", "node_a": "r1"})
+
+    assert completion.complete_project(ctx, "lab") == ["lab01"]
+    assert completion.complete_template(ctx, "v") == ["vEOS", "vSRX"]
+    assert completion.complete_node(ctx, "") == ["r1", "sw1"]
+    assert completion.complete_port("node_a")(ctx, "Ethernet") == ["Ethernet1", "Ethernet2"]
+    assert completion.complete_link_endpoint("node_b")(ctx, "") == ["sw1"]
+
+
+def test_index_unchanged_not_written(monkeypatch, settings):  # pylint: disable=unused-argument
+    """Test a project refresh with the same names does not write the name index."""
+    name_index.index_templates(["vEOS"])
+    name_index.index_project("lab01", ports={"r1": ["Ethernet1"]}, links=[])
+    saved = []
+    monkeypatch.setattr(name_index, "save_index", saved.append)
+
+    name_index.index_templates(["vEOS"])
+    name_index.index_project("lab01", ports={"r1": ["Ethernet1"]}, links=[])
+    assert not saved
+
+    name_index.index_project("lab01", ports={"r1": ["Ethernet1"], "r2": ["Ethernet1"]}, links=[])
+    assert saved[0]["nodes"]["lab01"] == ["r1", "r2"]
+
+
+def test_complete_missing_or_corrupt_index(settings):
+    """Test a missing or corrupt name index completes from the state file only."""
+    ctx = SimpleNamespace(params={"project_name": "lab01"})
+    assert completion.complete_project(ctx, "") == []
+    assert completion.complete_node(ctx, "") == []
+
+    settings.state_file.write_text(
+        json.dumps({"default": {"gns3-lab": {"projects": {"lab01": {"nodes": {"r1": {"template": "vEOS"}}}}}}})
+    )
+    index_path = name_index.get_index_path()
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text('{"projects": ["lab0')
+
+    assert completion.complete_project(ctx, "") == ["lab01"]
+    assert completion.complete_template(ctx, "") == ["vEOS"]
+    assert completion.complete_node(ctx, "") == ["r1"]
+    assert (
+        completion.complete_port("node_a")(SimpleNamespace(params={"project_name": "lab01", "node_a": "r1"}), "") == []
+    )
+
+
+def test_index_concurrent_projects(settings):  # pylint: disable=unused-argument
+    """Test the projects indexed at the same time, as by a parallel build, are all kept."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda x: name_index.index_project(f"lab{x:02}", ports={"r1": []}, links=[]), range(32)))
+
+    index = name_index.read_index()
+    assert index["projects"] == [f"lab{x:02}" for x in range(32)]
+    assert sorted(index["nodes"]) == index["projects"]
+    assert [x.name for x in name_index.get_index_path().parent.iterdir()] == ["gns3-lab.names.json"]
@@ -0,0 +1,49 @@
+"""Tests for the GNS3 connector rate limiting."""
+import labby.config  # noqa: F401 # pylint: disable=unused-import  # Loads the providers before the GNS3 modules
+from labby.providers.gns3.connector import AIMDRateLimiter, get_endpoint_class
+
+
+def test_get_endpoint_class():
+    """Requests are classified by method and endpoint."""
+    base = "http://gns3:3080/v2/projects/p1"
+    assert get_endpoint_class("get", f"{base}/nodes") == "read"
+    assert get_endpoint_class("post", f"{base}/nodes") == "create"
+    assert get_endpoint_class("post", f"{base}/nodes/n1/start") == "action"
+    assert get_endpoint_class("post", f"{base}/open") == "action"
+    assert get_endpoint_class("put", f"{base}/nodes/n1") == "write"
+    assert get_endpoint_class("delete", f"{base}/links/l1") == "write"
+
+
+def test_limiter_increases_while_server_keeps_up():
+    """The rate grows additively while the latency is steady, up to the maximum."""
+    limiter = AIMDRateLimiter("read", rate=10, max_rate=10.5)
+    for _ in range(20):
+        limiter.on_success(0.01)
+    assert limiter.rate == 10.5
+
+
+def test_limiter_decreases_on_overload():
+    """The rate is halved on errors and latency spikes, down to the minimum."""
+    limiter = AIMDRateLimiter("create", rate=8, min_rate=1)
+    limiter.on_failure(retried=True)
+    assert limiter.rate == 4
+    assert limiter.counters["errors"] == 1 and limiter.counters["retries"] == 1
+
+    limiter.on_success(0.01)
+    limiter._decreased = 0  # pylint: disable=protected-access
+    limiter.on_success(1)
+    assert limiter.rate < 4
+
+    for _ in range(10):
+        limiter._decreased = 0  # pylint: disable=protected-access
+        limiter.on_failure()
+    assert limiter.rate == 1
+
+
+def test_limiter_throttles_bursts():
+    """Requests over the bucket capacity wait for a token."""
+    limiter = AIMDRateLimiter("action", rate=100)
+    waited = [limiter.acquire() for _ in range(105)]
+    assert sum(waited) > 0
+    assert limiter.counters["requests"] == 105
+    assert limiter.counters["throttled"] >= 1
@@ -0,0 +1,35 @@
+"""Module for testing the cache of the parsed project files."""
+from types import SimpleNamespace
+
+from labby import cache, config, utils
+
+
+def test_load_file(monkeypatch, tmp_path):
+    """The parsed content is reused until the file content changes."""
+    monkeypatch.setattr(config, "SETTINGS", SimpleNamespace(cache_dir=tmp_path / "cache"))
+    project_file = tmp_path / "labby_project.yml"
+    project_file.write_text("main:\n  name: lab01\n")
+    calls = []
+
+    def parser(content):
+        calls.append(content)
+        return utils.load_yaml(content)
+
+    assert cache.load_file(project_file, parser) == {"main": {"name": "lab01"}}
+    assert cache.load_file(project_file, parser) == {"main": {"name": "lab01"}}
+    assert len(calls) == 1
+
+    project_file.write_text("main:\n  name: lab02\n")
+    assert cache.load_file(project_file, parser) == {"main": {"name": "lab02"}}
+    assert len(calls) == 2
+    assert len(list((tmp_path / "cache" / "files").iterdir())) == 1
+
+
+def test_load_file_not_cached(monkeypatch, tmp_path):
+    """Content changed by a JSON round trip is parsed each time."""
+    monkeypatch.setattr(config, "SETTINGS", SimpleNamespace(cache_dir=tmp_path / "cache"))
+    vars_file = tmp_path / "vars.yml"
+    vars_file.write_text("vlans:\n  10: users\n")
+
+    assert cache.load_file(vars_file, utils.load_yaml) == {"vlans": {10: "users"}}
+    assert not (tmp_path / "cache" / "files").exists()
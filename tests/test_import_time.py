@@ -0,0 +1,38 @@
+"""Tests for the import cost of the labby CLI."""
+import re
+import subprocess
+import sys
+
+
+# Dependencies only needed by the commands that use them
+HEAVY_MODULES = ["nornir", "nornir_scrapli", "scrapli", "gns3fy", "jinja2", "requests"]
+
+# Cumulative import time budget of the CLI module, in microseconds
+IMPORT_TIME_BUDGET = 1_000_000
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Runs python code on a new interpreter, with an empty modules cache."""
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def test_cli_does_not_import_heavy_modules():
+    """The command dependencies are not imported until a command runs."""
+    result = run_python(f"import sys, labby.main; print([x for x in {HEAVY_MODULES} if x in sys.modules])")
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_cli_import_time_budget():
+    """The CLI module is imported within its time budget."""
+    result = run_python("import labby.main")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| labby\.main$", result.stderr, re.MULTILINE)
+    assert match is not None
+    assert int(match.group(1)) < IMPORT_TIME_BUDGET
+
+
+def test_client_does_not_import_cli():
+    """The entrypoint only imports the labby CLI when the command runs locally."""
+    result = run_python("import sys, labby.client; print([x for x in ['click', 'typer', 'rich'] if x in sys.modules])")
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,51 @@
+"""Tests for the Labby Nornir inventory plugin."""
+from types import SimpleNamespace
+
+from labby.nornir.plugins.inventory.labby import LabbyNornirInventory
+
+
+class Node:
+    # pylint: disable=too-few-public-methods
+    """Stand-in of a Labby node, counting its serializations."""
+
+    serialized = 0
+
+    def __init__(self, name, mgmt_addr, net_os):
+        """Initialize a node with its management address and network OS."""
+        self.name = name
+        self.mgmt_addr = mgmt_addr
+        self.net_os = net_os
+
+    def dict(self):
+        """Returns the node attributes."""
+        Node.serialized += 1
+        return {"name": self.name, "net_os": self.net_os}
+
+
+def test_inventory_lazy_data():
+    """The host data is read from the node and serialized only when accessed."""
+    nodes = {
+        "r1": Node(name="r1", mgmt_addr="10.0.0.1/24", net_os="cisco_ios"),
+        "r2": Node(name="r2", mgmt_addr=None, net_os="arista_eos"),
+    }
+    inventory = LabbyNornirInventory(SimpleNamespace(nodes=nodes)).load()  # type: ignore
+    host = inventory.hosts["r1"]
+
+    assert Node.serialized == 0
+    assert host["labby_obj"] is nodes["r1"]
+    nodes["r1"].net_os = "cisco_iosxe"
+    assert host["labby_dict"] == {"name": "r1", "net_os": "cisco_iosxe"}
+    assert Node.serialized == 1
+    host["site"] = "dc1"
+    assert sorted(host.data) == ["labby_dict", "labby_obj", "site"]
+
+
+def test_inventory_connection_options():
+    """The scrapli options are shared in the defaults, with the platform and hostname of each host."""
+    nodes = {"r1": Node(name="r1", mgmt_addr="10.0.0.1/24", net_os="cisco_ios")}
+    inventory = LabbyNornirInventory(SimpleNamespace(nodes=nodes)).load()  # type: ignore
+    params = inventory.hosts["r1"].get_connection_parameters("scrapli")
+
+    assert (params.hostname, params.port, params.username, params.platform) == ("10.0.0.1", 22, "netops", "cisco_iosxe")
+    assert params.extras["auth_strict_key"] is False
+    assert not inventory.hosts["r1"].connection_options
@@ -0,0 +1,48 @@
+"""Module for testing the build journal."""
+from labby.journal import BuildJournal, BuildStep, get_config_hash
+
+
+def test_resume(tmp_path):
+    """A resumed journal keeps the steps completed, skipping an entry left partially written."""
+    journal_path = tmp_path / "lab01.jsonl"
+    journal = BuildJournal("lab01", path=journal_path)
+    journal.record(BuildStep.node_created, "r1")
+    journal.record(BuildStep.configured, "r1", config_hash=get_config_hash("hostname r1"))
+    with journal_path.open("a") as fil:
+        fil.write('{"timestamp": 1, "step": "node_cre')
+
+    journal = BuildJournal("lab01", resume=True, path=journal_path)
+
+    assert journal.completed_steps == 2
+    assert journal.is_done(BuildStep.node_created, "r1")
+    assert not journal.is_done(BuildStep.node_created, "r2")
+    assert not journal.is_done(BuildStep.link_created, "r1")
+    assert journal.is_done(BuildStep.configured, "r1", config_hash=get_config_hash("hostname r1"))
+    assert not journal.is_done(BuildStep.configured, "r1", config_hash=get_config_hash("hostname r1-new"))
+
+
+def test_start_over(tmp_path):
+    """A build not resumed starts the journal over."""
+    journal_path = tmp_path / "lab01.jsonl"
+    BuildJournal("lab01", path=journal_path).record(BuildStep.node_created, "r1")
+
+    journal = BuildJournal("lab01", path=journal_path)
+
+    assert journal.completed_steps == 0
+    assert not journal.is_done(BuildStep.node_created, "r1")
+    assert journal_path.read_text() == ""
+
+
+def test_record_after_partial_entry(tmp_path):
+    """The steps recorded after resuming from an entry left partially written are kept."""
+    journal_path = tmp_path / "lab01.jsonl"
+    BuildJournal("lab01", path=journal_path).record(BuildStep.node_created, "r1")
+    with journal_path.open("a") as fil:
+        fil.write('{"timestamp": 1, "step": "node_cre')
+
+    BuildJournal("lab01", resume=True, path=journal_path).record(BuildStep.node_created, "r2")
+    journal = BuildJournal("lab01", resume=True, path=journal_path)
+
+    assert journal.completed_steps == 2
+    assert journal.is_done(BuildStep.node_created, "r1")
+    assert journal.is_done(BuildStep.node_created, "r2")
@@ -0,0 +1,58 @@
+"""Module for testing the label expressions and the label index."""
+import pytest
+
+from labby.labels import LabelIndex, match_labels, parse_label_expression
+
+
+def get_index() -> LabelIndex:
+    """Returns the label index of a small project."""
+    return LabelIndex(
+        {
+            "spine1": ["spine", "core"],
+            "leaf1": ["leaf", "edge"],
+            "leaf2": ["leaf", "edge", "lab"],
+            "mgmt": [],
+        }
+    )
+
+
+def test_parse_label_expression_precedence():
+    """`!` binds tighter than `&`, which binds tighter than `|`."""
+    assert parse_label_expression("edge") == "edge"
+    assert parse_label_expression("a | b & !c") == ("or", "a", ("and", "b", ("not", "c")))
+    assert parse_label_expression("(a | b) & c") == ("and", ("or", "a", "b"), "c")
+    assert parse_label_expression("!!a") == ("not", ("not", "a"))
+
+
+@pytest.mark.parametrize("expression", ["", "a &", "& a", "(a | b", "a b", "a)", "a | | b"])
+def test_parse_label_expression_not_valid(expression):
+    """Incomplete or malformed expressions are rejected."""
+    with pytest.raises(ValueError):
+        parse_label_expression(expression)
+
+
+def test_label_index_select():
+    """The names matching any of the expressions are returned in the index order."""
+    index = get_index()
+
+    assert index.select(["edge"]) == ["leaf1", "leaf2"]
+    assert index.select(["edge & !lab"]) == ["leaf1"]
+    assert index.select(["!leaf"]) == ["spine1", "mgmt"]
+    assert index.select(["lab", "spine"]) == ["spine1", "leaf2"]
+    assert index.select(["(spine | leaf) & !edge"]) == ["spine1"]
+    assert index.select(["missing"]) == []
+
+
+def test_label_index_from_state_data():
+    """The resources not in the state file, or without labels, are indexed with no labels."""
+    index = LabelIndex.from_state_data(["r1", "r2", "r3"], {"r1": {"labels": ["edge"]}, "r2": {"mgmt_addr": "x"}})
+
+    assert list(index.names) == ["r1", "r2", "r3"]
+    assert index.select(["!edge"]) == ["r2", "r3"]
+
+
+def test_match_labels():
+    """The labels of a single resource are matched against the expressions."""
+    assert match_labels(["telemetry"], ["telemetry", "test"])
+    assert not match_labels(["telemetry & !test"], ["telemetry", "test"])
+    assert match_labels(["prod", "!test"], ["telemetry"])
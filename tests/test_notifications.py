@@ -0,0 +1,66 @@
+"""Module for testing the GNS3 project notifications listener."""
+import socket
+
+from gns3fy.connector import Connector
+
+import labby.config  # noqa: F401 # pylint: disable=unused-import  # Loads the providers before the GNS3 modules
+from labby.providers.gns3.notifications import GNS3NotificationListener, poll_until
+
+
+def test_poll_until():
+    """Test polling a check until it succeeds."""
+    calls = []
+    assert poll_until(lambda: calls.append(1) or len(calls) == 3, timeout=5, interval=0.01)
+    assert len(calls) == 3
+    assert not poll_until(lambda: False, timeout=0.05, interval=0.01)
+
+
+def test_listener_node_status(gns3_server):
+    """Test node status waits are resolved from the notification stream.
+
+    Args:
+        gns3_server: Fixture for the GNS3 stand-in server
+    """
+    listener = GNS3NotificationListener(Connector(url=gns3_server.url), "p1")
+    assert listener.start()
+    listener.seed(nodes=[{"node_id": "n1", "name": "r1", "status": "stopped"}], links=[])
+    assert listener.node_status("n1") == "stopped"
+
+    gns3_server.notify("ping", {"cpu_usage_percent": 1})
+    gns3_server.notify("node.updated", {"node_id": "n1", "status": "started"})
+    assert listener.wait_node_status("n1", "started", timeout=5, poll=lambda: False)
+    assert listener.nodes["n1"]["name"] == "r1"
+    listener.stop()
+
+
+def test_listener_link_created(gns3_server):
+    """Test link waits are resolved from the notification stream.
+
+    Args:
+        gns3_server: Fixture for the GNS3 stand-in server
+    """
+    listener = GNS3NotificationListener(Connector(url=gns3_server.url), "p1")
+    assert listener.start()
+    assert not listener.wait_link_created("l1", timeout=0.2)
+
+    gns3_server.notify("link.created", {"link_id": "l1", "nodes": [{"node_id": "n1"}, {"node_id": "n2"}]})
+    assert listener.wait_link_created("l1", timeout=5)
+
+    gns3_server.notify("link.deleted", {"link_id": "l1"})
+    gns3_server.notify("project.closed", {"project_id": "p1"})
+    assert listener.wait_for(lambda: not listener.active, timeout=5)
+    assert "l1" not in listener.links
+
+
+def test_listener_polling_fallback():
+    """Test the waits fall back to polling when the notification stream is not available."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    listener = GNS3NotificationListener(Connector(url=f"http://127.0.0.1:{port}", retries=0, timeout=1), "p1")
+    assert not listener.start()
+
+    polls = []
+    assert listener.wait_node_status("n1", "started", timeout=5, poll=lambda: polls.append(1) or len(polls) == 2)
+    assert len(polls) == 2
@@ -0,0 +1,82 @@
+"""Tests for the output of the get commands: machine-readable formats and row windows."""
+import json
+
+import pytest
+
+from labby import utils
+from labby.output import OutputFormat, setup_output, write_record, write_rows
+from labby.utils import parse_columns, select_columns, select_rows
+
+
+ROWS = [
+    {"name": "r1", "status": "started", "labels": ["edge"], "builtin": False, "mgmt_addr": None},
+    {"name": "r2", "status": "stopped", "labels": [], "builtin": True, "mgmt_addr": "10.0.0.2/24"},
+]
+
+
+def test_write_rows_json(capsys):
+    """The JSON output is one array with the rows."""
+    assert write_rows(iter(ROWS), OutputFormat.json) == 2
+    assert json.loads(capsys.readouterr().out) == ROWS
+
+
+def test_write_rows_json_empty(capsys):
+    """No rows is an empty JSON array."""
+    assert write_rows(iter([]), OutputFormat.json) == 0
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_write_rows_ndjson(capsys):
+    """The NDJSON output is one row per line."""
+    write_rows(iter(ROWS), OutputFormat.ndjson)
+    assert [json.loads(x) for x in capsys.readouterr().out.splitlines()] == ROWS
+
+
+def test_write_rows_csv(capsys):
+    """The CSV header comes from the first row and the lists and booleans are JSON encoded."""
+    write_rows(iter(ROWS), OutputFormat.csv)
+    assert capsys.readouterr().out.splitlines() == [
+        "name,status,labels,builtin,mgmt_addr",
+        'r1,started,"[""edge""]",false,',
+        "r2,stopped,[],true,10.0.0.2/24",
+    ]
+
+
+def test_write_record(capsys):
+    """A detail is a JSON object."""
+    write_record(ROWS[0], OutputFormat.json)
+    assert json.loads(capsys.readouterr().out) == ROWS[0]
+
+
+def test_setup_output():
+    """The console messages go to stderr with the machine-readable formats."""
+    try:
+        setup_output(OutputFormat.ndjson)
+        assert utils.console.stderr
+        setup_output(OutputFormat.table)
+        assert not utils.console.stderr
+    finally:
+        utils.console.stderr = False
+
+
+def test_select_rows_window():
+    """The window is taken in the order of the rows when not sorted."""
+    rows = [{"name": f"r{x}"} for x in range(10)]
+    assert [x["name"] for x in select_rows(iter(rows), limit=3, offset=2)] == ["r2", "r3", "r4"]
+    assert len(list(select_rows(iter(rows), offset=8))) == 2
+
+
+def test_select_rows_sorted():
+    """Sorted windows keep the empty values last on both orders."""
+    rows = [{"console": 5002}, {"console": None}, {"console": 5000}, {"console": 5001}]
+    assert [x["console"] for x in select_rows(iter(rows), sort="console", limit=2)] == [5000, 5001]
+    assert [x["console"] for x in select_rows(iter(rows), sort="-console", offset=1)] == [5001, 5000, None]
+
+
+def test_parse_columns():
+    """Columns can be comma separated or repeated, and must be summary fields."""
+    assert parse_columns(["name,status", "console"], ["name", "status", "console"]) == ["name", "status", "console"]
+    assert parse_columns(None, ["name"]) is None
+    with pytest.raises(ValueError):
+        parse_columns(["name,bogus"], ["name"])
+    assert select_columns(ROWS[1], ["status", "name"]) == {"status": "stopped", "name": "r2"}
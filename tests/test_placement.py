@@ -0,0 +1,60 @@
+"""Module for testing the GNS3 node placement."""
+import pytest
+
+import labby.config  # noqa: F401 # pylint: disable=unused-import  # Loads the providers before the GNS3 modules
+from labby.providers.gns3.placement import ComputeLoad, NodeFootprint, get_template_footprint, plan_placement
+
+
+def get_computes():
+    """Returns two computes, one of them half used."""
+    return [
+        ComputeLoad(compute_id="c1", name="c1", ram_total=8192, cpus_total=8, ram_used=4096, cpus_used=4),
+        ComputeLoad(compute_id="c2", name="c2", ram_total=8192, cpus_total=8),
+    ]
+
+
+def test_compute_load_from_compute_data():
+    """Test the compute load from the GNS3 compute data."""
+    compute = ComputeLoad.from_compute_data(
+        {
+            "compute_id": "local",
+            "memory_usage_percent": 25,
+            "cpu_usage_percent": 50,
+            "capabilities": {"cpus": 4, "memory": 16 * 1024**3},
+        }
+    )
+    assert compute.name == "local"
+    assert compute.ram_total == 16384
+    assert compute.ram_free == 12288
+    assert compute.cpus_used == 2
+
+
+def test_get_template_footprint():
+    """Test the node footprint defaults."""
+    assert get_template_footprint(None) == NodeFootprint(ram=256, cpus=1)
+
+
+def test_plan_placement_binpack():
+    """Test binpack fills the most used compute first."""
+    nodes = {f"r{i}": NodeFootprint(ram=2048, cpus=2) for i in range(1, 4)}
+    placement = plan_placement(nodes, get_computes(), strategy="binpack")
+    assert list(placement) == ["r1", "r2", "r3"]
+    assert sorted(placement.values()) == ["c1", "c1", "c2"]
+
+
+def test_plan_placement_spread():
+    """Test spread balances the load between the computes."""
+    nodes = {f"r{i}": NodeFootprint(ram=1024, cpus=1) for i in range(1, 7)}
+    placement = plan_placement(nodes, get_computes(), strategy="spread")
+    assert list(placement.values()).count("c2") == 5
+    assert list(placement.values()).count("c1") == 1
+
+
+def test_plan_placement_pinned_and_overcommit():
+    """Test pinned nodes keep their compute and nodes that do not fit go to the compute with more free RAM."""
+    nodes = {"r1": NodeFootprint(ram=1024, cpus=1), "big": NodeFootprint(ram=65536, cpus=8)}
+    placement = plan_placement(nodes, get_computes(), strategy="binpack", pinned={"r1": "c1", "gone": "c9"})
+    assert placement == {"r1": "c1", "big": "c2"}
+
+    with pytest.raises(ValueError):
+        plan_placement(nodes, get_computes(), strategy="random")
@@ -0,0 +1,37 @@
+"""Tests for the port index of the project links."""
+from labby.port_index import PortIndex
+
+
+def get_index() -> PortIndex:
+    """Returns the index of three nodes, with r1 linked to r2 and r3."""
+    ports = {name: ["Management1", "Ethernet1", "Ethernet2"] for name in ["r1", "r2", "r3"]}
+    links = {
+        "r1: Ethernet1 == r2: Ethernet1": [("r1", "Ethernet1"), ("r2", "Ethernet1")],
+        "r3: Ethernet2 == r1: Ethernet2": [("r3", "Ethernet2"), ("r1", "Ethernet2")],
+    }
+    return PortIndex(ports, links)
+
+
+def test_port_index_lookups():
+    """Ports are looked up by node and port name, and links found in any direction."""
+    index = get_index()
+
+    assert index.get_used_ports("r1") == ["Ethernet1", "Ethernet2"]
+    assert index.get_free_ports("r2") == ["Management1", "Ethernet2"]
+    assert index.get_node_links("r1") == ["r1: Ethernet1 == r2: Ethernet1", "r3: Ethernet2 == r1: Ethernet2"]
+    assert index.find_link("r1", "Ethernet2", "r3", "Ethernet2") == "r3: Ethernet2 == r1: Ethernet2"
+    assert index.find_link("r1", "Ethernet1", "r3", "Ethernet2") is None
+    assert not index.has_port("r9", "Ethernet1")
+
+
+def test_port_index_updates():
+    """Deleting a link frees its ports, and deleting a node removes its links."""
+    index = get_index()
+
+    index.remove_link("r1: Ethernet1 == r2: Ethernet1")
+    assert index.get_link("r2", "Ethernet1") is None
+    index.add_link("r2: Ethernet2 == r3: Ethernet1", [("r2", "Ethernet2"), ("r3", "Ethernet1")])
+    index.remove_node("r3")
+    assert index.get_used_ports("r1") == []
+    assert index.get_used_ports("r2") == []
+    assert not list(index.links)
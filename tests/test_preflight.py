@@ -0,0 +1,65 @@
+"""Module for testing the validation of the project files before the build."""
+from labby.preflight import check_project_data
+from labby.project_data import ProjectData
+from labby.providers.gns3.template import get_template_ports
+
+VEOS_TEMPLATE = {
+    "template_type": "qemu",
+    "adapters": 3,
+    "first_port_name": "Management1",
+    "port_name_format": "Ethernet{port1}",
+    "port_segment_size": 0,
+}
+
+PROJECT_FILE = """
+main:
+  name: lab01
+  mgmt_network:
+    network: 192.168.0.0/24
+    gateway: 192.168.0.1/24
+    ip_range: [192.168.0.1, 192.168.0.3]
+  mgmt_creds: {user: netops, password: "${PREFLIGHT_NOT_SET}"}
+nodes_spec:
+  - {template: "arista eos veos", nodes: ["r[1-3]"], mgmt_port: Management1}
+  - {template: "arista eos vEOS", nodes: [r4]}
+links_spec:
+  - node: r1
+    links:
+      - {port: Ethernet1, node_b: r2, port_b: Ethernet1}
+      - {port: Ethernet1, node_b: r3, port_b: Ethernet3}
+      - {port: Ethernet2, node_b: r5, port_b: Ethernet1}
+"""
+
+
+def test_get_template_ports():
+    """Port names follow the template name format, and are unknown when the format is not supported."""
+    assert get_template_ports(VEOS_TEMPLATE) == ["Management1", "Ethernet1", "Ethernet2"]
+    assert get_template_ports(dict(VEOS_TEMPLATE, port_name_format="Gi{segment0}/{port0}", port_segment_size=2)) == [
+        "Management1",
+        "Gi0/0",
+        "Gi0/1",
+    ]
+    assert get_template_ports({"template_type": "ethernet_switch", "ports_mapping": [{"name": "Ethernet0"}]}) == [
+        "Ethernet0"
+    ]
+    assert get_template_ports({"template_type": "docker", "adapters": 2}) == ["eth0", "eth1"]
+    assert get_template_ports({"template_type": "qemu", "adapters": 2}) is None
+
+
+def test_check_project_data(monkeypatch, tmp_path):
+    """All the issues of the project file are reported in one pass."""
+    monkeypatch.delenv("PREFLIGHT_NOT_SET", raising=False)
+    project_file = tmp_path / "labby_project.yml"
+    project_file.write_text(PROJECT_FILE)
+    templates_ports = {"arista eos veos": get_template_ports(VEOS_TEMPLATE), "cloud": None}
+
+    issues = [(x.resource, x.message) for x in check_project_data(ProjectData(project_file), templates_ports)]
+
+    assert issues == [
+        ("mgmt_creds", "Management password is empty, environment variable not set: ${PREFLIGHT_NOT_SET}"),
+        ("nodes ['r4']", "Template not found: arista eos vEOS. Did you mean arista eos veos?"),
+        ("mgmt_network", "Management IP range has 2 addresses for 4 nodes"),
+        ("link r1: Ethernet1 == r3: Ethernet3", "Port r1: Ethernet1 already used by r1: Ethernet1 == r2: Ethernet1"),
+        ("link r1: Ethernet1 == r3: Ethernet3", "r3 port not found: Ethernet3. Did you mean Ethernet2?"),
+        ("link r1: Ethernet2 == r5: Ethernet1", "Node not found: r5"),
+    ]
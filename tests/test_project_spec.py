@@ -0,0 +1,112 @@
+"""Module for testing the compact syntax of the project file node and link specs."""
+import pytest
+
+from labby.project_data import ProjectData
+from labby.project_spec import expand_pattern, iter_links_spec, iter_nodes_spec
+
+
+def get_links(links_spec):
+    """Returns the links of the expanded link specs as tuples."""
+    return [
+        (x["node"], link["port"], link["node_b"], link["port_b"])
+        for x in iter_links_spec(links_spec)
+        for link in x["links"]
+    ]
+
+
+def test_expand_pattern():
+    """Ranges expand in order, keeping the zero padding, and names without ranges are kept."""
+    assert expand_pattern("leaf[1-3]") == ["leaf1", "leaf2", "leaf3"]
+    assert expand_pattern("r[08-10,15]") == ["r08", "r09", "r10", "r15"]
+    assert expand_pattern("pod[1-2]-leaf[1-2]") == ["pod1-leaf1", "pod1-leaf2", "pod2-leaf1", "pod2-leaf2"]
+    assert expand_pattern("mgmt_switch") == ["mgmt_switch"]
+    assert expand_pattern("odd[name]") == ["odd[name]"]
+
+    with pytest.raises(ValueError):
+        expand_pattern("leaf[4-1]")
+
+
+def test_iter_nodes_spec():
+    """Node names and `start_after` references are expanded, the other fields are kept."""
+    nodes_spec = list(
+        iter_nodes_spec([{"template": "vEOS", "nodes": ["leaf[1-2]", "border"], "start_after": ["s[1-2]"]}])
+    )
+
+    assert nodes_spec == [{"template": "vEOS", "nodes": ["leaf1", "leaf2", "border"], "start_after": ["s1", "s2"]}]
+
+
+def test_iter_links_spec_patterns():
+    """The link spec node and the link ports expand together, repeating single values."""
+    links_spec = [
+        {"node": "leaf[1-2]", "links": [{"port": "Ethernet1", "node_b": "spine1", "port_b": "Ethernet[1-2]"}]},
+        {"node": "r1", "links": [{"port": "Gi0/1", "node_b": "r2", "port_b": "Gi0/1", "filter": {"packet_loss": 7}}]},
+    ]
+
+    assert get_links(links_spec) == [
+        ("leaf1", "Ethernet1", "spine1", "Ethernet1"),
+        ("leaf2", "Ethernet1", "spine1", "Ethernet2"),
+        ("r1", "Gi0/1", "r2", "Gi0/1"),
+    ]
+    assert list(iter_links_spec(links_spec))[-1] == links_spec[-1]
+
+    with pytest.raises(ValueError):
+        get_links([{"node": "leaf[1-2]", "links": [{"port": "Ethernet[1-3]", "node_b": "s1", "port_b": "Ethernet1"}]}])
+
+
+def test_iter_links_spec_macros():
+    """Macros link their nodes from the next free port of each one."""
+    assert get_links([{"macro": "full_mesh", "nodes": "r[1-3]", "ports": "eth[1-2]"}]) == [
+        ("r1", "eth1", "r2", "eth1"),
+        ("r1", "eth2", "r3", "eth1"),
+        ("r2", "eth2", "r3", "eth2"),
+    ]
+
+    links_spec = [
+        {
+            "macro": "leaf_spine",
+            "leaves": "leaf[1-3]",
+            "spines": "spine[1-2]",
+            "leaf_ports": "Ethernet[49-50]",
+            "spine_ports": "Ethernet[1-3]",
+            "labels": ["fabric"],
+        }
+    ]
+    assert get_links(links_spec)[:3] == [
+        ("leaf1", "Ethernet49", "spine1", "Ethernet1"),
+        ("leaf1", "Ethernet50", "spine2", "Ethernet1"),
+        ("leaf2", "Ethernet49", "spine1", "Ethernet2"),
+    ]
+    assert len(get_links(links_spec)) == 6
+    assert all(link["labels"] == ["fabric"] for x in iter_links_spec(links_spec) for link in x["links"])
+
+    with pytest.raises(ValueError):
+        get_links([{"macro": "full_mesh", "nodes": "r[1-3]", "ports": "eth1"}])
+    with pytest.raises(ValueError):
+        get_links([{"macro": "ring", "nodes": "r[1-3]"}])
+
+
+def test_project_data_specs(tmp_path):
+    """The project data exposes the expanded specs."""
+    project_file = tmp_path / "labby_project.yml"
+    project_file.write_text(
+        """
+main:
+  name: fabric
+  mgmt_network:
+    network: 192.168.0.0/24
+    ip_range: [192.168.0.16, 192.168.0.63]
+  mgmt_creds: {user: netops, password: netops123}
+nodes_spec:
+  - {template: "Arista EOS vEOS 4.25.0FX", nodes: ["spine[1-2]", "leaf[1-4]"]}
+links_spec:
+  - macro: leaf_spine
+    leaves: "leaf[1-4]"
+    spines: "spine[1-2]"
+    leaf_ports: "Ethernet[1-2]"
+    spine_ports: "Ethernet[1-4]"
+"""
+    )
+    project_data = ProjectData(project_file)
+
+    assert project_data.nodes_spec[0]["nodes"] == ["spine1", "spine2", "leaf1", "leaf2", "leaf3", "leaf4"]
+    assert sum(len(x["links"]) for x in project_data.links_spec) == 8
@@ -0,0 +1,110 @@
+"""Module for testing the commands over multiple providers."""
+import io
+from types import SimpleNamespace
+
+import pytest
+import typer
+from rich.console import Console
+
+from labby import config
+from labby.commands import get
+from labby.commands.common import get_labby_providers, iter_providers_project_list, render_providers_project_list
+from labby.output import OutputFormat
+from labby.providers import register_service
+from labby.providers.gns3.aio import GNS3AsyncProvider
+from labby.providers.gns3.provider import GNS3Provider
+
+CONFIG = """
+[main]
+environment = "default"
+
+[environment.default]
+provider = "gns3-lab"
+
+[environment.default.providers.gns3-lab]
+kind = "gns3"
+server_url = "http://gns3-lab:80"
+
+[environment.aws]
+provider = "gns3-lab"
+
+[environment.aws.providers.gns3-lab]
+kind = "gns3-async"
+server_url = "http://gns3-aws:80"
+
+[environment.aws.providers.container-lab]
+kind = "vrnetlab"
+server_url = "tcp://docker-host:2375"
+"""
+
+PROJECTS = [
+    {"name": "lab01", "status": "opened", "auto_start": True, "auto_close": False, "auto_open": None},
+    {"name": "lab02", "status": "closed", "auto_start": False, "auto_close": True, "auto_open": True},
+]
+
+
+@pytest.fixture(name="config_file")
+def fixture_config_file(monkeypatch, tmp_path):
+    """Configuration file with providers of the same name in two environments, loaded as the current one."""
+    monkeypatch.setattr(config, "SETTINGS", None)
+    config_file = tmp_path / "labby.toml"
+    config_file.write_text(CONFIG)
+    config.load_config(config_file=config_file)
+    env = config.get_environment()
+    register_service(env.provider.name, env.provider.kind, env.name)
+    return config_file
+
+
+def test_get_labby_providers(config_file):
+    """The providers are registered by environment, so providers sharing a name keep their own kind."""
+    providers = get_labby_providers(config_file, all_environments=True)
+
+    assert [(x[0], x[1].name, x[1].kind) for x in providers] == [
+        ("default", "gns3-lab", "gns3"),
+        ("aws", "gns3-lab", "gns3-async"),
+    ]
+    assert isinstance(providers[1][1], GNS3AsyncProvider)
+    assert config.get_provider() is providers[0][1]
+    assert [x[0] for x in get_labby_providers(config_file)] == ["default"]
+
+
+def test_providers_project_list(monkeypatch, config_file):
+    """The projects of all the providers are listed, and the unreachable providers reported."""
+
+    def unreachable(self, cached=None):  # pylint: disable=unused-argument
+        raise ConnectionError("Connection refused")
+
+    monkeypatch.setattr(GNS3Provider, "get_projects_data", lambda self, cached=None: PROJECTS)
+    monkeypatch.setattr(GNS3AsyncProvider, "get_projects_data", unreachable)
+    providers = get_labby_providers(config_file, all_environments=True)
+
+    projects = list(iter_providers_project_list(providers, field="status", value="opened"))
+    assert [(x["environment"], x["name"], x["status"], x["error"]) for x in projects] == [
+        ("default", "lab01", "opened", None),
+        ("aws", None, "unreachable", "Connection refused"),
+    ]
+
+    output = io.StringIO()
+    Console(file=output, width=200).print(render_providers_project_list(providers))
+    rows = [x for x in output.getvalue().splitlines() if "gns3-lab" in x]
+    assert len(rows) == 3
+    assert "lab01" in rows[0] and "started" in rows[0] and "Yes" in rows[0] and "No" in rows[0]
+    assert "lab02" in rows[1] and "stopped" in rows[1]
+    assert "Connection refused" in rows[2] and "unreachable" in rows[2]
+
+
+@pytest.mark.parametrize("labels, cached", [(["edge"], None), (None, True), (None, False)])
+def test_project_list_all_providers_options(config_file, labels, cached):
+    """The labels and the read cache of the current provider can not be used over all the providers."""
+    with pytest.raises(typer.BadParameter):
+        get.project_list(
+            ctx=SimpleNamespace(obj={"config_file": config_file}),
+            pfilter=None,
+            value=None,
+            labels=labels,
+            cached=cached,
+            all_providers=True,
+            all_environments=False,
+            output=OutputFormat.table,
+            timeout=10,
+        )
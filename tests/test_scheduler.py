@@ -0,0 +1,45 @@
+"""Tests for the nodes start scheduler."""
+import pytest
+
+from labby.scheduler import plan_start_waves
+
+
+NODES = {
+    "spine1": ["spine"],
+    "spine2": ["spine"],
+    "leaf1": ["leaf"],
+    "leaf2": ["leaf"],
+    "host1": [],
+}
+
+
+def test_plan_start_waves_all_at_once():
+    """Without any order the nodes start in a single wave."""
+    assert plan_start_waves(NODES) == [["spine1", "spine2", "leaf1", "leaf2", "host1"]]
+
+
+def test_plan_start_waves_labels_order():
+    """Nodes start by the order of their labels, the ones without them last."""
+    assert plan_start_waves(NODES, labels_order=["spine", "leaf"]) == [
+        ["spine1", "spine2"],
+        ["leaf1", "leaf2"],
+        ["host1"],
+    ]
+
+
+def test_plan_start_waves_start_after():
+    """Nodes start after the nodes and labels they depend on."""
+    waves = plan_start_waves(NODES, start_after={"leaf1": ["spine"], "leaf2": ["spine"], "host1": ["leaf1"]})
+    assert waves == [["spine1", "spine2"], ["leaf1", "leaf2"], ["host1"]]
+
+
+def test_plan_start_waves_max_booting():
+    """Waves are split to keep the maximum of nodes booting at the same time."""
+    waves = plan_start_waves(NODES, labels_order=["spine"], max_booting=2)
+    assert waves == [["spine1", "spine2"], ["leaf1", "leaf2"], ["host1"]]
+
+
+def test_plan_start_waves_cyclic():
+    """Cyclic start dependencies are rejected."""
+    with pytest.raises(ValueError, match="Cyclic"):
+        plan_start_waves(NODES, start_after={"spine1": ["leaf1"], "leaf1": ["spine1"]})
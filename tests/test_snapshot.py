@@ -0,0 +1,93 @@
+"""Module for testing the GNS3 project bulk snapshot."""
+# pylint: disable=too-few-public-methods
+from gns3fy.connector import Connector
+from gns3fy.projects import Project
+
+import labby.config  # noqa: F401 # pylint: disable=unused-import  # Loads the providers before the GNS3 modules
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot, fetch_project_snapshot
+
+PORT = {"name": "Ethernet1", "short_name": "e1", "adapter_number": 1, "port_number": 0, "link_type": "ethernet"}
+
+SERVER_DATA = {
+    "/projects/p1": {"project_id": "p1", "name": "lab01", "status": "opened"},
+    "/projects/p1/nodes": [
+        {"node_id": "n1", "name": "r1", "template_id": "t1", "node_type": "qemu", "status": "started", "ports": [PORT]},
+        {"node_id": "n2", "name": "r2", "template_id": "t1", "node_type": "qemu", "status": "stopped", "ports": [PORT]},
+        {"node_id": "n3", "name": "sw1", "node_type": "ethernet_switch", "status": "started", "ports": None},
+    ],
+    "/projects/p1/links": [
+        {
+            "link_id": "l1",
+            "link_type": "ethernet",
+            "nodes": [
+                {"node_id": "n1", "adapter_number": 1, "port_number": 0, "label": {"text": "Ethernet1"}},
+                {"node_id": "n2", "adapter_number": 1, "port_number": 0, "label": {"text": "Ethernet1"}},
+            ],
+        },
+        # Link being created, without its ends yet
+        {"link_id": "l2", "link_type": "ethernet", "nodes": []},
+    ],
+    "/templates": [
+        {"template_id": "t1", "name": "vEOS", "template_type": "qemu", "category": "router", "builtin": False},
+    ],
+}
+
+
+class FakeResponse:
+    """Response of the fake connector."""
+
+    def __init__(self, data):
+        """Initialize a response with its JSON data."""
+        self.data = data
+
+    def json(self):
+        """Returns the response data."""
+        return self.data
+
+
+class FakeConnector(Connector):
+    """Connector serving the GNS3 server data from memory, recording the requests made."""
+
+    def __init__(self, data):
+        """Initialize a connector serving the data given."""
+        super().__init__(url="http://gns3:3080")
+        self.data = data
+        self.calls = []
+
+    def http_call(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ,unused-argument
+        """Returns the data of an endpoint."""
+        self.calls.append((method, url))
+        return FakeResponse(self.data[url.split("/v2", 1)[1]])
+
+
+def test_fetch_project_snapshot():
+    """The project, nodes, links and templates are retrieved with one request each."""
+    connector = FakeConnector(SERVER_DATA)
+    snapshot = fetch_project_snapshot(connector, "p1")
+
+    assert sorted(x[1] for x in connector.calls) == sorted(f"http://gns3:3080/v2{x}" for x in SERVER_DATA)
+    assert snapshot.status == "opened"
+    assert GNS3ProjectSnapshot(**snapshot.to_dict()).to_dict() == snapshot.to_dict()
+
+
+def test_hydrate():
+    """The gns3fy objects are built from the snapshot data, without any further request."""
+    connector = FakeConnector(SERVER_DATA)
+    snapshot = fetch_project_snapshot(connector, "p1")
+    connector.calls.clear()
+    project = Project(project_id="p1", connector=connector)
+
+    templates = snapshot.hydrate(project)
+
+    assert not connector.calls
+    assert list(templates) == ["vEOS"]
+    assert project.name == "lab01" and project.status == "opened"
+    assert list(project.nodes) == ["r1", "r2", "sw1"]
+    assert project.nodes["r1"].template == "vEOS"
+    assert project.nodes["r1"].ports[0].node_name == "r1"
+    assert project.nodes["sw1"].ports == []
+    assert list(project.links) == ["r1: Ethernet1 == r2: Ethernet1"]
+    link = project.links["r1: Ethernet1 == r2: Ethernet1"]
+    assert [x.node_name for x in link.nodes] == ["r1", "r2"]
+    assert project.nodes["r1"].links == {link.name: link}
+    assert project.nodes["r2"].links == {link.name: link}
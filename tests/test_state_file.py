@@ -0,0 +1,27 @@
+"""Module for testing the state file writes."""
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from labby import config, state_file
+
+
+def test_concurrent_project_writes(monkeypatch, tmp_path):
+    """Projects written at the same time, as by a parallel build, are all kept in the state file."""
+    environment = SimpleNamespace(name="default", provider=SimpleNamespace(name="gns3-lab"))
+    monkeypatch.setattr(
+        config, "SETTINGS", SimpleNamespace(state_file=tmp_path / "state.json", environment=environment)
+    )
+    projects = [SimpleNamespace(name=f"lab{x}", labels=[], nodes={}, links={}) for x in range(8)]
+
+    def build(project):
+        state_file.apply_project_data(project)
+        state_file.apply_placement_data({"r1": "local"}, project)
+        state_file.apply_start_after_data({"r2": ["r1"]}, project)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(build, projects))
+
+    for project in projects:
+        project_data = state_file.get_project_data(project.name)
+        assert project_data["placement"] == {"r1": "local"}
+        assert project_data["start_after"] == {"r2": ["r1"]}
@@ -0,0 +1,51 @@
+"""Tests for the topology graph of the projects."""
+from labby.topology import Topology
+
+
+def get_topology() -> Topology:
+    """Returns a triangle of r1, r2 and r3, with r4 hanging from r3 and r5 isolated."""
+    links = [
+        ("l1", "r1", "Ethernet1", "r2", "Ethernet1"),
+        ("l2", "r2", "Ethernet2", "r3", "Ethernet1"),
+        ("l3", "r3", "Ethernet2", "r1", "Ethernet2"),
+        ("l4", "r3", "Ethernet3", "r4", "Ethernet1"),
+    ]
+    return Topology(["r1", "r2", "r3", "r4", "r5"], links)
+
+
+def test_topology_neighbors():
+    """The neighbors are seen from the node asked for."""
+    topology = get_topology()
+
+    assert [(x.port, x.neighbor, x.neighbor_port) for x in topology.neighbors("r1")] == [
+        ("Ethernet1", "r2", "Ethernet1"),
+        ("Ethernet2", "r3", "Ethernet2"),
+    ]
+    assert not topology.neighbors("r5")
+
+
+def test_topology_paths():
+    """The shortest path is the one of fewer hops, and None between disconnected nodes."""
+    topology = get_topology()
+
+    assert [x.link for x in topology.shortest_path("r2", "r4")] == ["l2", "l4"]
+    assert topology.shortest_path("r1", "r1") == []
+    assert topology.shortest_path("r1", "r5") is None
+
+
+def test_topology_components():
+    """Components are the groups of connected nodes, and a link failure may split one."""
+    topology = get_topology()
+
+    assert topology.components() == [["r1", "r2", "r3", "r4"], ["r5"]]
+    assert topology.link_impact("l1") == [["r1", "r2", "r3", "r4"]]
+    assert topology.link_impact("l4") == [["r1", "r2", "r3"], ["r4"]]
+
+
+def test_topology_export():
+    """The DOT export has a node per line and an edge per link."""
+    dot = get_topology().to_dot("lab").splitlines()
+
+    assert dot[0] == 'graph "lab" {'
+    assert '  "r3" -- "r4" [label="l4", taillabel="Ethernet3", headlabel="Ethernet1"];' in dot
+    assert "<edge" in get_topology().to_graphml()
@@ -0,0 +1,81 @@
+"""Module for testing the GNS3 compact project views."""
+import labby.config  # noqa: F401 # pylint: disable=unused-import  # Loads the providers before the GNS3 modules
+from labby.providers.gns3.snapshot import GNS3ProjectSnapshot
+from labby.providers.gns3.views import GNS3ProjectView
+
+
+def get_snapshot() -> GNS3ProjectSnapshot:
+    """Returns the snapshot of a project with two linked nodes."""
+    ports = [{"name": f"Ethernet{x}", "adapter_number": x, "port_number": 0, "link_type": "ethernet"} for x in range(3)]
+    return GNS3ProjectSnapshot(
+        project={"name": "lab", "project_id": "p1", "status": "opened", "auto_start": False},
+        nodes=[
+            {
+                "name": name,
+                "node_id": f"n{x}",
+                "node_type": "qemu",
+                "template_id": "t1",
+                "status": "started",
+                "console": 5000 + x,
+                "ports": ports,
+            }
+            for x, name in enumerate(["r1", "r2"])
+        ],
+        links=[
+            {
+                "link_id": "l1",
+                "link_type": "ethernet",
+                "suspend": False,
+                "filters": {},
+                "nodes": [
+                    {"node_id": "n0", "adapter_number": 1, "port_number": 0, "label": {"text": "Ethernet1"}},
+                    {"node_id": "n1", "adapter_number": 1, "port_number": 0, "label": {"text": "Ethernet1"}},
+                ],
+            },
+            {"link_id": "l2", "link_type": "ethernet", "nodes": []},
+        ],
+        templates=[{"template_id": "t1", "name": "Arista EOS vEOS 4.25F", "category": "router", "builtin": False}],
+    )
+
+
+def test_project_view():
+    """The view holds the summary fields of the nodes and links, with the state file data."""
+    project_state = {
+        "labels": ["dc1"],
+        "nodes": {"r1": {"labels": ["edge"], "mgmt_addr": "10.0.0.1/24"}},
+        "links": {"r1: Ethernet1 == r2: Ethernet1": {"labels": ["core"]}},
+    }
+    prj = GNS3ProjectView("lab", get_snapshot(), labels=["dc1"], project_state=project_state)
+
+    assert prj.summary()["nodes"] == 2
+    assert prj.summary()["links"] == 1
+    assert prj.nodes["r1"].summary() == {
+        "name": "r1",
+        "status": "started",
+        "kind": "qemu",
+        "category": "router",
+        "net_os": "arista_eos",
+        "model": "veos",
+        "version": "4.25F",
+        "builtin": False,
+        "template": "Arista EOS vEOS 4.25F",
+        "console": 5000,
+        "labels": ["edge"],
+        "mgmt_port": None,
+        "mgmt_addr": "10.0.0.1/24",
+        "config_managed": True,
+        "ports": 3,
+        "id": "n0",
+    }
+    link = prj.links["r1: Ethernet1 == r2: Ethernet1"]
+    assert (link.node_a, link.port_b, link.status, link.labels) == ("r1", "Ethernet1", "present", ["core"])
+
+
+def test_project_view_listing():
+    """The view is listed and rendered as the projects are."""
+    prj = GNS3ProjectView("lab", get_snapshot())
+
+    assert [x["name"] for x in prj.iter_nodes_summary(sort="-console")] == ["r2", "r1"]
+    assert [x.name for x in prj.filter_nodes(field="status", value="started")] == ["r1", "r2"]
+    assert prj.render_nodes_summary(limit=1).row_count == 1
+    assert prj.render_links_summary(columns=["name", "status"]).row_count == 1